@@ -26,9 +26,15 @@ else:
     import aqt
     import anki.sound
     
+    # start profiling startup
+    # =======================
+    from . import constants
+    from . import startup_profiler
+
+    profiler = startup_profiler.StartupProfiler()
+
     # setup sentry crash reporting
     # ============================
-    from . import constants
 
     if constants.ENABLE_SENTRY_CRASH_REPORTING:
         sys._sentry_crash_reporting = True
@@ -81,6 +87,7 @@ else:
             before_send=sentry_filter
         )
         sentry_sdk.set_user({"id": user_id})
+        profiler.end_phase('sentry')
 
     # addon imports
     # =============
@@ -88,8 +95,11 @@ else:
     from . import anki_utils
     from . import servicemanager
     from . import hypertts
+    from . import request_journal
     from . import gui
 
+    profiler.end_phase('addon imports')
+
     # initialize hypertts
     # ===================
 
@@ -108,8 +118,26 @@ else:
         current_script_dir = os.path.dirname(current_script_path)    
         return os.path.join(current_script_dir, 'services')
     service_manager = servicemanager.ServiceManager(services_dir(), 'services', False)
-    service_manager.init_services()    
+    profiler.service_manager = service_manager
+    service_manager.import_services()
+    profiler.end_phase('import services')
+    service_manager.instantiate_services()
+    profiler.end_phase('instantiate services')
     hyper_tts = hypertts.HyperTTS(ankiutils, service_manager)
+    hyper_tts.startup_profiler = profiler
+    # cloud-language-tools requests are recorded locally, see replay_journal.py
+    service_manager.cloudlanguagetools.set_request_journal(request_journal.RequestJournal(
+        os.path.join(ankiutils.get_user_files_dir(), constants.REQUEST_JOURNAL_FILENAME)))
     # configure services based on config
+    hyper_tts.migrate_configuration()
     service_manager.configure(hyper_tts.get_configuration())
+    profiler.end_phase('configure')
+    # configure invalidates the registry, it gets built with the voices of the enabled services
+    service_manager.get_voice_registry()
+    profiler.end_phase('voice registry')
     gui.init(hyper_tts)
+    profiler.end_phase('gui init')
+    profiler.finish()
+    startup_profile_filename = os.environ.get(constants.STARTUP_PROFILE_ENV_VAR, '')
+    if len(startup_profile_filename) > 0:
+        profiler.save(startup_profile_filename)
@@ -4,6 +4,7 @@ import aqt
 import anki.template
 import anki.sound
 import anki.collection
+import anki.errors
 import logging
 import aqt.qt
 from . import constants    
@@ -57,6 +58,28 @@ class AnkiUtils():
         note = aqt.mw.col.getNote(note_id)
         return note
 
+    def get_notes_by_id(self, note_id_list):
+        """load a chunk of notes, returns note_id -> note. notes which don't exist are left out.
+        loading is not batched, each note is still one call to the rust backend"""
+        # the chunking only bounds how many notes are held in memory, it skips the legacy getNote wrapper
+        col = aqt.mw.col
+        notes = {}
+        for note_id in note_id_list:
+            try:
+                notes[note_id] = col.get_note(note_id)
+            except anki.errors.NotFoundError:
+                pass
+        return notes
+
+    def get_note_type_ids(self, note_id_list):
+        """returns the set of note type ids of the notes, without loading the notes"""
+        model_id_set = set()
+        for start in range(0, len(note_id_list), constants.NOTE_LOAD_CHUNK_SIZE):
+            chunk_note_id_list = note_id_list[start:start + constants.NOTE_LOAD_CHUNK_SIZE]
+            ids = ','.join([str(note_id) for note_id in chunk_note_id_list])
+            model_id_set.update(aqt.mw.col.db.list(f'select distinct mid from notes where id in ({ids})'))
+        return model_id_set
+
     def get_model(self, model_id):
         return aqt.mw.col.models.get(model_id)
 
@@ -70,8 +93,38 @@ class AnkiUtils():
         return aqt.mw.col.decks.id_for_name(deck_name)
 
     def media_add_file(self, filename):
-        full_filename = aqt.mw.col.media.addFile(filename)
-        return full_filename
+        """returns the name of the file in the media folder, which may differ from the name of filename"""
+        # the audio file gets hard linked into the media folder instead of being read and copied. anki registers
+        # files which appear in the media folder the next time it scans it for changes (sync, check media)
+        media_filename = os.path.basename(filename)
+        media_full_filename = os.path.join(aqt.mw.col.media.dir(), media_filename)
+        if self.media_file_matches(filename, media_full_filename):
+            # the filename is the hash of the audio request, we already added this audio
+            return media_filename
+        try:
+            os.link(filename, media_full_filename)
+            return media_filename
+        except FileExistsError:
+            # another thread added it in the meantime, or the file in the media folder has different contents,
+            # in which case anki adds ours under a new name
+            if self.media_file_matches(filename, media_full_filename):
+                return media_filename
+        except OSError as e:
+            # different filesystem, or one which doesn't support hard links
+            logging.info(f'could not link {filename} into the media folder, copying it: {e}')
+        return aqt.mw.col.media.add_file(filename)
+
+    def media_file_matches(self, filename, media_full_filename):
+        # same file (hard link) or same contents. a partial or replaced file must not be reused
+        try:
+            if os.path.samefile(filename, media_full_filename):
+                return True
+            if os.path.getsize(filename) != os.path.getsize(media_full_filename):
+                return False
+            with open(filename, 'rb') as f1, open(media_full_filename, 'rb') as f2:
+                return f1.read() == f2.read()
+        except OSError:
+            return False
 
     def undo_start(self):
         return aqt.mw.col.add_custom_undo_entry(constants.UNDO_ENTRY_NAME)
@@ -84,6 +137,10 @@ class AnkiUtils():
     def update_note(self, note):
         aqt.mw.col.update_note(note)
 
+    def update_notes(self, note_list):
+        # adds one undo entry, which gets merged into the batch undo entry by undo_end
+        aqt.mw.col.update_notes(note_list)
+
     def create_card_from_note(self, note, card_ord, model, template):
         return note.ephemeral_card(
             card_ord,
@@ -95,6 +152,19 @@ class AnkiUtils():
         tts_tags = [x for x in av_tags if isinstance(x, anki.sound.TTSTag)]
         return tts_tags
 
+    def get_review_ahead_card_ids(self, card_count):
+        # only the v3 scheduler lets us look at the upcoming cards
+        scheduler = aqt.mw.col.sched
+        if not hasattr(scheduler, 'get_queued_cards'):
+            return []
+        queued_cards = scheduler.get_queued_cards(fetch_limit=card_count)
+        return [queued_card.card.id for queued_card in queued_cards.cards]
+
+    def get_card_tts_tags(self, card_id):
+        # renders both sides of the card
+        card = aqt.mw.col.get_card(card_id)
+        return self.extract_tts_tags(card.question_av_tags()) + self.extract_tts_tags(card.answer_av_tags())
+
     def save_note_type_update(self, note_model):
         logging.info(f"""updating note type: {note_model['name']}""")
         aqt.mw.col.models.update_dict(note_model)
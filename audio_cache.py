@@ -0,0 +1,270 @@
+import sys
+import os
+import json
+import time
+import logging
+import shutil
+import itertools
+import threading
+import collections
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+# makes temporary file names unique, also for several writers on the same thread
+writer_counter = itertools.count()
+
+class AudioFileWriter():
+    """
+    audio gets written in chunks to a temporary file next to its final location, which is renamed once complete,
+    so that a concurrent reader never sees a partial file. if the with block raises, the temporary file is removed.
+    with keep_temp_file (streaming playback reads the temporary file while it grows), the final location gets a link
+    to it or a copy of it instead, and the caller removes the temporary file once it's done with it.
+    the final location is never opened for writing: it may be hard linked into the collection media folder.
+    """
+
+    def __init__(self, cache, hash_str, full_filename, keep_temp_file=False):
+        self.cache = cache
+        self.hash_str = hash_str
+        self.full_filename = full_filename
+        self.keep_temp_file = keep_temp_file
+        self.temp_filename = f'{full_filename}.{threading.get_ident()}-{next(writer_counter)}.tmp'
+        self.file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_value != None:
+            self.abort()
+        else:
+            self.commit()
+        return False
+
+    # bulk requests open several writers at once, and commit or abort each one depending on its result
+
+    def open(self):
+        self.file = open(self.temp_filename, 'wb')
+        return self.file
+
+    def abort(self):
+        if self.file == None:
+            # never opened, there is no temporary file
+            return
+        self.file.close()
+        try:
+            os.remove(self.temp_filename)
+        except OSError as e:
+            logging.warning(f'could not remove {self.temp_filename}: {e}')
+
+    def commit(self):
+        size = self.file.tell()
+        self.file.flush()
+        if constants.AUDIO_FILE_FSYNC:
+            os.fsync(self.file.fileno())
+        self.file.close()
+        if self.keep_temp_file:
+            self.link_into_place()
+        else:
+            os.replace(self.temp_filename, self.full_filename)
+        self.cache.add_entry(self.hash_str, self.full_filename, size)
+
+    def link_into_place(self):
+        # replacing the final location gives it a new inode, whatever the old one was linked to stays untouched
+        link_filename = f'{self.temp_filename}.link'
+        try:
+            os.link(self.temp_filename, link_filename)
+        except OSError as e:
+            logging.info(f'could not link {self.temp_filename}, copying it: {e}')
+            shutil.copyfile(self.temp_filename, link_filename)
+        os.replace(link_filename, self.full_filename)
+
+class AudioCache():
+    """
+    content-addressed cache for generated audio files. entries are keyed by the audio request hash
+    (see HyperTTS.get_hash_for_audio_request), the files live in the user_files directory and
+    an index file keeps track of size and last access, so that we can evict least recently used entries.
+    """
+
+    def __init__(self, cache_dir,
+            max_size_bytes=constants.AUDIO_CACHE_MAX_SIZE_BYTES,
+            max_age_seconds=constants.AUDIO_CACHE_MAX_AGE_SECONDS):
+        self.cache_dir = cache_dir
+        self.index_filename = os.path.join(cache_dir, constants.AUDIO_CACHE_INDEX_FILENAME)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.lock = threading.Lock()
+        # hash_str -> entry dict, ordered from least recently used to most recently used
+        self.entries = collections.OrderedDict()
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.index_dirty = False
+        self.index_saved_time = time.time()
+        self.load_index()
+
+    # index persistence
+    # =================
+
+    def load_index(self):
+        if not os.path.exists(self.index_filename):
+            return
+        try:
+            with open(self.index_filename, 'r', encoding='utf-8') as f:
+                index_data = json.load(f)
+            entries = index_data.get('entries', {})
+        except Exception as e:
+            logging.warning(f'could not load audio cache index {self.index_filename}: {e}')
+            return
+        for hash_str, entry in sorted(entries.items(), key=lambda x: x[1]['last_access']):
+            self.entries[hash_str] = entry
+            self.total_size += entry['size']
+        self.prune_expired_locked()
+        self.evict_locked()
+        logging.info(f'loaded audio cache index, {len(self.entries)} entries, {self.total_size} bytes')
+
+    def save_index(self):
+        with self.lock:
+            self.save_index_locked()
+
+    def save_index_locked(self):
+        index_data = {
+            'version': constants.AUDIO_CACHE_INDEX_VERSION,
+            'entries': self.entries
+        }
+        temp_filename = self.index_filename + '.tmp'
+        try:
+            with open(temp_filename, 'w', encoding='utf-8') as f:
+                json.dump(index_data, f)
+            os.replace(temp_filename, self.index_filename)
+        except Exception as e:
+            logging.warning(f'could not save audio cache index {self.index_filename}: {e}')
+            return
+        self.index_dirty = False
+        self.index_saved_time = time.time()
+
+    def mark_index_dirty_locked(self):
+        # rewriting the index on every request would be expensive on large batches, save at most every few seconds
+        self.index_dirty = True
+        if time.time() - self.index_saved_time > constants.AUDIO_CACHE_INDEX_SAVE_INTERVAL_SECONDS:
+            self.save_index_locked()
+
+    def flush(self):
+        with self.lock:
+            if self.index_dirty:
+                self.save_index_locked()
+
+    # lookup / store
+    # ==============
+
+    def lookup(self, hash_str, full_filename):
+        """returns True if the audio for this request is already present in full_filename"""
+        with self.lock:
+            entry = self.entries.get(hash_str, None)
+            if entry != None:
+                now = time.time()
+                if now - entry['created'] > self.max_age_seconds:
+                    logging.info(f'audio cache entry {hash_str} expired')
+                    self.remove_entry_locked(hash_str)
+                elif os.path.exists(full_filename):
+                    entry['last_access'] = now
+                    self.entries.move_to_end(hash_str)
+                    self.hits += 1
+                    self.mark_index_dirty_locked()
+                    return True
+                else:
+                    # file was removed from user_files, forget about it
+                    self.total_size -= entry['size']
+                    del self.entries[hash_str]
+            self.misses += 1
+            return False
+
+    def contains(self, hash_str, full_filename):
+        """like lookup, but doesn't count as an access. used for planning"""
+        with self.lock:
+            entry = self.entries.get(hash_str, None)
+            if entry == None:
+                return False
+            if time.time() - entry['created'] > self.max_age_seconds:
+                return False
+            return os.path.exists(full_filename)
+
+    def store(self, hash_str, full_filename, audio_data):
+        with self.open_writer(hash_str, full_filename) as f:
+            f.write(audio_data)
+
+    def open_writer(self, hash_str, full_filename, keep_temp_file=False):
+        """returns a file to stream the audio into, the entry gets added once the with block completes"""
+        return AudioFileWriter(self, hash_str, full_filename, keep_temp_file=keep_temp_file)
+
+    def add_entry(self, hash_str, full_filename, size):
+        with self.lock:
+            if hash_str in self.entries:
+                self.total_size -= self.entries[hash_str]['size']
+            now = time.time()
+            self.entries[hash_str] = {
+                'filename': os.path.basename(full_filename),
+                'size': size,
+                'created': now,
+                'last_access': now
+            }
+            self.entries.move_to_end(hash_str)
+            self.total_size += size
+            self.evict_locked()
+            self.mark_index_dirty_locked()
+
+    # eviction
+    # ========
+
+    def remove_entry_locked(self, hash_str):
+        entry = self.entries.pop(hash_str)
+        self.total_size -= entry['size']
+        full_filename = os.path.join(self.cache_dir, entry['filename'])
+        try:
+            if os.path.exists(full_filename):
+                os.remove(full_filename)
+        except OSError as e:
+            logging.warning(f'could not remove cached audio file {full_filename}: {e}')
+        self.index_dirty = True
+
+    def evict_locked(self):
+        # least recently used entries come first
+        while len(self.entries) > 1 and self.total_size > self.max_size_bytes:
+            hash_str = next(iter(self.entries))
+            logging.info(f'evicting audio cache entry {hash_str}')
+            self.remove_entry_locked(hash_str)
+            self.evictions += 1
+
+    def prune_expired_locked(self):
+        # only done when loading the index, lookup() takes care of expired entries afterwards
+        now = time.time()
+        expired = [hash_str for hash_str, entry in self.entries.items() if now - entry['created'] > self.max_age_seconds]
+        for hash_str in expired:
+            self.remove_entry_locked(hash_str)
+            self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            for hash_str in list(self.entries.keys()):
+                self.remove_entry_locked(hash_str)
+            self.save_index_locked()
+
+    # statistics
+    # ==========
+
+    def reset_stats(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entry_count': len(self.entries),
+                'total_size': self.total_size
+            }
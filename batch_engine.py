@@ -0,0 +1,189 @@
+import sys
+import logging
+import collections
+import concurrent.futures
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+context = __import__('context', globals(), locals(), [], sys._addon_import_level_base)
+errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class PendingNote():
+    def __init__(self, note_id):
+        self.note_id = note_id
+        self.note = None
+        self.source_text = None
+        self.processed_text = None
+        # exception raised while loading the note or processing its text, re-raised in note order
+        self.exception = None
+        self.future = None
+
+class BatchEngine():
+    """
+    runs a batch with concurrent audio requests. the requests go to a thread pool sized according to the
+    concurrency limits of the services in the voice selection. the calling thread is the single writer:
+    notes, media files and the batch status are updated in note order. notes are loaded from the collection
+    and saved back in chunks.
+    """
+
+    def __init__(self, hypertts, batch, batch_status, journal=None):
+        self.hypertts = hypertts
+        self.batch = batch
+        self.batch_status = batch_status
+        # BatchJournal which records each note as it gets written, optional
+        self.journal = journal
+        self.max_workers = hypertts.service_manager.get_batch_worker_count(self.get_voice_list())
+        # don't read too far ahead of the writer, we keep the notes in memory until they are written
+        self.max_pending = self.max_workers * constants.BATCH_PENDING_PER_WORKER
+        # with hypertts pro, the audio is requested from cloud-language-tools in bulk
+        self.bulk_voice_with_options = self.get_bulk_voice_with_options()
+        if self.bulk_voice_with_options != None:
+            # enough notes for each worker to have a bulk request in flight
+            self.max_pending = self.max_workers * constants.CLOUDLANGUAGETOOLS_BULK_SIZE
+        # (processed_text, future) collected for the next bulk request
+        self.bulk_group = []
+        self.bulk_group_futures = set()
+        self.executor = None
+        # notes with the same processed text share one audio request. not in random mode, where each
+        # note is supposed to get its own voice
+        self.dedupe_requests = batch.voice_selection.selection_mode != constants.VoiceSelectionMode.random
+        self.request_futures = {}
+        # notes which got their audio, waiting to be saved to the collection
+        self.updated_notes = []
+
+    def get_voice_list(self):
+        voice_selection = self.batch.voice_selection
+        if voice_selection.selection_mode == constants.VoiceSelectionMode.single:
+            return [voice_selection.voice.voice]
+        return [voice_with_options.voice for voice_with_options in voice_selection.voice_list]
+
+    def get_bulk_voice_with_options(self):
+        # only a single voice, in priority and random mode each note may need a different one
+        if self.batch.voice_selection.selection_mode != constants.VoiceSelectionMode.single:
+            return None
+        voice_with_options = self.batch.voice_selection.voice
+        if not self.hypertts.service_manager.use_cloud_language_tools(voice_with_options.voice):
+            return None
+        if not self.hypertts.hypertts_pro_enabled():
+            return None
+        return voice_with_options
+
+    def run(self, note_id_list):
+        logging.info(f'running batch on {len(note_id_list)} notes with {self.max_workers} workers, bulk: {self.bulk_voice_with_options != None}')
+        pending_notes = collections.deque()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='hypertts_batch')
+        self.executor = executor
+        try:
+            for note_id, note in self.hypertts.iterate_notes(note_id_list):
+                if self.batch_status.must_continue == False:
+                    break
+                pending_notes.append(self.submit_note(executor, note_id, note))
+                while len(pending_notes) >= self.max_pending and self.batch_status.must_continue:
+                    self.write_note(pending_notes.popleft())
+            while len(pending_notes) > 0 and self.batch_status.must_continue:
+                self.write_note(pending_notes.popleft())
+            if self.batch_status.must_continue == False:
+                logging.info('batch_status execution interrupted')
+        finally:
+            # requests which haven't started yet won't be needed
+            for pending_note in pending_notes:
+                if pending_note.future != None:
+                    pending_note.future.cancel()
+            executor.shutdown(wait=True)
+            # the notes which were written so far get saved, even if the batch got interrupted
+            self.flush_note_updates()
+
+    def submit_note(self, executor, note_id, note):
+        pending_note = PendingNote(note_id)
+        try:
+            if note == None:
+                raise errors.NoteNotFoundError(note_id)
+            pending_note.note = note
+            pending_note.source_text, pending_note.processed_text = self.hypertts.prepare_note_audio(self.batch, pending_note.note)
+            pending_note.future = self.submit_audio_request(executor, pending_note.processed_text)
+        except Exception as e:
+            pending_note.exception = e
+        return pending_note
+
+    def submit_audio_request(self, executor, processed_text):
+        if self.dedupe_requests and processed_text in self.request_futures:
+            return self.request_futures[processed_text]
+        if self.bulk_voice_with_options != None:
+            future = concurrent.futures.Future()
+            self.bulk_group.append((processed_text, future))
+            self.bulk_group_futures.add(future)
+            if len(self.bulk_group) >= constants.CLOUDLANGUAGETOOLS_BULK_SIZE:
+                self.submit_bulk_group()
+        else:
+            future = executor.submit(self.hypertts.get_audio_file, processed_text,
+                self.batch.voice_selection, context.AudioRequestContext(constants.AudioRequestReason.batch))
+        if self.dedupe_requests:
+            self.request_futures[processed_text] = future
+        return future
+
+    # bulk requests
+    # =============
+
+    def submit_bulk_group(self):
+        bulk_group = self.bulk_group
+        self.bulk_group = []
+        self.bulk_group_futures = set()
+        self.executor.submit(self.run_bulk_group, bulk_group)
+
+    def run_bulk_group(self, bulk_group):
+        # notes which got cancelled in the meantime are left out
+        bulk_group = [(processed_text, future) for processed_text, future in bulk_group if future.set_running_or_notify_cancel()]
+        if len(bulk_group) == 0:
+            return
+        voice_with_options = self.bulk_voice_with_options
+        try:
+            results = self.hypertts.generate_audio_write_files_bulk([processed_text for processed_text, future in bulk_group],
+                voice_with_options.voice, voice_with_options.options, context.AudioRequestContext(constants.AudioRequestReason.batch))
+        except Exception as e:
+            results = {processed_text: e for processed_text, future in bulk_group}
+        for processed_text, future in bulk_group:
+            result = results[processed_text]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def write_note(self, pending_note):
+        if pending_note.future in self.bulk_group_futures:
+            # the writer is about to wait for this note, send the bulk request it's part of
+            self.submit_bulk_group()
+        written_sound_file = None
+        with self.batch_status.get_note_action_context(pending_note.note_id, False) as note_action_context:
+            if pending_note.exception != None:
+                raise pending_note.exception
+            full_filename, audio_filename = pending_note.future.result()
+            # add_mode: don't save the note right away, it gets saved with the next chunk
+            sound_file = self.hypertts.apply_note_audio(self.batch, pending_note.note, True, full_filename, audio_filename)
+            self.updated_notes.append(pending_note.note)
+            note_action_context.set_source_text(pending_note.source_text)
+            note_action_context.set_processed_text(pending_note.processed_text)
+            note_action_context.set_sound(sound_file)
+            note_action_context.set_status(constants.BatchNoteStatus.Done)
+            written_sound_file = sound_file
+        if self.journal != None:
+            if written_sound_file != None:
+                self.journal.record_done(pending_note.note_id, written_sound_file)
+            else:
+                self.journal.record_error(pending_note.note_id, self.batch_status.get_note_status(pending_note.note_id).error)
+        if len(self.updated_notes) >= constants.NOTE_UPDATE_CHUNK_SIZE:
+            self.flush_note_updates()
+
+    def flush_note_updates(self):
+        if len(self.updated_notes) == 0:
+            return
+        note_list = self.updated_notes
+        self.updated_notes = []
+        try:
+            self.hypertts.anki_utils.update_notes(note_list)
+        except Exception as e:
+            # find out which notes can't be saved
+            logging.warning(f'could not save {len(note_list)} notes at once, saving them one by one: {e}')
+            for note in note_list:
+                with self.batch_status.get_note_action_context(note.id, False) as note_action_context:
+                    self.hypertts.anki_utils.update_note(note)
+                    note_action_context.set_status(constants.BatchNoteStatus.Done)
@@ -0,0 +1,115 @@
+import sys
+import os
+import json
+import time
+import hashlib
+import logging
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+def get_journal_id(batch, note_id_list):
+    # the same batch on the same notes resumes the same journal
+    combined_data = {
+        'batch': batch.serialize(),
+        'note_id_list': list(note_id_list)
+    }
+    return hashlib.sha224(json.dumps(combined_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def prune_journals(journal_dir, max_age_seconds=constants.BATCH_JOURNAL_MAX_AGE_SECONDS):
+    """removes journals which weren't written to for max_age_seconds, returns how many were removed"""
+    removed_count = 0
+    oldest_mtime = time.time() - max_age_seconds
+    for filename in os.listdir(journal_dir):
+        if not filename.startswith(constants.BATCH_JOURNAL_FILENAME_PREFIX):
+            continue
+        full_filename = os.path.join(journal_dir, filename)
+        try:
+            if os.path.getmtime(full_filename) < oldest_mtime:
+                os.remove(full_filename)
+                removed_count += 1
+        except OSError as e:
+            logging.warning(f'could not prune batch journal {full_filename}: {e}')
+    if removed_count > 0:
+        logging.info(f'removed {removed_count} old batch journals')
+    return removed_count
+
+class BatchJournal():
+    """
+    records the progress of a batch on disk, one json line per note written, so that a batch which got
+    interrupted (stopped, crashed, anki restarted) can be resumed without requesting the audio again.
+    the journal is removed once the batch completes without errors, journals which never get resumed
+    are removed by prune_journals after BATCH_JOURNAL_MAX_AGE_SECONDS.
+    """
+
+    def __init__(self, journal_dir, batch, note_id_list):
+        self.journal_id = get_journal_id(batch, note_id_list)
+        self.filename = os.path.join(journal_dir, f'{constants.BATCH_JOURNAL_FILENAME_PREFIX}{self.journal_id}.jsonl')
+        self.file = None
+        self.unsynced_count = 0
+        self.error_count = 0
+
+    def exists(self):
+        return os.path.exists(self.filename)
+
+    def load(self):
+        """returns note_id -> latest entry for that note"""
+        entries = {}
+        if not self.exists():
+            return entries
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line may be truncated if we crashed while writing it
+                    logging.warning(f'skipping invalid line in batch journal {self.filename}')
+                    continue
+                if 'note_id' in entry:
+                    entries[entry['note_id']] = entry
+        return entries
+
+    def get_done_count(self):
+        entries = self.load()
+        return len([entry for entry in entries.values() if entry['status'] == constants.BatchNoteStatus.Done.name])
+
+    # writing
+    # =======
+
+    def open(self, resume):
+        # when resuming, we append to the existing journal, the latest entry for a note wins
+        mode = 'a' if resume else 'w'
+        self.file = open(self.filename, mode, encoding='utf-8')
+        self.error_count = 0
+        self.write_entry({'version': constants.BATCH_JOURNAL_VERSION, 'journal_id': self.journal_id, 'resume': resume})
+
+    def record_done(self, note_id, sound_file):
+        self.write_entry({'note_id': note_id, 'status': constants.BatchNoteStatus.Done.name, 'sound_file': sound_file})
+
+    def record_error(self, note_id, error):
+        self.error_count += 1
+        self.write_entry({'note_id': note_id, 'status': constants.BatchNoteStatus.Error.name, 'error': str(error)})
+
+    def write_entry(self, entry):
+        self.file.write(json.dumps(entry) + '\n')
+        # flushing makes the entry survive a crash of anki, fsync makes it survive a crash of the OS
+        self.file.flush()
+        self.unsynced_count += 1
+        if self.unsynced_count >= constants.BATCH_JOURNAL_SYNC_INTERVAL:
+            self.sync()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.unsynced_count = 0
+
+    def close(self):
+        if self.file == None:
+            return
+        self.sync()
+        self.file.close()
+        self.file = None
+
+    def delete(self):
+        self.close()
+        if self.exists():
+            os.remove(self.filename)
@@ -0,0 +1,158 @@
+import sys
+import logging
+import collections
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_base)
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f'{seconds}s'
+    if seconds < 3600:
+        return f'{seconds // 60}m {seconds % 60:02d}s'
+    return f'{seconds // 3600}h {(seconds % 3600) // 60:02d}m'
+
+class BatchPlan():
+    def __init__(self):
+        self.note_count = 0
+        # notes for which we couldn't get the source text
+        self.error_count = 0
+        # notes which need audio
+        self.request_count = 0
+        # audio requests left after removing duplicate texts
+        self.unique_request_count = 0
+        self.cached_request_count = 0
+        # characters we'll send to each service, only counting requests which are not cached
+        self.characters_by_service = {}
+        self.estimated_seconds = 0
+
+    def get_generate_count(self):
+        return self.unique_request_count - self.cached_request_count
+
+    def summary(self):
+        lines = []
+        duplicate_count = self.request_count - self.unique_request_count
+        lines.append(f'<b>Plan:</b> {self.note_count} notes, {self.unique_request_count} audio requests ({duplicate_count} duplicates), '
+            f'{self.cached_request_count} already cached, {self.get_generate_count()} to generate')
+        if self.error_count > 0:
+            lines.append(f'{self.error_count} notes with errors')
+        if len(self.characters_by_service) > 0:
+            characters_str = ', '.join([f'{service}: {characters:,}' for service, characters in sorted(self.characters_by_service.items())])
+            lines.append(f'<b>Characters:</b> {characters_str}')
+        lines.append(f'<b>Estimated time:</b> {format_duration(self.estimated_seconds)}')
+        return '<br/>'.join(lines)
+
+class BatchPlanBuilder():
+    """
+    accumulates a plan one processed text at a time, so that the texts don't need to be kept around.
+    only the counters are kept, and a hash of each distinct text to count duplicates.
+    """
+
+    def __init__(self, hypertts, voice_selection, voice_shares):
+        self.hypertts = hypertts
+        self.voice_shares = voice_shares
+        self.plan = BatchPlan()
+        # the batch engine sends one request per distinct text, except in random mode
+        self.dedupe = voice_selection.selection_mode != constants.VoiceSelectionMode.random
+        # the plan is an estimate, a hash collision only miscounts a duplicate
+        self.seen_text_hashes = set()
+        self.cached_count = 0.0
+        self.characters_by_service = collections.defaultdict(float)
+        self.uncached_count_by_key = collections.defaultdict(float)
+        self.voice_by_key = {}
+
+    def add_processed_text(self, processed_text):
+        """processed_text is None for notes which had an error"""
+        plan = self.plan
+        plan.note_count += 1
+        if processed_text == None or len(processed_text) == 0:
+            # the batch will report an error for this note
+            plan.error_count += 1
+            return
+        plan.request_count += 1
+        if self.dedupe:
+            text_hash = hash(processed_text)
+            if text_hash in self.seen_text_hashes:
+                return
+            self.seen_text_hashes.add(text_hash)
+        plan.unique_request_count += 1
+        service_manager = self.hypertts.service_manager
+        for voice_with_options, share in self.voice_shares:
+            voice = voice_with_options.voice
+            hash_str = self.hypertts.get_hash_for_audio_request(processed_text, voice, voice_with_options.options)
+            full_filename = self.hypertts.get_full_audio_file_name(hash_str)
+            if self.hypertts.audio_cache.contains(hash_str, full_filename):
+                self.cached_count += share
+            else:
+                self.characters_by_service[voice.service.name] += share * len(processed_text)
+                key = service_manager.get_concurrency_key(voice)
+                self.uncached_count_by_key[key] += share
+                self.voice_by_key[key] = voice
+
+    def get_plan(self):
+        service_manager = self.hypertts.service_manager
+        plan = self.plan
+        plan.cached_request_count = int(round(self.cached_count))
+        plan.characters_by_service = {service: int(round(characters)) for service, characters in self.characters_by_service.items()}
+
+        # each service gets its share of the workers, and may also be rate limited
+        plan.estimated_seconds = 0
+        for key, request_count in self.uncached_count_by_key.items():
+            voice = self.voice_by_key[key]
+            seconds = request_count * service_manager.get_latency_estimate(voice) / service_manager.get_concurrency_limit(voice)
+            requests_per_second = service_manager.get_rate_limiter(voice).rate
+            if requests_per_second > 0:
+                seconds = max(seconds, request_count / requests_per_second)
+            plan.estimated_seconds += seconds
+
+        return plan
+
+class BatchPlanner():
+    """
+    dry run of a batch: figures out which audio requests the batch will make, how many of them are already
+    in the audio cache, how many characters go to each service and roughly how long it will take
+    """
+
+    def __init__(self, hypertts):
+        self.hypertts = hypertts
+
+    def plan(self, note_id_list, batch):
+        plan_builder = self.get_plan_builder(batch.voice_selection)
+        for note_id, note in self.hypertts.iterate_notes(note_id_list):
+            try:
+                if note == None:
+                    raise errors.NoteNotFoundError(note_id)
+                source_text, processed_text = self.hypertts.prepare_note_audio(batch, note)
+                plan_builder.add_processed_text(processed_text)
+            except Exception as e:
+                logging.info(f'could not get text for note {note_id}: {e}')
+                plan_builder.add_processed_text(None)
+        return plan_builder.get_plan()
+
+    def get_voice_shares(self, voice_selection):
+        # which voices the requests go to, and what fraction of the requests each one gets
+        if voice_selection.selection_mode == constants.VoiceSelectionMode.single:
+            return [(voice_selection.voice, 1.0)]
+        voice_list = voice_selection.voice_list
+        if len(voice_list) == 0:
+            return []
+        if voice_selection.selection_mode == constants.VoiceSelectionMode.priority:
+            # the first voice gets tried first, we don't know which notes will fall back
+            return [(voice_list[0], 1.0)]
+        total_weight = sum([voice_with_options.random_weight for voice_with_options in voice_list])
+        if total_weight == 0:
+            # every weight set to 0, plan as if the voices were picked evenly
+            return [(voice_with_options, 1.0 / len(voice_list)) for voice_with_options in voice_list]
+        return [(voice_with_options, voice_with_options.random_weight / total_weight) for voice_with_options in voice_list]
+
+    def get_plan_builder(self, voice_selection):
+        return BatchPlanBuilder(self.hypertts, voice_selection, self.get_voice_shares(voice_selection))
+
+    def plan_processed_texts(self, processed_texts, voice_selection):
+        """processed_texts can be any iterable, it contains None for notes which had an error"""
+        plan_builder = self.get_plan_builder(voice_selection)
+        for processed_text in processed_texts:
+            plan_builder.add_processed_text(processed_text)
+        return plan_builder.get_plan()
@@ -1,10 +1,22 @@
 import sys
+import time
+import array
 import logging
+import threading
+import collections
 
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_base)
 
+# statuses are stored as small integers
+STATUS_LIST = list(constants.BatchNoteStatus)
+STATUS_INDEX = {status: index for index, status in enumerate(STATUS_LIST)}
+NO_STATUS = -1
+
 class NoteStatus():
+    """the status of one row, assembled by BatchStatus when asked for it"""
+    __slots__ = ['note_id', 'source_text', 'processed_text', 'sound_file', 'error', 'status']
+
     def __init__(self, note_id):
         self.note_id = note_id
         self.source_text = None
@@ -22,6 +34,7 @@ class BatchNoteActionContext():
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
+        # the listener hears about the note once, when we're done with it
         if exception_value != None:
             if isinstance(exception_value, errors.HyperTTSError):
                 self.batch_status.report_known_error(self.note_id, exception_value)
@@ -61,22 +74,41 @@ class BatchRunningActionContext():
         return False        
 
 class BatchStatus():
-    def __init__(self, anki_utils, note_id_list, change_listener):
+    """
+    keeps the status of each note in parallel arrays indexed by row, so that selections of 100k notes stay small.
+    source and processed texts are kept for the most recently used rows only, when given a text_provider,
+    text_provider(note_id) -> (source_text, processed_text) recomputes the text of the other rows when asked for them.
+
+    the change listener gets told about changes in two ways:
+    - batch_change(note_id, row) once each note is done, on the thread running the batch. should be cheap.
+    - batch_rows_changed(first_row, last_row) with the range of rows which changed since the last call,
+      at most every BATCH_STATUS_NOTIFY_INTERVAL_SECONDS, and once more before batch_end. meant for updating the GUI.
+    """
+
+    def __init__(self, anki_utils, note_id_list, change_listener, text_provider=None):
         self.anki_utils = anki_utils
         self.note_id_list = note_id_list
         self.change_listener = change_listener
-        self.note_status_array = []
-        self.note_status_map = {}
-        self.note_id_map = {}
+        self.text_provider = text_provider
         self.task_running = False
         self.must_continue = False
-        i = 0
-        for note_id in self.note_id_list:
-            note_status = NoteStatus(note_id)
-            self.note_status_array.append(note_status)
-            self.note_status_map[note_id] = note_status
-            self.note_id_map[note_id] = i
-            i += 1
+        row_count = len(self.note_id_list)
+        self.note_id_map = {note_id: row for row, note_id in enumerate(self.note_id_list)}
+        # index into STATUS_LIST, NO_STATUS if the note doesn't have a status yet
+        self.status_array = array.array('b', [NO_STATUS]) * row_count
+        self.sound_file_array = [None] * row_count
+        # row -> exception, only for the rows which have an error
+        self.errors = {}
+        # row -> [source_text, processed_text], least recently used first
+        self.text_lock = threading.Lock()
+        self.texts = collections.OrderedDict()
+        self.text_cache_size = constants.BATCH_STATUS_TEXT_CACHE_SIZE if text_provider != None else None
+        # rows which changed since the listener was last told, coalesced into one range
+        self.notify_lock = threading.Lock()
+        self.dirty_first_row = None
+        self.dirty_last_row = None
+        self.last_flush_time = 0
+        self.flush_timer = None
     
     def is_running(self):
         return self.task_running
@@ -85,59 +117,156 @@ class BatchStatus():
         logging.info('stopping current batch')
         self.must_continue = False
 
+    def __len__(self):
+        return len(self.note_id_list)
+
     def __getitem__(self, array_index):
-        return self.note_status_array[array_index]
+        note_status = NoteStatus(self.note_id_list[array_index])
+        note_status.status = self.get_status(array_index)
+        note_status.sound_file = self.sound_file_array[array_index]
+        note_status.error = self.errors.get(array_index, None)
+        note_status.source_text, note_status.processed_text = self.get_texts(array_index, note_status.status)
+        return note_status
+
+    def get_note_status(self, note_id):
+        return self[self.note_id_map[note_id]]
+
+    def get_status(self, row):
+        status_index = self.status_array[row]
+        if status_index == NO_STATUS:
+            return None
+        return STATUS_LIST[status_index]
+
+    def get_texts(self, row, status):
+        with self.text_lock:
+            if row in self.texts:
+                self.texts.move_to_end(row)
+                return tuple(self.texts[row])
+        if self.text_provider == None or status in [None, constants.BatchNoteStatus.Processing, constants.BatchNoteStatus.Error]:
+            # nothing to recompute, notes with errors never got their text
+            return None, None
+        # the text was dropped from memory, recompute it
+        try:
+            source_text, processed_text = self.text_provider(self.note_id_list[row])
+        except Exception as e:
+            logging.info(f'could not recompute text for row {row}: {e}')
+            source_text, processed_text = None, None
+        self.store_text(row, 0, source_text)
+        self.store_text(row, 1, processed_text)
+        return source_text, processed_text
+
+    def get_processed_text(self, row):
+        """like get_texts, but a recomputed text doesn't push the recently used rows out of memory"""
+        with self.text_lock:
+            if row in self.texts:
+                return self.texts[row][1]
+        if self.text_provider == None:
+            return None
+        source_text, processed_text = self.text_provider(self.note_id_list[row])
+        return processed_text
+
+    def store_text(self, row, text_index, text):
+        with self.text_lock:
+            if row not in self.texts:
+                self.texts[row] = [None, None]
+            self.texts[row][text_index] = text
+            self.texts.move_to_end(row)
+            if self.text_cache_size != None:
+                while len(self.texts) > self.text_cache_size:
+                    self.texts.popitem(last=False)
 
     def get_batch_running_action_context(self):
         return BatchRunningActionContext(self)
 
     def get_note_action_context(self, note_id, blank_fields):
-        note_status = self.note_status_map[note_id]
-        note_status.error = None
-        note_status.status = constants.BatchNoteStatus.Processing
+        row = self.note_id_map[note_id]
+        self.errors.pop(row, None)
+        self.status_array[row] = STATUS_INDEX[constants.BatchNoteStatus.Processing]
         if blank_fields:
-            note_status.source_text = None
-            note_status.processed_text = None
-            note_status.sound_file = None
+            with self.text_lock:
+                self.texts.pop(row, None)
+            self.sound_file_array[row] = None
         return BatchNoteActionContext(self, note_id)
 
     # error reporting
 
     def report_known_error(self, note_id, exception_value):
-        self.note_status_map[note_id].status = constants.BatchNoteStatus.Error
-        self.note_status_map[note_id].error = exception_value
-        self.notify_change(note_id)
+        row = self.note_id_map[note_id]
+        self.status_array[row] = STATUS_INDEX[constants.BatchNoteStatus.Error]
+        self.errors[row] = exception_value
+        self.mark_row_dirty(row)
 
     def report_unknown_exception(self, note_id, exception_value):
-        self.note_status_map[note_id].status = constants.BatchNoteStatus.Error
-        self.note_status_map[note_id].error = exception_value
+        row = self.note_id_map[note_id]
+        self.status_array[row] = STATUS_INDEX[constants.BatchNoteStatus.Error]
+        self.errors[row] = exception_value
         self.anki_utils.report_unknown_exception_background(exception_value)
-        self.notify_change(note_id)
+        self.mark_row_dirty(row)
 
-    # set the various fields on the NoteStatus
+    # set the various fields of a note
 
     def set_source_text(self, note_id, source_text):
-        self.note_status_map[note_id].source_text = source_text
-        self.notify_change(note_id)
+        row = self.note_id_map[note_id]
+        self.store_text(row, 0, source_text)
+        self.mark_row_dirty(row)
 
     def set_processed_text(self, note_id, processed_text):
-        self.note_status_map[note_id].processed_text = processed_text
-        self.notify_change(note_id)
+        row = self.note_id_map[note_id]
+        self.store_text(row, 1, processed_text)
+        self.mark_row_dirty(row)
 
     def set_sound_file(self, note_id, sound_file):
-        self.note_status_map[note_id].sound_file = sound_file
-        self.notify_change(note_id)
+        row = self.note_id_map[note_id]
+        self.sound_file_array[row] = sound_file
+        self.mark_row_dirty(row)
 
     def set_status(self, note_id, status):
-        self.note_status_map[note_id].status = status
-        self.notify_change(note_id)
+        row = self.note_id_map[note_id]
+        self.status_array[row] = STATUS_INDEX[status]
+        self.mark_row_dirty(row)
+
+    # change notifications
 
     def notify_start(self):
         self.change_listener.batch_start()
 
     def notify_change(self, note_id):
         row = self.note_id_map[note_id]
+        self.mark_row_dirty(row)
         self.change_listener.batch_change(note_id, row)
 
     def notify_end(self, completed):
-        self.change_listener.batch_end(completed)
\ No newline at end of file
+        self.flush_changes()
+        self.change_listener.batch_end(completed)
+
+    def mark_row_dirty(self, row):
+        with self.notify_lock:
+            if self.dirty_first_row == None:
+                self.dirty_first_row = row
+                self.dirty_last_row = row
+            else:
+                self.dirty_first_row = min(self.dirty_first_row, row)
+                self.dirty_last_row = max(self.dirty_last_row, row)
+            delay = self.last_flush_time + constants.BATCH_STATUS_NOTIFY_INTERVAL_SECONDS - time.monotonic()
+            if delay > 0:
+                # we told the listener recently, tell it about this change a bit later, along with the next ones
+                if self.flush_timer == None:
+                    self.flush_timer = threading.Timer(delay, self.flush_changes)
+                    self.flush_timer.daemon = True
+                    self.flush_timer.start()
+                return
+        self.flush_changes()
+
+    def flush_changes(self):
+        with self.notify_lock:
+            if self.flush_timer != None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if self.dirty_first_row == None:
+                return
+            first_row = self.dirty_first_row
+            last_row = self.dirty_last_row
+            self.dirty_first_row = None
+            self.dirty_last_row = None
+            self.last_flush_time = time.monotonic()
+        self.change_listener.batch_rows_changed(first_row, last_row)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+offline benchmark, runs the batch, realtime and batch preview code paths against synthetic decks, using the
+test services as a stand-in for the TTS services. latency, jitter and errors are injected into ServiceA.
+results are written as json, so that they can be diffed between releases.
+
+usage: python benchmark.py [--sizes 1000,10000,100000] [--latency 0.01] [--jitter 0.005]
+                           [--errors AudioNotFoundError=0.01,RequestError=0.005] [--duplicates 0.2]
+                           [--concurrency 8] [--realtime-count 1000] [--trace-memory] [--output results.json]
+
+note: RateLimitedError makes the rate limiter back off (RATE_LIMIT_BACKOFF_INITIAL_SECONDS and up), so even a
+small rate of it slows the batch down a lot, which is the point of injecting it.
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+
+if not hasattr(sys, '_addon_import_level_base'):
+    # running standalone, import the addon modules the same way the tests do
+    sys._pytest_mode = True
+    sys._addon_import_level_base = 0
+    sys._addon_import_level_services = 0
+
+import testing_utils
+import config_models
+import constants
+import errors
+import batch_status
+import audio_cache
+import metrics
+import startup_profiler
+import version
+
+
+BENCHMARK_FORMAT_VERSION = 1
+FIRST_NOTE_ID = 1000000
+
+ERROR_FACTORIES = {
+    'AudioNotFoundError': lambda source_text, voice: errors.AudioNotFoundError(source_text, voice),
+    'RequestError': lambda source_text, voice: errors.RequestError(source_text, voice, 'synthetic error'),
+    'RateLimitedError': lambda source_text, voice: errors.RateLimitedError(source_text, voice, 'synthetic 429'),
+}
+
+def parse_error_rates(errors_str):
+    """AudioNotFoundError=0.01,RequestError=0.005 -> [('AudioNotFoundError', 0.01), ('RequestError', 0.005)]"""
+    error_rates = []
+    if errors_str == None or len(errors_str) == 0:
+        return error_rates
+    for entry in errors_str.split(','):
+        error_name, rate = entry.split('=')
+        if error_name not in ERROR_FACTORIES:
+            raise ValueError(f'unknown error type {error_name}, choose from {", ".join(ERROR_FACTORIES.keys())}')
+        error_rates.append((error_name, float(rate)))
+    return error_rates
+
+class InjectedFaults():
+    """replaces the get_tts_audio of a service, adding latency, jitter and errors"""
+
+    def __init__(self, service, latency_seconds, jitter_seconds, error_rates, seed):
+        self.service_get_tts_audio = service.get_tts_audio
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rates = error_rates
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        service.get_tts_audio = self.get_tts_audio
+
+    def get_tts_audio(self, source_text, voice, options):
+        with self.lock:
+            delay_seconds = self.latency_seconds
+            if self.jitter_seconds > 0:
+                delay_seconds = max(0.0, self.random.gauss(self.latency_seconds, self.jitter_seconds))
+            draw = self.random.random()
+        if delay_seconds > 0:
+            time.sleep(delay_seconds)
+        cumulative_rate = 0.0
+        for error_name, rate in self.error_rates:
+            cumulative_rate += rate
+            if draw < cumulative_rate:
+                raise ERROR_FACTORIES[error_name](source_text, voice)
+        return self.service_get_tts_audio(source_text, voice, options)
+
+class Benchmark():
+    def __init__(self, options):
+        self.options = options
+        self.config_gen = testing_utils.TestConfigGenerator()
+
+    # setup
+    # =====
+
+    def build_hypertts_instance(self, user_files_dir):
+        hypertts_instance = self.config_gen.build_hypertts_instance_test_servicemanager('default')
+        hypertts_instance.anki_utils.user_files_dir = user_files_dir
+        hypertts_instance.audio_cache = audio_cache.AudioCache(user_files_dir)
+        configuration = config_models.Configuration()
+        configuration.set_service_enabled('ServiceA', True)
+        configuration.set_service_enabled('ServiceB', True)
+        configuration.set_service_configuration_key('ServiceA', constants.SERVICE_CONFIG_CONCURRENCY, self.options.concurrency)
+        hypertts_instance.service_manager.configure(configuration)
+        InjectedFaults(hypertts_instance.service_manager.get_service('ServiceA'),
+            self.options.latency, self.options.jitter, self.options.error_rates, self.options.seed)
+        return hypertts_instance
+
+    def build_deck(self, hypertts_instance, size):
+        """size notes, a fraction of them (options.duplicates) repeat the text of an earlier note"""
+        config_gen = self.config_gen
+        unique_count = max(1, int(round(size * (1.0 - self.options.duplicates))))
+        notes_by_id = {}
+        for i in range(size):
+            note_id = FIRST_NOTE_ID + i
+            notes_by_id[note_id] = testing_utils.MockNote(note_id, config_gen.model_id, {
+                config_gen.field_chinese: f'synthetic sentence {i % unique_count}',
+                config_gen.field_english: f'english {i}',
+                config_gen.field_sound: '',
+                config_gen.field_pinyin: ''
+            }, config_gen.all_fields, config_gen.model_chinese)
+        hypertts_instance.anki_utils.notes_by_id = notes_by_id
+        hypertts_instance.anki_utils.notes = {config_gen.deck_id: {config_gen.model_id: notes_by_id}}
+        return list(notes_by_id.keys())
+
+    def get_voice_selection(self, hypertts_instance):
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        voice_selection = config_models.VoiceSelectionSingle()
+        voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+        return voice_selection
+
+    def build_batch(self, hypertts_instance):
+        batch = config_models.BatchConfig()
+        batch.set_source(config_models.BatchSourceSimple(self.config_gen.field_chinese))
+        batch.set_target(config_models.BatchTarget(self.config_gen.field_sound, False, True))
+        batch.set_voice_selection(self.get_voice_selection(hypertts_instance))
+        batch.set_text_processing(config_models.TextProcessing())
+        return batch
+
+    def get_realtime_tts_tag_args(self, hypertts_instance):
+        front = config_models.RealtimeConfigSide()
+        front.side_enabled = True
+        source = config_models.RealtimeSourceAnkiTTS()
+        source.field_name = self.config_gen.field_chinese
+        source.field_type = constants.AnkiTTSFieldType.Regular
+        front.source = source
+        front.text_processing = config_models.TextProcessing()
+        front.voice_selection = self.get_voice_selection(hypertts_instance)
+        realtime_config = config_models.RealtimeConfig()
+        realtime_config.front = front
+        realtime_config.back = config_models.RealtimeConfigSide()
+        settings_key = hypertts_instance.save_realtime_config(realtime_config, None)
+        return [f'{constants.TTS_TAG_HYPERTTS_PRESET}=Front_{settings_key}']
+
+    # measurement
+    # ===========
+
+    def measure(self, hypertts_instance, scenario_fn):
+        hypertts_instance.reset_metrics()
+        if self.options.trace_memory:
+            tracemalloc.start()
+        start_time = time.monotonic()
+        result = scenario_fn()
+        result['seconds'] = time.monotonic() - start_time
+        if self.options.trace_memory:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result['traced_peak_memory_bytes'] = peak_bytes
+        result['process_peak_memory_bytes'] = startup_profiler.get_peak_memory_bytes()
+        service_metrics = hypertts_instance.get_metrics()
+        result['requests'] = service_metrics['counters'].get(metrics.REQUESTS, {}).get('ServiceA', 0)
+        result['request_errors'] = service_metrics['counters'].get(metrics.ERRORS, {}).get('ServiceA', {})
+        result['request_latency'] = service_metrics['histograms'].get(metrics.LATENCY, {}).get('ServiceA', metrics.Histogram().snapshot())
+        result['max_in_flight'] = service_metrics['gauges'].get(metrics.IN_FLIGHT, {}).get('ServiceA', metrics.Gauge().snapshot())['max']
+        result['audio_cache'] = service_metrics['audio_cache']
+        return result
+
+    def get_status_counts(self, batch_status_obj):
+        status_counts = {}
+        for row in range(len(batch_status_obj)):
+            status_name = batch_status_obj[row].status.name
+            status_counts[status_name] = status_counts.get(status_name, 0) + 1
+        return status_counts
+
+    # scenarios
+    # =========
+
+    def run_populate(self, hypertts_instance, note_id_list, batch):
+        def populate():
+            batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+            hypertts_instance.populate_batch_status_processed_text(note_id_list, batch.source, batch.text_processing, batch_status_obj)
+            return {'status_counts': self.get_status_counts(batch_status_obj)}
+        result = self.measure(hypertts_instance, populate)
+        result['notes_per_second'] = len(note_id_list) / max(result['seconds'], 1e-9)
+        return result
+
+    def run_batch(self, hypertts_instance, note_id_list, batch):
+        def process():
+            batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+            hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+            return {'status_counts': self.get_status_counts(batch_status_obj)}
+        result = self.measure(hypertts_instance, process)
+        result['notes_per_second'] = len(note_id_list) / max(result['seconds'], 1e-9)
+        return result
+
+    def run_realtime(self, hypertts_instance, note_id_list, other_args):
+        notes_by_id = hypertts_instance.anki_utils.notes_by_id
+        note_id_list = note_id_list[:self.options.realtime_count]
+        def play():
+            call_latency = metrics.Histogram()
+            error_count = 0
+            for note_id in note_id_list:
+                tts_tag = testing_utils.MockTTSTag(notes_by_id[note_id][self.config_gen.field_chinese], other_args)
+                start_time = time.monotonic()
+                try:
+                    hypertts_instance.get_audio_filename_tts_tag(tts_tag)
+                except errors.HyperTTSError:
+                    error_count += 1
+                call_latency.observe(time.monotonic() - start_time)
+            return {'calls': len(note_id_list), 'errors': error_count, 'call_latency': call_latency.snapshot()}
+        result = self.measure(hypertts_instance, play)
+        result['calls_per_second'] = result['calls'] / max(result['seconds'], 1e-9)
+        return result
+
+    def run_size(self, size):
+        user_files_dir = tempfile.mkdtemp(prefix='hypertts-benchmark-')
+        try:
+            hypertts_instance = self.build_hypertts_instance(user_files_dir)
+            note_id_list = self.build_deck(hypertts_instance, size)
+            batch = self.build_batch(hypertts_instance)
+            results = {'size': size}
+            results['populate'] = self.run_populate(hypertts_instance, note_id_list, batch)
+            logging.info(f'{size} notes: populate done')
+            # the second run finds the audio in the cache
+            results['batch_cold'] = self.run_batch(hypertts_instance, note_id_list, batch)
+            results['batch_warm'] = self.run_batch(hypertts_instance, note_id_list, batch)
+            logging.info(f'{size} notes: batch done')
+            # realtime requests go to a different user_files directory, so that they don't hit the batch's audio
+            realtime_user_files_dir = os.path.join(user_files_dir, 'realtime')
+            os.mkdir(realtime_user_files_dir)
+            hypertts_instance.anki_utils.user_files_dir = realtime_user_files_dir
+            hypertts_instance.audio_cache = audio_cache.AudioCache(realtime_user_files_dir)
+            other_args = self.get_realtime_tts_tag_args(hypertts_instance)
+            results['realtime_cold'] = self.run_realtime(hypertts_instance, note_id_list, other_args)
+            results['realtime_warm'] = self.run_realtime(hypertts_instance, note_id_list, other_args)
+            logging.info(f'{size} notes: realtime done')
+            return results
+        finally:
+            shutil.rmtree(user_files_dir, ignore_errors=True)
+
+    def run(self):
+        return {
+            'version': BENCHMARK_FORMAT_VERSION,
+            'hypertts_version': version.ANKI_HYPER_TTS_VERSION,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'parameters': {
+                'latency': self.options.latency,
+                'jitter': self.options.jitter,
+                'errors': dict(self.options.error_rates),
+                'duplicates': self.options.duplicates,
+                'concurrency': self.options.concurrency,
+                'realtime_count': self.options.realtime_count,
+                'seed': self.options.seed
+            },
+            'results': [self.run_size(size) for size in self.options.sizes]
+        }
+
+def parse_options(argv):
+    parser = argparse.ArgumentParser(description='HyperTTS offline benchmark')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='comma separated number of notes in each synthetic deck')
+    parser.add_argument('--latency', type=float, default=0.01, help='average seconds per audio request')
+    parser.add_argument('--jitter', type=float, default=0.005, help='standard deviation of the request latency, in seconds')
+    parser.add_argument('--errors', default='AudioNotFoundError=0.01', help='error type=rate, comma separated')
+    parser.add_argument('--duplicates', type=float, default=0.2, help='fraction of notes which repeat an earlier text')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent requests allowed to ServiceA')
+    parser.add_argument('--realtime-count', type=int, default=1000, help='tts tags played in the realtime scenarios')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--trace-memory', action='store_true', help='measure peak python memory with tracemalloc, slower')
+    parser.add_argument('--output', default=None, help='json file to write the results to, stdout by default')
+    parser.add_argument('--verbose', action='store_true')
+    options = parser.parse_args(argv)
+    options.sizes = [int(size) for size in options.sizes.split(',')]
+    options.error_rates = parse_error_rates(options.errors)
+    return options
+
+def main():
+    options = parse_options(sys.argv[1:])
+    if options.verbose:
+        logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s', level=logging.INFO)
+    else:
+        logging.disable(logging.CRITICAL)
+    results = Benchmark(options).run()
+    if options.output != None:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+builds services/voicelist.dat from a python file containing the VOICE_LIST literal, as exported from
+cloud language tools.
+
+usage: python build_voicelist.py <voicelist source .py> [<output .dat>]
+
+file format:
+- first line: json header with the version, the gender, language and option tables, and for each service
+  the byte offset and length of its section in the body
+- body: for each service, a json array of [name, gender index, language index, voice key, options index]
+"""
+
+import sys
+import os
+import json
+import runpy
+
+
+VOICELIST_FORMAT_VERSION = 1
+
+def get_table(values):
+    # sorted, so that the file only depends on which voices there are, not on their order
+    table_map = {json.dumps(value, sort_keys=True): value for value in values}
+    keys = sorted(table_map.keys())
+    return [table_map[key] for key in keys], {key: index for index, key in enumerate(keys)}
+
+def get_index(index_map, value):
+    return index_map[json.dumps(value, sort_keys=True)]
+
+def build_voicelist(voice_list):
+    genders, gender_index_map = get_table([voice_entry['gender'] for voice_entry in voice_list])
+    languages, language_index_map = get_table([voice_entry['language'] for voice_entry in voice_list])
+    # voices with identical options share one entry, and one dict once loaded
+    options, options_index_map = get_table([voice_entry['options'] for voice_entry in voice_list])
+
+    entries_by_service = {}
+    for voice_entry in sorted(voice_list, key=lambda voice_entry: voice_entry['service']):
+        entries_by_service.setdefault(voice_entry['service'], []).append([
+            voice_entry['name'],
+            get_index(gender_index_map, voice_entry['gender']),
+            get_index(language_index_map, voice_entry['language']),
+            voice_entry['key'],
+            get_index(options_index_map, voice_entry['options'])
+        ])
+
+    body = b''
+    sections = {}
+    for service_name, entries in entries_by_service.items():
+        section = json.dumps(entries, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        sections[service_name] = [len(body), len(section)]
+        body += section
+
+    header = {
+        'version': VOICELIST_FORMAT_VERSION,
+        'genders': genders,
+        'languages': languages,
+        'options': options,
+        'services': sections
+    }
+    return json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n' + body
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    source_path = sys.argv[1]
+    addon_dir = os.path.dirname(os.path.realpath(__file__))
+    output_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(addon_dir, 'services', 'voicelist.dat')
+    voice_list = runpy.run_path(source_path)['VOICE_LIST']
+    data = build_voicelist(voice_list)
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    print(f'wrote {len(voice_list)} voices to {output_path} ({len(data)} bytes)')
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
 import sys
 import os
+import io
+import time
+import hashlib
 import logging
 import requests
 import json
@@ -7,18 +10,107 @@ import json
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_base)
 version = __import__('version', globals(), locals(), [], sys._addon_import_level_base)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+rate_limiter = __import__('rate_limiter', globals(), locals(), [], sys._addon_import_level_base)
 
 if hasattr(sys, '_sentry_crash_reporting'):
     import sentry_sdk
 
+class BulkResponseReader():
+    """reads the frames of a bulk response out of the streamed chunks"""
+
+    def __init__(self, response):
+        self.chunks = response.iter_content(chunk_size=constants.AUDIO_STREAM_CHUNK_SIZE)
+        self.buffer = b''
+
+    def fill(self):
+        chunk = next(self.chunks, None)
+        if chunk == None:
+            return False
+        self.buffer += chunk
+        return True
+
+    def readline(self):
+        while b'\n' not in self.buffer:
+            if not self.fill():
+                line, self.buffer = self.buffer, b''
+                return line
+        end = self.buffer.index(b'\n') + 1
+        line, self.buffer = self.buffer[:end], self.buffer[end:]
+        return line
+
+    def read(self, size):
+        if len(self.buffer) == 0 and not self.fill():
+            return b''
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
 class CloudLanguageTools():
     def __init__(self):
         self.base_url = os.environ.get('ANKI_LANGUAGE_TOOLS_BASE_URL', 'https://cloud-language-tools-tts-prod.anki.study')
+        self.http_session = requests.Session()
+        # RequestJournal, None unless running within anki
+        self.request_journal = None
+        # set to False once the server tells us it doesn't know about bulk requests
+        self.bulk_audio_supported = True
+
+    def set_http_session(self, http_session):
+        self.http_session = http_session
+
+    def set_request_journal(self, request_journal):
+        self.request_journal = request_journal
 
     def configure(self, api_key):
         self.api_key = api_key
 
     def get_tts_audio(self, source_text, voice, options, audio_request_context):
+        output_file = io.BytesIO()
+        self.write_tts_audio(source_text, voice, options, audio_request_context, output_file)
+        return output_file.getvalue()
+
+    def write_tts_audio(self, source_text, voice, options, audio_request_context, output_file):
+        # the audio goes to output_file as it arrives, it's never held in memory in full
+        start_time = time.monotonic()
+        result_hash = hashlib.sha224()
+        size = 0
+        try:
+            response = self.request_tts_audio(source_text, voice, options, audio_request_context, True)
+            with response:
+                for chunk in response.iter_content(chunk_size=constants.AUDIO_STREAM_CHUNK_SIZE):
+                    output_file.write(chunk)
+                    result_hash.update(chunk)
+                    size += len(chunk)
+        except Exception as e:
+            self.journal_request(source_text, voice, options, audio_request_context, start_time, None, None, e)
+            raise e
+        self.journal_request(source_text, voice, options, audio_request_context, start_time, size, result_hash.hexdigest(), None)
+
+    def get_request_data(self, source_text, voice, options, audio_request_context):
+        return {
+            'text': source_text,
+            'service': voice.service.name,
+            'request_mode': audio_request_context.get_request_mode().name,
+            'language_code': voice.language.lang.name,
+            'voice_key': voice.voice_key,
+            'options': options
+        }
+
+    def journal_request(self, source_text, voice, options, audio_request_context, start_time, size, result_hash, exception):
+        if self.request_journal == None:
+            return
+        entry = {
+            'version': constants.REQUEST_JOURNAL_VERSION,
+            'time': time.time(),
+            'request': self.get_request_data(source_text, voice, options, audio_request_context),
+            'latency_seconds': time.monotonic() - start_time,
+            'size': size,
+            'result_hash': result_hash
+        }
+        if exception != None:
+            entry['error'] = type(exception).__name__
+            entry['error_message'] = str(exception)
+        self.request_journal.record(entry)
+
+    def request_tts_audio(self, source_text, voice, options, audio_request_context, stream):
         if hasattr(sys, '_sentry_crash_reporting'):
             sentry_sdk.set_user({"id": f'api_key:{self.api_key}'})
             sentry_sdk.set_context("user", {
@@ -28,28 +120,110 @@ class CloudLanguageTools():
         # query cloud language tools API
         url_path = '/audio_v2'
         full_url = self.base_url + url_path
-        data = {
-            'text': source_text,
-            'service': voice.service.name,
-            'request_mode': audio_request_context.get_request_mode().name,
-            'language_code': voice.language.lang.name,
-            'voice_key': voice.voice_key,
-            'options': options
-        }
+        data = self.get_request_data(source_text, voice, options, audio_request_context)
         logging.info(f'request url: {full_url}, data: {data}')
-        response = requests.post(full_url, json=data, headers={
+        response = self.http_session.post(full_url, json=data, headers=self.get_request_headers(),
+            timeout=constants.RequestTimeout, stream=stream)
+        self.check_response(response, source_text, voice)
+        return response
+
+    def get_request_headers(self):
+        return {
             'api_key': self.api_key, 
             'client': 'hypertts', 
-            'client_version': version.ANKI_HYPER_TTS_VERSION},
-            timeout=constants.RequestTimeout)
+            'client_version': version.ANKI_HYPER_TTS_VERSION}
 
+    def check_response(self, response, source_text, voice):
         if response.status_code == 200:
-            return response.content
+            return
+        elif response.status_code == 429:
+            error_message = f"Status code: {response.status_code} ({response.content})"
+            raise errors.RateLimitedError(source_text, voice, error_message, rate_limiter.get_retry_after(response))
         else:
             error_message = f"Status code: {response.status_code} ({response.content})"
             raise errors.RequestError(source_text, voice, error_message)    
 
+    # bulk requests
+    # =============
+
+    def write_tts_audio_bulk(self, audio_requests, audio_request_context):
+        """
+        requests the audio for a list of (source_text, voice, options, output_file) in one call to /audio_bulk_v2.
+        each entry of the requests array has the same fields as an /audio_v2 request. the response is streamed as
+        one frame per clip, in the order the server finishes them: a json header line
+        {"index": 0, "status": 200, "size": 1234} followed by size bytes of audio, or {"index": 1, "status": 500, "error": "..."}.
+        returns the exception (or None) for each request, or None if the server doesn't support bulk requests.
+        """
+        if not self.bulk_audio_supported:
+            return None
+        first_source_text, first_voice, _, _ = audio_requests[0]
+        bulk_source_text = f'{len(audio_requests)} clips starting with {first_source_text}'
+        full_url = self.base_url + '/audio_bulk_v2'
+        data = {
+            'requests': [self.get_request_data(source_text, voice, options, audio_request_context)
+                for source_text, voice, options, output_file in audio_requests]
+        }
+        logging.info(f'request url: {full_url}, {len(audio_requests)} clips')
+        start_time = time.monotonic()
+        response = self.http_session.post(full_url, json=data, headers=self.get_request_headers(),
+            timeout=constants.RequestTimeout, stream=True)
+        if response.status_code in [404, 405]:
+            logging.info(f'bulk audio requests not supported by {self.base_url}, requesting clips one by one')
+            self.bulk_audio_supported = False
+            response.close()
+            return None
+        self.check_response(response, bulk_source_text, first_voice)
+
+        exceptions = [None] * len(audio_requests)
+        # indices of the clips the server answered for
+        received = set()
+        read_exception = None
+        with response:
+            try:
+                self.read_bulk_response(response, audio_requests, audio_request_context, start_time, exceptions, received)
+            except Exception as e:
+                logging.warning(f'could not read bulk response: {e}')
+                read_exception = e
+        for index, (source_text, voice, options, output_file) in enumerate(audio_requests):
+            if index not in received:
+                # the connection broke off before we got this clip
+                exceptions[index] = read_exception
+                if read_exception == None:
+                    exceptions[index] = errors.RequestError(source_text, voice, 'missing from bulk response')
+        return exceptions
+
+    def read_bulk_response(self, response, audio_requests, audio_request_context, start_time, exceptions, received):
+        reader = BulkResponseReader(response)
+        while True:
+            header_line = reader.readline()
+            if len(header_line) == 0:
+                return
+            header = json.loads(header_line)
+            index = header['index']
+            source_text, voice, options, output_file = audio_requests[index]
+            if header['status'] != 200:
+                error_message = f"Status code: {header['status']} ({header.get('error', '')})"
+                if header['status'] == 429:
+                    exception = errors.RateLimitedError(source_text, voice, error_message)
+                else:
+                    exception = errors.RequestError(source_text, voice, error_message)
+                exceptions[index] = exception
+                received.add(index)
+                self.journal_request(source_text, voice, options, audio_request_context, start_time, None, None, exception)
+                continue
+            result_hash = hashlib.sha224()
+            remaining = header['size']
+            while remaining > 0:
+                chunk = reader.read(remaining)
+                if len(chunk) == 0:
+                    raise errors.RequestError(source_text, voice, 'bulk response ended in the middle of a clip')
+                output_file.write(chunk)
+                result_hash.update(chunk)
+                remaining -= len(chunk)
+            received.add(index)
+            self.journal_request(source_text, voice, options, audio_request_context, start_time, header['size'], result_hash.hexdigest(), None)
+
     def account_info(self, api_key):
-        response = requests.get(self.base_url + '/account', headers={'api_key': api_key})
+        response = self.http_session.get(self.base_url + '/account', headers={'api_key': api_key})
         data = json.loads(response.content)
         return data
\ No newline at end of file
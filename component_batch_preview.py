@@ -1,13 +1,15 @@
 import sys
 import logging
 import aqt.qt
-import time
+import json
 import html
+import threading
 
 
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
 component_common = __import__('component_common', globals(), locals(), [], sys._addon_import_level_base)
 batch_status = __import__('batch_status', globals(), locals(), [], sys._addon_import_level_base)
+batch_planner = __import__('batch_planner', globals(), locals(), [], sys._addon_import_level_base)
 
 
 class BatchPreviewTableModel(aqt.qt.QAbstractTableModel):
@@ -30,9 +32,9 @@ class BatchPreviewTableModel(aqt.qt.QAbstractTableModel):
         # logging.debug('SourceTextPreviewTableModel.columnCount')
         return 4
     
-    def notifyChange(self, row):
-        start_index = self.createIndex(row, 0)
-        end_index = self.createIndex(row, 2)
+    def notifyChange(self, first_row, last_row):
+        start_index = self.createIndex(first_row, 0)
+        end_index = self.createIndex(last_row, 3)
         self.dataChanged.emit(start_index, end_index, [aqt.qt.Qt.ItemDataRole.DisplayRole])
 
     def data(self, index, role):
@@ -77,32 +79,137 @@ class BatchPreview(component_common.ComponentBase):
         self.batch_start_fn = batch_start_fn
         self.batch_end_fn = batch_end_fn
 
-        self.batch_status = batch_status.BatchStatus(hypertts.anki_utils, note_id_list, self)
+        self.batch_status = batch_status.BatchStatus(hypertts.anki_utils, note_id_list, self, self.get_note_text)
         self.batch_preview_table_model = BatchPreviewTableModel(self.batch_status)
 
         # create certain widgets right away
         self.stack = aqt.qt.QStackedWidget()
         self.progress_bar = aqt.qt.QProgressBar()
         self.progress_bar.setMaximum(len(self.note_id_list))        
+        # shows the dry run of the batch: duplicates, cached audio, characters, estimated time
+        self.plan_label = aqt.qt.QLabel()
+        self.plan_label.setWordWrap(True)
+        self.batch_plan = None
+        # enabled when an earlier run of the same batch on the same notes got interrupted
+        self.resume_checkbox = aqt.qt.QCheckBox(constants.GUI_TEXT_BATCH_RESUME)
+        self.resume_checkbox.setEnabled(False)
+        self.resume_batch = False
 
         self.selected_row = None
 
         self.apply_to_notes_batch_started = False
 
+        # only one task at a time works on the batch status, a new task stops the running one and waits for it
+        self.batch_status_lock = threading.Lock()
+        # incremented on each model change, tasks for older models give up
+        self.model_generation = 0
+        # source and text processing settings of the texts currently in the batch status, None if incomplete
+        self.populated_text_key = None
+
     def load_model(self, model):
         self.batch_model = model
-        self.hypertts.anki_utils.run_in_background(self.update_batch_status_task, self.update_batch_status_task_done)
-
-    def update_batch_status_task(self):
-        if self.batch_status.is_running():
-            # stop current batch
-            self.batch_status.stop()
-        while self.batch_status.is_running():
-            time.sleep(0.1)
-
-        logging.info('update_batch_status_task')
-        if self.batch_model.text_processing != None:
-            self.hypertts.populate_batch_status_processed_text(self.note_id_list, self.batch_model.source, self.batch_model.text_processing, self.batch_status)
+        self.model_generation += 1
+        generation = self.model_generation
+        text_key = self.get_text_key(model)
+        visible_rows = self.get_visible_rows()
+        self.hypertts.anki_utils.run_in_background(lambda: self.update_batch_status_task(generation, text_key, visible_rows), 
+            self.update_batch_status_task_done)
+
+    def get_text_key(self, model):
+        if model.source == None or model.text_processing == None:
+            return None
+        return json.dumps([model.source.serialize(), model.text_processing.serialize()], sort_keys=True)
+
+    def get_visible_rows(self):
+        # rows shown in the table right now, they get their text first
+        if not hasattr(self, 'table_view'):
+            return range(0)
+        row_count = len(self.note_id_list)
+        first_row = max(self.table_view.rowAt(0), 0)
+        last_row = self.table_view.rowAt(self.table_view.viewport().height() - 1)
+        if last_row < 0:
+            last_row = row_count - 1
+        return range(first_row, min(last_row + 1, row_count))
+
+    def update_batch_status_task(self, generation, text_key, visible_rows):
+        # stop whatever is running, the lock lets us know when it's done
+        self.batch_status.stop()
+        with self.batch_status_lock:
+            if generation != self.model_generation:
+                # the model changed again in the meantime, a newer task will take care of it
+                return
+            logging.info('update_batch_status_task')
+            if text_key == None:
+                return
+            if text_key != self.populated_text_key:
+                # the source or text processing changed, recompute the text of every row, and plan the batch along the way
+                self.populated_text_key = None
+                planner = batch_planner.BatchPlanner(self.hypertts)
+                plan_builder = planner.get_plan_builder(self.batch_model.voice_selection)
+                self.populate_processed_text(visible_rows, plan_builder)
+                if not self.batch_status.must_continue:
+                    return
+                self.populated_text_key = text_key
+                self.set_batch_plan(plan_builder.get_plan())
+            # otherwise only the voice selection or target changed, the texts are still good
+            elif not self.update_batch_plan(generation):
+                return
+            self.update_resume_option()
+
+    def populate_processed_text(self, visible_rows, plan_builder):
+        # visible rows first, then the others
+        visible_row_set = set(visible_rows)
+        row_order = list(visible_rows) + [row for row in range(len(self.note_id_list)) if row not in visible_row_set]
+        note_id_list = [self.note_id_list[row] for row in row_order]
+        self.hypertts.populate_batch_status_processed_text(note_id_list, 
+            self.batch_model.source, self.batch_model.text_processing, self.batch_status, plan_builder)
+
+    def get_note_text(self, note_id):
+        # the batch status only keeps the text of recently used rows, this recomputes the others when they get displayed
+        note = self.hypertts.anki_utils.get_note_by_id(note_id)
+        return self.hypertts.get_source_processed_text(note, self.batch_model.source, self.batch_model.text_processing)
+
+    def iterate_processed_text(self, generation):
+        # the texts aren't all kept in memory, the ones the batch status dropped get recomputed
+        for row in range(len(self.note_id_list)):
+            if generation != self.model_generation:
+                return
+            status = self.batch_status.get_status(row)
+            if status != constants.BatchNoteStatus.OK:
+                yield None
+                continue
+            try:
+                processed_text = self.batch_status.get_processed_text(row)
+            except Exception as e:
+                logging.info(f'could not get text for row {row}: {e}')
+                processed_text = None
+            yield processed_text
+
+    def update_batch_plan(self, generation):
+        """returns False if the model changed while planning"""
+        planner = batch_planner.BatchPlanner(self.hypertts)
+        batch_plan = planner.plan_processed_texts(self.iterate_processed_text(generation), self.batch_model.voice_selection)
+        if generation != self.model_generation:
+            return False
+        self.set_batch_plan(batch_plan)
+        return True
+
+    def set_batch_plan(self, batch_plan):
+        self.batch_plan = batch_plan
+        summary = self.batch_plan.summary()
+        self.hypertts.anki_utils.run_on_main(lambda: self.plan_label.setText(summary))
+
+    def update_resume_option(self):
+        journal = self.hypertts.get_batch_journal(self.note_id_list, self.batch_model)
+        done_count = journal.get_done_count()
+        def update():
+            if done_count > 0:
+                self.resume_checkbox.setText(f'{constants.GUI_TEXT_BATCH_RESUME} ({done_count} notes already done)')
+            else:
+                self.resume_checkbox.setText(constants.GUI_TEXT_BATCH_RESUME)
+            self.resume_checkbox.setEnabled(done_count > 0)
+            self.resume_checkbox.setChecked(done_count > 0)
+        self.hypertts.anki_utils.run_on_main(update)
 
     def update_batch_status_task_done(self, result):
         logging.info('update_batch_status_task_done')
@@ -130,6 +237,8 @@ class BatchPreview(component_common.ComponentBase):
 
         # populate the "notRunning" stack
         notRunningLayout = aqt.qt.QVBoxLayout()
+        notRunningLayout.addWidget(self.plan_label)
+        notRunningLayout.addWidget(self.resume_checkbox)
         self.batchNotRunningStack.setLayout(notRunningLayout)
 
         # poulate the "running" stack
@@ -196,6 +305,7 @@ class BatchPreview(component_common.ComponentBase):
 
     def apply_audio_to_notes(self):
         self.apply_to_notes_batch_started = True
+        self.resume_batch = self.resume_checkbox.isEnabled() and self.resume_checkbox.isChecked()
         self.hypertts.anki_utils.run_in_background(self.load_audio_task, self.load_audio_task_done)
 
     def stop_button_pressed(self):
@@ -203,7 +313,11 @@ class BatchPreview(component_common.ComponentBase):
 
     def load_audio_task(self):
         logging.info('load_audio_task')
-        self.hypertts.process_batch_audio(self.note_id_list, self.batch_model, self.batch_status)
+        self.batch_status.stop()
+        with self.batch_status_lock:
+            # the rows will show the batch results, not the preview texts
+            self.populated_text_key = None
+            self.hypertts.process_batch_audio(self.note_id_list, self.batch_model, self.batch_status, resume=self.resume_batch)
 
     def load_audio_task_done(self, result):
         logging.info('load_audio_task_done')
@@ -218,6 +332,9 @@ class BatchPreview(component_common.ComponentBase):
             self.hypertts.anki_utils.run_on_main(self.show_completed_stack)
         else:
             self.hypertts.anki_utils.run_on_main(self.show_not_running_stack)
+        if self.apply_to_notes_batch_started and not completed:
+            # the batch can be resumed from where it stopped
+            self.update_resume_option()
         if self.apply_to_notes_batch_started:
             self.batch_end_fn(completed)
 
@@ -225,8 +342,14 @@ class BatchPreview(component_common.ComponentBase):
         self.progress_bar.setValue(row + 1)
 
     def batch_change(self, note_id, row):
-        # logging.info(f'change_listener row {row}')
-        self.batch_preview_table_model.notifyChange(row)
-        self.hypertts.anki_utils.run_on_main(lambda: self.update_progress_bar(row))
-        if row == self.selected_row:
-            self.hypertts.anki_utils.run_on_main(self.update_error_label_for_selected)
\ No newline at end of file
+        # the GUI gets updated in batch_rows_changed, for many rows at a time
+        pass
+
+    def batch_rows_changed(self, first_row, last_row):
+        self.hypertts.anki_utils.run_on_main(lambda: self.update_changed_rows(first_row, last_row))
+
+    def update_changed_rows(self, first_row, last_row):
+        self.batch_preview_table_model.notifyChange(first_row, last_row)
+        self.update_progress_bar(last_row)
+        if self.selected_row != None and first_row <= self.selected_row <= last_row:
+            self.update_error_label_for_selected()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from pydoc import describe
 import sys
+import os
 import aqt.qt
 import webbrowser
 import logging
@@ -8,6 +9,7 @@ component_common = __import__('component_common', globals(), locals(), [], sys._
 config_models = __import__('config_models', globals(), locals(), [], sys._addon_import_level_base)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
 gui_utils = __import__('gui_utils', globals(), locals(), [], sys._addon_import_level_base)
+metrics = __import__('metrics', globals(), locals(), [], sys._addon_import_level_base)
 
 
 class Configuration(component_common.ConfigComponentBase):
@@ -272,6 +274,17 @@ class Configuration(component_common.ConfigComponentBase):
         services_scroll_area.setWidget(services_widget)
         self.global_vlayout.addWidget(services_scroll_area, 1)
 
+        # request statistics
+        # ==================
+
+        self.draw_metrics(self.global_vlayout)
+
+        # startup profile
+        # ===============
+
+        if self.hypertts.startup_profiler != None:
+            self.draw_startup_profile(self.global_vlayout)
+
         # bottom buttons
         # ==============
 
@@ -299,6 +312,57 @@ class Configuration(component_common.ConfigComponentBase):
         layout.addLayout(self.global_vlayout)
 
 
+    def draw_metrics(self, layout):
+        groupbox = aqt.qt.QGroupBox('Statistics')
+        vlayout = aqt.qt.QVBoxLayout()
+        self.metrics_label = aqt.qt.QLabel()
+        self.metrics_label.setWordWrap(True)
+        vlayout.addWidget(self.metrics_label)
+        hlayout = aqt.qt.QHBoxLayout()
+        self.metrics_refresh_button = aqt.qt.QPushButton('Refresh')
+        self.metrics_reset_button = aqt.qt.QPushButton('Reset')
+        hlayout.addWidget(self.metrics_refresh_button)
+        hlayout.addWidget(self.metrics_reset_button)
+        hlayout.addStretch()
+        vlayout.addLayout(hlayout)
+        groupbox.setLayout(vlayout)
+        layout.addWidget(groupbox)
+        self.metrics_refresh_button.pressed.connect(self.update_metrics)
+        self.metrics_reset_button.pressed.connect(self.reset_metrics)
+        self.update_metrics()
+
+    def update_metrics(self):
+        self.metrics_label.setText(metrics.format_snapshot(self.hypertts.get_metrics()))
+
+    def reset_metrics(self):
+        self.hypertts.reset_metrics()
+        self.update_metrics()
+
+    def draw_startup_profile(self, layout):
+        groupbox = aqt.qt.QGroupBox('Startup Profile')
+        vlayout = aqt.qt.QVBoxLayout()
+        self.startup_profile_label = aqt.qt.QLabel(self.hypertts.startup_profiler.summary())
+        self.startup_profile_label.setWordWrap(True)
+        vlayout.addWidget(self.startup_profile_label)
+        hlayout = aqt.qt.QHBoxLayout()
+        self.startup_profile_save_button = aqt.qt.QPushButton(constants.GUI_TEXT_STARTUP_PROFILE_SAVE)
+        self.startup_profile_saved_label = aqt.qt.QLabel()
+        hlayout.addWidget(self.startup_profile_save_button)
+        hlayout.addWidget(self.startup_profile_saved_label, 1)
+        vlayout.addLayout(hlayout)
+        groupbox.setLayout(vlayout)
+        layout.addWidget(groupbox)
+        self.startup_profile_save_button.pressed.connect(self.save_startup_profile)
+
+    def get_startup_profile_filename(self):
+        return os.path.join(self.hypertts.anki_utils.get_user_files_dir(), constants.STARTUP_PROFILE_FILENAME)
+
+    def save_startup_profile(self):
+        with self.hypertts.error_manager.get_single_action_context('Saving Startup Profile'):
+            filename = self.get_startup_profile_filename()
+            self.hypertts.startup_profiler.save(filename)
+            self.startup_profile_saved_label.setText(f'saved to {filename}')
+
     def pro_api_key_entered(self):
         # get data for the API key in the background
         api_key = self.hypertts_pro_api_key.text()
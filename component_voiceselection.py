@@ -43,18 +43,13 @@ class VoiceSelection(component_common.ConfigComponentBase):
         self.preview_enabled = True
 
     def get_voices(self):
-        self.voice_list = self.hypertts.service_manager.full_voice_list()
+        self.voice_registry = self.hypertts.service_manager.get_voice_registry()
+        self.voice_list = self.voice_registry.voice_list
 
-        languages = set()
-        audio_languages = set()
-        services = set()
-        genders = set()
-
-        for voice in self.voice_list:
-            audio_languages.add(voice.language)
-            languages.add(voice.language.lang)
-            services.add(voice.service.name)
-            genders.add(voice.gender)
+        audio_languages = self.voice_registry.get_audio_languages()
+        languages = self.voice_registry.get_languages()
+        services = self.voice_registry.get_services()
+        genders = self.voice_registry.get_genders()
 
         def get_name(entry):
             return entry.name
@@ -365,23 +360,19 @@ class VoiceSelection(component_common.ConfigComponentBase):
 
     def filter_and_draw_voices(self, current_index):
         logging.info('filter_and_draw_voices')
-        voice_list = self.voice_list
-        # check filtering by audio language
+        audio_language = None
+        language = None
+        service = None
+        gender = None
         if self.audio_languages_combobox.currentIndex() != 0:
             audio_language = self.audio_languages[self.audio_languages_combobox.currentIndex() - 2]
-            voice_list = [voice for voice in voice_list if voice.language == audio_language]
-        # check filtering by language
         if self.languages_combobox.currentIndex() != 0:
             language = self.languages[self.languages_combobox.currentIndex() - 2]
-            voice_list = [voice for voice in voice_list if voice.language.lang == language]
-        # check filtering by service
         if self.services_combobox.currentIndex() != 0:
             service = self.services[self.services_combobox.currentIndex() - 2]
-            voice_list = [voice for voice in voice_list if voice.service.name == service] 
-        # check filtering by gender
         if self.genders_combobox.currentIndex() != 0:
             gender = self.genders[self.genders_combobox.currentIndex() - 2]
-            voice_list = [voice for voice in voice_list if voice.gender == gender]
+        voice_list = self.voice_registry.filter_voices(audio_language=audio_language, language=language, service=service, gender=gender)
         self.filtered_voice_list = voice_list
         self.draw_all_voices(self.filtered_voice_list)
 
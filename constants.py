@@ -7,6 +7,93 @@ ENABLE_SENTRY_CRASH_REPORTING = True
 # requests related constants
 RequestTimeout = 15 # 15 seconds max
 
+# audio cache
+AUDIO_CACHE_INDEX_FILENAME = 'hypertts-audio-cache.json'
+AUDIO_CACHE_INDEX_VERSION = 1
+AUDIO_CACHE_MAX_SIZE_BYTES = 500 * 1024 * 1024 # 500mb
+AUDIO_CACHE_MAX_AGE_SECONDS = 90 * 24 * 3600 # 90 days
+AUDIO_CACHE_INDEX_SAVE_INTERVAL_SECONDS = 10
+AUDIO_FILE_FSYNC = True # make sure audio files are on disk before they get renamed into place
+AUDIO_STREAM_CHUNK_SIZE = 64 * 1024 # audio responses are written to disk in chunks of that size
+
+# concurrent batch processing
+SERVICE_CONFIG_CONCURRENCY = 'concurrency' # per-service configuration key
+BATCH_DEFAULT_CONCURRENCY = 1 # services send one request at a time unless they allow more
+BATCH_PREMIUM_CONCURRENCY = 4 # cloud services which handle parallel requests well
+CLOUDLANGUAGETOOLS_CONCURRENCY = 4
+CLOUDLANGUAGETOOLS_BULK_SIZE = 20 # clips per bulk request, when batches go through cloud-language-tools
+BATCH_MAX_WORKERS = 16
+BATCH_PENDING_PER_WORKER = 4 # how many notes we prepare ahead of the writer, per worker
+
+# rate limiting
+SERVICE_CONFIG_REQUESTS_PER_SECOND = 'requests_per_second' # per-service configuration key, 0 means no limit
+SERVICE_CONFIG_BURST = 'burst' # per-service configuration key
+SERVICE_CONFIG_THROTTLE_SECONDS = 'throttle_seconds' # legacy configuration key, migrated to requests_per_second on startup
+RATE_LIMIT_BACKOFF_INITIAL_SECONDS = 1.0
+RATE_LIMIT_BACKOFF_MAX_SECONDS = 60.0
+RATE_LIMIT_MIN_RATE_FRACTION = 0.05 # don't go below 5% of the configured rate when backing off
+RATE_LIMIT_RECOVERY_FRACTION = 0.05 # recover 5% of the configured rate on each successful request
+RATE_LIMIT_MAX_RETRIES = 3
+
+# http connection pools, defaults which can be overridden per service in the configuration
+HTTP_POOL_CONNECTIONS = 4 # number of hosts per service that we keep connections for
+HTTP_POOL_MAXSIZE = BATCH_MAX_WORKERS # connections kept alive per host
+SERVICE_CONFIG_HTTP_POOL_CONNECTIONS = 'http_pool_connections' # per-service configuration key
+SERVICE_CONFIG_HTTP_POOL_MAXSIZE = 'http_pool_maxsize' # per-service configuration key
+
+# review-ahead prefetching of realtime audio
+PREFETCH_CARD_COUNT = 5 # how many upcoming cards we look at
+PREFETCH_MAX_WORKERS = 2
+PREFETCH_MAX_PENDING = 20
+PREFETCH_MAX_TRACKED = 500 # remember that many prefetched tags, so that we don't submit them again
+
+# streaming playback of realtime audio, while it's still being downloaded
+STREAMING_PLAYBACK_ENABLED = True
+STREAMING_PLAYBACK_MIN_TEXT_LENGTH = 80 # shorter texts download in about the time it takes the player to start
+STREAMING_PLAYBACK_START_BYTES = 16 * 1024 # about one second of mp3 audio, enough for the player to detect the format
+STREAMING_MAX_WORKERS = 2
+
+# batch planning
+BATCH_PLAN_DEFAULT_LATENCY_SECONDS = 1.0 # used when we haven't seen any request for a service yet
+LATENCY_ESTIMATE_EWMA_WEIGHT = 0.2 # weight of the latest request in the latency estimate, older requests fade out
+
+# request metrics
+METRICS_HISTOGRAM_MIN_VALUE = 0.001 # seconds, upper bound of the first histogram bucket
+METRICS_HISTOGRAM_GROWTH = 1.15 # each bucket is 15% wider than the previous one
+METRICS_HISTOGRAM_BUCKET_COUNT = 100 # up to about 20 minutes
+
+# the batch preview gets told about changed rows at most that often
+BATCH_STATUS_NOTIFY_INTERVAL_SECONDS = 0.1
+BATCH_STATUS_TEXT_CACHE_SIZE = 5000 # rows for which we keep the source and processed text in memory
+
+# compiled text processing pipelines kept around, one per distinct text processing setting
+TEXT_PIPELINE_CACHE_SIZE = 32
+
+# advanced templates
+ADVANCED_TEMPLATE_CACHE_SIZE = 32 # compiled templates kept around
+ADVANCED_TEMPLATE_MAX_STEPS = 100000 # lines a template may run for one note
+ADVANCED_TEMPLATE_TIMEOUT_SECONDS = 5.0
+
+# bulk note loading and saving
+NOTE_LOAD_CHUNK_SIZE = 500 # notes loaded from the collection at a time
+NOTE_UPDATE_CHUNK_SIZE = 100 # notes saved to the collection in one update
+
+# batch journal, lets interrupted batches resume
+BATCH_JOURNAL_FILENAME_PREFIX = 'hypertts-batch-journal-'
+BATCH_JOURNAL_VERSION = 1
+BATCH_JOURNAL_SYNC_INTERVAL = 50 # fsync the journal every that many notes
+BATCH_JOURNAL_MAX_AGE_SECONDS = 30 * 24 * 3600 # journals of batches which were never resumed get removed after that
+
+# startup profiler
+STARTUP_PROFILE_FILENAME = 'hypertts-startup-profile.json'
+STARTUP_PROFILE_ENV_VAR = 'HYPER_TTS_STARTUP_PROFILE' # when set, the startup profile is saved to that path
+STARTUP_PROFILE_SLOWEST_MODULES = 5 # service modules listed in the configuration dialog
+
+# journal of cloud-language-tools audio requests, see replay_journal.py
+REQUEST_JOURNAL_FILENAME = 'hypertts-request-journal.jsonl'
+REQUEST_JOURNAL_VERSION = 1
+REQUEST_JOURNAL_MAX_SIZE_BYTES = 10 * 1024 * 1024 # rotated once it gets that large
+
 class ServiceType(enum.Enum):
     dictionary = ("Dictionary, contains recordings of words.")
     tts = ("Text To Speech, can generate audio for full sentences.")
@@ -131,6 +218,8 @@ GUI_TEXT_TARGET_REMOVE_SOUND_TAG = """If the target field already contains a sou
 GUI_TEXT_BATCH_COMPLETED = """<b>Finished adding Audio to notes</b>. You can undo this operation in menu Edit, 
 Undo HyperTTS: Add Audio to Notes. You may close this dialog.
 """
+GUI_TEXT_BATCH_RESUME = """Resume interrupted batch"""
+GUI_TEXT_STARTUP_PROFILE_SAVE = """Save to JSON"""
 
 GUI_TEXT_HYPERTTS_PRO = """HyperTTS Pro gives you access to all premium services.""" +\
 """ (You can use the same API key as AwesomeTTS Plus / Language Tools)"""
@@ -25,6 +25,11 @@ class TargetFieldNotFoundError(HyperTTSError):
         message = f'Target Field <b>{field_name}</b> not found'
         super().__init__(message)    
 
+class NoteNotFoundError(HyperTTSError):
+    def __init__(self, note_id):
+        message = f'Note {note_id} not found'
+        super().__init__(message)
+
 class FieldEmptyError(HyperTTSError):
     def __init__(self, field_name):
         message = f'Field <b>{field_name}</b> is empty'
@@ -73,6 +78,12 @@ class RequestError(HyperTTSError):
         self.voice = voice
         self.error_message = error_message
 
+class RateLimitedError(RequestError):
+    # the service returned HTTP 429
+    def __init__(self, source_text, voice, error_message, retry_after=None):
+        super().__init__(source_text, voice, error_message)
+        self.retry_after = retry_after
+
 class NoVoicesAvailable(HyperTTSError):
     def __init__(self):
         message = f'No voices available. You may need to configure some services in the HyperTTS Configuration.'
@@ -94,6 +105,13 @@ class TemplateExpansionError(HyperTTSError):
         message = f'Could not process template: {str(exception)}'
         super().__init__(message)
 
+# not an Exception, so that "except Exception" in a template can't swallow it.
+# expand_advanced_template reports it as a TemplateExpansionError.
+class TemplateBudgetExceeded(BaseException):
+    def __init__(self, max_steps, timeout_seconds):
+        message = f'Template stopped, it ran more than {max_steps} lines or more than {timeout_seconds} seconds'
+        super().__init__(message)
+
 # TTS related errors
 class TTSTagProcessingError(HyperTTSError):
     def __init__(self):
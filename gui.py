@@ -207,7 +207,7 @@ def init(hypertts):
                 with hypertts.error_manager.get_single_action_context('Adding Audio to Note'):
                     # logging.info(f'received message: {str}')
                     batch_name = str.replace(constants.PYCMD_ADD_AUDIO_PREFIX, '')
-                    batch = hypertts.load_batch_config(batch_name)
+                    batch = hypertts.get_batch_config_cached(batch_name)
                     hypertts.editor_note_add_audio(batch, editor, editor.note, editor.addMode)
             return True, None
 
@@ -226,5 +226,12 @@ def init(hypertts):
     aqt.gui_hooks.webview_will_set_content.append(on_webview_will_set_content)
     aqt.gui_hooks.webview_did_receive_js_message.append(onBridge)
 
+    # persist the audio cache index when the profile closes
+    aqt.gui_hooks.profile_will_close.append(hypertts.audio_cache.flush)
+
+    # generate realtime audio for the next cards in the review queue
+    aqt.gui_hooks.reviewer_did_show_question.append(lambda card: hypertts.prefetcher.prefetch_review_ahead())
+    aqt.gui_hooks.profile_will_close.append(hypertts.prefetcher.cancel_pending)
+
     # register TTS player
     aqt.sound.av_player.players.append(ttsplayer.AnkiHyperTTSPlayer(aqt.mw.taskman, hypertts))
\ No newline at end of file
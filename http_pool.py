@@ -0,0 +1,67 @@
+import sys
+import logging
+import threading
+import requests
+import requests.adapters
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class HttpSessionManager():
+    """
+    hands out one requests.Session per service. each session keeps keep-alive connection pools per host,
+    so that a large batch reuses a few connections instead of doing a TCP+TLS handshake for every clip.
+    """
+
+    def __init__(self, pool_connections=constants.HTTP_POOL_CONNECTIONS, pool_maxsize=constants.HTTP_POOL_MAXSIZE):
+        # pool_connections: number of hosts we keep a pool for, pool_maxsize: connections kept alive per host
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.sessions = {}
+        # name -> (pool_connections, pool_maxsize), for the sessions which don't use the defaults
+        self.pool_sizes = {}
+        self.lock = threading.Lock()
+
+    def get_pool_sizes(self, name):
+        return self.pool_sizes.get(name, (self.pool_connections, self.pool_maxsize))
+
+    def get_session(self, name):
+        with self.lock:
+            if name not in self.sessions:
+                pool_connections, pool_maxsize = self.get_pool_sizes(name)
+                logging.info(f'creating http session for {name}, pool_connections: {pool_connections} pool_maxsize: {pool_maxsize}')
+                self.sessions[name] = self.build_session(pool_connections, pool_maxsize)
+            return self.sessions[name]
+
+    def configure_session(self, name, pool_connections=None, pool_maxsize=None):
+        """sets the pool sizes of a session, None keeps the default. the session object stays the same,
+        services hold on to it, it gets new connection pools if the sizes changed"""
+        if pool_connections == None:
+            pool_connections = self.pool_connections
+        if pool_maxsize == None:
+            pool_maxsize = self.pool_maxsize
+        with self.lock:
+            if self.get_pool_sizes(name) == (pool_connections, pool_maxsize):
+                return
+            self.pool_sizes[name] = (pool_connections, pool_maxsize)
+            if name in self.sessions:
+                logging.info(f'resizing http session for {name}, pool_connections: {pool_connections} pool_maxsize: {pool_maxsize}')
+                self.mount_adapter(self.sessions[name], pool_connections, pool_maxsize)
+
+    def build_session(self, pool_connections, pool_maxsize):
+        session = requests.Session()
+        self.mount_adapter(session, pool_connections, pool_maxsize)
+        return session
+
+    def mount_adapter(self, session, pool_connections, pool_maxsize):
+        # pool_block=False: if more threads than pool_maxsize make requests, extra connections get opened
+        # and discarded instead of blocking
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=False)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+    def close(self):
+        with self.lock:
+            for name, session in self.sessions.items():
+                session.close()
+            self.sessions = {}
@@ -10,6 +10,7 @@ import copy
 import json
 from typing import List, Dict
 import pprint
+import concurrent.futures
 
 # anki imports
 import aqt
@@ -23,6 +24,12 @@ errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_b
 text_utils = __import__('text_utils', globals(), locals(), [], sys._addon_import_level_base)
 config_models = __import__('config_models', globals(), locals(), [], sys._addon_import_level_base)
 context = __import__('context', globals(), locals(), [], sys._addon_import_level_base)
+audio_cache = __import__('audio_cache', globals(), locals(), [], sys._addon_import_level_base)
+single_flight = __import__('single_flight', globals(), locals(), [], sys._addon_import_level_base)
+prefetch = __import__('prefetch', globals(), locals(), [], sys._addon_import_level_base)
+batch_journal = __import__('batch_journal', globals(), locals(), [], sys._addon_import_level_base)
+batch_engine = __import__('batch_engine', globals(), locals(), [], sys._addon_import_level_base)
+streaming_playback = __import__('streaming_playback', globals(), locals(), [], sys._addon_import_level_base)
 
 
 class HyperTTS():
@@ -41,29 +48,79 @@ class HyperTTS():
         self.config = self.anki_utils.get_config()
         self.error_manager = errors.ErrorManager(self.anki_utils)
         self.latest_saved_batch_name = None
-
-
-    def process_batch_audio(self, note_id_list, batch, batch_status):
-        # for each note, generate audio
+        self.audio_cache = audio_cache.AudioCache(self.anki_utils.get_user_files_dir())
+        # identical audio requests which are in flight at the same time only go out once
+        self.audio_single_flight = single_flight.SingleFlight()
+        # deserialized presets used at review and editor time, cleared whenever the config is saved
+        self.realtime_side_config_cache = {}
+        self.batch_config_cache = {}
+        self.prefetcher = prefetch.RealtimePrefetcher(self)
+        # downloads realtime audio which is played while it's being downloaded
+        self.streaming_executor = concurrent.futures.ThreadPoolExecutor(max_workers=constants.STREAMING_MAX_WORKERS, thread_name_prefix='hypertts_streaming')
+        # StartupProfiler, set when running within anki
+        self.startup_profiler = None
+
+
+    def process_batch_audio(self, note_id_list, batch, batch_status, resume=False):
+        # for each note, generate audio. audio requests run concurrently, notes get updated in order.
+        # progress is journaled to disk, with resume=True, notes which an earlier interrupted run of the same
+        # batch already did are skipped
+        journal = self.get_batch_journal(note_id_list, batch)
+        batch_journal.prune_journals(self.anki_utils.get_user_files_dir())
         with batch_status.get_batch_running_action_context():
             undo_id = self.anki_utils.undo_start()
-            for note_id in note_id_list:
+            try:
+                remaining_note_id_list = note_id_list
+                if resume:
+                    remaining_note_id_list = self.restore_batch_journal(journal, note_id_list, batch, batch_status)
+                journal.open(resume)
+                engine = batch_engine.BatchEngine(self, batch, batch_status, journal)
+                engine.run(remaining_note_id_list)
+            finally:
+                # notes written before a failure still get their undo entry, and their audio stays in the cache index
+                journal.close()
+                self.anki_utils.undo_end(undo_id)
+                self.audio_cache.flush()
+            if batch_status.must_continue and journal.error_count == 0:
+                # nothing left to resume
+                journal.delete()
+
+    def get_batch_journal(self, note_id_list, batch):
+        return batch_journal.BatchJournal(self.anki_utils.get_user_files_dir(), batch, note_id_list)
+
+    def restore_batch_journal(self, journal, note_id_list, batch, batch_status):
+        """marks notes which the journal has as done as done, returns the notes which still need to be processed"""
+        entries = journal.load()
+        remaining_note_id_list = []
+        for note_id, note in self.iterate_notes(note_id_list):
+            entry = entries.get(note_id, None)
+            if entry != None and entry['status'] == constants.BatchNoteStatus.Done.name \
+                and self.note_has_sound_file(note, batch, entry['sound_file']):
                 with batch_status.get_note_action_context(note_id, False) as note_action_context:
-                    note = self.anki_utils.get_note_by_id(note_id)
-                    # process note
-                    source_text, processed_text, sound_file, full_filename = self.process_note_audio(batch, note, False,
-                        context.AudioRequestContext(constants.AudioRequestReason.batch))
-                    # update note action context
-                    note_action_context.set_source_text(source_text)
-                    note_action_context.set_processed_text(processed_text)
-                    note_action_context.set_sound(sound_file)
-                    note_action_context.set_status(constants.BatchNoteStatus.Done)                    
-                if batch_status.must_continue == False:
-                    logging.info('batch_status execution interrupted')
-                    break
-            self.anki_utils.undo_end(undo_id)
+                    note_action_context.set_sound(entry['sound_file'])
+                    note_action_context.set_status(constants.BatchNoteStatus.Done)
+            else:
+                remaining_note_id_list.append(note_id)
+        logging.info(f'resuming batch, {len(note_id_list) - len(remaining_note_id_list)} notes already done, '
+            f'{len(remaining_note_id_list)} remaining')
+        return remaining_note_id_list
+
+    def note_has_sound_file(self, note, batch, sound_file):
+        # the user may have edited the note since the journal entry was written
+        if note == None:
+            return False
+        target_field = batch.target.target_field
+        if target_field not in note:
+            return False
+        return f'[sound:{sound_file}]' in note[target_field]
 
     def process_note_audio(self, batch, note, add_mode, audio_request_context):
+        source_text, processed_text = self.prepare_note_audio(batch, note)
+        full_filename, audio_filename = self.get_audio_file(processed_text, batch.voice_selection, audio_request_context)
+        sound_file = self.apply_note_audio(batch, note, add_mode, full_filename, audio_filename)
+        return source_text, processed_text, sound_file, full_filename
+
+    def prepare_note_audio(self, batch, note):
         target_field = batch.target.target_field
 
         if target_field not in note:
@@ -71,8 +128,10 @@ class HyperTTS():
 
         source_text = self.get_source_text(note, batch.source)
         processed_text = self.process_text(source_text, batch.text_processing)
+        return source_text, processed_text
 
-        full_filename, audio_filename = self.get_audio_file(processed_text, batch.voice_selection, audio_request_context)
+    def apply_note_audio(self, batch, note, add_mode, full_filename, audio_filename):
+        target_field = batch.target.target_field
         sound_tag, sound_file = self.get_collection_sound_tag(full_filename, audio_filename)
 
         target_field_content = note[target_field]
@@ -91,7 +150,7 @@ class HyperTTS():
         if not add_mode:
             self.anki_utils.update_note(note)
 
-        return source_text, processed_text, sound_file, full_filename
+        return sound_file
 
     def get_note_audio(self, batch, note, audio_request_context):
         source_text = self.get_source_text(note, batch.source)
@@ -103,7 +162,12 @@ class HyperTTS():
         processed_text = text_utils.process_text(source_text, realtime_model.text_processing)
         return self.get_audio_file(processed_text, realtime_model.voice_selection, context.AudioRequestContext(constants.AudioRequestReason.realtime))
 
-    def get_audio_file(self, processed_text, voice_selection, audio_request_context):
+    def get_realtime_audio_stream(self, realtime_model: config_models.RealtimeConfigSide, text):
+        processed_text = text_utils.process_text(text, realtime_model.text_processing)
+        return self.get_audio_file(processed_text, realtime_model.voice_selection, context.AudioRequestContext(constants.AudioRequestReason.realtime), streaming=True)
+
+    def get_audio_file(self, processed_text, voice_selection, audio_request_context, streaming=False):
+        """returns full_filename, audio_filename. with streaming, returns an AudioStream as soon as playback can start"""
         # sanity checks
         if voice_selection.selection_mode in [constants.VoiceSelectionMode.priority, constants.VoiceSelectionMode.random]:
             if len(voice_selection.voice_list) == 0:
@@ -120,6 +184,9 @@ class HyperTTS():
         while loop_condition:
             try:
                 voice_with_options = self.choose_voice(voice_selection, voice_list)
+                if streaming:
+                    return self.generate_audio_stream(processed_text,
+                        voice_with_options.voice, voice_with_options.options, audio_request_context)
                 full_filename, audio_filename = self.generate_audio_write_file(processed_text, 
                     voice_with_options.voice, voice_with_options.options, audio_request_context)
                 return full_filename, audio_filename
@@ -174,12 +241,11 @@ class HyperTTS():
         return source_template.format_map(field_values)
 
     def expand_advanced_template(self, note, source_template):
-        local_variables = {
-            'template_fields': self.get_field_values(note)
-        }
+        # compiled once per template, not once per note
+        code = text_utils.compile_advanced_template(source_template)
         try:
-            expanded_template = exec(source_template, {}, local_variables)
-        except Exception as e:
+            local_variables = text_utils.run_advanced_template(code, self.get_field_values(note))
+        except (Exception, errors.TemplateBudgetExceeded) as e:
             raise errors.TemplateExpansionError(e)
         if 'result' not in local_variables:
             raise errors.NoResultVar()
@@ -216,21 +282,134 @@ class HyperTTS():
         full_filename, audio_filename = self.generate_audio_write_file(source_text, voice, options, context.AudioRequestContext(constants.AudioRequestReason.preview))
         self.anki_utils.play_sound(full_filename)
 
+    # metrics
+    # =======
+
+    def get_metrics(self):
+        """request metrics from the service manager, plus the audio cache hit ratio"""
+        result = self.service_manager.get_metrics()
+        audio_cache_stats = self.audio_cache.get_stats()
+        lookup_count = audio_cache_stats['hits'] + audio_cache_stats['misses']
+        audio_cache_stats['hit_ratio'] = None if lookup_count == 0 else audio_cache_stats['hits'] / lookup_count
+        result['audio_cache'] = audio_cache_stats
+        return result
+
+    def reset_metrics(self):
+        self.service_manager.reset_metrics()
+        self.audio_cache.reset_stats()
+
     # processing of sound tags / collection stuff
     # ===========================================
 
     def generate_audio_write_file(self, source_text, voice, options, audio_request_context):
-        # write to user files directory
+        # write to user files directory, unless we already have that exact audio in the cache
         hash_str = self.get_hash_for_audio_request(source_text, voice, options)
         audio_filename = self.get_audio_filename(hash_str)
         full_filename = self.get_full_audio_file_name(hash_str)
-        with open(full_filename, 'wb') as f:
-            f.write(self.service_manager.get_tts_audio(source_text, voice, options, audio_request_context))
+        def fetch_audio():
+            if not self.audio_cache.lookup(hash_str, full_filename):
+                # the service response is streamed to disk, it only gets renamed into place once complete
+                with self.audio_cache.open_writer(hash_str, full_filename) as output_file:
+                    self.service_manager.write_tts_audio(source_text, voice, options, audio_request_context, output_file)
+        self.audio_single_flight.run(hash_str, fetch_audio)
         return full_filename, audio_filename
 
+    def generate_audio_write_files_bulk(self, source_text_list, voice, options, audio_request_context):
+        """
+        like generate_audio_write_file for several texts with the same voice, the texts which aren't in the cache are
+        requested together. returns source_text -> (full_filename, audio_filename), or the exception for that text.
+        texts which another request is already fetching are left to it, like in generate_audio_write_file.
+        """
+        results = {}
+        # source_text -> (hash_str, call), for the texts this request leads, and the ones it waits for
+        leader_calls = {}
+        follower_calls = {}
+        # source_text -> writer, until the writer is committed or aborted
+        writers = {}
+        try:
+            for source_text in source_text_list:
+                if source_text in results:
+                    continue
+                hash_str = self.get_hash_for_audio_request(source_text, voice, options)
+                full_filename = self.get_full_audio_file_name(hash_str)
+                results[source_text] = full_filename, self.get_audio_filename(hash_str)
+                call, leader = self.audio_single_flight.acquire(hash_str)
+                if not leader:
+                    follower_calls[source_text] = hash_str, call
+                    continue
+                leader_calls[source_text] = hash_str, call
+                if not self.audio_cache.lookup(hash_str, full_filename):
+                    writers[source_text] = self.audio_cache.open_writer(hash_str, full_filename)
+            if len(writers) > 0:
+                audio_requests = [(source_text, voice, options, writer.open()) for source_text, writer in writers.items()]
+                try:
+                    exceptions = self.service_manager.write_tts_audio_bulk(audio_requests, audio_request_context)
+                except Exception as e:
+                    exceptions = [e] * len(audio_requests)
+                for (source_text, writer), exception in zip(list(writers.items()), exceptions):
+                    if exception == None:
+                        writer.commit()
+                    else:
+                        writer.abort()
+                        results[source_text] = exception
+                    del writers[source_text]
+        except BaseException as e:
+            # the callers waiting on our texts get the exception too
+            for source_text in leader_calls:
+                results[source_text] = e
+            raise e
+        finally:
+            # a commit which raised, or an exception before the results came in, leaves temporary files behind
+            for writer in writers.values():
+                writer.abort()
+            # the texts we fetched are released before waiting for the others, so that two bulk requests can't wait on each other
+            for source_text, (hash_str, call) in leader_calls.items():
+                result = results[source_text]
+                if isinstance(result, BaseException):
+                    self.audio_single_flight.release(hash_str, call, exception=result)
+                else:
+                    self.audio_single_flight.release(hash_str, call)
+        for source_text, (hash_str, call) in follower_calls.items():
+            try:
+                self.audio_single_flight.wait(hash_str, call)
+            except Exception as e:
+                results[source_text] = e
+        return results
+
+    def generate_audio_stream(self, source_text, voice, options, audio_request_context):
+        """
+        like generate_audio_write_file, but the audio gets written in the background and the AudioStream is returned
+        once the beginning of it is on disk. short texts and cached audio come back as a complete stream.
+        """
+        hash_str = self.get_hash_for_audio_request(source_text, voice, options)
+        audio_stream = streaming_playback.AudioStream(self.get_full_audio_file_name(hash_str), self.get_audio_filename(hash_str))
+        if len(source_text) < constants.STREAMING_PLAYBACK_MIN_TEXT_LENGTH:
+            self.generate_audio_write_file(source_text, voice, options, audio_request_context)
+            audio_stream.set_complete()
+            return audio_stream
+        def fetch_audio():
+            if not self.audio_cache.lookup(hash_str, audio_stream.full_filename):
+                # the player reads the temporary file while it grows, it's linked into place once complete
+                writer = self.audio_cache.open_writer(hash_str, audio_stream.full_filename, keep_temp_file=True)
+                audio_stream.set_temp_filename(writer.temp_filename)
+                with writer as output_file:
+                    self.service_manager.write_tts_audio(source_text, voice, options, audio_request_context,
+                        streaming_playback.AudioStreamFile(audio_stream, output_file))
+        def download_audio():
+            try:
+                self.audio_single_flight.run(hash_str, fetch_audio)
+                audio_stream.set_complete()
+            except Exception as e:
+                logging.warning(f'could not stream audio for {source_text}: {e}')
+                audio_stream.set_exception(e)
+        self.streaming_executor.submit(download_audio)
+        audio_stream.wait_for_start()
+        return audio_stream
+
     def get_collection_sound_tag(self, full_filename, audio_filename):
-        self.anki_utils.media_add_file(full_filename)
-        return f'[sound:{audio_filename}]', audio_filename
+        # the media folder may already have a different file under that name, anki then renames ours
+        media_filename = self.anki_utils.media_add_file(full_filename)
+        return f'[sound:{media_filename}]', media_filename
 
     def get_full_audio_file_name(self, hash_str):
         # return the absolute path of the audio file in the user_files directory
@@ -263,6 +442,11 @@ class HyperTTS():
         full_filename, audio_filename = self.get_realtime_audio(realtime_side_model, tts_tag.field_text)
         return full_filename
 
+    def get_audio_stream_tts_tag(self, tts_tag):
+        hypertts_preset = self.extract_hypertts_preset(tts_tag.other_args)
+        realtime_side_model = self.get_realtime_side_config(hypertts_preset)
+        return self.get_realtime_audio_stream(realtime_side_model, tts_tag.field_text)
+
     def build_realtime_tts_tag(self, realtime_side_model: config_models.RealtimeConfigSide, setting_key):
         if realtime_side_model.source.mode == constants.RealtimeSourceType.AnkiTTSTag:
             # get the audio language of the first voice
@@ -290,6 +474,12 @@ class HyperTTS():
         return components[1]
 
     def get_realtime_side_config(self, hypertts_preset):
+        # called on every card flip, don't deserialize the preset and resolve voices every time
+        if hypertts_preset not in self.realtime_side_config_cache:
+            self.realtime_side_config_cache[hypertts_preset] = self.load_realtime_side_config(hypertts_preset)
+        return self.realtime_side_config_cache[hypertts_preset]
+
+    def load_realtime_side_config(self, hypertts_preset):
         # based 
         if constants.AnkiCardSide.Front.name in hypertts_preset:
             # front
@@ -387,26 +577,44 @@ class HyperTTS():
     # functions related to getting data from notes
     # ============================================
 
+    def iterate_notes(self, note_id_list):
+        """yields (note_id, note) in order, loading the notes from the collection in chunks.
+        note is None if the note doesn't exist"""
+        for start in range(0, len(note_id_list), constants.NOTE_LOAD_CHUNK_SIZE):
+            chunk_note_id_list = note_id_list[start:start + constants.NOTE_LOAD_CHUNK_SIZE]
+            notes = self.anki_utils.get_notes_by_id(chunk_note_id_list)
+            for note_id in chunk_note_id_list:
+                yield note_id, notes.get(note_id, None)
+
     def get_all_fields_from_notes(self, note_id_list):
+        # the fields only depend on the note types, so the notes themselves don't need to be loaded
         field_name_set = {}
-        for note_id in note_id_list:
-            note = self.anki_utils.get_note_by_id(note_id)
-            for field in self.get_fields_from_note(note):
-                field_name_set[field] = True
+        for model_id in self.anki_utils.get_note_type_ids(note_id_list):
+            for field in self.anki_utils.get_model(model_id)['flds']:
+                field_name_set[field['name']] = True
         return sorted(field_name_set.keys())
 
     def get_fields_from_note(self, note):
         return list(note.keys())
 
-    def populate_batch_status_processed_text(self, note_id_list, batch_source, text_processing, batch_status):
+    def populate_batch_status_processed_text(self, note_id_list, batch_source, text_processing, batch_status, plan_builder=None):
+        """
+        the processed text of each note goes into the batch status, and into the plan_builder when given one
+        (None for notes with errors), so that the batch can be planned without keeping all the texts.
+        """
         with batch_status.get_batch_running_action_context():
-            for note_id in note_id_list:
+            for note_id, note in self.iterate_notes(note_id_list):
+                note_processed_text = None
                 with batch_status.get_note_action_context(note_id, True) as note_action_context:
-                    note = self.anki_utils.get_note_by_id(note_id)
+                    if note == None:
+                        raise errors.NoteNotFoundError(note_id)
                     source_text, processed_text = self.get_source_processed_text(note, batch_source, text_processing)
                     note_action_context.set_source_text(source_text)
                     note_action_context.set_processed_text(processed_text)
                     note_action_context.set_status(constants.BatchNoteStatus.OK)
+                    note_processed_text = processed_text
+                if plan_builder != None:
+                    plan_builder.add_processed_text(note_processed_text)
                 if batch_status.must_continue == False:
                     logging.info('batch_status execution interrupted')
                     break
@@ -427,6 +635,7 @@ class HyperTTS():
             self.config[constants.CONFIG_BATCH_CONFIG] = {}
         self.config[constants.CONFIG_BATCH_CONFIG][batch_name] = batch.serialize()
         self.anki_utils.write_config(self.config)
+        self.clear_preset_cache()
         self.latest_saved_batch_name = batch_name
         logging.info(f'saved batch config [{batch_name}]')
 
@@ -436,12 +645,19 @@ class HyperTTS():
             raise errors.PresetNotFound(batch_name)
         return self.deserialize_batch_config(self.config[constants.CONFIG_BATCH_CONFIG][batch_name])
 
+    def get_batch_config_cached(self, batch_name):
+        # the returned batch config is shared, it must not be modified
+        if batch_name not in self.batch_config_cache:
+            self.batch_config_cache[batch_name] = self.load_batch_config(batch_name)
+        return self.batch_config_cache[batch_name]
+
     def delete_batch_config(self, batch_name):
         logging.info(f'deleting batch config [{batch_name}]')
         if batch_name not in self.config[constants.CONFIG_BATCH_CONFIG]:
             raise errors.PresetNotFound(batch_name)
         del self.config[constants.CONFIG_BATCH_CONFIG][batch_name]
         self.anki_utils.write_config(self.config)
+        self.clear_preset_cache()
 
     def get_batch_config_list(self):
         if constants.CONFIG_BATCH_CONFIG not in self.config:
@@ -480,6 +696,7 @@ class HyperTTS():
             final_key = settings_key
         self.config[constants.CONFIG_REALTIME_CONFIG][final_key] = realtime_model.serialize()
         self.anki_utils.write_config(self.config)
+        self.clear_preset_cache()
         return final_key
 
     def load_realtime_config(self, settings_key):
@@ -488,16 +705,42 @@ class HyperTTS():
             raise errors.PresetNotFound(settings_key)
         return self.deserialize_realtime_config(self.config[constants.CONFIG_REALTIME_CONFIG][settings_key])
 
+    # preset cache
+
+    def clear_preset_cache(self):
+        self.realtime_side_config_cache = {}
+        self.batch_config_cache = {}
+        self.prefetcher.clear()
+
     # services config
 
     def save_configuration(self, configuration_model):
         configuration_model.validate()
         self.config[constants.CONFIG_CONFIGURATION] = configuration_model.serialize()
         self.anki_utils.write_config(self.config)
+        # enabled services may have changed, voices need to be resolved again
+        self.clear_preset_cache()
 
     def get_configuration(self):
         return self.deserialize_configuration(self.config.get(constants.CONFIG_CONFIGURATION, {}))
 
+    def migrate_configuration(self):
+        # older configurations wait throttle_seconds before each request, that's one request per throttle_seconds
+        service_config = self.config.get(constants.CONFIG_CONFIGURATION, {}).get('service_config', {})
+        migrated = False
+        for service_name, config in service_config.items():
+            if constants.SERVICE_CONFIG_THROTTLE_SECONDS not in config:
+                continue
+            throttle_seconds = config.pop(constants.SERVICE_CONFIG_THROTTLE_SECONDS)
+            requests_per_second = config.get(constants.SERVICE_CONFIG_REQUESTS_PER_SECOND, 0)
+            if (requests_per_second == None or requests_per_second == 0) and throttle_seconds != None and throttle_seconds > 0:
+                config[constants.SERVICE_CONFIG_REQUESTS_PER_SECOND] = 1.0 / throttle_seconds
+                config[constants.SERVICE_CONFIG_BURST] = 1
+            logging.info(f'migrated {constants.SERVICE_CONFIG_THROTTLE_SECONDS} of {service_name}: {config}')
+            migrated = True
+        if migrated:
+            self.anki_utils.write_config(self.config)
+
     def hypertts_pro_enabled(self):
         return self.get_configuration().hypertts_pro_api_key_set()
 
@@ -0,0 +1,35 @@
+import sys
+import time
+import logging
+import importlib
+import threading
+
+# module name -> seconds it took to import
+import_seconds = {}
+
+class LazyModule():
+    """
+    stands in for a module which is slow to import (boto3, gtts), the module gets imported the first time
+    one of its attributes is used. services use this for their heavy dependencies, so that services which are
+    disabled don't slow down Anki startup.
+    """
+
+    def __init__(self, module_name):
+        self._module_name = module_name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module == None:
+                start_time = time.monotonic()
+                self._module = importlib.import_module(self._module_name)
+                import_seconds[self._module_name] = time.monotonic() - start_time
+                logging.info(f'imported {self._module_name} in {import_seconds[self._module_name]:.3f}s')
+        return self._module
+
+    def is_loaded(self):
+        return self._module != None
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
@@ -0,0 +1,257 @@
+import sys
+import math
+import time
+import logging
+import threading
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+# metric names
+# ============
+
+# counters, by service
+REQUESTS = 'requests'
+BYTES = 'bytes'
+# counter, by service then exception type
+ERRORS = 'errors'
+# histograms, in seconds. latency by service, rate limiter wait by concurrency key
+LATENCY = 'latency'
+RATE_LIMIT_WAIT = 'rate_limit_wait'
+# gauges, by concurrency key
+IN_FLIGHT = 'in_flight'
+WAITING = 'waiting'
+
+
+class Histogram():
+    """
+    latency histogram with geometric buckets, so that memory stays constant however many requests we see.
+    percentiles are accurate to within one bucket (constants.METRICS_HISTOGRAM_GROWTH), count, sum, min and max are exact.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (constants.METRICS_HISTOGRAM_BUCKET_COUNT + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def get_bucket_index(self, value):
+        if value <= constants.METRICS_HISTOGRAM_MIN_VALUE:
+            return 0
+        index = int(math.log(value / constants.METRICS_HISTOGRAM_MIN_VALUE, constants.METRICS_HISTOGRAM_GROWTH)) + 1
+        return min(index, constants.METRICS_HISTOGRAM_BUCKET_COUNT)
+
+    def get_bucket_bounds(self, index):
+        if index == 0:
+            return 0.0, constants.METRICS_HISTOGRAM_MIN_VALUE
+        lower = constants.METRICS_HISTOGRAM_MIN_VALUE * constants.METRICS_HISTOGRAM_GROWTH ** (index - 1)
+        return lower, lower * constants.METRICS_HISTOGRAM_GROWTH
+
+    def observe(self, value):
+        self.buckets[self.get_bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min == None or value < self.min:
+            self.min = value
+        if self.max == None or value > self.max:
+            self.max = value
+
+    def mean(self):
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def percentile(self, percentile):
+        if self.count == 0:
+            return None
+        target = percentile / 100.0 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count > 0:
+                if index == constants.METRICS_HISTOGRAM_BUCKET_COUNT:
+                    # the last bucket has no upper bound
+                    return self.max
+                lower, upper = self.get_bucket_bounds(index)
+                # middle of the bucket, but never outside of what we actually observed
+                return min(max((lower + upper) / 2.0, self.min), self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean': self.mean(),
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99)
+        }
+
+class Gauge():
+    def __init__(self):
+        self.value = 0
+        self.max = 0
+
+    def add(self, delta):
+        self.value += delta
+        self.max = max(self.max, self.value)
+
+    def snapshot(self):
+        return {'value': self.value, 'max': self.max}
+
+class GaugeContext():
+    """increments a gauge for the duration of a with block"""
+    def __init__(self, registry, name, key):
+        self.registry = registry
+        self.name = name
+        self.key = key
+
+    def __enter__(self):
+        self.registry.add_gauge(self.name, self.key, 1)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.registry.add_gauge(self.name, self.key, -1)
+        return False
+
+class LatencyEstimator():
+    """
+    exponentially weighted moving average of the request latency, by concurrency key, so that the estimate
+    follows the recent behavior of the service. it's kept apart from the MetricsRegistry, resetting the metrics
+    doesn't lose it.
+    """
+
+    def __init__(self, weight=constants.LATENCY_ESTIMATE_EWMA_WEIGHT):
+        self.weight = weight
+        self.lock = threading.Lock()
+        # key -> seconds
+        self.estimates = {}
+
+    def observe(self, key, seconds):
+        with self.lock:
+            estimate = self.estimates.get(key, None)
+            if estimate == None:
+                self.estimates[key] = seconds
+            else:
+                self.estimates[key] = estimate + self.weight * (seconds - estimate)
+
+    def get_estimate(self, key):
+        """None if there wasn't any request for that key yet"""
+        with self.lock:
+            return self.estimates.get(key, None)
+
+class MetricsRegistry():
+    """
+    in-memory metrics about audio requests: counters, latency histograms and concurrency gauges. nothing
+    leaves the computer, this is meant to help with tuning the concurrency and rate limit settings.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # name -> key -> Gauge
+        self.gauges = {}
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.start_time = time.monotonic()
+            # name -> key -> value, or name -> key -> sub_key -> value
+            self.counters = {}
+            # name -> key -> Histogram
+            self.histograms = {}
+            # requests which are still in flight keep their gauge value
+            for gauges in self.gauges.values():
+                for gauge in gauges.values():
+                    gauge.max = gauge.value
+        logging.info('metrics reset')
+
+    def increment(self, name, key, amount=1, sub_key=None):
+        with self.lock:
+            counters = self.counters.setdefault(name, {})
+            if sub_key != None:
+                counters = counters.setdefault(key, {})
+                key = sub_key
+            counters[key] = counters.get(key, 0) + amount
+
+    def observe(self, name, key, value):
+        with self.lock:
+            histograms = self.histograms.setdefault(name, {})
+            if key not in histograms:
+                histograms[key] = Histogram()
+            histograms[key].observe(value)
+
+    def add_gauge(self, name, key, delta):
+        with self.lock:
+            gauges = self.gauges.setdefault(name, {})
+            if key not in gauges:
+                gauges[key] = Gauge()
+            gauges[key].add(delta)
+
+    def get_gauge_context(self, name, key):
+        return GaugeContext(self, name, key)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'elapsed_seconds': time.monotonic() - self.start_time,
+                'counters': {name: {key: (dict(value) if isinstance(value, dict) else value) for key, value in counters.items()}
+                    for name, counters in self.counters.items()},
+                'histograms': {name: {key: histogram.snapshot() for key, histogram in histograms.items()}
+                    for name, histograms in self.histograms.items()},
+                'gauges': {name: {key: gauge.snapshot() for key, gauge in gauges.items()}
+                    for name, gauges in self.gauges.items()}
+            }
+
+def format_seconds(seconds):
+    if seconds == None:
+        return '-'
+    if seconds < 1.0:
+        return f'{seconds * 1000:.0f}ms'
+    return f'{seconds:.2f}s'
+
+def format_snapshot(snapshot):
+    """html summary of a snapshot (see HyperTTS.get_metrics), for the configuration dialog"""
+    counters = snapshot['counters']
+    latency_histograms = snapshot['histograms'].get(LATENCY, {})
+    elapsed_seconds = max(snapshot['elapsed_seconds'], 1.0)
+    lines = []
+
+    service_names = sorted(set(counters.get(REQUESTS, {}).keys()) | set(counters.get(ERRORS, {}).keys()))
+    if len(service_names) == 0:
+        lines.append('No audio requests yet.')
+    else:
+        rows = ['<tr><th>Service</th><th>Requests</th><th>Req/min</th><th>Errors</th><th>KB</th><th>p50</th><th>p95</th><th>p99</th></tr>']
+        for service_name in service_names:
+            request_count = counters.get(REQUESTS, {}).get(service_name, 0)
+            error_counts = counters.get(ERRORS, {}).get(service_name, {})
+            errors_str = ', '.join([f'{error_type}: {count}' for error_type, count in sorted(error_counts.items())])
+            if len(errors_str) == 0:
+                errors_str = '0'
+            kilobytes = counters.get(BYTES, {}).get(service_name, 0) / 1024.0
+            latency = latency_histograms.get(service_name, Histogram().snapshot())
+            rows.append(f'<tr><td>{service_name}</td><td>{request_count}</td><td>{request_count * 60.0 / elapsed_seconds:.1f}</td>'
+                f'<td>{errors_str}</td><td>{kilobytes:.0f}</td><td>{format_seconds(latency["p50"])}</td>'
+                f'<td>{format_seconds(latency["p95"])}</td><td>{format_seconds(latency["p99"])}</td></tr>')
+        lines.append('<table cellspacing="6">' + ''.join(rows) + '</table>')
+
+    in_flight_gauges = snapshot['gauges'].get(IN_FLIGHT, {})
+    waiting_gauges = snapshot['gauges'].get(WAITING, {})
+    rate_limit_waits = snapshot['histograms'].get(RATE_LIMIT_WAIT, {})
+    for key in sorted(set(in_flight_gauges.keys()) | set(waiting_gauges.keys())):
+        in_flight = in_flight_gauges.get(key, Gauge().snapshot())
+        waiting = waiting_gauges.get(key, Gauge().snapshot())
+        line = (f'<b>{key}:</b> {in_flight["value"]} in flight (max {in_flight["max"]}), '
+            f'{waiting["value"]} waiting (max {waiting["max"]})')
+        if key in rate_limit_waits:
+            line += f', rate limit wait p95 {format_seconds(rate_limit_waits[key]["p95"])}'
+        lines.append(line)
+
+    audio_cache = snapshot.get('audio_cache', None)
+    if audio_cache != None:
+        hit_ratio = audio_cache['hit_ratio']
+        hit_ratio_str = '-' if hit_ratio == None else f'{hit_ratio * 100:.0f}%'
+        lines.append(f'<b>Audio cache:</b> {audio_cache["hits"]} hits, {audio_cache["misses"]} misses, '
+            f'hit ratio {hit_ratio_str}, {audio_cache["entry_count"]} entries')
+    return '<br/>'.join(lines)
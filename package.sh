@@ -18,9 +18,13 @@ git push origin ${GIT_TAG}
 rm meta.json
 rm -rf __pycache__
 rm user_files/*.mp3
+rm -f user_files/hypertts-audio-cache.json
+rm -f user_files/hypertts-batch-journal-*.jsonl
+rm -f user_files/hypertts-startup-profile.json
+rm -f user_files/hypertts-request-journal.jsonl*
 rm -rvf htmlcov/
 ADDON_FILENAME=${HOME}/anki-addons-releases/anki-hyper-tts-${VERSION_NUMBER}.ankiaddon
-zip --exclude "*node_modules*" "*__pycache__*" "test_*.py" "*test_services*" "*.ini" "*.workspace" "*.md" "*.sh" requirements.txt "*.code-workspace" "web" -r ${ADDON_FILENAME} *
+zip --exclude "*node_modules*" "*__pycache__*" "test_*.py" "*test_services*" "*.ini" "*.workspace" "*.md" "*.sh" build_voicelist.py benchmark.py replay_journal.py requirements.txt "*.code-workspace" "web" -r ${ADDON_FILENAME} *
 
 
 # if you need to undo a release:
@@ -0,0 +1,93 @@
+import sys
+import logging
+import threading
+import collections
+import concurrent.futures
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class RealtimePrefetcher():
+    """
+    generates the realtime audio of the next cards in the review queue in the background, so that it's
+    already in the audio cache when the card gets shown and the TTS tag gets played.
+    """
+
+    def __init__(self, hypertts, card_count=constants.PREFETCH_CARD_COUNT, max_workers=constants.PREFETCH_MAX_WORKERS):
+        self.hypertts = hypertts
+        self.card_count = card_count
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hypertts_prefetch')
+        self.lock = threading.Lock()
+        # tags currently being prefetched: tag key -> future
+        self.pending = {}
+        # tags which were prefetched recently, oldest first, so that we don't submit them again
+        self.done = collections.OrderedDict()
+        # cards whose tags we already looked at, rendering a card is too slow to do it again for every question shown
+        self.rendered_card_ids = collections.OrderedDict()
+
+    def get_tag_key(self, tts_tag):
+        return (tts_tag.field_text, tuple(tts_tag.other_args))
+
+    def is_hypertts_tag(self, tts_tag):
+        return any(constants.TTS_TAG_HYPERTTS_PRESET in arg for arg in tts_tag.other_args)
+
+    def prefetch_review_ahead(self):
+        """
+        called on the main thread when the reviewer shows a question. only the cards which just entered
+        the upcoming queue get rendered, usually one per question.
+        """
+        anki_utils = self.hypertts.anki_utils
+        try:
+            card_ids = anki_utils.get_review_ahead_card_ids(self.card_count)
+            tts_tags = []
+            for card_id in card_ids:
+                if card_id in self.rendered_card_ids:
+                    continue
+                tts_tags.extend(anki_utils.get_card_tts_tags(card_id))
+                self.rendered_card_ids[card_id] = True
+                while len(self.rendered_card_ids) > constants.PREFETCH_MAX_TRACKED:
+                    self.rendered_card_ids.popitem(last=False)
+        except Exception as e:
+            logging.warning(f'could not get upcoming cards for prefetching: {e}')
+            return
+        self.prefetch_tts_tags(tts_tags)
+
+    def prefetch_tts_tags(self, tts_tags):
+        for tts_tag in tts_tags:
+            if not self.is_hypertts_tag(tts_tag):
+                continue
+            tag_key = self.get_tag_key(tts_tag)
+            with self.lock:
+                if tag_key in self.pending or tag_key in self.done:
+                    continue
+                if len(self.pending) >= constants.PREFETCH_MAX_PENDING:
+                    # we're not keeping up, the reviewer will generate the remaining ones itself
+                    return
+                logging.info(f'prefetching audio for {tts_tag.field_text}')
+                self.pending[tag_key] = self.executor.submit(self.prefetch_tts_tag, tag_key, tts_tag)
+
+    def prefetch_tts_tag(self, tag_key, tts_tag):
+        try:
+            self.hypertts.get_audio_filename_tts_tag(tts_tag)
+        except Exception as e:
+            # the error will be reported when the tag actually gets played
+            logging.warning(f'could not prefetch audio for {tts_tag.field_text}: {e}')
+        finally:
+            with self.lock:
+                del self.pending[tag_key]
+                self.done[tag_key] = True
+                while len(self.done) > constants.PREFETCH_MAX_TRACKED:
+                    self.done.popitem(last=False)
+
+    def clear(self):
+        # when presets change, the audio for a tag may change too
+        with self.lock:
+            self.done = collections.OrderedDict()
+        self.rendered_card_ids = collections.OrderedDict()
+
+    def cancel_pending(self):
+        # requests which haven't started yet are dropped, the executor can still be used afterwards
+        with self.lock:
+            for tag_key, future in list(self.pending.items()):
+                if future.cancel():
+                    del self.pending[tag_key]
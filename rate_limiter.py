@@ -0,0 +1,83 @@
+import sys
+import time
+import logging
+import threading
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class TokenBucket():
+    """
+    paces requests to a service. callers reserve a token and sleep until it becomes available, so that
+    concurrent callers get spaced out evenly. a rate of 0 means no limit, but we still back off when
+    the service tells us we're sending too many requests.
+    """
+
+    def __init__(self, name, rate, burst):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        # reduced when the service returns HTTP 429, recovers gradually on success
+        self.current_rate = rate
+        self.tokens = self.burst
+        self.last_refill = time.monotonic()
+        self.backoff_seconds = 0
+        self.blocked_until = 0
+        self.lock = threading.Lock()
+
+    def refill_locked(self, now):
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.current_rate)
+
+    def acquire(self):
+        """wait until we're allowed to send a request, returns the number of seconds waited"""
+        with self.lock:
+            now = time.monotonic()
+            start_time = max(now, self.blocked_until)
+            if self.current_rate > 0:
+                self.refill_locked(now)
+                # the token count may go negative, later callers will wait longer
+                self.tokens -= 1
+                if self.tokens < 0:
+                    start_time = max(start_time, now + (-self.tokens) / self.current_rate)
+            wait_seconds = start_time - now
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def penalize(self, retry_after=None):
+        """the service returned HTTP 429"""
+        with self.lock:
+            now = time.monotonic()
+            if self.backoff_seconds == 0:
+                self.backoff_seconds = constants.RATE_LIMIT_BACKOFF_INITIAL_SECONDS
+            else:
+                self.backoff_seconds = min(self.backoff_seconds * 2, constants.RATE_LIMIT_BACKOFF_MAX_SECONDS)
+            backoff_seconds = self.backoff_seconds
+            if retry_after != None:
+                backoff_seconds = max(backoff_seconds, retry_after)
+            self.blocked_until = max(self.blocked_until, now + backoff_seconds)
+            if self.rate > 0:
+                self.refill_locked(now)
+                self.current_rate = max(self.rate * constants.RATE_LIMIT_MIN_RATE_FRACTION, self.current_rate / 2)
+            logging.warning(f'{self.name}: rate limited, backing off {backoff_seconds:.2f}s, rate: {self.current_rate:.2f} requests/s')
+
+    def reward(self):
+        """a request went through"""
+        with self.lock:
+            self.backoff_seconds = 0
+            if self.current_rate < self.rate:
+                self.refill_locked(time.monotonic())
+                self.current_rate = min(self.rate, self.current_rate + self.rate * constants.RATE_LIMIT_RECOVERY_FRACTION)
+
+def get_retry_after(response):
+    """seconds to wait according to the Retry-After header of a requests response, if present"""
+    retry_after = response.headers.get('Retry-After', None)
+    if retry_after == None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        # could be an http date, just use our own backoff
+        return None
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+replays a cloud-language-tools request journal (see request_journal.py) to reproduce production load patterns and
+regressions offline. unless --base-url is given, the requests go to a local stand-in server which mirrors the
+/audio_v2 contract, and which answers every journaled request with the latency, size and error that were recorded.
+results are written as json, so that they can be diffed between releases.
+
+usage: python replay_journal.py user_files/hypertts-request-journal.jsonl [--base-url http://localhost:5000]
+                           [--speed 1.0] [--latency-scale 1.0] [--concurrency 4] [--record replayed.jsonl]
+                           [--output results.json]
+
+--speed 2 replays the requests twice as fast as they were made, --speed 0 sends them as fast as the concurrency allows.
+"""
+
+import sys
+import io
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+import http.server
+import concurrent.futures
+
+if not hasattr(sys, '_addon_import_level_base'):
+    # running standalone, import the addon modules the same way the tests do
+    sys._pytest_mode = True
+    sys._addon_import_level_base = 0
+    sys._addon_import_level_services = 0
+
+import constants
+import languages
+import metrics
+import version
+import request_journal
+import cloudlanguagetools
+
+
+REPLAY_FORMAT_VERSION = 1
+STAND_IN_DEFAULT_SIZE = 16 * 1024 # audio size for requests which are not in the journal
+STAND_IN_REQUIRED_FIELDS = ['text', 'service', 'request_mode', 'language_code', 'voice_key', 'options']
+
+def get_request_key(request):
+    return json.dumps(request, sort_keys=True)
+
+def get_stand_in_audio(request, size):
+    """the same request always gets the same bytes, so that result hashes can be compared between replays"""
+    seed = hashlib.sha224(get_request_key(request).encode('utf-8')).digest()
+    return (seed * (size // len(seed) + 1))[:size]
+
+# stand-in server
+# ===============
+
+class StandInRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        content_length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(content_length)
+        status, headers, content = self.server.stand_in.handle_request(self.path, self.headers, body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if isinstance(content, bytes):
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+            return
+        # streamed response, the end of it is signaled by closing the connection
+        self.end_headers()
+        for chunk in content:
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    def log_message(self, format, *args):
+        logging.info(f'stand-in server: {format % args}')
+
+class StandInServer():
+    """
+    local http server which mirrors the cloud-language-tools /audio_v2 contract. requests found in the journal entries
+    get the recorded latency (times latency_scale), size and error, other requests get a clip right away.
+    /audio_bulk_v2 takes a list of /audio_v2 requests and streams the clips back, see CloudLanguageTools.write_tts_audio_bulk,
+    with bulk_supported=False it answers 404 like a server which predates it.
+    """
+
+    def __init__(self, entries=[], latency_scale=1.0, bulk_supported=True):
+        self.recorded = {get_request_key(entry['request']): entry for entry in entries}
+        self.latency_scale = latency_scale
+        self.bulk_supported = bulk_supported
+        self.lock = threading.Lock()
+        self.request_count = 0
+        # url path -> number of requests
+        self.path_request_counts = {}
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandInRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stand_in = self
+        self.thread = None
+
+    def get_base_url(self):
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logging.info(f'stand-in server listening on {self.get_base_url()}')
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def handle_request(self, path, headers, body):
+        """returns status, headers, content"""
+        with self.lock:
+            self.request_count += 1
+            self.path_request_counts[path] = self.path_request_counts.get(path, 0) + 1
+        bulk = path == '/audio_bulk_v2' and self.bulk_supported
+        if path != '/audio_v2' and not bulk:
+            return 404, {}, b'not found'
+        if len(headers.get('api_key', '')) == 0:
+            return 401, {}, b'missing api_key'
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return 400, {}, b'invalid json'
+        request_list = request.get('requests', None) if bulk else [request]
+        if not isinstance(request_list, list) or len(request_list) == 0:
+            return 400, {}, b'missing requests'
+        for request_entry in request_list:
+            missing_fields = [field for field in STAND_IN_REQUIRED_FIELDS if field not in request_entry]
+            if len(missing_fields) > 0:
+                return 400, {}, f'missing fields: {missing_fields}'.encode('utf-8')
+        if bulk:
+            return 200, {'Content-Type': 'application/octet-stream'}, self.get_bulk_audio_frames(request_list)
+        return self.get_audio_response(request)
+
+    def get_bulk_audio_frames(self, request_list):
+        for index, request in enumerate(request_list):
+            status, headers, content = self.get_audio_response(request)
+            if status != 200:
+                header = {'index': index, 'status': status, 'error': content.decode('utf-8')}
+                yield (json.dumps(header) + '\n').encode('utf-8')
+                continue
+            header = {'index': index, 'status': status, 'size': len(content)}
+            yield (json.dumps(header) + '\n').encode('utf-8') + content
+
+    def get_audio_response(self, request):
+        entry = self.recorded.get(get_request_key(request), None)
+        if entry == None:
+            return 200, {'Content-Type': 'audio/mpeg'}, get_stand_in_audio(request, STAND_IN_DEFAULT_SIZE)
+        time.sleep(entry['latency_seconds'] * self.latency_scale)
+        error = entry.get('error', None)
+        if error == 'RateLimitedError':
+            return 429, {'Retry-After': '1'}, b'rate limited'
+        if error != None:
+            return 500, {}, entry.get('error_message', error).encode('utf-8')
+        return 200, {'Content-Type': 'audio/mpeg'}, get_stand_in_audio(request, entry['size'])
+
+# replay
+# ======
+
+class ReplayService():
+    def __init__(self, name):
+        self.name = name
+
+class ReplayLanguage():
+    def __init__(self, language_code):
+        self.lang = languages.Language[language_code]
+
+class ReplayVoice():
+    """what CloudLanguageTools needs out of a voice, rebuilt from a journaled request"""
+    def __init__(self, request):
+        self.service = ReplayService(request['service'])
+        self.language = ReplayLanguage(request['language_code'])
+        self.voice_key = request['voice_key']
+
+    def __str__(self):
+        return f'{self.service.name} {self.voice_key}'
+
+class ReplayRequestContext():
+    def __init__(self, request_mode_name):
+        self.request_mode = constants.RequestMode[request_mode_name]
+
+    def get_request_mode(self):
+        return self.request_mode
+
+class ReplayResult():
+    def __init__(self, entry, latency_seconds, result_hash, error):
+        self.entry = entry
+        self.latency_seconds = latency_seconds
+        self.result_hash = result_hash
+        self.error = error
+
+class JournalReplay():
+    def __init__(self, entries, base_url, api_key='replay', speed=1.0, concurrency=constants.CLOUDLANGUAGETOOLS_CONCURRENCY, record_filename=None):
+        # requests are sent in the order they were made
+        self.entries = sorted(entries, key=lambda entry: entry['time'])
+        self.speed = speed
+        self.concurrency = concurrency
+        self.client = cloudlanguagetools.CloudLanguageTools()
+        self.client.base_url = base_url
+        self.client.configure(api_key)
+        if record_filename != None:
+            # the replay gets journaled like a real session, it can be replayed or compared in turn
+            self.client.set_request_journal(request_journal.RequestJournal(record_filename))
+
+    def replay_entry(self, entry):
+        request = entry['request']
+        output_file = io.BytesIO()
+        start_time = time.monotonic()
+        try:
+            self.client.write_tts_audio(request['text'], ReplayVoice(request), request['options'],
+                ReplayRequestContext(request['request_mode']), output_file)
+        except Exception as e:
+            return ReplayResult(entry, time.monotonic() - start_time, None, type(e).__name__)
+        return ReplayResult(entry, time.monotonic() - start_time, hashlib.sha224(output_file.getvalue()).hexdigest(), None)
+
+    def run(self):
+        replay_results = []
+        start_time = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = []
+            if len(self.entries) > 0:
+                first_request_time = self.entries[0]['time']
+            for entry in self.entries:
+                if self.speed > 0:
+                    # keep the gaps between requests, so that bursts and idle periods are reproduced
+                    delay = (entry['time'] - first_request_time) / self.speed - (time.monotonic() - start_time)
+                    if delay > 0:
+                        time.sleep(delay)
+                futures.append(executor.submit(self.replay_entry, entry))
+            for future in futures:
+                replay_results.append(future.result())
+        elapsed_seconds = time.monotonic() - start_time
+        return self.get_results(replay_results, elapsed_seconds)
+
+    def get_results(self, replay_results, elapsed_seconds):
+        latency = metrics.Histogram()
+        recorded_latency = metrics.Histogram()
+        errors = {}
+        recorded_errors = {}
+        status_mismatches = 0
+        result_hash_mismatches = 0
+        for result in replay_results:
+            latency.observe(result.latency_seconds)
+            recorded_latency.observe(result.entry['latency_seconds'])
+            recorded_error = result.entry.get('error', None)
+            if result.error != None:
+                errors[result.error] = errors.get(result.error, 0) + 1
+            if recorded_error != None:
+                recorded_errors[recorded_error] = recorded_errors.get(recorded_error, 0) + 1
+            if (result.error == None) != (recorded_error == None):
+                status_mismatches += 1
+            elif result.error == None and result.result_hash != result.entry['result_hash']:
+                result_hash_mismatches += 1
+        return {
+            'format_version': REPLAY_FORMAT_VERSION,
+            'hypertts_version': version.ANKI_HYPER_TTS_VERSION,
+            'parameters': {
+                'speed': self.speed,
+                'concurrency': self.concurrency
+            },
+            'request_count': len(replay_results),
+            'elapsed_seconds': elapsed_seconds,
+            'requests_per_second': len(replay_results) / elapsed_seconds if elapsed_seconds > 0 else None,
+            'latency': latency.snapshot(),
+            'recorded_latency': recorded_latency.snapshot(),
+            'errors': errors,
+            'recorded_errors': recorded_errors,
+            # the request failed now and succeeded when recorded, or the other way around
+            'status_mismatches': status_mismatches,
+            # only meaningful when the server returns the same audio for the same request, like the stand-in
+            'result_hash_mismatches': result_hash_mismatches
+        }
+
+def replay_journal(options):
+    entries = []
+    for journal_filename in options.journals:
+        entries.extend(request_journal.load_journal(journal_filename))
+    stand_in = None
+    base_url = options.base_url
+    if base_url == None:
+        stand_in = StandInServer(entries, options.latency_scale)
+        stand_in.start()
+        base_url = stand_in.get_base_url()
+    try:
+        replay = JournalReplay(entries, base_url, api_key=options.api_key, speed=options.speed,
+            concurrency=options.concurrency, record_filename=options.record)
+        results = replay.run()
+        results['parameters']['base_url'] = options.base_url
+        results['parameters']['latency_scale'] = options.latency_scale
+        return results
+    finally:
+        if stand_in != None:
+            stand_in.stop()
+
+def parse_options(argv):
+    parser = argparse.ArgumentParser(description='replay a HyperTTS cloud-language-tools request journal')
+    parser.add_argument('journals', nargs='+', help='request journal files, hypertts-request-journal.jsonl in user_files')
+    parser.add_argument('--base-url', default=None, help='server to replay against, a local stand-in server by default')
+    parser.add_argument('--api-key', default='replay')
+    parser.add_argument('--speed', type=float, default=1.0, help='how much faster than recorded to send the requests, 0 for no delay')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='multiplies the latency the stand-in server replays')
+    parser.add_argument('--concurrency', type=int, default=constants.CLOUDLANGUAGETOOLS_CONCURRENCY)
+    parser.add_argument('--record', default=None, help='journal the replayed requests to that file')
+    parser.add_argument('--output', default=None, help='json file to write the results to, stdout by default')
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+def main():
+    options = parse_options(sys.argv[1:])
+    if options.verbose:
+        logging.basicConfig(format='%(asctime)s %(levelname)-8s %(message)s', level=logging.INFO)
+    else:
+        logging.disable(logging.CRITICAL)
+    results = replay_journal(options)
+    if options.output != None:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+if __name__ == '__main__':
+    main()
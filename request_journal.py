@@ -0,0 +1,52 @@
+import sys
+import os
+import json
+import logging
+import threading
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class RequestJournal():
+    """
+    appends one json line per cloud-language-tools audio request: what was requested, how long it took and
+    a hash of the audio which came back. the journal stays on this computer, replay_journal.py re-runs it
+    against a local stand-in server. once the file reaches max_size_bytes it's rotated, keeping one previous file.
+    """
+
+    def __init__(self, filename, max_size_bytes=constants.REQUEST_JOURNAL_MAX_SIZE_BYTES):
+        self.filename = filename
+        self.max_size_bytes = max_size_bytes
+        self.lock = threading.Lock()
+        self.size = None
+
+    def get_rotated_filename(self):
+        return self.filename + '.1'
+
+    def record(self, entry):
+        line = json.dumps(entry) + '\n'
+        with self.lock:
+            try:
+                if self.size == None:
+                    self.size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+                if self.size > 0 and self.size + len(line) > self.max_size_bytes:
+                    os.replace(self.filename, self.get_rotated_filename())
+                    self.size = 0
+                with open(self.filename, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                self.size += len(line)
+            except OSError as e:
+                # the journal is a diagnostic tool, it must never fail an audio request
+                logging.warning(f'could not write to request journal {self.filename}: {e}')
+
+def load_journal(filename):
+    """returns the list of entries in a journal file"""
+    entries = []
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # the last line may be truncated if anki was closed while writing it
+                logging.warning(f'skipping invalid line in request journal {filename}')
+    return entries
@@ -2,6 +2,7 @@ import sys
 import abc
 from posixpath import dirname
 import typing
+import requests
 
 if hasattr(sys, '_pytest_mode'):
     import services.voicelist
@@ -38,6 +39,17 @@ class ServiceBase(abc.ABC):
 
     enabled = property(fget=_get_enabled, fset=_set_enabled)
 
+    # http session with keep-alive connection pools, handed to us by the ServiceManager
+    def _get_http_session(self):
+        if not hasattr(self, '_http_session'):
+            self._http_session = requests.Session()
+        return self._http_session
+
+    def _set_http_session(self, http_session):
+        self._http_session = http_session
+
+    http_session = property(fget=_get_http_session, fset=_set_http_session)
+
     # whether the service is supported by cloud-language-tools
     def cloudlanguagetools_enabled(self):
         return False # default
@@ -59,6 +71,11 @@ class ServiceBase(abc.ABC):
     def test_service(self):
         return False
 
+    # how many audio requests can be sent to this service at the same time during a batch,
+    # can be overridden by the user with the SERVICE_CONFIG_CONCURRENCY configuration key
+    def concurrency_default(self):
+        return constants.BATCH_DEFAULT_CONCURRENCY
+
     @abc.abstractmethod
     def voice_list(self) -> typing.List[voice.VoiceBase]:
         pass
@@ -67,17 +84,25 @@ class ServiceBase(abc.ABC):
     def get_tts_audio(self, source_text, voice: voice.VoiceBase, options):
         pass
 
+    def write_tts_audio(self, source_text, voice: voice.VoiceBase, options, output_file):
+        """writes the audio to output_file. services which can stream their response override this,
+        so that long clips don't have to be held in memory"""
+        output_file.write(self.get_tts_audio(source_text, voice, options))
+
     # some helper functions
     def basic_voice_list(self) -> typing.List[voice.VoiceBase]:
-        """basic processing for voice list which should work for most services which are represented in voicelist.py"""
-        service_voices_json = [voice for voice in services.voicelist.VOICE_LIST if voice['service'] == self.name]
-        service_voices = [voice.Voice(v['name'], 
-                            constants.Gender[v['gender']], 
-                            languages.AudioLanguage[v['language']], 
-                            self, 
-                            v['key'],
-                            v['options']) for v in service_voices_json]
-        return service_voices
+        """basic processing for voice list which should work for most services which are represented in voicelist.dat"""
+        # the Voice objects are built once per service instance
+        if not hasattr(self, '_basic_voice_list'):
+            # only this service's section of the voice list gets parsed
+            service_voices_json = services.voicelist.get_service_voices(self.name)
+            self._basic_voice_list = [voice.Voice(v['name'], 
+                                constants.Gender[v['gender']], 
+                                languages.AudioLanguage[v['language']], 
+                                self, 
+                                v['key'],
+                                v['options']) for v in service_voices_json]
+        return self._basic_voice_list
 
     # the following functions can be overriden if a service requires configuration
     def configuration_options(self):
@@ -1,9 +1,12 @@
 from re import sub
 import sys
 import os
+import io
 import importlib
 import logging
 import typing
+import time
+import threading
 import requests
 
 voice = __import__('voice', globals(), locals(), [], sys._addon_import_level_base)
@@ -11,6 +14,10 @@ service = __import__('service', globals(), locals(), [], sys._addon_import_level
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_base)
 version = __import__('version', globals(), locals(), [], sys._addon_import_level_base)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+voice_registry = __import__('voice_registry', globals(), locals(), [], sys._addon_import_level_base)
+http_pool = __import__('http_pool', globals(), locals(), [], sys._addon_import_level_base)
+rate_limiter = __import__('rate_limiter', globals(), locals(), [], sys._addon_import_level_base)
+metrics = __import__('metrics', globals(), locals(), [], sys._addon_import_level_base)
 cloudlanguagetools_module = __import__('cloudlanguagetools', globals(), locals(), [], sys._addon_import_level_base)
 
 if hasattr(sys, '_sentry_crash_reporting'):
@@ -28,19 +35,51 @@ class ServiceManager():
         self.cloudlanguagetools_enabled = False
         self.allow_test_services = allow_test_services
         self.cloudlanguagetools = cloudlanguagetools
+        self.http_session_manager = http_pool.HttpSessionManager()
+        self.cloudlanguagetools.set_http_session(self.http_session_manager.get_session('cloudlanguagetools'))
+        # service_name -> user configured concurrency limit
+        self.service_concurrency = {}
+        # service_name (or cloudlanguagetools) -> semaphore, limiting concurrent audio requests
+        self.concurrency_semaphores = {}
+        # service_name -> (requests per second, burst)
+        self.service_rate_limits = {}
+        # service_name (or cloudlanguagetools) -> TokenBucket
+        self.rate_limiters = {}
+        self.concurrency_lock = threading.Lock()
+        # request counts, latencies and concurrency, see get_metrics
+        self.metrics = metrics.MetricsRegistry()
+        # recent latency by concurrency key, for the batch planner. survives reset_metrics
+        self.latency_estimator = metrics.LatencyEstimator()
+        # built on init_services, rebuilt when services get enabled or disabled
+        self.voice_registry = None
+        # service module name -> seconds it took to import
+        self.service_import_seconds = {}
 
     def configure(self, configuration_model):
+        self.service_concurrency = {}
+        self.service_rate_limits = {}
         for service_name, enabled in configuration_model.get_service_enabled_map().items():
             service = self.get_service(service_name)
             service.enabled = enabled
         for service_name, config in configuration_model.get_service_config().items():
             service = self.get_service(service_name)
             service.configure(config)
+            concurrency = config.get(constants.SERVICE_CONFIG_CONCURRENCY, 0)
+            if concurrency != None and concurrency > 0:
+                self.service_concurrency[service_name] = concurrency
+            rate_limit = self.get_rate_limit_from_config(config)
+            if rate_limit != None:
+                self.service_rate_limits[service_name] = rate_limit
+        with self.concurrency_lock:
+            self.concurrency_semaphores = {}
+            self.rate_limiters = {}
+        self.configure_http_sessions(configuration_model)
         # if we enable cloudlanguagetools, it may force some services to enabled
         if configuration_model.hypertts_pro_api_key_set():
             self.configure_cloudlanguagetools(configuration_model.hypertts_pro_api_key)
         else:
             self.cloudlanguagetools_enabled = False
+        self.invalidate_voice_registry()
 
     # service discovery
     # =================
@@ -57,14 +96,21 @@ class ServiceManager():
     def init_services(self):
         self.import_services()
         self.instantiate_services()
+        self.invalidate_voice_registry()
+        self.get_voice_registry()
 
     def import_services(self):
+        # the service modules are light, their heavy dependencies (boto3, gtts) are loaded through
+        # lazy_import.LazyModule the first time the service gets used
         module_names = self.discover_services()
         logging.info(f'discovered {len(module_names)} services')
         # sys.path.insert(0, self.services_directory)
         for module_name in module_names:
-            logging.info(f'importing module {module_name}')
+            start_time = time.monotonic()
             __import__(self.package_name, globals(), locals(), [module_name], sys._addon_import_level_base)
+            self.service_import_seconds[module_name] = time.monotonic() - start_time
+            logging.info(f'imported module {module_name} in {self.service_import_seconds[module_name]:.3f}s')
+        logging.info(f'imported {len(module_names)} service modules in {sum(self.service_import_seconds.values()):.3f}s')
 
     def instantiate_services(self):
         for subclass in service.ServiceBase.__subclasses__():
@@ -73,6 +119,7 @@ class ServiceManager():
                 logging.info(f'skipping test service {subclass_instance.name}')
                 continue
             logging.info(f'instantiating service {subclass_instance.name}')
+            subclass_instance.http_session = self.http_session_manager.get_session(subclass_instance.name)
             self.services[subclass_instance.name] = subclass_instance
 
     def get_service(self, service_name):
@@ -84,6 +131,17 @@ class ServiceManager():
     # service configuration
     # =====================
 
+    def configure_http_sessions(self, configuration_model):
+        # services which don't set the pool sizes (or set them to 0) go back to the defaults
+        service_config = configuration_model.get_service_config()
+        for service_name in self.services.keys():
+            config = service_config.get(service_name, {})
+            pool_connections = config.get(constants.SERVICE_CONFIG_HTTP_POOL_CONNECTIONS, None)
+            pool_maxsize = config.get(constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE, None)
+            self.http_session_manager.configure_session(service_name,
+                pool_connections if pool_connections != None and pool_connections > 0 else None,
+                pool_maxsize if pool_maxsize != None and pool_maxsize > 0 else None)
+
     def configure_cloudlanguagetools(self, api_key):
         logging.info('configure_cloudlanguagetools')
         self.cloudlanguagetools.configure(api_key)
@@ -106,13 +164,197 @@ class ServiceManager():
                 return True
         return False
 
+    # concurrency limits
+    # ==================
+
+    def get_concurrency_key(self, voice):
+        if self.use_cloud_language_tools(voice):
+            return 'cloudlanguagetools'
+        return voice.service.name
+
+    def get_concurrency_limit(self, voice):
+        if self.use_cloud_language_tools(voice):
+            return constants.CLOUDLANGUAGETOOLS_CONCURRENCY
+        return self.service_concurrency.get(voice.service.name, voice.service.concurrency_default())
+
+    def get_concurrency_semaphore(self, voice):
+        key = self.get_concurrency_key(voice)
+        with self.concurrency_lock:
+            if key not in self.concurrency_semaphores:
+                self.concurrency_semaphores[key] = threading.BoundedSemaphore(self.get_concurrency_limit(voice))
+            return self.concurrency_semaphores[key]
+
+    def get_batch_worker_count(self, voice_list):
+        # one worker per allowed concurrent request, over all services used by this batch
+        limits = {}
+        for voice in voice_list:
+            limits[self.get_concurrency_key(voice)] = self.get_concurrency_limit(voice)
+        worker_count = sum(limits.values())
+        return max(1, min(worker_count, constants.BATCH_MAX_WORKERS))
+
+    # rate limiting
+    # =============
+
+    def get_rate_limit_from_config(self, config):
+        requests_per_second = config.get(constants.SERVICE_CONFIG_REQUESTS_PER_SECOND, 0)
+        burst = config.get(constants.SERVICE_CONFIG_BURST, 0)
+        if requests_per_second == None or requests_per_second <= 0:
+            return None
+        if burst == None or burst <= 0:
+            burst = 1
+        return requests_per_second, burst
+
+    def get_rate_limiter(self, voice):
+        key = self.get_concurrency_key(voice)
+        with self.concurrency_lock:
+            if key not in self.rate_limiters:
+                # no rate limit on cloudlanguagetools, but we still back off on HTTP 429
+                requests_per_second, burst = 0, 1
+                if not self.use_cloud_language_tools(voice):
+                    requests_per_second, burst = self.service_rate_limits.get(voice.service.name, (0, 1))
+                self.rate_limiters[key] = rate_limiter.TokenBucket(key, requests_per_second, burst)
+            return self.rate_limiters[key]
+
+    # metrics
+    # =======
+
+    def get_metrics(self):
+        """snapshot of the request metrics since startup (or the last reset_metrics), see metrics.MetricsRegistry"""
+        return self.metrics.snapshot()
+
+    def reset_metrics(self):
+        self.metrics.reset()
+
+    def get_latency_estimate(self, voice):
+        latency = self.latency_estimator.get_estimate(self.get_concurrency_key(voice))
+        if latency == None:
+            return constants.BATCH_PLAN_DEFAULT_LATENCY_SECONDS
+        return latency
+
     def get_tts_audio(self, source_text, voice, options, audio_request_context):
+        output_file = io.BytesIO()
+        self.write_tts_audio(source_text, voice, options, audio_request_context, output_file)
+        return output_file.getvalue()
+
+    def write_tts_audio(self, source_text, voice, options, audio_request_context, output_file):
+        """writes the audio to output_file as it comes in from the service, returns the number of bytes written"""
+        token_bucket = self.get_rate_limiter(voice)
+        key = self.get_concurrency_key(voice)
+        with self.metrics.get_gauge_context(metrics.WAITING, key):
+            semaphore = self.get_concurrency_semaphore(voice)
+            semaphore.acquire()
+        try:
+            with self.metrics.get_gauge_context(metrics.IN_FLIGHT, key):
+                return self.write_tts_audio_rate_limited(source_text, voice, options, audio_request_context, output_file, token_bucket)
+        finally:
+            semaphore.release()
+
+    def write_tts_audio_rate_limited(self, source_text, voice, options, audio_request_context, output_file, token_bucket):
+        key = self.get_concurrency_key(voice)
+        start_position = output_file.tell()
+        retry_count = 0
+        while True:
+            self.metrics.observe(metrics.RATE_LIMIT_WAIT, key, token_bucket.acquire())
+            try:
+                start_time = time.monotonic()
+                self.write_tts_audio_limited(source_text, voice, options, audio_request_context, output_file)
+                size = output_file.tell() - start_position
+                latency = time.monotonic() - start_time
+                self.metrics.observe(metrics.LATENCY, voice.service.name, latency)
+                self.latency_estimator.observe(key, latency)
+                self.metrics.increment(metrics.REQUESTS, voice.service.name)
+                self.metrics.increment(metrics.BYTES, voice.service.name, size)
+                token_bucket.reward()
+                return size
+            except errors.RateLimitedError as e:
+                self.metrics.increment(metrics.ERRORS, voice.service.name, sub_key=type(e).__name__)
+                # the request gets retried, drop anything the service wrote before it failed
+                output_file.seek(start_position)
+                output_file.truncate()
+                token_bucket.penalize(e.retry_after)
+                if retry_count >= constants.RATE_LIMIT_MAX_RETRIES:
+                    raise e
+                retry_count += 1
+                logging.info(f'retrying rate limited request for {voice}, attempt {retry_count}')
+            except Exception as e:
+                self.metrics.increment(metrics.ERRORS, voice.service.name, sub_key=type(e).__name__)
+                raise e
+
+    def write_tts_audio_bulk(self, audio_requests, audio_request_context):
+        """
+        audio_requests is a list of (source_text, voice, options, output_file) which all go to cloud-language-tools.
+        they are sent as one bulk request, which counts as one request against the concurrency limit, or one by one
+        if the server doesn't support that. returns the exception (or None) for each request.
+        """
+        voice = audio_requests[0][1]
+        token_bucket = self.get_rate_limiter(voice)
+        key = self.get_concurrency_key(voice)
+        with self.metrics.get_gauge_context(metrics.WAITING, key):
+            semaphore = self.get_concurrency_semaphore(voice)
+            semaphore.acquire()
+        try:
+            with self.metrics.get_gauge_context(metrics.IN_FLIGHT, key):
+                exceptions = self.write_tts_audio_bulk_rate_limited(audio_requests, audio_request_context, token_bucket)
+        finally:
+            semaphore.release()
+
+        if exceptions == None:
+            exceptions = [None] * len(audio_requests)
+            retry_indices = range(len(audio_requests))
+        else:
+            # clips which got rate limited within the bulk request are retried one by one, with the usual backoff
+            retry_indices = [index for index, exception in enumerate(exceptions) if isinstance(exception, errors.RateLimitedError)]
+        for index in retry_indices:
+            source_text, voice, options, output_file = audio_requests[index]
+            try:
+                self.write_tts_audio(source_text, voice, options, audio_request_context, output_file)
+                exceptions[index] = None
+            except Exception as e:
+                exceptions[index] = e
+        return exceptions
+
+    def write_tts_audio_bulk_rate_limited(self, audio_requests, audio_request_context, token_bucket):
+        voice = audio_requests[0][1]
+        key = self.get_concurrency_key(voice)
+        retry_count = 0
+        while True:
+            self.metrics.observe(metrics.RATE_LIMIT_WAIT, key, token_bucket.acquire())
+            try:
+                start_time = time.monotonic()
+                exceptions = self.cloudlanguagetools.write_tts_audio_bulk(audio_requests, audio_request_context)
+                if exceptions == None:
+                    return None
+                # the clips share the request time, this keeps latency estimates per clip comparable with single requests
+                clip_latency = (time.monotonic() - start_time) / len(audio_requests)
+                for (source_text, voice, options, output_file), exception in zip(audio_requests, exceptions):
+                    if exception != None:
+                        self.metrics.increment(metrics.ERRORS, voice.service.name, sub_key=type(exception).__name__)
+                        continue
+                    self.metrics.observe(metrics.LATENCY, voice.service.name, clip_latency)
+                    self.latency_estimator.observe(key, clip_latency)
+                    self.metrics.increment(metrics.REQUESTS, voice.service.name)
+                    self.metrics.increment(metrics.BYTES, voice.service.name, output_file.tell())
+                token_bucket.reward()
+                return exceptions
+            except errors.RateLimitedError as e:
+                # the whole bulk request was rejected, nothing was written yet
+                self.metrics.increment(metrics.ERRORS, voice.service.name, sub_key=type(e).__name__)
+                token_bucket.penalize(e.retry_after)
+                if retry_count >= constants.RATE_LIMIT_MAX_RETRIES:
+                    raise e
+                retry_count += 1
+                logging.info(f'retrying rate limited bulk request of {len(audio_requests)} clips, attempt {retry_count}')
+            except Exception as e:
+                self.metrics.increment(metrics.ERRORS, voice.service.name, sub_key=type(e).__name__)
+                raise e
+
+    def write_tts_audio_limited(self, source_text, voice, options, audio_request_context, output_file):
         if hasattr(sys, '_sentry_crash_reporting'):
-            return self.get_tts_audio_instrumented(source_text, voice, options, audio_request_context)
+            self.write_tts_audio_instrumented(source_text, voice, options, audio_request_context, output_file)
         else:
-            return self.get_tts_audio_implementation(source_text, voice, options, audio_request_context)
+            self.write_tts_audio_implementation(source_text, voice, options, audio_request_context, output_file)
 
-    def get_tts_audio_instrumented(self, source_text, voice, options, audio_request_context):
+    def write_tts_audio_instrumented(self, source_text, voice, options, audio_request_context, output_file):
         transaction_name = f'{voice.service.name}'
         if self.use_cloud_language_tools(voice):
             transaction_name = f'cloudlanguagetools_{voice.service.name}'
@@ -120,9 +362,9 @@ class ServiceManager():
         raise_exception = None
         with sentry_sdk.start_transaction(op="audio", name=transaction_name) as transaction:
             try:
-                result_audio = self.get_tts_audio_implementation(source_text, voice, options, audio_request_context)
+                self.write_tts_audio_implementation(source_text, voice, options, audio_request_context, output_file)
                 transaction.status = 'ok'
-                return result_audio
+                return
             except Exception as e:
                 transaction.status = 'invalid_argument'
                 sentry_sdk.set_context("audio_request", {
@@ -134,23 +376,29 @@ class ServiceManager():
         if raise_exception != None:
             raise raise_exception
 
-    def get_tts_audio_implementation(self, source_text, voice, options, audio_request_context):
+    def write_tts_audio_implementation(self, source_text, voice, options, audio_request_context, output_file):
         if self.use_cloud_language_tools(voice):
-            return self.cloudlanguagetools.get_tts_audio(source_text, voice, options, audio_request_context)
+            self.cloudlanguagetools.write_tts_audio(source_text, voice, options, audio_request_context, output_file)
         else:
-            return voice.service.get_tts_audio(source_text, voice, options)
+            voice.service.write_tts_audio(source_text, voice, options, output_file)
+
+    # voice registry
+    # ==============
+
+    def invalidate_voice_registry(self):
+        self.voice_registry = None
+
+    def get_voice_registry(self) -> voice_registry.VoiceRegistry:
+        # services can also be enabled or disabled directly, check whether that happened
+        if self.voice_registry == None or not self.voice_registry.is_current(self.services):
+            self.voice_registry = voice_registry.VoiceRegistry(self.services)
+        return self.voice_registry
 
     def full_voice_list(self) -> typing.List[voice.VoiceBase]:
-        full_list = []
-        for service_name, service_instance in self.services.items():
-            if service_instance.enabled:
-                voices = service_instance.voice_list()
-                full_list.extend(voices)
-        return full_list
+        return list(self.get_voice_registry().voice_list)
 
     def deserialize_voice(self, voice_data):
-        voice_list = self.full_voice_list()
-        voice_subset = [voice for voice in voice_list if voice.voice_key == voice_data['voice_key'] and voice.service.name == voice_data['service']]
-        if len(voice_subset) == 0:
+        registry = self.get_voice_registry()
+        if not registry.has_voice(voice_data['service'], voice_data['voice_key']):
             raise errors.VoiceNotFound(voice_data)
-        return voice_subset[0]
\ No newline at end of file
+        return registry.get_voice(voice_data['service'], voice_data['voice_key'])
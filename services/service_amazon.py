@@ -1,30 +1,39 @@
 import sys
 import requests
 import datetime
+import shutil
 import logging
-import time
-import boto3
-import botocore
+import threading
 import contextlib
 
 voice = __import__('voice', globals(), locals(), [], sys._addon_import_level_services)
 service = __import__('service', globals(), locals(), [], sys._addon_import_level_services)
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_services)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_services)
+lazy_import = __import__('lazy_import', globals(), locals(), [], sys._addon_import_level_services)
+
+# boto3 is slow to import, only load it when the service gets used
+boto3 = lazy_import.LazyModule('boto3')
+botocore_config = lazy_import.LazyModule('botocore.config')
+botocore_exceptions = lazy_import.LazyModule('botocore.exceptions')
 
 class Amazon(service.ServiceBase):
     CONFIG_ACCESS_KEY_ID = 'aws_access_key_id'
     CONFIG_SECRET_ACCESS_KEY = 'aws_secret_access_key'
     CONFIG_REGION = 'aws_region'
-    CONFIG_THROTTLE_SECONDS = 'throttle_seconds'
 
     def __init__(self):
         service.ServiceBase.__init__(self)
         self.access_token = None
+        self.polly_client = None
+        self.polly_client_lock = threading.Lock()
 
     def cloudlanguagetools_enabled(self):
         return True
 
+    def concurrency_default(self):
+        return constants.BATCH_PREMIUM_CONCURRENCY
+
     @property
     def service_type(self) -> constants.ServiceType:
         return constants.ServiceType.tts
@@ -62,26 +71,42 @@ class Amazon(service.ServiceBase):
                 'us-gov-east-1',
                 'us-gov-west-1',                
             ],
-            self.CONFIG_THROTTLE_SECONDS: float
+            constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: float,
+            constants.SERVICE_CONFIG_BURST: int,
+            constants.SERVICE_CONFIG_CONCURRENCY: int
         }
 
     def configure(self, config):
         self._config = config
-        self.polly_client = boto3.client("polly",
-            aws_access_key_id=self.get_configuration_value_mandatory(self.CONFIG_ACCESS_KEY_ID),
-            aws_secret_access_key=self.get_configuration_value_mandatory(self.CONFIG_SECRET_ACCESS_KEY),
-            region_name=self.get_configuration_value_optional(self.CONFIG_REGION, 'us-east-1'),
-            config=botocore.config.Config(connect_timeout=constants.RequestTimeout, read_timeout=constants.RequestTimeout))        
-
+        # checks the mandatory settings right away, but creating the client imports boto3,
+        # which only happens once audio gets requested
+        self.get_configuration_value_mandatory(self.CONFIG_ACCESS_KEY_ID)
+        self.get_configuration_value_mandatory(self.CONFIG_SECRET_ACCESS_KEY)
+        with self.polly_client_lock:
+            self.polly_client = None
+
+    def get_polly_client(self):
+        with self.polly_client_lock:
+            if self.polly_client == None:
+                self.polly_client = boto3.client("polly",
+                    aws_access_key_id=self.get_configuration_value_mandatory(self.CONFIG_ACCESS_KEY_ID),
+                    aws_secret_access_key=self.get_configuration_value_mandatory(self.CONFIG_SECRET_ACCESS_KEY),
+                    region_name=self.get_configuration_value_optional(self.CONFIG_REGION, 'us-east-1'),
+                    config=botocore_config.Config(connect_timeout=constants.RequestTimeout, read_timeout=constants.RequestTimeout))
+            return self.polly_client
 
     def voice_list(self):
         return self.basic_voice_list()
 
     def get_tts_audio(self, source_text, voice: voice.VoiceBase, options):
-        throttle_seconds = self.get_configuration_value_optional(self.CONFIG_THROTTLE_SECONDS, 0)
-        if throttle_seconds > 0:
-            time.sleep(throttle_seconds)        
+        with contextlib.closing(self.get_audio_stream(source_text, voice, options)) as stream:
+            return stream.read()
 
+    def write_tts_audio(self, source_text, voice: voice.VoiceBase, options, output_file):
+        with contextlib.closing(self.get_audio_stream(source_text, voice, options)) as stream:
+            shutil.copyfileobj(stream, output_file, constants.AUDIO_STREAM_CHUNK_SIZE)
+
+    def get_audio_stream(self, source_text, voice: voice.VoiceBase, options):
         pitch = options.get('pitch', voice.options['pitch']['default'])
         pitch_str = f'{pitch:+.0f}%'
         rate = options.get('rate', voice.options['rate']['default'])
@@ -100,12 +125,15 @@ class Amazon(service.ServiceBase):
 </speak>"""
 
         try:
-            response = self.polly_client.synthesize_speech(Text=ssml_str, TextType="ssml", OutputFormat="mp3", VoiceId=voice.voice_key['voice_id'], Engine=voice.voice_key['engine'])
-        except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError) as error:
+            response = self.get_polly_client().synthesize_speech(Text=ssml_str, TextType="ssml", OutputFormat="mp3", VoiceId=voice.voice_key['voice_id'], Engine=voice.voice_key['engine'])
+        except botocore_exceptions.ClientError as error:
+            if error.response.get('Error', {}).get('Code', None) == 'ThrottlingException':
+                raise errors.RateLimitedError(source_text, voice, str(error))
+            raise errors.RequestError(source_text, voice, str(error))
+        except botocore_exceptions.BotoCoreError as error:
             raise errors.RequestError(source_text, voice, str(error))
 
         if "AudioStream" in response:
-            with contextlib.closing(response["AudioStream"]) as stream:
-                return stream.read()
+            return response["AudioStream"]
 
         raise errors.RequestError(source_text, voice, 'no audio stream')
\ No newline at end of file
@@ -2,17 +2,16 @@ import sys
 import requests
 import datetime
 import logging
-import time
 
 voice = __import__('voice', globals(), locals(), [], sys._addon_import_level_services)
 service = __import__('service', globals(), locals(), [], sys._addon_import_level_services)
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_services)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_services)
+rate_limiter = __import__('rate_limiter', globals(), locals(), [], sys._addon_import_level_services)
 
 class Azure(service.ServiceBase):
     CONFIG_REGION = 'region'
     CONFIG_API_KEY = 'api_key'
-    CONFIG_THROTTLE_SECONDS = 'throttle_seconds'
 
     def __init__(self):
         service.ServiceBase.__init__(self)
@@ -21,6 +20,9 @@ class Azure(service.ServiceBase):
     def cloudlanguagetools_enabled(self):
         return True
 
+    def concurrency_default(self):
+        return constants.BATCH_PREMIUM_CONCURRENCY
+
     @property
     def service_type(self) -> constants.ServiceType:
         return constants.ServiceType.tts
@@ -56,7 +58,11 @@ class Azure(service.ServiceBase):
                 'uksouth',                
             ],
             self.CONFIG_API_KEY: str,
-            self.CONFIG_THROTTLE_SECONDS: float
+            constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: float,
+            constants.SERVICE_CONFIG_BURST: int,
+            constants.SERVICE_CONFIG_CONCURRENCY: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_CONNECTIONS: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE: int
         }
 
     def get_token(self, subscription_key, region):
@@ -67,7 +73,7 @@ class Azure(service.ServiceBase):
         headers = {
             'Ocp-Apim-Subscription-Key': subscription_key
         }
-        response = requests.post(fetch_token_url, headers=headers)
+        response = self.http_session.post(fetch_token_url, headers=headers)
         self.access_token = str(response.text)
         self.access_token_timestamp = datetime.datetime.now()
         logging.debug(f'requested access_token')
@@ -86,13 +92,17 @@ class Azure(service.ServiceBase):
         return self.basic_voice_list()
 
     def get_tts_audio(self, source_text, voice: voice.VoiceBase, options):
+        return self.request_tts_audio(source_text, voice, options, False).content
+
+    def write_tts_audio(self, source_text, voice: voice.VoiceBase, options, output_file):
+        response = self.request_tts_audio(source_text, voice, options, True)
+        with response:
+            for chunk in response.iter_content(chunk_size=constants.AUDIO_STREAM_CHUNK_SIZE):
+                output_file.write(chunk)
 
+    def request_tts_audio(self, source_text, voice: voice.VoiceBase, options, stream):
         region = self.get_configuration_value_mandatory(self.CONFIG_REGION)
         subscription_key = self.get_configuration_value_mandatory(self.CONFIG_API_KEY)
-        throttle_seconds = self.get_configuration_value_optional(self.CONFIG_THROTTLE_SECONDS, 0)
-
-        if throttle_seconds > 0:
-            time.sleep(throttle_seconds)
         
         if self.token_refresh_required():
             self.get_token(subscription_key, region)
@@ -118,10 +128,13 @@ class Azure(service.ServiceBase):
         
         body = ssml_str.encode(encoding='utf-8')
 
-        response = requests.post(constructed_url, headers=headers, data=body, timeout=constants.RequestTimeout)
+        response = self.http_session.post(constructed_url, headers=headers, data=body, timeout=constants.RequestTimeout, stream=stream)
+        if response.status_code == 429:
+            raise errors.RateLimitedError(source_text, voice, f'status code {response.status_code}: {response.reason}',
+                rate_limiter.get_retry_after(response))
         if response.status_code != 200:
             error_message = f'status code {response.status_code}: {response.reason}'
             logging.error(error_message)
             raise errors.RequestError(source_text, voice, error_message)
 
-        return response.content
+        return response
@@ -47,7 +47,7 @@ class Collins(service.ServiceBase):
             'dictCode': voice.voice_key,
             'q': source_text
         }
-        response = requests.get(self.SEARCH_URL, params=search_params, headers=headers)
+        response = self.http_session.get(self.SEARCH_URL, params=search_params, headers=headers)
         
         # word not found ?
         if '/spellcheck/' in response.url:
@@ -66,7 +66,7 @@ class Collins(service.ServiceBase):
         logging.info(f'found sound_url: {sound_url}')
 
         logging.info(f'downloading url {sound_url}')
-        response = requests.get(sound_url, headers=headers)
+        response = self.http_session.get(sound_url, headers=headers)
         if response.status_code != 200:
             raise errors.RequestError(source_text, voice, f'download audio returned status code {response.status_code} ({sound_url})')
 
@@ -2,17 +2,16 @@ import sys
 import requests
 import base64
 import logging
-import time
 
 voice = __import__('voice', globals(), locals(), [], sys._addon_import_level_services)
 service = __import__('service', globals(), locals(), [], sys._addon_import_level_services)
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_services)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_services)
+rate_limiter = __import__('rate_limiter', globals(), locals(), [], sys._addon_import_level_services)
 
 class Google(service.ServiceBase):
     CONFIG_API_KEY = 'api_key'
     CONFIG_EXPLORER_API_KEY = 'explorer_api_key'
-    CONFIG_THROTTLE_SECONDS = 'throttle_seconds'
 
     def __init__(self):
         service.ServiceBase.__init__(self)
@@ -20,6 +19,9 @@ class Google(service.ServiceBase):
     def cloudlanguagetools_enabled(self):
         return True
 
+    def concurrency_default(self):
+        return constants.BATCH_PREMIUM_CONCURRENCY
+
     @property
     def service_type(self) -> constants.ServiceType:
         return constants.ServiceType.tts
@@ -32,7 +34,11 @@ class Google(service.ServiceBase):
         return {
             self.CONFIG_API_KEY: str,
             self.CONFIG_EXPLORER_API_KEY: bool,
-            self.CONFIG_THROTTLE_SECONDS: float
+            constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: float,
+            constants.SERVICE_CONFIG_BURST: int,
+            constants.SERVICE_CONFIG_CONCURRENCY: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_CONNECTIONS: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE: int
         }
 
     def voice_list(self):
@@ -42,10 +48,6 @@ class Google(service.ServiceBase):
         # configuration options
         api_key = self.get_configuration_value_mandatory(self.CONFIG_API_KEY)
         is_explorer_api_key = self.get_configuration_value_optional(self.CONFIG_EXPLORER_API_KEY, False)
-        throttle_seconds = self.get_configuration_value_optional(self.CONFIG_THROTTLE_SECONDS, 0)
-
-        if throttle_seconds > 0:
-            time.sleep(throttle_seconds)
 
         payload = {
             "audioConfig": {
@@ -67,9 +69,12 @@ class Google(service.ServiceBase):
         headers = {}
         if is_explorer_api_key:
             headers['x-origin'] = 'https://explorer.apis.google.com'
-        response = requests.post(f"https://texttospeech.googleapis.com/v1/text:synthesize?key={api_key}", json=payload, headers=headers,
+        response = self.http_session.post(f"https://texttospeech.googleapis.com/v1/text:synthesize?key={api_key}", json=payload, headers=headers,
             timeout=constants.RequestTimeout)
         
+        if response.status_code == 429:
+            raise errors.RateLimitedError(source_text, voice, f'status code {response.status_code}: {response.reason}',
+                rate_limiter.get_retry_after(response))
         if response.status_code != 200:
             data = response.json()
             error_message = data.get('error', {}).get('message', str(data))
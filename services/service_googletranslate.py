@@ -2,8 +2,6 @@ import sys
 import requests
 import base64
 import logging
-import time
-import gtts
 import tempfile
 import io
 import pprint
@@ -13,6 +11,12 @@ service = __import__('service', globals(), locals(), [], sys._addon_import_level
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_services)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_services)
 languages = __import__('languages', globals(), locals(), [], sys._addon_import_level_services)
+lazy_import = __import__('lazy_import', globals(), locals(), [], sys._addon_import_level_services)
+
+# gtts is slow to import, only load it when the service gets used
+gtts = lazy_import.LazyModule('gtts')
+gtts_lang = lazy_import.LazyModule('gtts.lang')
+gtts_tts = lazy_import.LazyModule('gtts.tts')
 
 
 lang = languages.AudioLanguage
@@ -83,14 +87,15 @@ GENDER_MAP = {
 }
 
 class GoogleTranslate(service.ServiceBase):
-    CONFIG_THROTTLE_SECONDS = 'throttle_seconds'
 
     def __init__(self):
         service.ServiceBase.__init__(self)
 
     def configuration_options(self):
         return {
-            self.CONFIG_THROTTLE_SECONDS: float
+            constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: float,
+            constants.SERVICE_CONFIG_BURST: int,
+            constants.SERVICE_CONFIG_CONCURRENCY: int
         }
 
     @property
@@ -102,7 +107,7 @@ class GoogleTranslate(service.ServiceBase):
         return constants.ServiceFee.Free
 
     def voice_list(self):
-        languages = gtts.lang.tts_langs()
+        languages = gtts_lang.tts_langs()
         # pprint.pprint(languages)
         voices = []
         for language_key, language_name in languages.items():
@@ -115,15 +120,17 @@ class GoogleTranslate(service.ServiceBase):
         return voices
 
     def get_tts_audio(self, source_text, voice: voice.VoiceBase, options):
-        # configuration options
-        throttle_seconds = self.get_configuration_value_optional(self.CONFIG_THROTTLE_SECONDS, 0)
-
-        if throttle_seconds > 0:
-            time.sleep(throttle_seconds)
-
-        tts = gtts.gTTS(text=source_text, lang=voice.voice_key)
         buffer = io.BytesIO()
-        tts.write_to_fp(buffer)
-
+        self.write_tts_audio(source_text, voice, options, buffer)
         return buffer.getbuffer()
 
+    def write_tts_audio(self, source_text, voice: voice.VoiceBase, options, output_file):
+        # gtts writes each part of the text as it gets it
+        tts = gtts.gTTS(text=source_text, lang=voice.voice_key)
+        try:
+            tts.write_to_fp(output_file)
+        except gtts_tts.gTTSError as error:
+            if error.rsp != None and error.rsp.status_code == 429:
+                raise errors.RateLimitedError(source_text, voice, str(error))
+            raise error
+
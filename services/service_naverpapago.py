@@ -2,7 +2,6 @@ import sys
 import requests
 import base64
 import logging
-import time
 import uuid
 import hmac
 import hashlib
@@ -12,12 +11,12 @@ voice = __import__('voice', globals(), locals(), [], sys._addon_import_level_ser
 service = __import__('service', globals(), locals(), [], sys._addon_import_level_services)
 errors = __import__('errors', globals(), locals(), [], sys._addon_import_level_services)
 constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_services)
+rate_limiter = __import__('rate_limiter', globals(), locals(), [], sys._addon_import_level_services)
 languages = __import__('languages', globals(), locals(), [], sys._addon_import_level_services)
 
 
 
 class NaverPapago(service.ServiceBase):
-    CONFIG_THROTTLE_SECONDS = 'throttle_seconds'
 
     TRANSLATE_ENDPOINT = 'https://papago.naver.com/apis/tts/'
     TRANSLATE_MKID = TRANSLATE_ENDPOINT + 'makeID'    
@@ -29,7 +28,11 @@ class NaverPapago(service.ServiceBase):
 
     def configuration_options(self):
         return {
-            self.CONFIG_THROTTLE_SECONDS: float
+            constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: float,
+            constants.SERVICE_CONFIG_BURST: int,
+            constants.SERVICE_CONFIG_CONCURRENCY: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_CONNECTIONS: int,
+            constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE: int
         }
 
     @property
@@ -95,11 +98,6 @@ class NaverPapago(service.ServiceBase):
         }
 
     def get_tts_audio(self, source_text, voice: voice.VoiceBase, options):
-        # configuration options
-        throttle_seconds = self.get_configuration_value_optional(self.CONFIG_THROTTLE_SECONDS, 0)
-        if throttle_seconds > 0:
-            time.sleep(throttle_seconds)
-
         url = self.TRANSLATE_MKID
         params = {
             'alpha': 0,
@@ -110,7 +108,10 @@ class NaverPapago(service.ServiceBase):
         }
         headers = self.generate_headers()
         logging.info(f'executing POST request on {url} with headers={headers}, data={params}')
-        response = requests.post(url, headers=headers, data=params)
+        response = self.http_session.post(url, headers=headers, data=params)
+        if response.status_code == 429:
+            raise errors.RateLimitedError(source_text, voice, f'got status_code {response.status_code} from {url}',
+                rate_limiter.get_retry_after(response))
         if response.status_code != 200:
             raise errors.RequestError(source_text, voice, f'got status_code {response.status_code} from {url}: {response.content}')
 
@@ -124,7 +125,7 @@ class NaverPapago(service.ServiceBase):
         final_url = self.TRANSLATE_ENDPOINT + sound_id
         logging.info(f'final_url: {final_url}')
 
-        response = requests.get(final_url)
+        response = self.http_session.get(final_url)
         if response.status_code != 200:
             raise errors.RequestError(source_text, voice, f'got status_code {response.status_code} from {final_url}: {response.content}')
         return response.content
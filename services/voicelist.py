@@ -1,5745 +1,66 @@
-VOICE_LIST = [{'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'af'}, 'language': 'af_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (af-ZA, AdriNeural)'},
-  'language': 'af_ZA',
-  'name': 'Adri (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'af'}, 'language': 'af_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'language_code': 'af-ZA', 'name': 'af-ZA-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'af_ZA',
-  'name': 'af-ZA-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'af'}, 'language': 'af_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (af-ZA, WillemNeural)'},
-  'language': 'af_ZA',
-  'name': 'Willem (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (am-ET, MekdesNeural)'},
-  'language': 'am_ET',
-  'name': 'Mekdes መቅደስ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (am-ET, AmehaNeural)'},
-  'language': 'am_ET',
-  'name': 'Ameha አምሀ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'DZA', 'language_code': 'ar'}, 'language': 'ar_DZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-DZ, AminaNeural)'},
-  'language': 'ar_DZ',
-  'name': 'Amina أمينة (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'DZA', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_DZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'DZA', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_DZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-DZ, IsmaelNeural)'},
-  'language': 'ar_DZ',
-  'name': 'Ismael إسماعيل (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'BHR', 'language_code': 'ar'}, 'language': 'ar_BH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'BHR', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_BH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-BH, LailaNeural)'},
-  'language': 'ar_BH',
-  'name': 'Laila ليلى (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-BH, AliNeural)'},
-  'language': 'ar_BH',
-  'name': 'Ali علي (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'BHR', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_BH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'EGY', 'language_code': 'ar'}, 'language': 'ar_EG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'EGY', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_EG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-EG, Hoda)'},
-  'language': 'ar_EG',
-  'name': 'Hoda هدى (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-EG, SalmaNeural)'},
-  'language': 'ar_EG',
-  'name': 'Salma سلمى (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'EGY', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_EG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-EG, ShakirNeural)'},
-  'language': 'ar_EG',
-  'name': 'Shakir شاكر (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'IRQ', 'language_code': 'ar'}, 'language': 'ar_IQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'IRQ', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_IQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-IQ, RanaNeural)'},
-  'language': 'ar_IQ',
-  'name': 'Rana رنا (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-IQ, BasselNeural)'},
-  'language': 'ar_IQ',
-  'name': 'Bassel باسل (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'IRQ', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_IQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'JOR', 'language_code': 'ar'}, 'language': 'ar_JO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'JOR', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_JO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-JO, SanaNeural)'},
-  'language': 'ar_JO',
-  'name': 'Sana سناء (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'JOR', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_JO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-JO, TaimNeural)'},
-  'language': 'ar_JO',
-  'name': 'Taim تيم (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'KWT', 'language_code': 'ar'}, 'language': 'ar_KW', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'KWT', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_KW', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-KW, NouraNeural)'},
-  'language': 'ar_KW',
-  'name': 'Noura نورا (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-KW, FahedNeural)'},
-  'language': 'ar_KW',
-  'name': 'Fahed فهد (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'KWT', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_KW', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'LBY', 'language_code': 'ar'}, 'language': 'ar_LY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'LBY', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_LY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-LY, ImanNeural)'},
-  'language': 'ar_LY',
-  'name': 'Iman إيمان (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'LBY', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_LY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-LY, OmarNeural)'},
-  'language': 'ar_LY',
-  'name': 'Omar أحمد (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'MAR', 'language_code': 'ar'}, 'language': 'ar_MA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'MAR', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_MA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-MA, MounaNeural)'},
-  'language': 'ar_MA',
-  'name': 'Mouna منى (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'MAR', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_MA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-MA, JamalNeural)'},
-  'language': 'ar_MA',
-  'name': 'Jamal جمال (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'QAT', 'language_code': 'ar'}, 'language': 'ar_QA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-QA, AmalNeural)'},
-  'language': 'ar_QA',
-  'name': 'Amal أمل (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'QAT', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_QA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'QAT', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_QA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-QA, MoazNeural)'},
-  'language': 'ar_QA',
-  'name': 'Moaz معاذ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'SAU', 'language_code': 'ar'}, 'language': 'ar_SA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'SAU', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_SA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-SA, ZariyahNeural)'},
-  'language': 'ar_SA',
-  'name': 'Zariyah زارية (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'SAU', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_SA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-SA, HamedNeural)'},
-  'language': 'ar_SA',
-  'name': 'Hamed حامد (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-SA, Naayf)'},
-  'language': 'ar_SA',
-  'name': 'Naayf نايف (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'SYR', 'language_code': 'ar'}, 'language': 'ar_SY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-SY, AmanyNeural)'},
-  'language': 'ar_SY',
-  'name': 'Amany أماني (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'SYR', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_SY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'SYR', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_SY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-SY, LaithNeural)'},
-  'language': 'ar_SY',
-  'name': 'Laith ليث (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'TUN', 'language_code': 'ar'}, 'language': 'ar_TN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'TUN', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_TN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-TN, ReemNeural)'},
-  'language': 'ar_TN',
-  'name': 'Reem ريم (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'TUN', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_TN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-TN, HediNeural)'},
-  'language': 'ar_TN',
-  'name': 'Hedi هادي (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ARE', 'language_code': 'ar'}, 'language': 'ar_AE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-AE, FatimaNeural)'},
-  'language': 'ar_AE',
-  'name': 'Fatima فاطمة (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ARE', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_AE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ARE', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_AE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-AE, HamdanNeural)'},
-  'language': 'ar_AE',
-  'name': 'Hamdan حمدان (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'YEM', 'language_code': 'ar'}, 'language': 'ar_YE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'YEM', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_YE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-YE, MaryamNeural)'},
-  'language': 'ar_YE',
-  'name': 'Maryam مريم (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'YEM', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_YE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ar-YE, SalehNeural)'},
-  'language': 'ar_YE',
-  'name': 'Saleh صالح (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ar'}, 'language': 'ar_XA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 27, 'voice_id': 1}, 'language': 'ar_XA', 'name': 'Amina', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ar'}, 'language': 'ar_XA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 27, 'voice_id': 2}, 'language': 'ar_XA', 'name': 'Laila', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Zeina'},
-  'language': 'ar_XA',
-  'name': 'Zeina (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ar'}, 'language': 'ar_XA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 27, 'voice_id': 2}, 'language': 'ar_XA', 'name': 'Jamal', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'ar-MS_OmarVoice'}, 'language': 'ar_XA', 'name': 'Omar', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 27, 'voice_id': 1}, 'language': 'ar_XA', 'name': 'Tarik', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ar-XA', 'name': 'ar-XA-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'ar_XA',
-  'name': 'ar-XA-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'BGD', 'language_code': 'bn'}, 'language': 'bn_BD', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'BGD', 'gender': 'f', 'language_code': 'bn'}, 'language': 'bn_BD', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bn-BD, NabanitaNeural)'},
-  'language': 'bn_BD',
-  'name': 'Nabanita নবনীতা (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'BGD', 'gender': 'm', 'language_code': 'bn'}, 'language': 'bn_BD', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bn-BD, PradeepNeural)'},
-  'language': 'bn_BD',
-  'name': 'Pradeep প্রদ্বীপ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'IND', 'language_code': 'bn'}, 'language': 'bn_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'IND', 'gender': 'f', 'language_code': 'bn'}, 'language': 'bn_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bn-IN, TanishaaNeural)'},
-  'language': 'bn_IN',
-  'name': 'Tanishaa তানিশা (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'bn-IN', 'name': 'bn-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'bn_IN',
-  'name': 'bn-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'bn-IN', 'name': 'bn-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'bn_IN',
-  'name': 'bn-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bn-IN, BashkarNeural)'},
-  'language': 'bn_IN',
-  'name': 'Bashkar ভাস্কর (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'IND', 'gender': 'm', 'language_code': 'bn'}, 'language': 'bn_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'language_code': 'bn-IN', 'name': 'bn-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'bn_IN',
-  'name': 'bn-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'bn-IN', 'name': 'bn-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'bn_IN',
-  'name': 'bn-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'bg'}, 'language': 'bg_BG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'bg'}, 'language': 'bg_BG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bg-BG, KalinaNeural)'},
-  'language': 'bg_BG',
-  'name': 'Kalina Калина (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'bg-BG', 'name': 'bg-bg-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'bg_BG',
-  'name': 'bg-bg-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bg-BG, BorislavNeural)'},
-  'language': 'bg_BG',
-  'name': 'Borislav Борислав (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'bg'}, 'language': 'bg_BG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (bg-BG, Ivan)'},
-  'language': 'bg_BG',
-  'name': 'Ivan Иван (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (my-MM, NilarNeural)'},
-  'language': 'my_MM',
-  'name': 'Nilar နီလာ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (my-MM, ThihaNeural)'},
-  'language': 'my_MM',
-  'name': 'Thiha သီဟ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ca'}, 'language': 'ca_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ca-ES, AlbaNeural)'},
-  'language': 'ca_ES',
-  'name': 'Alba (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 5, 'voice_id': 3}, 'language': 'ca_ES', 'name': 'Empar', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 17, 'voice_id': 1}, 'language': 'ca_ES', 'name': 'Empar', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ca'}, 'language': 'ca_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ca-ES, HerenaRUS)'},
-  'language': 'ca_ES',
-  'name': 'Herena Helena (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ca-ES, JoanaNeural)'},
-  'language': 'ca_ES',
-  'name': 'Joana (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 5, 'voice_id': 1}, 'language': 'ca_ES', 'name': 'Montserrat', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Rita'}, 'language': 'ca_ES', 'name': 'Rita (Central)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Rita-CereWave'}, 'language': 'ca_ES', 'name': 'Rita-CereWave (Central)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'language_code': 'ca-ES', 'name': 'ca-es-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ca_ES',
-  'name': 'ca-es-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ca-ES, EnricNeural)'},
-  'language': 'ca_ES',
-  'name': 'Enric (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ca'}, 'language': 'ca_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 5, 'voice_id': 2}, 'language': 'ca_ES', 'name': 'Jordi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'yue'}, 'language': 'zh_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'yue'}, 'language': 'zh_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-HK, HiuGaaiNeural)'},
-  'language': 'zh_HK',
-  'name': 'HiuGaai 曉佳 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-HK, HiuMaanNeural)'},
-  'language': 'zh_HK',
-  'name': 'HiuMaan 曉曼 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 7}, 'language': 'zh_HK', 'name': 'Kayan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-HK, TracyRUS)'},
-  'language': 'zh_HK',
-  'name': 'Tracy (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 10, 'voice_id': 3}, 'language': 'zh_HK', 'name': 'Yan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'yue-HK', 'name': 'yue-HK-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_HK',
-  'name': 'yue-HK-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'yue-HK', 'name': 'yue-HK-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_HK',
-  'name': 'yue-HK-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 10, 'voice_id': 4}, 'language': 'zh_HK', 'name': 'Chan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-HK, Danny)'},
-  'language': 'zh_HK',
-  'name': 'Danny (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'yue'}, 'language': 'zh_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 6}, 'language': 'zh_HK', 'name': 'Kaho', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-HK, WanLungNeural)'},
-  'language': 'zh_HK',
-  'name': 'WanLung 雲龍 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'yue-HK', 'name': 'yue-HK-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'zh_HK',
-  'name': 'yue-HK-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'yue-HK', 'name': 'yue-HK-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'zh_HK',
-  'name': 'yue-HK-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'zh'}, 'language': 'zh_CN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'zh'}, 'language': 'zh_CN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 3}, 'language': 'zh_CN', 'name': 'Hui', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, HuihuiRUS)'},
-  'language': 'zh_CN',
-  'name': 'Huihui 慧慧 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'zh-CN_LiNaVoice'}, 'language': 'zh_CN', 'name': 'Li Na', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 1}, 'language': 'zh_CN', 'name': 'Lily', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 10, 'voice_id': 1}, 'language': 'zh_CN', 'name': 'Linlin', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 10, 'voice_id': 2}, 'language': 'zh_CN', 'name': 'Lisheng', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Mailin-CereWave'}, 'language': 'zh_CN', 'name': 'Mailin-CereWave (China)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'meimei'},
-  'language': 'zh_CN',
-  'name': 'Meimei (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaochenNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaochen 晓辰 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaohanNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaohan 晓涵 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaomoNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaomo 晓墨 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoqiuNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoqiu 晓秋 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoruiNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaorui 晓睿 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoshuangNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoshuang 晓双 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoxiaoNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoxiao 晓晓 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoxuanNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoxuan 晓萱 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoyanNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoyan 晓颜 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, XiaoyouNeural)'},
-  'language': 'zh_CN',
-  'name': 'Xiaoyou 晓悠 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, Yaoyao)'},
-  'language': 'zh_CN',
-  'name': 'Yaoyao 瑶瑶 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'zh-CN_ZhangJingVoice'}, 'language': 'zh_CN', 'name': 'Zhang Jing', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Zhiyu'},
-  'language': 'zh_CN',
-  'name': 'Zhiyu (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'zh'}, 'language': 'zh_CN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, Kangkang)'},
-  'language': 'zh_CN',
-  'name': 'Kangkang 康康 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 5}, 'language': 'zh_CN', 'name': 'Kiang', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 4}, 'language': 'zh_CN', 'name': 'Liang', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'liangliang'},
-  'language': 'zh_CN',
-  'name': 'Liangliang (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'name': 'zh-CN_WangWeiVoice'}, 'language': 'zh_CN', 'name': 'Wang Wei', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 2}, 'language': 'zh_CN', 'name': 'Wang', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, YunxiNeural)'},
-  'language': 'zh_CN',
-  'name': 'Yunxi 云希 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, YunyangNeural)'},
-  'language': 'zh_CN',
-  'name': 'Yunyang 云扬 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-CN, YunyeNeural)'},
-  'language': 'zh_CN',
-  'name': 'Yunye 云野 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-CN', 'name': 'cmn-CN-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'zh_CN',
-  'name': 'cmn-CN-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 10, 'voice_id': 1}, 'language': 'zh_TW', 'name': 'Chia-ling', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'chiahua'},
-  'language': 'zh_TW',
-  'name': 'Chiahua (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, HanHanRUS)'},
-  'language': 'zh_TW',
-  'name': 'HanHan 涵涵 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, HsiaoChenNeural)'},
-  'language': 'zh_TW',
-  'name': 'HsiaoChen 曉臻 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, HsiaoYuNeural)'},
-  'language': 'zh_TW',
-  'name': 'HsiaoYu 曉雨 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 10, 'voice_id': 8}, 'language': 'zh_TW', 'name': 'Yafang', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, Yating)'},
-  'language': 'zh_TW',
-  'name': 'Yating 雅婷 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 10, 'voice_id': 2}, 'language': 'zh_TW', 'name': 'Chia-hao', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'kuanlin'},
-  'language': 'zh_TW',
-  'name': 'Kuanlin (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, YunJheNeural)'},
-  'language': 'zh_TW',
-  'name': 'YunJhe 雲哲 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zh-TW, Zhiwei)'},
-  'language': 'zh_TW',
-  'name': 'Zhiwei 志威 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'cmn-TW', 'name': 'cmn-TW-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'zh_TW',
-  'name': 'cmn-TW-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'hr'}, 'language': 'hr_HR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'hr'}, 'language': 'hr_HR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hr-HR, GabrijelaNeural)'},
-  'language': 'hr_HR',
-  'name': 'Gabrijela (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'hr'}, 'language': 'hr_HR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hr-HR, Matej)'},
-  'language': 'hr_HR',
-  'name': 'Matej (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hr-HR, SreckoNeural)'},
-  'language': 'hr_HR',
-  'name': 'Srecko Srećko (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'cs'}, 'language': 'cs_CZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'cs-CZ_AlenaVoice'}, 'language': 'cs_CZ', 'name': 'Alena', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'cs'}, 'language': 'cs_CZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 18, 'voice_id': 1}, 'language': 'cs_CZ', 'name': 'Pavla', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (cs-CZ, VlastaNeural)'},
-  'language': 'cs_CZ',
-  'name': 'Vlasta (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'cs-CZ', 'name': 'cs-CZ-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'cs_CZ',
-  'name': 'cs-CZ-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'cs-CZ', 'name': 'cs-CZ-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'cs_CZ',
-  'name': 'cs-CZ-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (cs-CZ, AntoninNeural)'},
-  'language': 'cs_CZ',
-  'name': 'Antonin Antonín (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'cs'}, 'language': 'cs_CZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (cs-CZ, Jakub)'},
-  'language': 'cs_CZ',
-  'name': 'Jakub (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 18, 'voice_id': 2}, 'language': 'cs_CZ', 'name': 'Janek', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'da'}, 'language': 'da_DK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (da-DK, ChristelNeural)'},
-  'language': 'da_DK',
-  'name': 'Christel (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 19, 'voice_id': 1}, 'language': 'da_DK', 'name': 'Dagny', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'da'}, 'language': 'da_DK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 19, 'voice_id': 1}, 'language': 'da_DK', 'name': 'Frida', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (da-DK, HelleRUS)'},
-  'language': 'da_DK',
-  'name': 'Helle (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Marie-CereWave'}, 'language': 'da_DK', 'name': 'Marie-CereWave (Insular Danish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Naja'},
-  'language': 'da_DK',
-  'name': 'Naja (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 19, 'voice_id': 2}, 'language': 'da_DK', 'name': 'Erik', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'da'}, 'language': 'da_DK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (da-DK, JeppeNeural)'},
-  'language': 'da_DK',
-  'name': 'Jeppe (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Mads'},
-  'language': 'da_DK',
-  'name': 'Mads (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 19, 'voice_id': 2}, 'language': 'da_DK', 'name': 'Magnus', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'da-DK', 'name': 'da-DK-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'da_DK',
-  'name': 'da-DK-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'BEL', 'language_code': 'nl'}, 'language': 'nl_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'nl-BE_AdeleVoice'}, 'language': 'nl_BE', 'name': 'Adele', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-BE, DenaNeural)'},
-  'language': 'nl_BE',
-  'name': 'Dena (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'BEL', 'gender': 'f', 'language_code': 'nl'}, 'language': 'nl_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-BE', 'name': 'nl-BE-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_BE',
-  'name': 'nl-BE-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-BE', 'name': 'nl-BE-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_BE',
-  'name': 'nl-BE-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-BE, ArnaudNeural)'},
-  'language': 'nl_BE',
-  'name': 'Arnaud (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'nl-BE_BramVoice'}, 'language': 'nl_BE', 'name': 'Bram', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'country_code': 'BEL', 'gender': 'm', 'language_code': 'nl'}, 'language': 'nl_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-BE', 'name': 'nl-BE-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'nl_BE',
-  'name': 'nl-BE-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-BE', 'name': 'nl-BE-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'nl_BE',
-  'name': 'nl-BE-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'NLD', 'language_code': 'nl'}, 'language': 'nl_NL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Ada'}, 'language': 'nl_NL', 'name': 'Ada (NL)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Ada-CereWave'}, 'language': 'nl_NL', 'name': 'Ada-CereWave (NL)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-NL, ColetteNeural)'},
-  'language': 'nl_NL',
-  'name': 'Colette (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'nl-NL_EmmaVoice'}, 'language': 'nl_NL', 'name': 'Emma', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 11, 'voice_id': 1}, 'language': 'nl_NL', 'name': 'Famke', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-NL, FennaNeural)'},
-  'language': 'nl_NL',
-  'name': 'Fenna (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'NLD', 'gender': 'f', 'language_code': 'nl'}, 'language': 'nl_NL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-NL, HannaRUS)'},
-  'language': 'nl_NL',
-  'name': 'Hanna (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Lotte'},
-  'language': 'nl_NL',
-  'name': 'Lotte (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 11, 'voice_id': 2}, 'language': 'nl_NL', 'name': 'Saskia', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 11, 'voice_id': 2}, 'language': 'nl_NL', 'name': 'Dirk', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'NLD', 'gender': 'm', 'language_code': 'nl'}, 'language': 'nl_NL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'name': 'nl-NL_LiamVoice'}, 'language': 'nl_NL', 'name': 'Liam', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nl-NL, MaartenNeural)'},
-  'language': 'nl_NL',
-  'name': 'Maarten (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Ruben'},
-  'language': 'nl_NL',
-  'name': 'Ruben (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 11, 'voice_id': 1}, 'language': 'nl_NL', 'name': 'Willem', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nl-NL', 'name': 'nl-NL-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'nl_NL',
-  'name': 'nl-NL-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'AUS', 'language_code': 'en'}, 'language': 'en_AU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-AU, Catherine)'},
-  'language': 'en_AU',
-  'name': 'Catherine (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'AUS', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_AU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 10}, 'language': 'en_AU', 'name': 'Grace', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-AU, HayleyRUS)'},
-  'language': 'en_AU',
-  'name': 'Hayley (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'en-AU_MadisonVoice'}, 'language': 'en_AU', 'name': 'Madison', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 3}, 'language': 'en_AU', 'name': 'Matilda', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-AU, NatashaNeural)'},
-  'language': 'en_AU',
-  'name': 'Natasha (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Nicole'},
-  'language': 'en_AU',
-  'name': 'Nicole (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Olivia'},
-  'language': 'en_AU',
-  'name': 'Olivia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 9}, 'language': 'en_AU', 'name': 'Alan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'en-AU_CraigVoice'}, 'language': 'en_AU', 'name': 'Craig', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'country_code': 'AUS', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_AU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 4}, 'language': 'en_AU', 'name': 'Jackson', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Russell'},
-  'language': 'en_AU',
-  'name': 'Russell (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'name': 'en-AU_SteveVoice'}, 'language': 'en_AU', 'name': 'Steve', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-AU, WilliamNeural)'},
-  'language': 'en_AU',
-  'name': 'William (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-AU', 'name': 'en-AU-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'en_AU',
-  'name': 'en-AU-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'CAN', 'language_code': 'en'}, 'language': 'en_CA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-CA, ClaraNeural)'},
-  'language': 'en_CA',
-  'name': 'Clara (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'CAN', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_CA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-CA, HeatherRUS)'},
-  'language': 'en_CA',
-  'name': 'Heather (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-CA, Linda)'},
-  'language': 'en_CA',
-  'name': 'Linda (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'CAN', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_CA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-CA, LiamNeural)'},
-  'language': 'en_CA',
-  'name': 'Liam (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'HKG', 'language_code': 'en'}, 'language': 'en_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'HKG', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-HK, YanNeural)'},
-  'language': 'en_HK',
-  'name': 'Yan (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'HKG', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_HK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-HK, SamNeural)'},
-  'language': 'en_HK',
-  'name': 'Sam (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'IND', 'language_code': 'en'}, 'language': 'en_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Aditi'},
-  'language': 'en_IN',
-  'name': 'Aditi (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'IND', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IN, Heera)'},
-  'language': 'en_IN',
-  'name': 'Heera (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 5}, 'language': 'en_IN', 'name': 'Lakshmi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IN, NeerjaNeural)'},
-  'language': 'en_IN',
-  'name': 'Neerja (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IN, PriyaRUS)'},
-  'language': 'en_IN',
-  'name': 'Priya (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Raveena'},
-  'language': 'en_IN',
-  'name': 'Raveena (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 11}, 'language': 'en_IN', 'name': 'Veena', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'IND', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IN, PrabhatNeural)'},
-  'language': 'en_IN',
-  'name': 'Prabhat (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 6}, 'language': 'en_IN', 'name': 'Prashant', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IN, Ravi)'},
-  'language': 'en_IN',
-  'name': 'Ravi (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-IN', 'name': 'en-IN-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'en_IN',
-  'name': 'en-IN-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'IRL', 'language_code': 'en'}, 'language': 'en_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Caitlin'}, 'language': 'en_IE', 'name': 'Caitlin (Irish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Caitlin-CereWave'}, 'language': 'en_IE', 'name': 'Caitlin-CereWave (Irish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IE, EmilyNeural)'},
-  'language': 'en_IE',
-  'name': 'Emily (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'IRL', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IE, ConnorNeural)'},
-  'language': 'en_IE',
-  'name': 'Connor (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'IRL', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-IE, Sean)'},
-  'language': 'en_IE',
-  'name': 'Sean (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'KEN', 'language_code': 'en'}, 'language': 'en_KE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-KE, AsiliaNeural)'},
-  'language': 'en_KE',
-  'name': 'Asilia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'KEN', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_KE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-KE, ChilembaNeural)'},
-  'language': 'en_KE',
-  'name': 'Chilemba (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'KEN', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_KE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'NZL', 'language_code': 'en'}, 'language': 'en_NZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Aria'},
-  'language': 'en_NZ',
-  'name': 'Aria (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'NZL', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_NZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-NZ, MollyNeural)'},
-  'language': 'en_NZ',
-  'name': 'Molly (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'NZL', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_NZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-NZ, MitchellNeural)'},
-  'language': 'en_NZ',
-  'name': 'Mitchell (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'NGA', 'language_code': 'en'}, 'language': 'en_NG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-NG, EzinneNeural)'},
-  'language': 'en_NG',
-  'name': 'Ezinne (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'NGA', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_NG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-NG, AbeoNeural)'},
-  'language': 'en_NG',
-  'name': 'Abeo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'NGA', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_NG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'PHL', 'language_code': 'en'}, 'language': 'en_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'PHL', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-PH, RosaNeural)'},
-  'language': 'en_PH',
-  'name': 'Rosa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PHL', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-PH, JamesNeural)'},
-  'language': 'en_PH',
-  'name': 'James (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'SGP', 'language_code': 'en'}, 'language': 'en_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'SGP', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-SG, LunaNeural)'},
-  'language': 'en_SG',
-  'name': 'Luna (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'SGP', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-SG, WayneNeural)'},
-  'language': 'en_SG',
-  'name': 'Wayne (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ZAF', 'language_code': 'en'}, 'language': 'en_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Ayanda'},
-  'language': 'en_ZA',
-  'name': 'Ayanda (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'ZAF', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-ZA, LeahNeural)'},
-  'language': 'en_ZA',
-  'name': 'Leah (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ZAF', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_ZA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-ZA, LukeNeural)'},
-  'language': 'en_ZA',
-  'name': 'Luke (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'TZA', 'language_code': 'en'}, 'language': 'en_TZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'TZA', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_TZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-TZ, ImaniNeural)'},
-  'language': 'en_TZ',
-  'name': 'Imani (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-TZ, ElimuNeural)'},
-  'language': 'en_TZ',
-  'name': 'Elimu (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'TZA', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_TZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'GBR', 'language_code': 'en'}, 'language': 'en_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, AbbiNeural)'},
-  'language': 'en_GB',
-  'name': 'Abbi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Amy'},
-  'language': 'en_GB',
-  'name': 'Amy (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'Amy'}, 'language': 'en_GB', 'name': 'Amy (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Amy-CereWave'}, 'language': 'en_GB', 'name': 'Amy-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, BellaNeural)'},
-  'language': 'en_GB',
-  'name': 'Bella (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 4}, 'language': 'en_GB', 'name': 'Bridget', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 6}, 'language': 'en_GB', 'name': 'Catherine', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'en-GB_CharlotteV3Voice'}, 'language': 'en_GB', 'name': 'Charlotte (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 4}, 'language': 'en_GB', 'name': 'Elizabeth', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Emma'},
-  'language': 'en_GB',
-  'name': 'Emma (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'GBR', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Goblin'}, 'language': 'en_GB', 'name': 'Goblin (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Goblin-CereWave'}, 'language': 'en_GB', 'name': 'Goblin-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, HazelRUS)'},
-  'language': 'en_GB',
-  'name': 'Hazel (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Heather'}, 'language': 'en_GB', 'name': 'Heather (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Heather-CereWave'}, 'language': 'en_GB', 'name': 'Heather-CereWave (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, HollieNeural)'},
-  'language': 'en_GB',
-  'name': 'Hollie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Jess'}, 'language': 'en_GB', 'name': 'Jess (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Jess-CereWave'}, 'language': 'en_GB', 'name': 'Jess-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'en-GB_KateV3Voice'}, 'language': 'en_GB', 'name': 'Kate (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'en-GB_KateVoice'}, 'language': 'en_GB', 'name': 'Kate', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'Kirsty'}, 'language': 'en_GB', 'name': 'Kirsty (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Kirsty-CereWave'}, 'language': 'en_GB', 'name': 'Kirsty-CereWave (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Lauren'}, 'language': 'en_GB', 'name': 'Lauren (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Lauren-CereWave'}, 'language': 'en_GB', 'name': 'Lauren-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, LibbyNeural)'},
-  'language': 'en_GB',
-  'name': 'Libby (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Mairi'}, 'language': 'en_GB', 'name': 'Mairi (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Mairi-CereWave'}, 'language': 'en_GB', 'name': 'Mairi-CereWave (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, MaisieNeural)'},
-  'language': 'en_GB',
-  'name': 'Maisie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, MiaNeural)'},
-  'language': 'en_GB',
-  'name': 'Mia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Nicole'}, 'language': 'en_GB', 'name': 'Nicole (Sexy French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Nicole-CereWave'}, 'language': 'en_GB', 'name': 'Nicole-CereWave (Sexy French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, OliviaNeural)'},
-  'language': 'en_GB',
-  'name': 'Olivia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 1}, 'language': 'en_GB', 'name': 'Olivia', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Pixie'}, 'language': 'en_GB', 'name': 'Pixie (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Pixie-CereWave'}, 'language': 'en_GB', 'name': 'Pixie-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Sarah'}, 'language': 'en_GB', 'name': 'Sarah (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Sarah-CereWave'}, 'language': 'en_GB', 'name': 'Sarah-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, SoniaNeural)'},
-  'language': 'en_GB',
-  'name': 'Sonia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Sue'}, 'language': 'en_GB', 'name': 'Sue (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Sue-CereWave'}, 'language': 'en_GB', 'name': 'Sue-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, Susan)'},
-  'language': 'en_GB',
-  'name': 'Susan (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Standard-F', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Standard-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Wavenet-F', 'ssml_gender': 'FEMALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Wavenet-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, AlfieNeural)'},
-  'language': 'en_GB',
-  'name': 'Alfie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'Andrew'}, 'language': 'en_GB', 'name': 'Andrew (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Andrew-CereWave'}, 'language': 'en_GB', 'name': 'Andrew-CereWave (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Brian'},
-  'language': 'en_GB',
-  'name': 'Brian (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'name': 'Demon'}, 'language': 'en_GB', 'name': 'Demon (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Demon-CereWave'}, 'language': 'en_GB', 'name': 'Demon-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, ElliotNeural)'},
-  'language': 'en_GB',
-  'name': 'Elliot (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, EthanNeural)'},
-  'language': 'en_GB',
-  'name': 'Ethan (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'GBR', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, George)'},
-  'language': 'en_GB',
-  'name': 'George (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'Giles'}, 'language': 'en_GB', 'name': 'Giles (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Giles-CereWave'}, 'language': 'en_GB', 'name': 'Giles-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 5}, 'language': 'en_GB', 'name': 'Hugh', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'Jack'}, 'language': 'en_GB', 'name': 'Jack (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Jack-CereWave'}, 'language': 'en_GB', 'name': 'Jack-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'en-GB_JamesV3Voice'}, 'language': 'en_GB', 'name': 'James (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, NoahNeural)'},
-  'language': 'en_GB',
-  'name': 'Noah (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, OliverNeural)'},
-  'language': 'en_GB',
-  'name': 'Oliver (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 2}, 'language': 'en_GB', 'name': 'Oliver', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'Robot'}, 'language': 'en_GB', 'name': 'Robot (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Robot-CereWave'}, 'language': 'en_GB', 'name': 'Robot-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, RyanNeural)'},
-  'language': 'en_GB',
-  'name': 'Ryan (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 5}, 'language': 'en_GB', 'name': 'Simon', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'Stuart'}, 'language': 'en_GB', 'name': 'Stuart (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Stuart-CereWave'}, 'language': 'en_GB', 'name': 'Stuart-CereWave (Scottish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-GB, ThomasNeural)'},
-  'language': 'en_GB',
-  'name': 'Thomas (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'William'}, 'language': 'en_GB', 'name': 'William (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'William-CereWave'}, 'language': 'en_GB', 'name': 'William-CereWave (RP)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-GB', 'name': 'en-GB-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'en_GB',
-  'name': 'en-GB-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'USA', 'language_code': 'en'}, 'language': 'en_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'en-US_AllisonV2Voice'}, 'language': 'en_US', 'name': 'Allison (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'en-US_AllisonV3Voice'}, 'language': 'en_US', 'name': 'Allison (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 7}, 'language': 'en_US', 'name': 'Allison', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'en-US_AllisonVoice'}, 'language': 'en_US', 'name': 'Allison', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, AmberNeural)'},
-  'language': 'en_US',
-  'name': 'Amber (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, AnaNeural)'},
-  'language': 'en_US',
-  'name': 'Ana (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'danna'},
-  'language': 'en_US',
-  'name': 'Anna (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, AriaNeural)'},
-  'language': 'en_US',
-  'name': 'Aria (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, AriaRUS)'},
-  'language': 'en_US',
-  'name': 'Aria (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, AshleyNeural)'},
-  'language': 'en_US',
-  'name': 'Ashley (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 6}, 'language': 'en_US', 'name': 'Ashley', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 8}, 'language': 'en_US', 'name': 'Beth', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 7}, 'language': 'en_US', 'name': 'Brenda', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Carolyn'}, 'language': 'en_US', 'name': 'Carolyn (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Carolyn-CereWave'}, 'language': 'en_US', 'name': 'Carolyn-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'clara'},
-  'language': 'en_US',
-  'name': 'Clara (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, CoraNeural)'},
-  'language': 'en_US',
-  'name': 'Cora (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, ElizabethNeural)'},
-  'language': 'en_US',
-  'name': 'Elizabeth (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'en-US_EmilyV3Voice'}, 'language': 'en_US', 'name': 'Emily (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'country_code': 'USA', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Hannah'}, 'language': 'en_US', 'name': 'Hannah (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Hannah-CereWave'}, 'language': 'en_US', 'name': 'Hannah-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Isabella'}, 'language': 'en_US', 'name': 'Isabella (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Isabella-CereWave'}, 'language': 'en_US', 'name': 'Isabella-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Ivy'},
-  'language': 'en_US',
-  'name': 'Ivy (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, JennyNeural)'},
-  'language': 'en_US',
-  'name': 'Jenny (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, JennyMultilingualNeural)'},
-  'language': 'en_US',
-  'name': 'Jenny Multilingual (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Joanna'},
-  'language': 'en_US',
-  'name': 'Joanna (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'djoey'},
-  'language': 'en_US',
-  'name': 'Joey (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 3}, 'language': 'en_US', 'name': 'Julie', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 1}, 'language': 'en_US', 'name': 'Kate', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Katherine'}, 'language': 'en_US', 'name': 'Katherine (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Katherine-CereWave'}, 'language': 'en_US', 'name': 'Katherine-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Kendra'},
-  'language': 'en_US',
-  'name': 'Kendra (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Kimberly'},
-  'language': 'en_US',
-  'name': 'Kimberly (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'en-US_LisaV3Voice'}, 'language': 'en_US', 'name': 'Lisa (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'en-US_LisaV2Voice'}, 'language': 'en_US', 'name': 'Lisa (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'en-US_LisaVoice'}, 'language': 'en_US', 'name': 'Lisa', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'Megan'}, 'language': 'en_US', 'name': 'Megan (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Megan-CereWave'}, 'language': 'en_US', 'name': 'Megan-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, MichelleNeural)'},
-  'language': 'en_US',
-  'name': 'Michelle (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, MonicaNeural)'},
-  'language': 'en_US',
-  'name': 'Monica (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'en-US_OliviaV3Voice'}, 'language': 'en_US', 'name': 'Olivia (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Salli'},
-  'language': 'en_US',
-  'name': 'Salli (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, SaraNeural)'},
-  'language': 'en_US',
-  'name': 'Sara (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 1}, 'language': 'en_US', 'name': 'Susan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, ZiraRUS)'},
-  'language': 'en_US',
-  'name': 'Zira (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-F', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-G', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-G',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-H', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-H',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-F', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-G', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-G',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-H', 'ssml_gender': 'FEMALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-H',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'name': 'Adam'}, 'language': 'en_US', 'name': 'Adam (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Adam-CereWave'}, 'language': 'en_US', 'name': 'Adam-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Andy'}, 'language': 'en_US', 'name': 'Andy (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Andy-CereWave'}, 'language': 'en_US', 'name': 'Andy-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, BenjaminRUS)'},
-  'language': 'en_US',
-  'name': 'Benjamin (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, BrandonNeural)'},
-  'language': 'en_US',
-  'name': 'Brandon (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, ChristopherNeural)'},
-  'language': 'en_US',
-  'name': 'Christopher (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 2}, 'language': 'en_US', 'name': 'Dave', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, EricNeural)'},
-  'language': 'en_US',
-  'name': 'Eric (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'USA', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'name': 'Ghost'}, 'language': 'en_US', 'name': 'Ghost (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Ghost-CereWave'}, 'language': 'en_US', 'name': 'Ghost-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, GuyNeural)'},
-  'language': 'en_US',
-  'name': 'Guy (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, GuyRUS)'},
-  'language': 'en_US',
-  'name': 'Guy (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'en-US_HenryV3Voice'}, 'language': 'en_US', 'name': 'Henry (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (en-US, JacobNeural)'},
-  'language': 'en_US',
-  'name': 'Jacob (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 7}, 'language': 'en_US', 'name': 'James', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Joey'},
-  'language': 'en_US',
-  'name': 'Joey (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'name': 'Jordan'}, 'language': 'en_US', 'name': 'Jordan (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Jordan-CereWave'}, 'language': 'en_US', 'name': 'Jordan-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Justin'},
-  'language': 'en_US',
-  'name': 'Justin (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 3}, 'language': 'en_US', 'name': 'Kenneth', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'en-US_KevinV3Voice'}, 'language': 'en_US', 'name': 'Kevin (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Kevin'},
-  'language': 'en_US',
-  'name': 'Kevin (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'name': 'matt'},
-  'language': 'en_US',
-  'name': 'Matt (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Matthew'},
-  'language': 'en_US',
-  'name': 'Matthew (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'name': 'en-US_MichaelV3Voice'}, 'language': 'en_US', 'name': 'Michael (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'name': 'en-US_MichaelV2Voice'}, 'language': 'en_US', 'name': 'Michael (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'name': 'en-US_MichaelVoice'}, 'language': 'en_US', 'name': 'Michael', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'name': 'Nathan'}, 'language': 'en_US', 'name': 'Nathan (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Nathan-CereWave'}, 'language': 'en_US', 'name': 'Nathan-CereWave (General American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 1, 'voice_id': 2}, 'language': 'en_US', 'name': 'Paul', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 1, 'voice_id': 8}, 'language': 'en_US', 'name': 'Steven', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 1, 'voice_id': 8}, 'language': 'en_US', 'name': 'Warren', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-A', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-I', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-I',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Standard-J', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Standard-J',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-A', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-I', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-I',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'en-US', 'name': 'en-US-Wavenet-J', 'ssml_gender': 'MALE'},
-  'language': 'en_US',
-  'name': 'en-US-Wavenet-J',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'GBR', 'language_code': 'en'}, 'language': 'en_GB_WLS', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'GBR', 'gender': 'f', 'language_code': 'en'}, 'language': 'en_GB_WLS', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'GBR', 'gender': 'm', 'language_code': 'en'}, 'language': 'en_GB_WLS', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Geraint'},
-  'language': 'en_GB_WLS',
-  'name': 'Geraint (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'eo'}, 'language': 'eo_XX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'eo'}, 'language': 'eo_XX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'eo'}, 'language': 'eo_XX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 31, 'voice_id': 1}, 'language': 'eo_XX', 'name': 'Ludoviko', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'et'}, 'language': 'et_EE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (et-EE, AnuNeural)'},
-  'language': 'et_EE',
-  'name': 'Anu (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'et'}, 'language': 'et_EE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'et'}, 'language': 'et_EE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (et-EE, KertNeural)'},
-  'language': 'et_EE',
-  'name': 'Kert (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'tl'}, 'language': 'fil_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fil-PH, BlessicaNeural)'},
-  'language': 'fil_PH',
-  'name': 'Blessica (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'tl'}, 'language': 'fil_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 32, 'voice_id': 1}, 'language': 'fil_PH', 'name': 'Mayumi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Standard-B', 'ssml_gender': 'FEMALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Wavenet-B', 'ssml_gender': 'FEMALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fil-PH, AngeloNeural)'},
-  'language': 'fil_PH',
-  'name': 'Angelo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 32, 'voice_id': 2}, 'language': 'fil_PH', 'name': 'Datu', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'tl'}, 'language': 'fil_PH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fil-PH', 'name': 'fil-PH-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'fil_PH',
-  'name': 'fil-PH-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'fi'}, 'language': 'fi_FI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'fi'}, 'language': 'fi_FI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fi-FI, HeidiRUS)'},
-  'language': 'fi_FI',
-  'name': 'Heidi (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 23, 'voice_id': 1}, 'language': 'fi_FI', 'name': 'Milla', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fi-FI, NooraNeural)'},
-  'language': 'fi_FI',
-  'name': 'Noora (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 23, 'voice_id': 1}, 'language': 'fi_FI', 'name': 'Sanna', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fi-FI, SelmaNeural)'},
-  'language': 'fi_FI',
-  'name': 'Selma (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'fi-FI', 'name': 'fi-FI-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fi_FI',
-  'name': 'fi-FI-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fi-FI', 'name': 'fi-FI-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fi_FI',
-  'name': 'fi-FI-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'fi'}, 'language': 'fi_FI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fi-FI, HarriNeural)'},
-  'language': 'fi_FI',
-  'name': 'Harri (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 23, 'voice_id': 2}, 'language': 'fi_FI', 'name': 'Marko', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 23, 'voice_id': 2}, 'language': 'fi_FI', 'name': 'Mikko', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Any', 'key': {'country_code': 'BEL', 'language_code': 'fr'}, 'language': 'fr_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-BE, CharlineNeural)'},
-  'language': 'fr_BE',
-  'name': 'Charline (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'BEL', 'gender': 'f', 'language_code': 'fr'}, 'language': 'fr_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'BEL', 'gender': 'm', 'language_code': 'fr'}, 'language': 'fr_BE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-BE, GerardNeural)'},
-  'language': 'fr_BE',
-  'name': 'Gerard (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CA, Caroline)'},
-  'language': 'fr_CA',
-  'name': 'Caroline (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Chantal'},
-  'language': 'fr_CA',
-  'name': 'Chantal (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 5}, 'language': 'fr_CA', 'name': 'Charlotte', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 4, 'voice_id': 1}, 'language': 'fr_CA', 'name': 'Chloe', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Florence'}, 'language': 'fr_CA', 'name': 'Florence (Canadian French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Florence-CereWave'}, 'language': 'fr_CA', 'name': 'Florence-CereWave (Canadian French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Gabrielle'},
-  'language': 'fr_CA',
-  'name': 'Gabrielle (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CA, HarmonieRUS)'},
-  'language': 'fr_CA',
-  'name': 'Harmonie (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 4, 'voice_id': 3}, 'language': 'fr_CA', 'name': 'Leonie', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'fr-CA_LouiseV3Voice'}, 'language': 'fr_CA', 'name': 'Louise (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CA, SylvieNeural)'},
-  'language': 'fr_CA',
-  'name': 'Sylvie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CA, AntoineNeural)'},
-  'language': 'fr_CA',
-  'name': 'Antoine (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 4, 'voice_id': 4}, 'language': 'fr_CA', 'name': 'Gaspard', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CA, JeanNeural)'},
-  'language': 'fr_CA',
-  'name': 'Jean (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 4, 'voice_id': 2}, 'language': 'fr_CA', 'name': 'Leo', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 6}, 'language': 'fr_CA', 'name': 'Olivier', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-CA', 'name': 'fr-CA-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'fr_CA',
-  'name': 'fr-CA-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'FRA', 'language_code': 'fr'}, 'language': 'fr_FR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 4, 'voice_id': 1}, 'language': 'fr_FR', 'name': 'Beatrice', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, BrigitteNeural)'},
-  'language': 'fr_FR',
-  'name': 'Brigitte (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, CelesteNeural)'},
-  'language': 'fr_FR',
-  'name': 'Celeste (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, CoralieNeural)'},
-  'language': 'fr_FR',
-  'name': 'Coralie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Celine'},
-  'language': 'fr_FR',
-  'name': 'Céline (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, DeniseNeural)'},
-  'language': 'fr_FR',
-  'name': 'Denise (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, EloiseNeural)'},
-  'language': 'fr_FR',
-  'name': 'Eloise (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 4}, 'language': 'fr_FR', 'name': 'Florence', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'FRA', 'gender': 'f', 'language_code': 'fr'}, 'language': 'fr_FR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, HortenseRUS)'},
-  'language': 'fr_FR',
-  'name': 'Hortense (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, JacquelineNeural)'},
-  'language': 'fr_FR',
-  'name': 'Jacqueline (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 3}, 'language': 'fr_FR', 'name': 'Jolie', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, JosephineNeural)'},
-  'language': 'fr_FR',
-  'name': 'Josephine (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, Julie)'},
-  'language': 'fr_FR',
-  'name': 'Julie (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Lea'},
-  'language': 'fr_FR',
-  'name': 'Léa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'fr-FR_ReneeV3Voice'}, 'language': 'fr_FR', 'name': 'Renee (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'fr-FR_ReneeVoice'}, 'language': 'fr_FR', 'name': 'Renee', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 4, 'voice_id': 3}, 'language': 'fr_FR', 'name': 'Roxane', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 1}, 'language': 'fr_FR', 'name': 'Sophie', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Suzanne'}, 'language': 'fr_FR', 'name': 'Suzanne (Metropolitan French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Suzanne-CereWave'}, 'language': 'fr_FR', 'name': 'Suzanne-CereWave (Metropolitan French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, YvetteNeural)'},
-  'language': 'fr_FR',
-  'name': 'Yvette (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, AlainNeural)'},
-  'language': 'fr_FR',
-  'name': 'Alain (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 4, 'voice_id': 2}, 'language': 'fr_FR', 'name': 'Antoine', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 4, 'voice_id': 2}, 'language': 'fr_FR', 'name': 'Bernard', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, ClaudeNeural)'},
-  'language': 'fr_FR',
-  'name': 'Claude (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'FRA', 'gender': 'm', 'language_code': 'fr'}, 'language': 'fr_FR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, HenriNeural)'},
-  'language': 'fr_FR',
-  'name': 'Henri (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, JeromeNeural)'},
-  'language': 'fr_FR',
-  'name': 'Jerome (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'Laurent'}, 'language': 'fr_FR', 'name': 'Laurent (Metropolitan French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Laurent-CereWave'}, 'language': 'fr_FR', 'name': 'Laurent-CereWave (Metropolitan French)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 4, 'voice_id': 4}, 'language': 'fr_FR', 'name': 'Louis', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Mathieu'},
-  'language': 'fr_FR',
-  'name': 'Mathieu (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, MauriceNeural)'},
-  'language': 'fr_FR',
-  'name': 'Maurice (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'fr-FR_NicolasV3Voice'}, 'language': 'fr_FR', 'name': 'Nicolas (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, Paul)'},
-  'language': 'fr_FR',
-  'name': 'Paul (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-FR, YvesNeural)'},
-  'language': 'fr_FR',
-  'name': 'Yves (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'fr-FR', 'name': 'fr-FR-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'fr_FR',
-  'name': 'fr-FR-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'CHE', 'language_code': 'fr'}, 'language': 'fr_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CH, ArianeNeural)'},
-  'language': 'fr_CH',
-  'name': 'Ariane (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'CHE', 'gender': 'f', 'language_code': 'fr'}, 'language': 'fr_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CH, FabriceNeural)'},
-  'language': 'fr_CH',
-  'name': 'Fabrice (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'CHE', 'gender': 'm', 'language_code': 'fr'}, 'language': 'fr_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fr-CH, Guillaume)'},
-  'language': 'fr_CH',
-  'name': 'Guillaume (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Ceitidh'}, 'language': 'gd_GB', 'name': 'Ceitidh (Mid Minch)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Ceitidh-CereWave'}, 'language': 'gd_GB', 'name': 'Ceitidh-CereWave (Mid Minch)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'gl'}, 'language': 'gl_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 15, 'voice_id': 1}, 'language': 'gl_ES', 'name': 'Carmela', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'gl'}, 'language': 'gl_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (gl-ES, SabelaNeural)'},
-  'language': 'gl_ES',
-  'name': 'Sabela (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'gl'}, 'language': 'gl_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (gl-ES, RoiNeural)'},
-  'language': 'gl_ES',
-  'name': 'Roi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'AUT', 'language_code': 'de'}, 'language': 'de_AT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'AUT', 'gender': 'f', 'language_code': 'de'}, 'language': 'de_AT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-AT, IngridNeural)'},
-  'language': 'de_AT',
-  'name': 'Ingrid (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'AUT', 'gender': 'm', 'language_code': 'de'}, 'language': 'de_AT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-AT, JonasNeural)'},
-  'language': 'de_AT',
-  'name': 'Jonas (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'Leopold'}, 'language': 'de_AT', 'name': 'Leopold (Austrian)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Leopold-CereWave'}, 'language': 'de_AT', 'name': 'Leopold-CereWave (Austrian)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-AT, Michael)'},
-  'language': 'de_AT',
-  'name': 'Michael (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'DEU', 'language_code': 'de'}, 'language': 'de_DE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, AmalaNeural)'},
-  'language': 'de_DE',
-  'name': 'Amala (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'de-DE_BirgitV3Voice'}, 'language': 'de_DE', 'name': 'Birgit (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'de-DE_BirgitV2Voice'}, 'language': 'de_DE', 'name': 'Birgit (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'de-DE_BirgitVoice'}, 'language': 'de_DE', 'name': 'Birgit', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, ElkeNeural)'},
-  'language': 'de_DE',
-  'name': 'Elke (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'de-DE_ErikaV3Voice'}, 'language': 'de_DE', 'name': 'Erika (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'country_code': 'DEU', 'gender': 'f', 'language_code': 'de'}, 'language': 'de_DE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, GiselaNeural)'},
-  'language': 'de_DE',
-  'name': 'Gisela (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Gudrun'}, 'language': 'de_DE', 'name': 'Gudrun (German)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Gudrun-CereWave'}, 'language': 'de_DE', 'name': 'Gudrun-CereWave (German)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, HeddaRUS)'},
-  'language': 'de_DE',
-  'name': 'Hedda (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 3, 'voice_id': 1}, 'language': 'de_DE', 'name': 'Hilda', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, KatjaNeural)'},
-  'language': 'de_DE',
-  'name': 'Katja (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 3, 'voice_id': 3}, 'language': 'de_DE', 'name': 'Katrin', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, KlarissaNeural)'},
-  'language': 'de_DE',
-  'name': 'Klarissa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 3, 'voice_id': 1}, 'language': 'de_DE', 'name': 'Lena', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, LouisaNeural)'},
-  'language': 'de_DE',
-  'name': 'Louisa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, MajaNeural)'},
-  'language': 'de_DE',
-  'name': 'Maja (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Marlene'},
-  'language': 'de_DE',
-  'name': 'Marlene (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, TanjaNeural)'},
-  'language': 'de_DE',
-  'name': 'Tanja (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 3, 'voice_id': 1}, 'language': 'de_DE', 'name': 'Ulrike', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Vicki'},
-  'language': 'de_DE',
-  'name': 'Vicki (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-F', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-F', 'ssml_gender': 'FEMALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-F',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'name': 'Alex'}, 'language': 'de_DE', 'name': 'Alex (German)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Alex-CereWave'}, 'language': 'de_DE', 'name': 'Alex-CereWave (German)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, BerndNeural)'},
-  'language': 'de_DE',
-  'name': 'Bernd (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, ChristophNeural)'},
-  'language': 'de_DE',
-  'name': 'Christoph (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, ConradNeural)'},
-  'language': 'de_DE',
-  'name': 'Conrad (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'de-DE_DieterV2Voice'}, 'language': 'de_DE', 'name': 'Dieter (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'name': 'de-DE_DieterV3Voice'}, 'language': 'de_DE', 'name': 'Dieter (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'name': 'de-DE_DieterVoice'}, 'language': 'de_DE', 'name': 'Dieter', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'country_code': 'DEU', 'gender': 'm', 'language_code': 'de'}, 'language': 'de_DE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Hans'},
-  'language': 'de_DE',
-  'name': 'Hans (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 3, 'voice_id': 2}, 'language': 'de_DE', 'name': 'Heinz', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, KasperNeural)'},
-  'language': 'de_DE',
-  'name': 'Kasper (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, KillianNeural)'},
-  'language': 'de_DE',
-  'name': 'Killian (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, KlausNeural)'},
-  'language': 'de_DE',
-  'name': 'Klaus (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, RalfNeural)'},
-  'language': 'de_DE',
-  'name': 'Ralf (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-DE, Stefan)'},
-  'language': 'de_DE',
-  'name': 'Stefan (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 3, 'voice_id': 2}, 'language': 'de_DE', 'name': 'Stefan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 3, 'voice_id': 2}, 'language': 'de_DE', 'name': 'Tim', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Standard-E', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'de-DE', 'name': 'de-DE-Wavenet-E', 'ssml_gender': 'MALE'},
-  'language': 'de_DE',
-  'name': 'de-DE-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'CHE', 'language_code': 'de'}, 'language': 'de_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'CHE', 'gender': 'f', 'language_code': 'de'}, 'language': 'de_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-CH, LeniNeural)'},
-  'language': 'de_CH',
-  'name': 'Leni (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'CHE', 'gender': 'm', 'language_code': 'de'}, 'language': 'de_CH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-CH, JanNeural)'},
-  'language': 'de_CH',
-  'name': 'Jan (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (de-CH, Karsten)'},
-  'language': 'de_CH',
-  'name': 'Karsten (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'el'}, 'language': 'el_GR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 8, 'voice_id': 1}, 'language': 'el_GR', 'name': 'Afroditi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 8, 'voice_id': 2}, 'language': 'el_GR', 'name': 'Artemis', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (el-GR, AthinaNeural)'},
-  'language': 'el_GR',
-  'name': 'Athina Αθηνά (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 8, 'voice_id': 1}, 'language': 'el_GR', 'name': 'Eleni', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'el'}, 'language': 'el_GR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'language_code': 'el-GR', 'name': 'el-GR-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'el_GR',
-  'name': 'el-GR-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'el-GR', 'name': 'el-GR-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'el_GR',
-  'name': 'el-GR-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'el'}, 'language': 'el_GR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 8, 'voice_id': 2}, 'language': 'el_GR', 'name': 'Giorgos', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (el-GR, NestorasNeural)'},
-  'language': 'el_GR',
-  'name': 'Nestoras Νέστορας (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 8, 'voice_id': 3}, 'language': 'el_GR', 'name': 'Nikos', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (el-GR, Stefanos)'},
-  'language': 'el_GR',
-  'name': 'Stefanos Στέφανος (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (gu-IN, DhwaniNeural)'},
-  'language': 'gu_IN',
-  'name': 'Dhwani ધ્વની (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'gu-IN', 'name': 'gu-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'gu_IN',
-  'name': 'gu-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'gu-IN', 'name': 'gu-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'gu_IN',
-  'name': 'gu-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (gu-IN, NiranjanNeural)'},
-  'language': 'gu_IN',
-  'name': 'Niranjan નિરંજન (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'gu-IN', 'name': 'gu-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'gu_IN',
-  'name': 'gu-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'gu-IN', 'name': 'gu-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'gu_IN',
-  'name': 'gu-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'he'}, 'language': 'he_IL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'he'}, 'language': 'he_IL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (he-IL, HilaNeural)'},
-  'language': 'he_IL',
-  'name': 'Hila הילה (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (he-IL, Asaf)'},
-  'language': 'he_IL',
-  'name': 'Asaf אסף (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (he-IL, AvriNeural)'},
-  'language': 'he_IL',
-  'name': 'Avri אברי (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'he'}, 'language': 'he_IL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'hi'}, 'language': 'hi_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'hi'}, 'language': 'hi_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hi-IN, Kalpana)'},
-  'language': 'hi_IN',
-  'name': 'Kalpana कल्पना (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hi-IN, SwaraNeural)'},
-  'language': 'hi_IN',
-  'name': 'Swara स्वरा (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 24, 'voice_id': 1}, 'language': 'hi_IN', 'name': 'Swathi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'hi'}, 'language': 'hi_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hi-IN, Hemant)'},
-  'language': 'hi_IN',
-  'name': 'Hemant हेमन्त (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 24, 'voice_id': 2}, 'language': 'hi_IN', 'name': 'Karan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hi-IN, MadhurNeural)'},
-  'language': 'hi_IN',
-  'name': 'Madhur मधुर (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'hi-IN', 'name': 'hi-IN-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'hi_IN',
-  'name': 'hi-IN-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'hu'}, 'language': 'hu_HU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 29, 'voice_id': 1}, 'language': 'hu_HU', 'name': 'Flora', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'hu'}, 'language': 'hu_HU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hu-HU, NoemiNeural)'},
-  'language': 'hu_HU',
-  'name': 'Noemi Noémi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'hu-HU', 'name': 'hu-HU-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'hu_HU',
-  'name': 'hu-HU-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'hu-HU', 'name': 'hu-HU-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'hu_HU',
-  'name': 'hu-HU-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'hu'}, 'language': 'hu_HU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 29, 'voice_id': 2}, 'language': 'hu_HU', 'name': 'Laszlo', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hu-HU, Szabolcs)'},
-  'language': 'hu_HU',
-  'name': 'Szabolcs (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (hu-HU, TamasNeural)'},
-  'language': 'hu_HU',
-  'name': 'Tamas Tamás (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Dora'},
-  'language': 'is_IS',
-  'name': 'Dóra (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (is-IS, GudrunNeural)'},
-  'language': 'is_IS',
-  'name': 'Gudrun Guðrún (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'is-IS', 'name': 'is-is-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'is_IS',
-  'name': 'is-is-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (is-IS, GunnarNeural)'},
-  'language': 'is_IS',
-  'name': 'Gunnar (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Karl'},
-  'language': 'is_IS',
-  'name': 'Karl (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ind'}, 'language': 'id_ID', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ind'}, 'language': 'id_ID', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (id-ID, GadisNeural)'},
-  'language': 'id_ID',
-  'name': 'Gadis (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 28, 'voice_id': 1}, 'language': 'id_ID', 'name': 'Putri', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (id-ID, Andika)'},
-  'language': 'id_ID',
-  'name': 'Andika (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (id-ID, ArdiNeural)'},
-  'language': 'id_ID',
-  'name': 'Ardi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 28, 'voice_id': 2}, 'language': 'id_ID', 'name': 'Bintang', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ind'}, 'language': 'id_ID', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'id-ID', 'name': 'id-ID-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'id_ID',
-  'name': 'id-ID-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ga'}, 'language': 'ga_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ga'}, 'language': 'ga_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ga-IE, OrlaNeural)'},
-  'language': 'ga_IE',
-  'name': 'Orla (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Peig'}, 'language': 'ga_IE', 'name': 'Peig (Ulster)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Peig-CereWave'}, 'language': 'ga_IE', 'name': 'Peig-CereWave (Ulster)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ga-IE, ColmNeural)'},
-  'language': 'ga_IE',
-  'name': 'Colm (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ga'}, 'language': 'ga_IE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'it'}, 'language': 'it_IT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Bianca'},
-  'language': 'it_IT',
-  'name': 'Bianca (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 7, 'voice_id': 1}, 'language': 'it_IT', 'name': 'Bianca', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Carla'},
-  'language': 'it_IT',
-  'name': 'Carla (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 7, 'voice_id': 1}, 'language': 'it_IT', 'name': 'Elisa', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (it-IT, ElsaNeural)'},
-  'language': 'it_IT',
-  'name': 'Elsa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 10}, 'language': 'it_IT', 'name': 'Federica', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'it'}, 'language': 'it_IT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'it-IT_FrancescaV2Voice'}, 'language': 'it_IT', 'name': 'Francesca (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'it-IT_FrancescaV3Voice'}, 'language': 'it_IT', 'name': 'Francesca (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'it-IT_FrancescaVoice'}, 'language': 'it_IT', 'name': 'Francesca', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 9}, 'language': 'it_IT', 'name': 'Giulia', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (it-IT, IsabellaNeural)'},
-  'language': 'it_IT',
-  'name': 'Isabella (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Laura'}, 'language': 'it_IT', 'name': 'Laura (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Laura-CereWave'}, 'language': 'it_IT', 'name': 'Laura-CereWave (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (it-IT, LuciaRUS)'},
-  'language': 'it_IT',
-  'name': 'Lucia (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Nicoletta-CereWave'}, 'language': 'it_IT', 'name': 'Nicoletta-CereWave (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 1}, 'language': 'it_IT', 'name': 'Paola', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 2}, 'language': 'it_IT', 'name': 'Silvana', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 3}, 'language': 'it_IT', 'name': 'Valentina', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Standard-B', 'ssml_gender': 'FEMALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Wavenet-B', 'ssml_gender': 'FEMALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 7, 'voice_id': 2}, 'language': 'it_IT', 'name': 'Alessandro', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (it-IT, Cosimo)'},
-  'language': 'it_IT',
-  'name': 'Cosimo (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'Dario'}, 'language': 'it_IT', 'name': 'Dario (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Dario-CereWave'}, 'language': 'it_IT', 'name': 'Dario-CereWave (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (it-IT, DiegoNeural)'},
-  'language': 'it_IT',
-  'name': 'Diego (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 4}, 'language': 'it_IT', 'name': 'Fabio', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'it'}, 'language': 'it_IT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'name': 'Francesco-CereWave'}, 'language': 'it_IT', 'name': 'Francesco-CereWave (IT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Giorgio'},
-  'language': 'it_IT',
-  'name': 'Giorgio (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 5}, 'language': 'it_IT', 'name': 'Luca', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 6}, 'language': 'it_IT', 'name': 'Marcello', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 8}, 'language': 'it_IT', 'name': 'Matteo', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 7, 'voice_id': 7}, 'language': 'it_IT', 'name': 'Raffaele', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 7, 'voice_id': 2}, 'language': 'it_IT', 'name': 'Roberto', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'it-IT', 'name': 'it-IT-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'it_IT',
-  'name': 'it-IT-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ja'}, 'language': 'ja_JP', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ja-JP, Ayumi)'},
-  'language': 'ja_JP',
-  'name': 'Ayumi 歩美 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'ja-JP_EmiV3Voice'}, 'language': 'ja_JP', 'name': 'Emi (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'ja-JP_EmiVoice'}, 'language': 'ja_JP', 'name': 'Emi', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'deriko'},
-  'language': 'ja_JP',
-  'name': 'Eriko (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ja'}, 'language': 'ja_JP', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ja-JP, HarukaRUS)'},
-  'language': 'ja_JP',
-  'name': 'Haruka 春香 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 6}, 'language': 'ja_JP', 'name': 'Haruka', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 5}, 'language': 'ja_JP', 'name': 'Hikari', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 12, 'voice_id': 1}, 'language': 'ja_JP', 'name': 'Himari', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'dmio'},
-  'language': 'ja_JP',
-  'name': 'Mio (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 3}, 'language': 'ja_JP', 'name': 'Misaki', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 1}, 'language': 'ja_JP', 'name': 'Miyu', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Mizuki'},
-  'language': 'ja_JP',
-  'name': 'Mizuki (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ja-JP, NanamiNeural)'},
-  'language': 'ja_JP',
-  'name': 'Nanami 七海 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'dnaomi_formal'},
-  'language': 'ja_JP',
-  'name': 'Naomi (Formal) (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'dnaomi_joyful'},
-  'language': 'ja_JP',
-  'name': 'Naomi (Joyful) (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'nnaomi'},
-  'language': 'ja_JP',
-  'name': 'Naomi (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'driko'},
-  'language': 'ja_JP',
-  'name': 'Riko (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 4}, 'language': 'ja_JP', 'name': 'Sayaka', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'nsayuri'},
-  'language': 'ja_JP',
-  'name': 'Sayuri (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'ntomoko'},
-  'language': 'ja_JP',
-  'name': 'Tomoko (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'name': 'Yuki'}, 'language': 'ja_JP', 'name': 'Yuki (Tokyo)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Yuki-CereWave'}, 'language': 'ja_JP', 'name': 'Yuki-CereWave (Tokyo)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Standard-B', 'ssml_gender': 'FEMALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Wavenet-B', 'ssml_gender': 'FEMALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'dayumu'},
-  'language': 'ja_JP',
-  'name': 'Ayumu (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'ddaiki'},
-  'language': 'ja_JP',
-  'name': 'Daiki (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ja'}, 'language': 'ja_JP', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'dhajime'},
-  'language': 'ja_JP',
-  'name': 'Hajime (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ja-JP, Ichiro)'},
-  'language': 'ja_JP',
-  'name': 'Ichiro 一郎 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 12, 'voice_id': 2}, 'language': 'ja_JP', 'name': 'Kaito', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ja-JP, KeitaNeural)'},
-  'language': 'ja_JP',
-  'name': 'Keita 圭太 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 7}, 'language': 'ja_JP', 'name': 'Ryo', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'shinji'},
-  'language': 'ja_JP',
-  'name': 'Shinji (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 2}, 'language': 'ja_JP', 'name': 'Show', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 12, 'voice_id': 8}, 'language': 'ja_JP', 'name': 'Takeru', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'engine': 'neural', 'voice_id': 'Takumi'},
-  'language': 'ja_JP',
-  'name': 'Takumi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ja-JP', 'name': 'ja-JP-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'ja_JP',
-  'name': 'ja-JP-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (jv-ID, SitiNeural)'},
-  'language': 'jv_ID',
-  'name': 'Siti (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (jv-ID, DimasNeural)'},
-  'language': 'jv_ID',
-  'name': 'Dimas (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (kn-IN, SapnaNeural)'},
-  'language': 'kn_IN',
-  'name': 'Sapna ಸಪ್ನಾ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'kn-IN', 'name': 'kn-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'kn_IN',
-  'name': 'kn-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'kn-IN', 'name': 'kn-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'kn_IN',
-  'name': 'kn-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (kn-IN, GaganNeural)'},
-  'language': 'kn_IN',
-  'name': 'Gagan ಗಗನ್ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'kn-IN', 'name': 'kn-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'kn_IN',
-  'name': 'kn-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'kn-IN', 'name': 'kn-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'kn_IN',
-  'name': 'kn-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (kk-KZ, AigulNeural)'},
-  'language': 'kk_KZ',
-  'name': 'Aigul Айгүл (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (kk-KZ, DauletNeural)'},
-  'language': 'kk_KZ',
-  'name': 'Daulet Дәулет (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (km-KH, SreymomNeural)'},
-  'language': 'km_KH',
-  'name': 'Sreymom ស្រីមុំ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (km-KH, PisethNeural)'},
-  'language': 'km_KH',
-  'name': 'Piseth ពិសិដ្ឋ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ko'}, 'language': 'ko_KR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'dara_ang'},
-  'language': 'ko_KR',
-  'name': 'Ara (Angry) (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'nbora'},
-  'language': 'ko_KR',
-  'name': 'Bora (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'ndain'},
-  'language': 'ko_KR',
-  'name': 'Dain (Premium (Child))',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'dara'},
-  'language': 'ko_KR',
-  'name': 'Dara (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 7}, 'language': 'ko_KR', 'name': 'Dayoung', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'neunyoung'},
-  'language': 'ko_KR',
-  'name': 'Eunyoung (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ko'}, 'language': 'ko_KR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ko-KR, HeamiRUS)'},
-  'language': 'ko_KR',
-  'name': 'Heami 해 미 (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 4}, 'language': 'ko_KR', 'name': 'Hyeryun', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 8}, 'language': 'ko_KR', 'name': 'Hyuna', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 5}, 'language': 'ko_KR', 'name': 'Jimin', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'njiwon'},
-  'language': 'ko_KR',
-  'name': 'Jiwon (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'njiyun'},
-  'language': 'ko_KR',
-  'name': 'Jiyoon (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'ngoeun'},
-  'language': 'ko_KR',
-  'name': 'Koeun (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'mijin'},
-  'language': 'ko_KR',
-  'name': 'Mijin (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'nminseo'},
-  'language': 'ko_KR',
-  'name': 'Minseo (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'nara'},
-  'language': 'ko_KR',
-  'name': 'Nara (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 6}, 'language': 'ko_KR', 'name': 'Sena', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Seoyeon'},
-  'language': 'ko_KR',
-  'name': 'Seoyeon (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'nsujin'},
-  'language': 'ko_KR',
-  'name': 'Sujin (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 3}, 'language': 'ko_KR', 'name': 'Sujin', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ko-KR, SunHiNeural)'},
-  'language': 'ko_KR',
-  'name': 'Sun-Hi 선히 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'nsunhee'},
-  'language': 'ko_KR',
-  'name': 'Sunhee (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female',
-  'key': {'name': 'nsunkyung'},
-  'language': 'ko_KR',
-  'name': 'Sunkyung (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'name': 'ko-KR_YoungmiVoice'}, 'language': 'ko_KR', 'name': 'Youngmi', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'nyujin'},
-  'language': 'ko_KR',
-  'name': 'Yujin (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 1}, 'language': 'ko_KR', 'name': 'Yumi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'ko-KR_YunaVoice'}, 'language': 'ko_KR', 'name': 'Yuna', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 9}, 'language': 'ko_KR', 'name': 'Yura', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Standard-B', 'ssml_gender': 'FEMALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Wavenet-B', 'ssml_gender': 'FEMALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ko'}, 'language': 'ko_KR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'nhajun'},
-  'language': 'ko_KR',
-  'name': 'Hajoon (Premium (Child))',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'name': 'ko-KR_HyunjunVoice'}, 'language': 'ko_KR', 'name': 'Hyunjun', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ko-KR, InJoonNeural)'},
-  'language': 'ko_KR',
-  'name': 'InJoon 인준 (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'njaewook'},
-  'language': 'ko_KR',
-  'name': 'Jaewook (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'njihun'},
-  'language': 'ko_KR',
-  'name': 'Jihoon (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 10}, 'language': 'ko_KR', 'name': 'Jihun', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'jinho'},
-  'language': 'ko_KR',
-  'name': 'Jinho (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'njinho'},
-  'language': 'ko_KR',
-  'name': 'Jinho (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'njonghyun'},
-  'language': 'ko_KR',
-  'name': 'Jonghyun (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'njoonyoung'},
-  'language': 'ko_KR',
-  'name': 'Joonyoung (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 13, 'voice_id': 2}, 'language': 'ko_KR', 'name': 'Junwoo', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'nminsang'},
-  'language': 'ko_KR',
-  'name': 'Minsang (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'nseungpyo'},
-  'language': 'ko_KR',
-  'name': 'Seungpyo (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'nsinu'},
-  'language': 'ko_KR',
-  'name': 'Shinwoo (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'name': 'ko-KR_SiWooVoice'}, 'language': 'ko_KR', 'name': 'SiWoo', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'name': 'ntaejin'},
-  'language': 'ko_KR',
-  'name': 'Taejin (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'nwontak'},
-  'language': 'ko_KR',
-  'name': 'Wontak (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'name': 'nyoungil'},
-  'language': 'ko_KR',
-  'name': 'Youngil (Premium)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ko-KR', 'name': 'ko-KR-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'ko_KR',
-  'name': 'ko-KR-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'lo'}, 'language': 'lo_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'lo'}, 'language': 'lo_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lo-LA, KeomanyNeural)'},
-  'language': 'lo_LA',
-  'name': 'Keomany ແກ້ວມະນີ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lo-LA, ChanthavongNeural)'},
-  'language': 'lo_LA',
-  'name': 'Chanthavong ຈັນທະວົງ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'lo'}, 'language': 'lo_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'lv'}, 'language': 'lv_LV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lv-LV, EveritaNeural)'},
-  'language': 'lv_LV',
-  'name': 'Everita (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'lv'}, 'language': 'lv_LV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'lv'}, 'language': 'lv_LV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lv-LV, NilsNeural)'},
-  'language': 'lv_LV',
-  'name': 'Nils (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'lv-LV', 'name': 'lv-lv-Standard-A', 'ssml_gender': 'MALE'},
-  'language': 'lv_LV',
-  'name': 'lv-lv-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'lt'}, 'language': 'lt_LT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'lt'}, 'language': 'lt_LT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lt-LT, OnaNeural)'},
-  'language': 'lt_LT',
-  'name': 'Ona (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'lt'}, 'language': 'lt_LT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (lt-LT, LeonasNeural)'},
-  'language': 'lt_LT',
-  'name': 'Leonas (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'mk'}, 'language': 'mk_MK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'mk'}, 'language': 'mk_MK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mk-MK, MarijaNeural)'},
-  'language': 'mk_MK',
-  'name': 'Marija Марија (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mk-MK, AleksandarNeural)'},
-  'language': 'mk_MK',
-  'name': 'Aleksandar Александар (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'mk'}, 'language': 'mk_MK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ms-MY, YasminNeural)'},
-  'language': 'ms_MY',
-  'name': 'Yasmin (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ms-MY, OsmanNeural)'},
-  'language': 'ms_MY',
-  'name': 'Osman (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ms-MY, Rizwan)'},
-  'language': 'ms_MY',
-  'name': 'Rizwan (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ms-MY', 'name': 'ms-MY-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'ms_MY',
-  'name': 'ms-MY-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ml-IN, SobhanaNeural)'},
-  'language': 'ml_IN',
-  'name': 'Sobhana ശോഭന (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'ml-IN', 'name': 'ml-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ml_IN',
-  'name': 'ml-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ml-IN', 'name': 'ml-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ml_IN',
-  'name': 'ml-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ml-IN, MidhunNeural)'},
-  'language': 'ml_IN',
-  'name': 'Midhun മിഥുൻ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'ml-IN', 'name': 'ml-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'ml_IN',
-  'name': 'ml-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ml-IN', 'name': 'ml-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'ml_IN',
-  'name': 'ml-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mt-MT, GraceNeural)'},
-  'language': 'mt_MT',
-  'name': 'Grace (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mt-MT, JosephNeural)'},
-  'language': 'mt_MT',
-  'name': 'Joseph (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mr-IN, AarohiNeural)'},
-  'language': 'mr_IN',
-  'name': 'Aarohi आरोही (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (mr-IN, ManoharNeural)'},
-  'language': 'mr_IN',
-  'name': 'Manohar मनोहर (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'no'}, 'language': 'nb_NO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Clara'}, 'language': 'nb_NO', 'name': 'Clara (Norwegian Bokml)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Clara-CereWave'}, 'language': 'nb_NO', 'name': 'Clara-CereWave (Norwegian Bokml)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 20, 'voice_id': 1}, 'language': 'nb_NO', 'name': 'Dagrun', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'no'}, 'language': 'nb_NO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Hulda'}, 'language': 'nb_NO', 'name': 'Hulda (Norwegian Nynorsk)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nb-NO, HuldaRUS)'},
-  'language': 'nb_NO',
-  'name': 'Hulda (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Hulda-CereWave'}, 'language': 'nb_NO', 'name': 'Hulda-CereWave (Norwegian Nynorsk)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nb-NO, IselinNeural)'},
-  'language': 'nb_NO',
-  'name': 'Iselin (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Liv'},
-  'language': 'nb_NO',
-  'name': 'Liv (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nb-NO, PernilleNeural)'},
-  'language': 'nb_NO',
-  'name': 'Pernille (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 20, 'voice_id': 1}, 'language': 'nb_NO', 'name': 'Vilde', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-no-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-no-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-no-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-no-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-no-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'nb_NO',
-  'name': 'nb-no-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (nb-NO, FinnNeural)'},
-  'language': 'nb_NO',
-  'name': 'Finn (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'no'}, 'language': 'nb_NO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 20, 'voice_id': 2}, 'language': 'nb_NO', 'name': 'Henrik', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 20, 'voice_id': 2}, 'language': 'nb_NO', 'name': 'Lars', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'nb-NO', 'name': 'nb-NO-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'nb_NO',
-  'name': 'nb-NO-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ps-AF, LatifaNeural)'},
-  'language': 'ps_AF',
-  'name': 'Latifa لطيفه (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ps-AF, GulNawazNeural)'},
-  'language': 'ps_AF',
-  'name': 'Gul Nawaz  ګل نواز (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'fa'}, 'language': 'fa_IR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fa-IR, DilaraNeural)'},
-  'language': 'fa_IR',
-  'name': 'Dilara دلارا (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'fa'}, 'language': 'fa_IR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (fa-IR, FaridNeural)'},
-  'language': 'fa_IR',
-  'name': 'Farid فرید (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'fa'}, 'language': 'fa_IR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'pl'}, 'language': 'pl_PL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pl-PL, AgnieszkaNeural)'},
-  'language': 'pl_PL',
-  'name': 'Agnieszka (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 14, 'voice_id': 1}, 'language': 'pl_PL', 'name': 'Danota', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Ewa'},
-  'language': 'pl_PL',
-  'name': 'Ewa (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'pl'}, 'language': 'pl_PL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Maja'},
-  'language': 'pl_PL',
-  'name': 'Maja (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pl-PL, PaulinaRUS)'},
-  'language': 'pl_PL',
-  'name': 'Paulina (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Pola'}, 'language': 'pl_PL', 'name': 'Pola (PL)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Pola-CereWave'}, 'language': 'pl_PL', 'name': 'Pola-CereWave (PL)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pl-PL, ZofiaNeural)'},
-  'language': 'pl_PL',
-  'name': 'Zofia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 14, 'voice_id': 1}, 'language': 'pl_PL', 'name': 'Zosia', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'pl'}, 'language': 'pl_PL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Jacek'},
-  'language': 'pl_PL',
-  'name': 'Jacek (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Jan'},
-  'language': 'pl_PL',
-  'name': 'Jan (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 14, 'voice_id': 2}, 'language': 'pl_PL', 'name': 'Krzysztof', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pl-PL, MarekNeural)'},
-  'language': 'pl_PL',
-  'name': 'Marek (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 14, 'voice_id': 2}, 'language': 'pl_PL', 'name': 'Wojciech', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pl-PL', 'name': 'pl-PL-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'pl_PL',
-  'name': 'pl-PL-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 6, 'voice_id': 1}, 'language': 'pt_BR', 'name': 'Ana', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Camila'},
-  'language': 'pt_BR',
-  'name': 'Camila (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 6, 'voice_id': 4}, 'language': 'pt_BR', 'name': 'Fernanda', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-BR, FranciscaNeural)'},
-  'language': 'pt_BR',
-  'name': 'Francisca (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 6, 'voice_id': 1}, 'language': 'pt_BR', 'name': 'Gabriela', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 6, 'voice_id': 1}, 'language': 'pt_BR', 'name': 'Helena', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-BR, HeloisaRUS)'},
-  'language': 'pt_BR',
-  'name': 'Heloisa (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'pt-BR_IsabelaV3Voice'}, 'language': 'pt_BR', 'name': 'Isabela (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'pt-BR_IsabelaVoice'}, 'language': 'pt_BR', 'name': 'Isabela', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Vitoria'},
-  'language': 'pt_BR',
-  'name': 'Vitória (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-BR', 'name': 'pt-BR-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_BR',
-  'name': 'pt-BR-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-BR', 'name': 'pt-BR-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_BR',
-  'name': 'pt-BR-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-BR, AntonioNeural)'},
-  'language': 'pt_BR',
-  'name': 'Antonio Antônio (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 6, 'voice_id': 2}, 'language': 'pt_BR', 'name': 'Antonio', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-BR, Daniel)'},
-  'language': 'pt_BR',
-  'name': 'Daniel (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 6, 'voice_id': 5}, 'language': 'pt_BR', 'name': 'Felipe', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'name': 'Gabriel'}, 'language': 'pt_BR', 'name': 'Gabriel (BR)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'name': 'Gabriel-CereWave'}, 'language': 'pt_BR', 'name': 'Gabriel-CereWave (BR)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 6, 'voice_id': 2}, 'language': 'pt_BR', 'name': 'Rafael', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Ricardo'},
-  'language': 'pt_BR',
-  'name': 'Ricardo (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-BR', 'name': 'pt-BR-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'pt_BR',
-  'name': 'pt-BR-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-BR', 'name': 'pt-BR-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'pt_BR',
-  'name': 'pt-BR-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'pt'}, 'language': 'pt_PT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 6, 'voice_id': 2}, 'language': 'pt_PT', 'name': 'Amalia', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-PT, FernandaNeural)'},
-  'language': 'pt_PT',
-  'name': 'Fernanda (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'pt'}, 'language': 'pt_PT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-PT, HeliaRUS)'},
-  'language': 'pt_PT',
-  'name': 'Helia Hélia (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Ines'},
-  'language': 'pt_PT',
-  'name': 'Inês (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 6, 'voice_id': 3}, 'language': 'pt_PT', 'name': 'Leonor', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'Lucia'}, 'language': 'pt_PT', 'name': 'Lucia (PT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Lucia-CereWave'}, 'language': 'pt_PT', 'name': 'Lucia-CereWave (PT)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-PT, RaquelNeural)'},
-  'language': 'pt_PT',
-  'name': 'Raquel (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Cristiano'},
-  'language': 'pt_PT',
-  'name': 'Cristiano (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (pt-PT, DuarteNeural)'},
-  'language': 'pt_PT',
-  'name': 'Duarte (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 6, 'voice_id': 3}, 'language': 'pt_PT', 'name': 'Eusebio', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'pt'}, 'language': 'pt_PT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 6, 'voice_id': 4}, 'language': 'pt_PT', 'name': 'Tiago', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pt-PT', 'name': 'pt-PT-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'pt_PT',
-  'name': 'pt-PT-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'pa'}, 'language': 'pa_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'pa'}, 'language': 'pa_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'pa'}, 'language': 'pa_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'pa-IN', 'name': 'pa-IN-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'pa_IN',
-  'name': 'pa-IN-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ro'}, 'language': 'ro_RO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ro-RO, AlinaNeural)'},
-  'language': 'ro_RO',
-  'name': 'Alina (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Carmen'},
-  'language': 'ro_RO',
-  'name': 'Carmen (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'Daria'}, 'language': 'ro_RO', 'name': 'Daria (ro)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Daria-CereWave'}, 'language': 'ro_RO', 'name': 'Daria-CereWave (ro)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ro'}, 'language': 'ro_RO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 30, 'voice_id': 1}, 'language': 'ro_RO', 'name': 'Ioana', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'ro-RO', 'name': 'ro-RO-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ro_RO',
-  'name': 'ro-RO-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ro-RO', 'name': 'ro-RO-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ro_RO',
-  'name': 'ro-RO-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ro-RO, Andrei)'},
-  'language': 'ro_RO',
-  'name': 'Andrei (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ro-RO, EmilNeural)'},
-  'language': 'ro_RO',
-  'name': 'Emil (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ro'}, 'language': 'ro_RO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'ru'}, 'language': 'ru_RU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Avrora'}, 'language': 'ru_RU', 'name': 'Avrora (RU)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Avrora-CereWave'}, 'language': 'ru_RU', 'name': 'Avrora-CereWave (RU)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, DariyaNeural)'},
-  'language': 'ru_RU',
-  'name': 'Dariya Дария (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, EkaterinaRUS)'},
-  'language': 'ru_RU',
-  'name': 'Ekaterina Екатерина (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'ru'}, 'language': 'ru_RU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, Irina)'},
-  'language': 'ru_RU',
-  'name': 'Irina Ирина (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 21, 'voice_id': 1}, 'language': 'ru_RU', 'name': 'Olga', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, SvetlanaNeural)'},
-  'language': 'ru_RU',
-  'name': 'Svetlana Светлана (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Tatyana'},
-  'language': 'ru_RU',
-  'name': 'Tatyana (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Standard-E', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Wavenet-E', 'ssml_gender': 'FEMALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 21, 'voice_id': 2}, 'language': 'ru_RU', 'name': 'Dmitri', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, DmitryNeural)'},
-  'language': 'ru_RU',
-  'name': 'Dmitry Дмитрий (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'ru'}, 'language': 'ru_RU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Maxim'},
-  'language': 'ru_RU',
-  'name': 'Maxim (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ru-RU, Pavel)'},
-  'language': 'ru_RU',
-  'name': 'Pavel Павел (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ru-RU', 'name': 'ru-RU-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'ru_RU',
-  'name': 'ru-RU-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sr-RS, SophieNeural)'},
-  'language': 'sr_RS',
-  'name': 'Sophie Софија (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'sr-RS', 'name': 'sr-rs-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'sr_RS',
-  'name': 'sr-rs-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sr-RS, NicholasNeural)'},
-  'language': 'sr_RS',
-  'name': 'Nicholas Никола (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (si-LK, ThiliniNeural)'},
-  'language': 'si_LK',
-  'name': 'Thilini තිළිණි (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (si-LK, SameeraNeural)'},
-  'language': 'si_LK',
-  'name': 'Sameera සමීර (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'sk'}, 'language': 'sk_SK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 37, 'voice_id': 1}, 'language': 'sk_SK', 'name': 'Eliska', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'sk'}, 'language': 'sk_SK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sk-SK, ViktoriaNeural)'},
-  'language': 'sk_SK',
-  'name': 'Viktoria Viktória (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'sk-SK', 'name': 'sk-SK-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'sk_SK',
-  'name': 'sk-SK-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sk-SK', 'name': 'sk-SK-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'sk_SK',
-  'name': 'sk-SK-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sk-SK, Filip)'},
-  'language': 'sk_SK',
-  'name': 'Filip (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'sk'}, 'language': 'sk_SK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 37, 'voice_id': 2}, 'language': 'sk_SK', 'name': 'Jakub', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sk-SK, LukasNeural)'},
-  'language': 'sk_SK',
-  'name': 'Lukas Lukáš (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'sl'}, 'language': 'sl_SI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'sl'}, 'language': 'sl_SI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sl-SI, PetraNeural)'},
-  'language': 'sl_SI',
-  'name': 'Petra (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'sl'}, 'language': 'sl_SI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sl-SI, Lado)'},
-  'language': 'sl_SI',
-  'name': 'Lado (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sl-SI, RokNeural)'},
-  'language': 'sl_SI',
-  'name': 'Rok (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (so-SO, UbaxNeural)'},
-  'language': 'so_SO',
-  'name': 'Ubax (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (so-SO, MuuseNeural)'},
-  'language': 'so_SO',
-  'name': 'Muuse (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ARG', 'language_code': 'es'}, 'language': 'es_AR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-AR, ElenaNeural)'},
-  'language': 'es_AR',
-  'name': 'Elena (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ARG', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_AR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ARG', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_AR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-AR, TomasNeural)'},
-  'language': 'es_AR',
-  'name': 'Tomas (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'BOL', 'language_code': 'es'}, 'language': 'es_BO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'BOL', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_BO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-BO, SofiaNeural)'},
-  'language': 'es_BO',
-  'name': 'Sofia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'BOL', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_BO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-BO, MarceloNeural)'},
-  'language': 'es_BO',
-  'name': 'Marcelo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'CHL', 'language_code': 'es'}, 'language': 'es_CL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CL, CatalinaNeural)'},
-  'language': 'es_CL',
-  'name': 'Catalina (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'CHL', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_CL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'CHL', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_CL', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CL, LorenzoNeural)'},
-  'language': 'es_CL',
-  'name': 'Lorenzo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'COL', 'language_code': 'es'}, 'language': 'es_CO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'COL', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_CO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CO, SalomeNeural)'},
-  'language': 'es_CO',
-  'name': 'Salome (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'COL', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_CO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CO, GonzaloNeural)'},
-  'language': 'es_CO',
-  'name': 'Gonzalo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'CRI', 'language_code': 'es'}, 'language': 'es_CR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'CRI', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_CR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CR, MariaNeural)'},
-  'language': 'es_CR',
-  'name': 'Maria María (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'CRI', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_CR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CR, JuanNeural)'},
-  'language': 'es_CR',
-  'name': 'Juan (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'CUB', 'language_code': 'es'}, 'language': 'es_CU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CU, BelkysNeural)'},
-  'language': 'es_CU',
-  'name': 'Belkys (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'CUB', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_CU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'CUB', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_CU', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-CU, ManuelNeural)'},
-  'language': 'es_CU',
-  'name': 'Manuel (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'DOM', 'language_code': 'es'}, 'language': 'es_DO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'DOM', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_DO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-DO, RamonaNeural)'},
-  'language': 'es_DO',
-  'name': 'Ramona (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-DO, EmilioNeural)'},
-  'language': 'es_DO',
-  'name': 'Emilio (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'DOM', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_DO', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ECU', 'language_code': 'es'}, 'language': 'es_EC', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-EC, AndreaNeural)'},
-  'language': 'es_EC',
-  'name': 'Andrea (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ECU', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_EC', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'country_code': 'ECU', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_EC', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-EC, LuisNeural)'},
-  'language': 'es_EC',
-  'name': 'Luis (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'SLV', 'language_code': 'es'}, 'language': 'es_SV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'SLV', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_SV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-SV, LorenaNeural)'},
-  'language': 'es_SV',
-  'name': 'Lorena (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'SLV', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_SV', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-SV, RodrigoNeural)'},
-  'language': 'es_SV',
-  'name': 'Rodrigo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'GNQ', 'language_code': 'es'}, 'language': 'es_GQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'GNQ', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_GQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-GQ, TeresaNeural)'},
-  'language': 'es_GQ',
-  'name': 'Teresa (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'GNQ', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_GQ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-GQ, JavierNeural)'},
-  'language': 'es_GQ',
-  'name': 'Javier (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'GTM', 'language_code': 'es'}, 'language': 'es_GT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'GTM', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_GT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-GT, MartaNeural)'},
-  'language': 'es_GT',
-  'name': 'Marta (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-GT, AndresNeural)'},
-  'language': 'es_GT',
-  'name': 'Andres Andrés (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'GTM', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_GT', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'HND', 'language_code': 'es'}, 'language': 'es_HN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'HND', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_HN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-HN, KarlaNeural)'},
-  'language': 'es_HN',
-  'name': 'Karla (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-HN, CarlosNeural)'},
-  'language': 'es_HN',
-  'name': 'Carlos (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'HND', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_HN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'es'}, 'language': 'es_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 3}, 'language': 'es_LA', 'name': 'Francisca', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'name': 'es-LA_SofiaV3Voice'}, 'language': 'es_LA', 'name': 'Sofia (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'es-LA_SofiaVoice'}, 'language': 'es_LA', 'name': 'Sofia', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 4}, 'language': 'es_LA', 'name': 'Diego', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_LA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'MEX', 'language_code': 'es'}, 'language': 'es_MX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-MX, DaliaNeural)'},
-  'language': 'es_MX',
-  'name': 'Dalia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 5}, 'language': 'es_MX', 'name': 'Esperanza', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'MEX', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_MX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 2, 'voice_id': 3}, 'language': 'es_MX', 'name': 'Gloria', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-MX, HildaRUS)'},
-  'language': 'es_MX',
-  'name': 'Hilda (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Mia'},
-  'language': 'es_MX',
-  'name': 'Mia (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 2, 'voice_id': 1}, 'language': 'es_MX', 'name': 'Violeta', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'MEX', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_MX', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 2, 'voice_id': 2}, 'language': 'es_MX', 'name': 'Francisco', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-MX, JorgeNeural)'},
-  'language': 'es_MX',
-  'name': 'Jorge (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-MX, Raul)'},
-  'language': 'es_MX',
-  'name': 'Raul Raúl (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'NIC', 'language_code': 'es'}, 'language': 'es_NI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'NIC', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_NI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-NI, YolandaNeural)'},
-  'language': 'es_NI',
-  'name': 'Yolanda (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-NI, FedericoNeural)'},
-  'language': 'es_NI',
-  'name': 'Federico (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'NIC', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_NI', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'USA', 'language_code': 'es'}, 'language': 'es_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'name': 'Ana'}, 'language': 'es_US', 'name': 'Ana (Latin American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Ana-CereWave'}, 'language': 'es_US', 'name': 'Ana-CereWave (Latin American)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'country_code': 'USA', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Lupe'},
-  'language': 'es_US',
-  'name': 'Lupe (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-US, PalomaNeural)'},
-  'language': 'es_US',
-  'name': 'Paloma (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Penelope'},
-  'language': 'es_US',
-  'name': 'Penélope (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'es-US_SofiaV3Voice'}, 'language': 'es_US', 'name': 'Sofia (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'name': 'es-US_SofiaVoice'}, 'language': 'es_US', 'name': 'Sofia', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 8}, 'language': 'es_US', 'name': 'Soledad', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 10}, 'language': 'es_US', 'name': 'Ximena', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'es_US',
-  'name': 'es-US-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'es_US',
-  'name': 'es-US-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-US, AlonsoNeural)'},
-  'language': 'es_US',
-  'name': 'Alonso (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 7}, 'language': 'es_US', 'name': 'Carlos', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'USA', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_US', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Miguel'},
-  'language': 'es_US',
-  'name': 'Miguel (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'es_US',
-  'name': 'es-US-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Standard-C', 'ssml_gender': 'MALE'},
-  'language': 'es_US',
-  'name': 'es-US-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'es_US',
-  'name': 'es-US-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-US', 'name': 'es-US-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'es_US',
-  'name': 'es-US-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'PAN', 'language_code': 'es'}, 'language': 'es_PA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'PAN', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_PA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PA, MargaritaNeural)'},
-  'language': 'es_PA',
-  'name': 'Margarita (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PAN', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_PA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PA, RobertoNeural)'},
-  'language': 'es_PA',
-  'name': 'Roberto (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'PRY', 'language_code': 'es'}, 'language': 'es_PY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'PRY', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_PY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PY, TaniaNeural)'},
-  'language': 'es_PY',
-  'name': 'Tania (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PRY', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_PY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PY, MarioNeural)'},
-  'language': 'es_PY',
-  'name': 'Mario (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'PER', 'language_code': 'es'}, 'language': 'es_PE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PE, CamilaNeural)'},
-  'language': 'es_PE',
-  'name': 'Camila (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'PER', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_PE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PE, AlexNeural)'},
-  'language': 'es_PE',
-  'name': 'Alex (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PER', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_PE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'PRI', 'language_code': 'es'}, 'language': 'es_PR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'PRI', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_PR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PR, KarinaNeural)'},
-  'language': 'es_PR',
-  'name': 'Karina (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PRI', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_PR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-PR, VictorNeural)'},
-  'language': 'es_PR',
-  'name': 'Victor Víctor (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ESP', 'language_code': 'es'}, 'language': 'es_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'carmen'},
-  'language': 'es_ES',
-  'name': 'Carmen (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 1}, 'language': 'es_ES', 'name': 'Carmen', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Conchita'},
-  'language': 'es_ES',
-  'name': 'Conchita (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-ES, ElviraNeural)'},
-  'language': 'es_ES',
-  'name': 'Elvira (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ESP', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-ES, HelenaRUS)'},
-  'language': 'es_ES',
-  'name': 'Helena (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'es-ES_LauraV3Voice'}, 'language': 'es_ES', 'name': 'Laura (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-ES, Laura)'},
-  'language': 'es_ES',
-  'name': 'Laura (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'es-ES_LauraVoice'}, 'language': 'es_ES', 'name': 'Laura', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 9}, 'language': 'es_ES', 'name': 'Leonor', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 2, 'voice_id': 4}, 'language': 'es_ES', 'name': 'Lola', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'neural', 'voice_id': 'Lucia'},
-  'language': 'es_ES',
-  'name': 'Lucia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'name': 'Sara'}, 'language': 'es_ES', 'name': 'Sara (Catalan)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Sara-CereWave'}, 'language': 'es_ES', 'name': 'Sara-CereWave (Catalan)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-ES, AlvaroNeural)'},
-  'language': 'es_ES',
-  'name': 'Alvaro Álvaro (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'name': 'es-ES_EnriqueV3Voice'}, 'language': 'es_ES', 'name': 'Enrique (Dnn)', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male',
-  'key': {'engine': 'standard', 'voice_id': 'Enrique'},
-  'language': 'es_ES',
-  'name': 'Enrique (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Male', 'key': {'name': 'es-ES_EnriqueVoice'}, 'language': 'es_ES', 'name': 'Enrique', 'options': {}, 'service': 'Watson'},
- {'gender': 'Male', 'key': {'country_code': 'ESP', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_ES', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 6}, 'language': 'es_ES', 'name': 'Jorge', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'jose'},
-  'language': 'es_ES',
-  'name': 'Jose (General)',
-  'options': {'pitch': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}, 'speed': {'default': 0, 'max': 5, 'min': -5, 'type': 'number_int'}},
-  'service': 'Naver'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 2, 'voice_id': 2}, 'language': 'es_ES', 'name': 'Juan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 2, 'voice_id': 5}, 'language': 'es_ES', 'name': 'Manuel', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-ES, Pablo)'},
-  'language': 'es_ES',
-  'name': 'Pablo (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'es-ES', 'name': 'es-ES-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'es_ES',
-  'name': 'es-ES-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'URY', 'language_code': 'es'}, 'language': 'es_UY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'URY', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_UY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-UY, ValentinaNeural)'},
-  'language': 'es_UY',
-  'name': 'Valentina (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'URY', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_UY', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-UY, MateoNeural)'},
-  'language': 'es_UY',
-  'name': 'Mateo (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'VEN', 'language_code': 'es'}, 'language': 'es_VE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'VEN', 'gender': 'f', 'language_code': 'es'}, 'language': 'es_VE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-VE, PaolaNeural)'},
-  'language': 'es_VE',
-  'name': 'Paola (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'VEN', 'gender': 'm', 'language_code': 'es'}, 'language': 'es_VE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (es-VE, SebastianNeural)'},
-  'language': 'es_VE',
-  'name': 'Sebastian Sebastián (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (su-ID, TutiNeural)'},
-  'language': 'su_ID',
-  'name': 'Tuti (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (su-ID, JajangNeural)'},
-  'language': 'su_ID',
-  'name': 'Jajang (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sw-KE, ZuriNeural)'},
-  'language': 'sw_KE',
-  'name': 'Zuri (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sw-KE, RafikiNeural)'},
-  'language': 'sw_KE',
-  'name': 'Rafiki (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sw-TZ, RehemaNeural)'},
-  'language': 'sw_TZ',
-  'name': 'Rehema (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sw-TZ, DaudiNeural)'},
-  'language': 'sw_TZ',
-  'name': 'Daudi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'sv'}, 'language': 'sv_SE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 9, 'voice_id': 1}, 'language': 'sv_SE', 'name': 'Annika', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Astrid'},
-  'language': 'sv_SE',
-  'name': 'Astrid (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 9, 'voice_id': 1}, 'language': 'sv_SE', 'name': 'Astrid', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'sv'}, 'language': 'sv_SE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sv-SE, HedvigRUS)'},
-  'language': 'sv_SE',
-  'name': 'Hedvig (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sv-SE, HilleviNeural)'},
-  'language': 'sv_SE',
-  'name': 'Hillevi (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'sv-SE_IngridVoice'}, 'language': 'sv_SE', 'name': 'Ingrid', 'options': {}, 'service': 'Watson'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sv-SE, SofieNeural)'},
-  'language': 'sv_SE',
-  'name': 'Sofie (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'name': 'Ylva'}, 'language': 'sv_SE', 'name': 'Ylva (Standard Swedish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female', 'key': {'name': 'Ylva-CereWave'}, 'language': 'sv_SE', 'name': 'Ylva-CereWave (Standard Swedish)', 'options': {}, 'service': 'CereProc'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Standard-B', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Wavenet-B', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'sv'}, 'language': 'sv_SE', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 9, 'voice_id': 2}, 'language': 'sv_SE', 'name': 'Gustav', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (sv-SE, MattiasNeural)'},
-  'language': 'sv_SE',
-  'name': 'Mattias (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 9, 'voice_id': 2}, 'language': 'sv_SE', 'name': 'Sven', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Standard-E', 'ssml_gender': 'MALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Wavenet-C', 'ssml_gender': 'MALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'sv-SE', 'name': 'sv-SE-Wavenet-E', 'ssml_gender': 'MALE'},
-  'language': 'sv_SE',
-  'name': 'sv-SE-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'IND', 'language_code': 'ta'}, 'language': 'ta_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'IND', 'gender': 'f', 'language_code': 'ta'}, 'language': 'ta_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-IN, PallaviNeural)'},
-  'language': 'ta_IN',
-  'name': 'Pallavi பல்லவி (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'ta-IN', 'name': 'ta-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ta_IN',
-  'name': 'ta-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'ta-IN', 'name': 'ta-IN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'ta_IN',
-  'name': 'ta-IN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'IND', 'gender': 'm', 'language_code': 'ta'}, 'language': 'ta_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-IN, ValluvarNeural)'},
-  'language': 'ta_IN',
-  'name': 'Valluvar வள்ளுவர் (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-IN, Valluvar)'},
-  'language': 'ta_IN',
-  'name': 'Valluvar வள்ளுவர் (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'ta-IN', 'name': 'ta-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'ta_IN',
-  'name': 'ta-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'ta-IN', 'name': 'ta-IN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'ta_IN',
-  'name': 'ta-IN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'SGP', 'language_code': 'ta'}, 'language': 'ta_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'SGP', 'gender': 'f', 'language_code': 'ta'}, 'language': 'ta_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-SG, VenbaNeural)'},
-  'language': 'ta_SG',
-  'name': 'Venba வெண்பா (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-SG, AnbuNeural)'},
-  'language': 'ta_SG',
-  'name': 'Anbu அன்பு (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'SGP', 'gender': 'm', 'language_code': 'ta'}, 'language': 'ta_SG', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'LKA', 'language_code': 'ta'}, 'language': 'ta_LK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'LKA', 'gender': 'f', 'language_code': 'ta'}, 'language': 'ta_LK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-LK, SaranyaNeural)'},
-  'language': 'ta_LK',
-  'name': 'Saranya சரண்யா (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'LKA', 'gender': 'm', 'language_code': 'ta'}, 'language': 'ta_LK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ta-LK, KumarNeural)'},
-  'language': 'ta_LK',
-  'name': 'Kumar குமார் (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (te-IN, Chitra)'},
-  'language': 'te_IN',
-  'name': 'Chitra చిత్ర (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (te-IN, ShrutiNeural)'},
-  'language': 'te_IN',
-  'name': 'Shruti శ్రుతి (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'language_code': 'te-IN', 'name': 'te-IN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'te_IN',
-  'name': 'te-IN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (te-IN, MohanNeural)'},
-  'language': 'te_IN',
-  'name': 'Mohan మోహన్ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'language_code': 'te-IN', 'name': 'te-IN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'te_IN',
-  'name': 'te-IN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'th'}, 'language': 'th_TH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (th-TH, AcharaNeural)'},
-  'language': 'th_TH',
-  'name': 'Achara อัจฉรา (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'th'}, 'language': 'th_TH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (th-TH, PremwadeeNeural)'},
-  'language': 'th_TH',
-  'name': 'Premwadee เปรมวดี (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 3, 'language_id': 26, 'voice_id': 2}, 'language': 'th_TH', 'name': 'Somsi', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'th-TH', 'name': 'th-TH-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'th_TH',
-  'name': 'th-TH-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'th'}, 'language': 'th_TH', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (th-TH, NiwatNeural)'},
-  'language': 'th_TH',
-  'name': 'Niwat นิวัฒน์ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (th-TH, Pattara)'},
-  'language': 'th_TH',
-  'name': 'Pattara ภัทรา (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 3, 'language_id': 26, 'voice_id': 1}, 'language': 'th_TH', 'name': 'Sarawut', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'tr'}, 'language': 'tr_TR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (tr-TR, EmelNeural)'},
-  'language': 'tr_TR',
-  'name': 'Emel (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Filiz'},
-  'language': 'tr_TR',
-  'name': 'Filiz (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'tr'}, 'language': 'tr_TR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (tr-TR, SedaRUS)'},
-  'language': 'tr_TR',
-  'name': 'Seda (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 16, 'voice_id': 3}, 'language': 'tr_TR', 'name': 'Selin', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 16, 'voice_id': 1}, 'language': 'tr_TR', 'name': 'Zehra', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'engine_id': 2, 'language_id': 16, 'voice_id': 2}, 'language': 'tr_TR', 'name': 'Zeynep', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Standard-D', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Wavenet-D', 'ssml_gender': 'FEMALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (tr-TR, AhmetNeural)'},
-  'language': 'tr_TR',
-  'name': 'Ahmet (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 16, 'voice_id': 2}, 'language': 'tr_TR', 'name': 'Eymen', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'tr'}, 'language': 'tr_TR', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'engine_id': 2, 'language_id': 16, 'voice_id': 1}, 'language': 'tr_TR', 'name': 'Kerem', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Standard-E', 'ssml_gender': 'MALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Standard-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'tr-TR', 'name': 'tr-TR-Wavenet-E', 'ssml_gender': 'MALE'},
-  'language': 'tr_TR',
-  'name': 'tr-TR-Wavenet-E',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'uk'}, 'language': 'uk_UA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'uk'}, 'language': 'uk_UA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (uk-UA, PolinaNeural)'},
-  'language': 'uk_UA',
-  'name': 'Polina Поліна (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 40, 'voice_id': 1}, 'language': 'uk_UA', 'name': 'Vira', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female',
-  'key': {'language_code': 'uk-UA', 'name': 'uk-UA-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'uk_UA',
-  'name': 'uk-UA-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'uk-UA', 'name': 'uk-UA-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'uk_UA',
-  'name': 'uk-UA-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 40, 'voice_id': 2}, 'language': 'uk_UA', 'name': 'Bohdan', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'uk'}, 'language': 'uk_UA', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (uk-UA, OstapNeural)'},
-  'language': 'uk_UA',
-  'name': 'Ostap Остап (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'IND', 'language_code': 'ur'}, 'language': 'ur_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'IND', 'gender': 'f', 'language_code': 'ur'}, 'language': 'ur_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ur-IN, GulNeural)'},
-  'language': 'ur_IN',
-  'name': 'Gul گل (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'IND', 'gender': 'm', 'language_code': 'ur'}, 'language': 'ur_IN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ur-IN, SalmanNeural)'},
-  'language': 'ur_IN',
-  'name': 'Salman سلمان (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'PAK', 'language_code': 'ur'}, 'language': 'ur_PK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'PAK', 'gender': 'f', 'language_code': 'ur'}, 'language': 'ur_PK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ur-PK, UzmaNeural)'},
-  'language': 'ur_PK',
-  'name': 'Uzma عظمیٰ (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (ur-PK, AsadNeural)'},
-  'language': 'ur_PK',
-  'name': 'Asad اسد (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'PAK', 'gender': 'm', 'language_code': 'ur'}, 'language': 'ur_PK', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'uz'}, 'language': 'uz_UZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'uz'}, 'language': 'uz_UZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (uz-UZ, MadinaNeural)'},
-  'language': 'uz_UZ',
-  'name': 'Madina (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'uz'}, 'language': 'uz_UZ', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (uz-UZ, SardorNeural)'},
-  'language': 'uz_UZ',
-  'name': 'Sardor (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'vi'}, 'language': 'vi_VN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'voice_id': 'banmaiace'}, 'language': 'vi_VN', 'name': 'Ban Mai (AceSound) (miền Bắc)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'banmai'}, 'language': 'vi_VN', 'name': 'Ban Mai (miền Bắc)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'vi'}, 'language': 'vi_VN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (vi-VN, HoaiMyNeural)'},
-  'language': 'vi_VN',
-  'name': 'HoaiMy Hoài My (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Female', 'key': {'voice_id': 'lannhi'}, 'language': 'vi_VN', 'name': 'Lan Nhi (miền Nam)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'linhsanace'}, 'language': 'vi_VN', 'name': 'Linh San (AceSound) (miền Nam)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'linhsan'}, 'language': 'vi_VN', 'name': 'Linh San (miền Nam)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'myan'}, 'language': 'vi_VN', 'name': 'Mỹ An (miền Trung)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'engine_id': 7, 'language_id': 41, 'voice_id': 1}, 'language': 'vi_VN', 'name': 'Nguyet', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Female', 'key': {'voice_id': 'ngoclamace'}, 'language': 'vi_VN', 'name': 'Ngọc Lam (AceSound) (miền Trung)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'ngoclam'}, 'language': 'vi_VN', 'name': 'Ngọc Lam (miền Trung)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'thuminhace'}, 'language': 'vi_VN', 'name': 'Thu Minh (AceSound) (miền Bắc)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female', 'key': {'voice_id': 'thuminh'}, 'language': 'vi_VN', 'name': 'Thu Minh (miền Bắc)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Female',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Standard-A', 'ssml_gender': 'FEMALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Standard-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Standard-C', 'ssml_gender': 'FEMALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Standard-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Wavenet-A', 'ssml_gender': 'FEMALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Wavenet-A',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Female',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Wavenet-C', 'ssml_gender': 'FEMALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Wavenet-C',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (vi-VN, An)'},
-  'language': 'vi_VN',
-  'name': 'An (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'vi'}, 'language': 'vi_VN', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Male', 'key': {'voice_id': 'giahuy'}, 'language': 'vi_VN', 'name': 'Gia Huy (miền Trung)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Male', 'key': {'voice_id': 'leminh'}, 'language': 'vi_VN', 'name': 'Lê Minh (miền Bắc)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Male', 'key': {'voice_id': 'minhquangace'}, 'language': 'vi_VN', 'name': 'Minh Quang (AceSound) (miền Nam)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Male', 'key': {'voice_id': 'minhquang'}, 'language': 'vi_VN', 'name': 'Minh Quang (miền Nam)', 'options': {'speed': {'default': 0, 'max': 3, 'min': -3, 'type': 'number'}}, 'service': 'FptAi'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (vi-VN, NamMinhNeural)'},
-  'language': 'vi_VN',
-  'name': 'NamMinh Nam Minh (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'engine_id': 7, 'language_id': 41, 'voice_id': 2}, 'language': 'vi_VN', 'name': 'Phuong', 'options': {}, 'service': 'VocalWare'},
- {'gender': 'Male',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Standard-B', 'ssml_gender': 'MALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Standard-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Standard-D', 'ssml_gender': 'MALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Standard-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Wavenet-B', 'ssml_gender': 'MALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Wavenet-B',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Male',
-  'key': {'language_code': 'vi-VN', 'name': 'vi-VN-Wavenet-D', 'ssml_gender': 'MALE'},
-  'language': 'vi_VN',
-  'name': 'vi-VN-Wavenet-D',
-  'options': {'pitch': {'default': 0.0, 'max': 20.0, 'min': -20.0, 'type': 'number'}, 'speaking_rate': {'default': 1.0, 'max': 4.0, 'min': 0.25, 'type': 'number'}},
-  'service': 'Google'},
- {'gender': 'Any', 'key': {'country_code': 'ANY', 'language_code': 'cy'}, 'language': 'cy_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female', 'key': {'country_code': 'ANY', 'gender': 'f', 'language_code': 'cy'}, 'language': 'cy_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'engine': 'standard', 'voice_id': 'Gwyneth'},
-  'language': 'cy_GB',
-  'name': 'Gwyneth (Standard)',
-  'options': {'pitch': {'default': 0, 'max': 50, 'min': -50, 'type': 'number'}, 'rate': {'default': 100, 'max': 200, 'min': 20, 'type': 'number'}},
-  'service': 'Amazon'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (cy-GB, NiaNeural)'},
-  'language': 'cy_GB',
-  'name': 'Nia (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (cy-GB, AledNeural)'},
-  'language': 'cy_GB',
-  'name': 'Aled (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male', 'key': {'country_code': 'ANY', 'gender': 'm', 'language_code': 'cy'}, 'language': 'cy_GB', 'name': None, 'options': {}, 'service': 'Forvo'},
- {'gender': 'Female',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zu-ZA, ThandoNeural)'},
-  'language': 'zu_ZA',
-  'name': 'Thando (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'},
- {'gender': 'Male',
-  'key': {'name': 'Microsoft Server Speech Text to Speech Voice (zu-ZA, ThembaNeural)'},
-  'language': 'zu_ZA',
-  'name': 'Themba (Neural)',
-  'options': {'pitch': {'default': 0, 'max': 100, 'min': -100, 'type': 'number'}, 'rate': {'default': 1.0, 'max': 3.0, 'min': 0.5, 'type': 'number'}},
-  'service': 'Azure'}]
\ No newline at end of file
+import os
+import json
+import threading
+
+# the voice list is stored in voicelist.dat, built by build_voicelist.py. the header holds the tables
+# shared by all voices and the location of each service's section, so a service only parses its own voices.
+
+VOICELIST_FILENAME = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'voicelist.dat')
+VOICELIST_FORMAT_VERSION = 1
+
+_lock = threading.Lock()
+_header = None
+_body_offset = None
+# service name -> list of voice entries, loaded on first use
+_service_voices = {}
+
+def load_header():
+    global _header, _body_offset
+    if _header == None:
+        with open(VOICELIST_FILENAME, 'rb') as f:
+            header_line = f.readline()
+            header = json.loads(header_line.decode('utf-8'))
+        if header['version'] != VOICELIST_FORMAT_VERSION:
+            raise Exception(f'unsupported voice list version {header["version"]} in {VOICELIST_FILENAME}')
+        _body_offset = len(header_line)
+        _header = header
+    return _header
+
+def get_service_names():
+    with _lock:
+        return list(load_header()['services'].keys())
+
+def get_service_voices(service_name):
+    """returns the voice entries for one service, as dicts with name, gender, language, key, options and service.
+    voices with the same options share the same options dict, it must not be modified."""
+    with _lock:
+        if service_name not in _service_voices:
+            _service_voices[service_name] = load_service_voices(service_name)
+        return _service_voices[service_name]
+
+def load_service_voices(service_name):
+    header = load_header()
+    if service_name not in header['services']:
+        return []
+    offset, length = header['services'][service_name]
+    with open(VOICELIST_FILENAME, 'rb') as f:
+        f.seek(_body_offset + offset)
+        entries = json.loads(f.read(length).decode('utf-8'))
+    genders = header['genders']
+    languages = header['languages']
+    options = header['options']
+    return [{
+        'name': name,
+        'gender': genders[gender_index],
+        'language': languages[language_index],
+        'key': key,
+        'options': options[options_index],
+        'service': service_name
+    } for name, gender_index, language_index, key, options_index in entries]
+
+def get_voice_list():
+    """all voices, in the same form as the VOICE_LIST which used to live in this module"""
+    voice_list = []
+    for service_name in get_service_names():
+        voice_list.extend(get_service_voices(service_name))
+    return voice_list
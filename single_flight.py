@@ -0,0 +1,61 @@
+import sys
+import logging
+import threading
+
+
+class InFlightCall():
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+
+class SingleFlight():
+    """
+    makes sure only one call is running for a given key. callers which show up while a call is in flight
+    wait for it and get the same result (or exception) instead of doing the work again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.shared_count = 0
+
+    def run(self, key, fn):
+        call, leader = self.acquire(key)
+        if not leader:
+            return self.wait(key, call)
+        try:
+            result = fn()
+        except BaseException as e:
+            self.release(key, call, exception=e)
+            raise e
+        self.release(key, call, result=result)
+        return result
+
+    # bulk requests do the work for several keys at once, they acquire each key, and release the ones
+    # they lead once done. a caller must release the keys it leads before waiting on other keys.
+
+    def acquire(self, key):
+        """returns (call, leader), the leader must call release once done, the others can wait for the call"""
+        with self.lock:
+            call = self.calls.get(key, None)
+            if call != None:
+                self.shared_count += 1
+                return call, False
+            call = InFlightCall()
+            self.calls[key] = call
+            return call, True
+
+    def release(self, key, call, result=None, exception=None):
+        call.result = result
+        call.exception = exception
+        with self.lock:
+            del self.calls[key]
+        call.event.set()
+
+    def wait(self, key, call):
+        logging.info(f'waiting for in-flight request {key}')
+        call.event.wait()
+        if call.exception != None:
+            raise call.exception
+        return call.result
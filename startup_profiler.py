@@ -0,0 +1,132 @@
+import sys
+import time
+import json
+import logging
+import platform
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+version = __import__('version', globals(), locals(), [], sys._addon_import_level_base)
+lazy_import = __import__('lazy_import', globals(), locals(), [], sys._addon_import_level_base)
+
+
+def get_peak_memory_bytes():
+    """peak resident memory of the anki process so far, None if we can't tell on this platform"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            import ctypes.wintypes
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [('cb', ctypes.wintypes.DWORD),
+                            ('PageFaultCount', ctypes.wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t),
+                            ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t),
+                            ('PeakPagefileUsage', ctypes.c_size_t)]
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.PeakWorkingSetSize
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, kilobytes on linux
+        if sys.platform == 'darwin':
+            return max_rss
+        return max_rss * 1024
+    except Exception as e:
+        logging.warning(f'could not get peak memory: {e}')
+        return None
+
+def format_memory(memory_bytes):
+    if memory_bytes == None:
+        return 'unknown'
+    return f'{memory_bytes / (1024 * 1024):.0f} MB'
+
+class StartupPhase():
+    def __init__(self, name, seconds, peak_memory_bytes):
+        self.name = name
+        self.seconds = seconds
+        # high-water mark of the process at the end of the phase
+        self.peak_memory_bytes = peak_memory_bytes
+
+class StartupProfiler():
+    """
+    records how long each phase of the addon startup takes, how long each service module took to import,
+    and the peak memory of the process. shown in the configuration dialog, and saved as json so that
+    startup can be compared across versions.
+    """
+
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.phase_start_time = self.start_time
+        self.total_seconds = None
+        self.phases = []
+        # set once the service manager is created
+        self.service_manager = None
+
+    def end_phase(self, name):
+        # a phase runs from the end of the previous one, startup is a flat sequence of steps
+        end_time = time.monotonic()
+        seconds = end_time - self.phase_start_time
+        self.phase_start_time = end_time
+        self.phases.append(StartupPhase(name, seconds, get_peak_memory_bytes()))
+        logging.info(f'startup phase {name}: {seconds:.3f}s')
+
+    def finish(self):
+        self.total_seconds = time.monotonic() - self.start_time
+        logging.info(f'startup took {self.total_seconds:.3f}s')
+
+    def get_service_import_seconds(self):
+        if self.service_manager == None:
+            return {}
+        return dict(self.service_manager.service_import_seconds)
+
+    def get_report(self):
+        try:
+            import anki.buildinfo
+            anki_version = anki.buildinfo.version
+        except ImportError:
+            anki_version = None
+        return {
+            'hypertts_version': version.ANKI_HYPER_TTS_VERSION,
+            'anki_version': anki_version,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'total_seconds': self.total_seconds,
+            'phases': [{
+                'name': phase.name,
+                'seconds': phase.seconds,
+                'peak_memory_bytes': phase.peak_memory_bytes
+            } for phase in self.phases],
+            'service_import_seconds': self.get_service_import_seconds(),
+            # dependencies which got imported after startup, the first time a service used them
+            'lazy_import_seconds': dict(lazy_import.import_seconds),
+            'peak_memory_bytes': get_peak_memory_bytes()
+        }
+
+    def summary(self):
+        report = self.get_report()
+        lines = []
+        if report['total_seconds'] != None:
+            lines.append(f'<b>Startup:</b> {report["total_seconds"]:.3f}s, peak memory {format_memory(report["peak_memory_bytes"])}')
+        phases_str = ', '.join([f'{phase["name"]}: {phase["seconds"]:.3f}s' for phase in report['phases']])
+        lines.append(f'<b>Phases:</b> {phases_str}')
+        slowest_modules = sorted(report['service_import_seconds'].items(), key=lambda item: item[1], reverse=True)
+        slowest_modules = slowest_modules[:constants.STARTUP_PROFILE_SLOWEST_MODULES]
+        if len(slowest_modules) > 0:
+            modules_str = ', '.join([f'{module_name}: {seconds:.3f}s' for module_name, seconds in slowest_modules])
+            lines.append(f'<b>Slowest service modules:</b> {modules_str}')
+        if len(report['lazy_import_seconds']) > 0:
+            lazy_str = ', '.join([f'{module_name}: {seconds:.3f}s' for module_name, seconds in sorted(report['lazy_import_seconds'].items())])
+            lines.append(f'<b>Imported on first use:</b> {lazy_str}')
+        return '<br/>'.join(lines)
+
+    def save(self, filename):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(), f, indent=4)
+        logging.info(f'saved startup profile to {filename}')
@@ -0,0 +1,111 @@
+import sys
+import os
+import logging
+import threading
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+class AudioStreamFile():
+    """
+    file handed to the service while the audio is being streamed. every chunk gets flushed right away,
+    so that the player reading the growing file sees it, and the AudioStream gets told about it.
+    """
+
+    def __init__(self, audio_stream, file):
+        self.audio_stream = audio_stream
+        self.file = file
+
+    def write(self, data):
+        result = self.file.write(data)
+        self.file.flush()
+        self.audio_stream.set_bytes_written(self.file.tell())
+        return result
+
+    # used by the service manager to drop a partial response before retrying
+    def tell(self):
+        return self.file.tell()
+
+    def seek(self, offset, whence=0):
+        return self.file.seek(offset, whence)
+
+    def truncate(self, size=None):
+        return self.file.truncate(size)
+
+class AudioStream():
+    """
+    realtime audio which gets downloaded into full_filename while it's being played. the download runs
+    in the background, wait_for_start returns once enough of the file is on disk for the player to start.
+    the player reads playback_filename: a temporary file when downloading, which gets removed once the download
+    is complete and the player has released it.
+    """
+
+    def __init__(self, full_filename, audio_filename, start_bytes=constants.STREAMING_PLAYBACK_START_BYTES):
+        self.full_filename = full_filename
+        self.audio_filename = audio_filename
+        self.playback_filename = full_filename
+        self.temp_filename = None
+        self.start_bytes = start_bytes
+        self.condition = threading.Condition()
+        self.bytes_written = 0
+        self.complete = False
+        self.released = False
+        self.exception = None
+
+    def set_temp_filename(self, temp_filename):
+        with self.condition:
+            self.temp_filename = temp_filename
+            self.playback_filename = temp_filename
+
+    def set_bytes_written(self, bytes_written):
+        with self.condition:
+            self.bytes_written = bytes_written
+            self.condition.notify_all()
+
+    def set_complete(self):
+        with self.condition:
+            self.complete = True
+            self.condition.notify_all()
+        self.remove_temp_file()
+
+    def set_exception(self, exception):
+        with self.condition:
+            self.exception = exception
+            self.condition.notify_all()
+
+    def release(self):
+        """called once the player is done with playback_filename"""
+        with self.condition:
+            self.released = True
+        self.remove_temp_file()
+
+    def remove_temp_file(self):
+        # the temporary file is only needed until both the download and the playback are over.
+        # a failed download has already removed it.
+        with self.condition:
+            if not (self.complete and self.released) or self.temp_filename == None:
+                return
+            temp_filename = self.temp_filename
+            self.temp_filename = None
+        try:
+            os.remove(temp_filename)
+        except OSError as e:
+            logging.info(f'could not remove {temp_filename}: {e}')
+
+    def is_complete(self):
+        with self.condition:
+            return self.complete
+
+    def wait_for_start(self):
+        """blocks until the player can start, raises if the download failed before that"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.complete or self.exception != None or self.bytes_written >= self.start_bytes)
+            if self.exception != None and self.bytes_written < self.start_bytes:
+                raise self.exception
+
+    def wait_for_completion(self):
+        with self.condition:
+            self.condition.wait_for(lambda: self.complete or self.exception != None)
+            if self.exception != None:
+                raise self.exception
+        logging.info(f'finished streaming {self.full_filename}, {self.bytes_written} bytes')
@@ -4,7 +4,11 @@ import constants
 import languages
 import config_models
 import batch_status
+import errors
+import batch_journal
 import logging
+import os
+import time
 import pprint
 
 class mock_progress_bar():
@@ -15,24 +19,6 @@ class mock_progress_bar():
         self.iteration = iteration
 
 
-class MockBatchStatusListener():
-    def __init__(self):
-        self.callbacks_received = {}
-        self.current_row = None
-
-        self.batch_started = None
-        self.batch_ended = None
-
-    def batch_start(self):
-        self.batch_started = True
-
-    def batch_end(self, completed):
-        self.batch_ended = True
-
-    def batch_change(self, note_id, row):
-        self.callbacks_received[note_id] = True
-        self.current_row = row
-
 def test_simple_1(qtbot):
     # create batch configuration
     # ==========================
@@ -62,7 +48,7 @@ def test_simple_1(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -144,7 +130,7 @@ def test_simple_text_processing(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -188,7 +174,7 @@ def test_simple_error_handling(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)    
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -231,7 +217,7 @@ def test_simple_error_handling_nonexistent_target_field(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)    
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -272,7 +258,7 @@ def test_simple_error_handling_nonexistent_source_field(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)    
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -313,7 +299,7 @@ def test_simple_error_handling_not_found(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)    
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -356,7 +342,7 @@ def test_simple_append(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -411,7 +397,7 @@ def test_simple_same_field_source_target(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -466,7 +452,7 @@ def test_simple_sound_only_append(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -510,7 +496,7 @@ def test_random_voices(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -551,7 +537,7 @@ def test_simple_template(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -601,7 +587,7 @@ result = f"{article} {word}"
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -653,7 +639,7 @@ result = f"{article} {word}"
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -696,7 +682,7 @@ def test_priority_voices_success(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -738,7 +724,7 @@ def test_priority_voices_not_found(qtbot):
 
     # run batch add audio (simple mode)
     # =================================
-    listener = MockBatchStatusListener()
+    listener = testing_utils.MockBatchStatusListener()
     batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
     hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
 
@@ -747,3 +733,357 @@ def test_priority_voices_not_found(qtbot):
 
     # make sure we got a AudioNotFoundError in the batch error manager
     assert str(batch_status_obj[0].error) == 'Audio not found in any voices for [老人家]'
+
+def test_concurrent_batch_note_order(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    # allow several concurrent requests to ServiceA
+    hypertts_instance.service_manager.service_concurrency['ServiceA'] = 4
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    single = config_models.VoiceSelectionSingle()
+    single.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch = config_models.BatchConfig()
+    batch.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch.set_target(config_models.BatchTarget('Sound', False, True))
+    batch.set_voice_selection(single)
+    batch.set_text_processing(config_models.TextProcessing())
+
+    assert hypertts_instance.service_manager.get_batch_worker_count([voice_a_1]) == 4
+
+    # note 3 has an empty source field
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_3, config_gen.note_id_4]
+    rows = []
+    class OrderListener(testing_utils.MockBatchStatusListener):
+        def batch_change(self, note_id, row):
+            testing_utils.MockBatchStatusListener.batch_change(self, note_id, row)
+            rows.append(row)
+    listener = OrderListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    # the batch status is updated in note order
+    assert rows == sorted(rows)
+    assert listener.batch_ended == True
+
+    expected_text = {0: '老人家', 1: '你好', 3: '赚钱'}
+    for row, source_text in expected_text.items():
+        assert batch_status_obj[row].status == constants.BatchNoteStatus.Done
+        note = hypertts_instance.anki_utils.get_note_by_id(note_id_list[row])
+        audio_full_path = hypertts_instance.anki_utils.extract_sound_tag_audio_full_path(note.set_values['Sound'])
+        audio_data = hypertts_instance.anki_utils.extract_mock_tts_audio(audio_full_path)
+        assert audio_data['source_text'] == source_text
+
+    assert batch_status_obj[2].status == constants.BatchNoteStatus.Error
+    assert str(batch_status_obj[2].error) == 'Source text is empty'
+
+def test_concurrent_batch_stop(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    hypertts_instance.service_manager.service_concurrency['ServiceA'] = 2
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    single = config_models.VoiceSelectionSingle()
+    single.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch = config_models.BatchConfig()
+    batch.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch.set_target(config_models.BatchTarget('Sound', False, True))
+    batch.set_voice_selection(single)
+    batch.set_text_processing(config_models.TextProcessing())
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+    # the user stops the batch as soon as the first note is done
+    class StopListener(testing_utils.MockBatchStatusListener):
+        def batch_change(self, note_id, row):
+            testing_utils.MockBatchStatusListener.batch_change(self, note_id, row)
+            if batch_status_obj[row].status == constants.BatchNoteStatus.Done:
+                batch_status_obj.stop()
+    listener = StopListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    assert listener.batch_ended == True
+    assert batch_status_obj[0].status == constants.BatchNoteStatus.Done
+    assert batch_status_obj[1].status == None
+    assert batch_status_obj[2].status == None
+    note_2 = hypertts_instance.anki_utils.get_note_by_id(config_gen.note_id_2)
+    assert 'Sound' not in note_2.set_values
+    assert hypertts_instance.anki_utils.undo_finished == True
+
+def test_batch_dedupe_requests(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    hypertts_instance.service_manager.service_concurrency['ServiceA'] = 4
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    single = config_models.VoiceSelectionSingle()
+    single.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    # every note gets the same text
+    batch = config_models.BatchConfig()
+    batch.set_source(config_models.BatchSourceTemplate(constants.BatchMode.template, 'same text', constants.TemplateFormatVersion.v1))
+    batch.set_target(config_models.BatchTarget('Sound', False, True))
+    batch.set_voice_selection(single)
+    batch.set_text_processing(config_models.TextProcessing())
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_3, config_gen.note_id_4]
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    # a single request went out
+    assert hypertts_instance.audio_cache.get_stats()['misses'] == 1
+    assert hypertts_instance.audio_cache.get_stats()['hits'] == 0
+    sound_files = set([batch_status_obj[i].sound_file for i in range(len(note_id_list))])
+    assert len(sound_files) == 1
+    for i in range(len(note_id_list)):
+        assert batch_status_obj[i].status == constants.BatchNoteStatus.Done
+
+def build_resume_test_batch(hypertts_instance):
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    single = config_models.VoiceSelectionSingle()
+    single.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch = config_models.BatchConfig()
+    batch.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch.set_target(config_models.BatchTarget('Sound', False, True))
+    batch.set_voice_selection(single)
+    batch.set_text_processing(config_models.TextProcessing())
+    return batch
+
+def run_stopped_batch(hypertts_instance, note_id_list, batch):
+    # the user stops the batch as soon as the first note is done
+    class StopListener(testing_utils.MockBatchStatusListener):
+        def batch_change(self, note_id, row):
+            testing_utils.MockBatchStatusListener.batch_change(self, note_id, row)
+            if batch_status_obj[row].status == constants.BatchNoteStatus.Done:
+                batch_status_obj.stop()
+    listener = StopListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+    return batch_status_obj
+
+def test_batch_resume(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    batch = build_resume_test_batch(hypertts_instance)
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+    batch_status_obj = run_stopped_batch(hypertts_instance, note_id_list, batch)
+    assert batch_status_obj[0].status == constants.BatchNoteStatus.Done
+    sound_file_1 = batch_status_obj[0].sound_file
+
+    journal = hypertts_instance.get_batch_journal(note_id_list, batch)
+    assert journal.exists()
+    assert journal.get_done_count() == 1
+    # requests for the following notes may have gone out before the batch stopped
+    stats = hypertts_instance.audio_cache.get_stats()
+    lookup_count = stats['hits'] + stats['misses']
+
+    # the note got saved with its sound tag
+    note_1 = hypertts_instance.anki_utils.get_note_by_id(config_gen.note_id_1)
+    note_1.field_dict['Sound'] = note_1.set_values['Sound']
+
+    # resume, the first note doesn't get requested again
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj, resume=True)
+
+    stats = hypertts_instance.audio_cache.get_stats()
+    assert stats['hits'] + stats['misses'] == lookup_count + 2
+    assert stats['misses'] == 3
+    for i in range(len(note_id_list)):
+        assert batch_status_obj[i].status == constants.BatchNoteStatus.Done
+    assert batch_status_obj[0].sound_file == sound_file_1
+    note_4 = hypertts_instance.anki_utils.get_note_by_id(config_gen.note_id_4)
+    assert 'Sound' in note_4.set_values
+
+    # the batch completed, nothing left to resume
+    assert not journal.exists()
+
+def test_batch_resume_note_edited(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    batch = build_resume_test_batch(hypertts_instance)
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+    run_stopped_batch(hypertts_instance, note_id_list, batch)
+    stats = hypertts_instance.audio_cache.get_stats()
+    lookup_count = stats['hits'] + stats['misses']
+
+    # the target field of the first note doesn't have the sound tag anymore, it gets processed again
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj, resume=True)
+
+    stats = hypertts_instance.audio_cache.get_stats()
+    assert stats['hits'] + stats['misses'] == lookup_count + 3
+    assert stats['misses'] == 3
+    for i in range(len(note_id_list)):
+        assert batch_status_obj[i].status == constants.BatchNoteStatus.Done
+
+def test_batch_media_file_mismatch(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    batch = build_resume_test_batch(hypertts_instance)
+
+    # the media folder has a partial file with the name of the first note's audio
+    voice_a_1 = batch.voice_selection.voice.voice
+    hash_str = hypertts_instance.get_hash_for_audio_request('老人家', voice_a_1, {})
+    audio_filename = hypertts_instance.get_audio_filename(hash_str)
+    hypertts_instance.anki_utils.media_files[audio_filename] = b'partial'
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2]
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    # the note points at the renamed file, not at the partial one
+    sound_file = batch_status_obj[0].sound_file
+    assert sound_file != audio_filename
+    assert sound_file.startswith(audio_filename.replace('.mp3', '-'))
+    note_1 = hypertts_instance.anki_utils.get_note_by_id(config_gen.note_id_1)
+    assert note_1.set_values['Sound'] == f'[sound:{sound_file}]'
+    with open(hypertts_instance.get_full_audio_file_name(hash_str), 'rb') as f:
+        assert hypertts_instance.anki_utils.media_files[sound_file] == f.read()
+    assert hypertts_instance.anki_utils.media_files[audio_filename] == b'partial'
+    # the other note's audio keeps its name
+    assert batch_status_obj[1].sound_file.startswith('hypertts-')
+    assert batch_status_obj[1].sound_file in hypertts_instance.anki_utils.media_files
+
+def test_batch_journal_cleanup(qtbot, monkeypatch):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    user_files_dir = hypertts_instance.anki_utils.user_files_dir
+
+    # a journal which was never resumed, a recent one, and an audio file
+    old_journal_filename = os.path.join(user_files_dir, f'{constants.BATCH_JOURNAL_FILENAME_PREFIX}old.jsonl')
+    recent_journal_filename = os.path.join(user_files_dir, f'{constants.BATCH_JOURNAL_FILENAME_PREFIX}recent.jsonl')
+    audio_filename = os.path.join(user_files_dir, 'hypertts-old.mp3')
+    for filename in [old_journal_filename, recent_journal_filename, audio_filename]:
+        with open(filename, 'w') as f:
+            f.write('\n')
+    old_time = time.time() - constants.BATCH_JOURNAL_MAX_AGE_SECONDS - 60
+    os.utime(old_journal_filename, (old_time, old_time))
+    os.utime(audio_filename, (old_time, old_time))
+
+    # the batch fails halfway
+    def run(self, note_id_list):
+        raise Exception('engine failure')
+    monkeypatch.setattr(hypertts.batch_engine.BatchEngine, 'run', run)
+    flush_calls = []
+    original_flush = hypertts_instance.audio_cache.flush
+    def flush():
+        flush_calls.append(True)
+        original_flush()
+    hypertts_instance.audio_cache.flush = flush
+
+    batch = build_resume_test_batch(hypertts_instance)
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2]
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+    try:
+        hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+    except Exception as e:
+        assert str(e) == 'engine failure'
+    # the undo entry and the cache index still get finished
+    assert hypertts_instance.anki_utils.undo_finished == True
+    assert flush_calls == [True]
+    # the old journal was pruned, the others stay
+    assert not os.path.exists(old_journal_filename)
+    assert os.path.exists(recent_journal_filename)
+    assert os.path.exists(audio_filename)
+    assert hypertts_instance.get_batch_journal(note_id_list, batch).exists()
+    assert batch_journal.prune_journals(user_files_dir) == 0
+
+def test_batch_bulk_note_io(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    batch = build_resume_test_batch(hypertts_instance)
+    # the last note doesn't exist anymore
+    missing_note_id = 424242
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4, missing_note_id]
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, listener)
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    # notes got loaded with one query and saved with one update
+    assert hypertts_instance.anki_utils.get_notes_by_id_calls == 1
+    assert hypertts_instance.anki_utils.update_notes_calls == 1
+    for i in range(3):
+        assert batch_status_obj[i].status == constants.BatchNoteStatus.Done
+        note = hypertts_instance.anki_utils.get_note_by_id(note_id_list[i])
+        assert note.flush_called == True
+    assert batch_status_obj[3].status == constants.BatchNoteStatus.Error
+    assert str(batch_status_obj[3].error) == f'Note {missing_note_id} not found'
+
+def test_batch_status_coalesced_changes(qtbot):
+    note_id_list = list(range(1000))
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(None, note_id_list, listener)
+    with batch_status_obj.get_batch_running_action_context():
+        for note_id in note_id_list:
+            with batch_status_obj.get_note_action_context(note_id, True) as note_action_context:
+                note_action_context.set_source_text(f'source {note_id}')
+                note_action_context.set_processed_text(f'processed {note_id}')
+                note_action_context.set_status(constants.BatchNoteStatus.OK)
+
+    # one per-note notification
+    assert len(listener.callbacks_received) == 1000
+    assert listener.current_row == 999
+    # the first change goes out right away, the following ones get coalesced and flushed at the end
+    assert len(listener.rows_changed_calls) < 10
+    assert listener.rows_changed_calls[0] == (0, 0)
+    assert listener.rows_changed_calls[-1][1] == 999
+    covered_rows = set()
+    for first_row, last_row in listener.rows_changed_calls:
+        covered_rows.update(range(first_row, last_row + 1))
+    assert covered_rows == set(note_id_list)
+
+def test_batch_status_text_provider(qtbot):
+    note_id_list = [1000 + i for i in range(100)]
+    provider_calls = []
+    def text_provider(note_id):
+        provider_calls.append(note_id)
+        return f'source {note_id}', f'processed {note_id}'
+    listener = testing_utils.MockBatchStatusListener()
+    batch_status_obj = batch_status.BatchStatus(None, note_id_list, listener, text_provider)
+    batch_status_obj.text_cache_size = 10
+    assert len(batch_status_obj) == 100
+    assert batch_status_obj[0].status == None
+
+    with batch_status_obj.get_batch_running_action_context():
+        for note_id in note_id_list:
+            with batch_status_obj.get_note_action_context(note_id, True) as note_action_context:
+                if note_id == 1050:
+                    raise errors.SourceTextEmpty()
+                note_action_context.set_source_text(f'source {note_id}')
+                note_action_context.set_processed_text(f'processed {note_id}')
+                note_action_context.set_status(constants.BatchNoteStatus.OK)
+
+    # only the last rows are still in memory
+    assert len(batch_status_obj.texts) == 10
+    assert batch_status_obj[99].processed_text == 'processed 1099'
+    assert provider_calls == []
+
+    # the first row gets recomputed
+    note_status = batch_status_obj[0]
+    assert note_status.note_id == 1000
+    assert note_status.status == constants.BatchNoteStatus.OK
+    assert note_status.source_text == 'source 1000'
+    assert note_status.processed_text == 'processed 1000'
+    assert provider_calls == [1000]
+    batch_status_obj[0]
+    assert provider_calls == [1000]
+
+    # rows with errors don't have text
+    note_status = batch_status_obj.get_note_status(1050)
+    assert note_status.status == constants.BatchNoteStatus.Error
+    assert str(note_status.error) == 'Source text is empty'
+    assert note_status.processed_text == None
+    assert provider_calls == [1000]
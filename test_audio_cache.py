@@ -0,0 +1,101 @@
+import os
+import time
+import tempfile
+import unittest
+
+import audio_cache
+import constants
+
+
+class AudioCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def get_full_filename(self, hash_str):
+        return os.path.join(self.cache_dir, f'hypertts-{hash_str}.mp3')
+
+    def test_lookup_store(self):
+        cache = audio_cache.AudioCache(self.cache_dir)
+        full_filename = self.get_full_filename('hash1')
+
+        assert cache.lookup('hash1', full_filename) == False
+        cache.store('hash1', full_filename, b'audio data 1')
+        assert cache.lookup('hash1', full_filename) == True
+        assert open(full_filename, 'rb').read() == b'audio data 1'
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entry_count'] == 1
+        assert stats['total_size'] == len(b'audio data 1')
+
+        # if the file disappears from user_files, it's a miss
+        os.remove(full_filename)
+        assert cache.lookup('hash1', full_filename) == False
+        assert cache.get_stats()['entry_count'] == 0
+
+    def test_open_writer(self):
+        cache = audio_cache.AudioCache(self.cache_dir)
+        full_filename = self.get_full_filename('hash1')
+
+        # the audio arrives in chunks, the file only appears once it's complete
+        with cache.open_writer('hash1', full_filename) as f:
+            f.write(b'audio ')
+            assert os.path.exists(full_filename) == False
+            f.write(b'data 1')
+        assert open(full_filename, 'rb').read() == b'audio data 1'
+        assert cache.get_stats()['total_size'] == len(b'audio data 1')
+        assert cache.lookup('hash1', full_filename) == True
+
+        # if the request fails half way, nothing is left behind
+        full_filename_2 = self.get_full_filename('hash2')
+        try:
+            with cache.open_writer('hash2', full_filename_2) as f:
+                f.write(b'partial')
+                raise Exception('connection reset')
+        except Exception:
+            pass
+        assert os.path.exists(full_filename_2) == False
+        assert [filename for filename in os.listdir(self.cache_dir) if filename.endswith('.tmp')] == []
+        assert cache.get_stats()['entry_count'] == 1
+
+    def test_index_persistence(self):
+        cache = audio_cache.AudioCache(self.cache_dir)
+        full_filename = self.get_full_filename('hash1')
+        cache.store('hash1', full_filename, b'audio data 1')
+        cache.flush()
+
+        # a new cache instance picks up the index
+        cache = audio_cache.AudioCache(self.cache_dir)
+        assert cache.lookup('hash1', full_filename) == True
+
+        # a file without a matching index entry is not a hit
+        cache = audio_cache.AudioCache(self.cache_dir)
+        full_filename_2 = self.get_full_filename('hash2')
+        with open(full_filename_2, 'wb') as f:
+            f.write(b'stray file')
+        assert cache.lookup('hash2', full_filename_2) == False
+
+    def test_lru_eviction(self):
+        cache = audio_cache.AudioCache(self.cache_dir, max_size_bytes=25)
+        cache.store('hash1', self.get_full_filename('hash1'), b'0123456789')
+        cache.store('hash2', self.get_full_filename('hash2'), b'0123456789')
+        # access hash1, so that hash2 becomes the least recently used
+        assert cache.lookup('hash1', self.get_full_filename('hash1')) == True
+        cache.store('hash3', self.get_full_filename('hash3'), b'0123456789')
+
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['total_size'] == 20
+        assert os.path.exists(self.get_full_filename('hash2')) == False
+        assert cache.lookup('hash2', self.get_full_filename('hash2')) == False
+        assert cache.lookup('hash1', self.get_full_filename('hash1')) == True
+        assert cache.lookup('hash3', self.get_full_filename('hash3')) == True
+
+    def test_max_age(self):
+        cache = audio_cache.AudioCache(self.cache_dir, max_age_seconds=60)
+        full_filename = self.get_full_filename('hash1')
+        cache.store('hash1', full_filename, b'audio data 1')
+        # pretend the entry was created two minutes ago
+        cache.entries['hash1']['created'] = time.time() - 120
+        assert cache.lookup('hash1', full_filename) == False
+        assert os.path.exists(full_filename) == False
@@ -0,0 +1,103 @@
+import unittest
+
+import testing_utils
+import config_models
+import constants
+import batch_planner
+import batch_status
+
+
+class BatchPlannerTests(unittest.TestCase):
+    def setUp(self):
+        self.config_gen = testing_utils.TestConfigGenerator()
+        self.hypertts_instance = self.config_gen.build_hypertts_instance_test_servicemanager('default')
+        voice_list = self.hypertts_instance.service_manager.full_voice_list()
+        self.voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        self.voice_b_1 = [x for x in voice_list if x.name == 'alex'][0]
+
+    def build_batch(self, voice_selection):
+        batch = config_models.BatchConfig()
+        batch.set_source(config_models.BatchSourceSimple('Chinese'))
+        batch.set_target(config_models.BatchTarget('Sound', False, True))
+        batch.set_voice_selection(voice_selection)
+        batch.set_text_processing(config_models.TextProcessing())
+        return batch
+
+    def test_plan_single_voice(self):
+        single = config_models.VoiceSelectionSingle()
+        single.set_voice(config_models.VoiceWithOptions(self.voice_a_1, {}))
+        batch = self.build_batch(single)
+
+        # audio for the first note is already in the cache
+        hash_str = self.hypertts_instance.get_hash_for_audio_request('老人家', self.voice_a_1, {})
+        self.hypertts_instance.audio_cache.store(hash_str, self.hypertts_instance.get_full_audio_file_name(hash_str), b'audio')
+        self.hypertts_instance.service_manager.latency_estimator.observe('ServiceA', 2.0)
+
+        # note 3 has an empty source field, note 2 appears twice
+        note_id_list = [self.config_gen.note_id_1, self.config_gen.note_id_2, self.config_gen.note_id_3,
+            self.config_gen.note_id_4, self.config_gen.note_id_2]
+        planner = batch_planner.BatchPlanner(self.hypertts_instance)
+        plan = planner.plan(note_id_list, batch)
+
+        assert plan.note_count == 5
+        assert plan.error_count == 1
+        assert plan.request_count == 4
+        assert plan.unique_request_count == 3
+        assert plan.cached_request_count == 1
+        assert plan.get_generate_count() == 2
+        # 你好 and 赚钱
+        assert plan.characters_by_service == {'ServiceA': 4}
+        # 2 requests, 2 seconds each, one at a time
+        assert plan.estimated_seconds == 4.0
+        assert '3 audio requests (1 duplicates)' in plan.summary()
+        assert 'ServiceA: 4' in plan.summary()
+
+        # planning doesn't count as a cache access
+        assert self.hypertts_instance.audio_cache.get_stats()['hits'] == 0
+
+    def test_plan_random_voices(self):
+        random_selection = config_models.VoiceSelectionRandom()
+        random_selection.add_voice(config_models.VoiceWithOptionsRandom(self.voice_a_1, {}, 3))
+        random_selection.add_voice(config_models.VoiceWithOptionsRandom(self.voice_b_1, {}, 1))
+        batch = self.build_batch(random_selection)
+
+        note_id_list = [self.config_gen.note_id_2, self.config_gen.note_id_2, self.config_gen.note_id_2, self.config_gen.note_id_2]
+        planner = batch_planner.BatchPlanner(self.hypertts_instance)
+        plan = planner.plan(note_id_list, batch)
+
+        # no deduplication in random mode, requests are split according to the weights
+        assert plan.unique_request_count == 4
+        assert plan.characters_by_service == {'ServiceA': 6, 'ServiceB': 2}
+
+        # with all the weights at 0, the requests are split evenly
+        random_selection.set_random_weight(0, 0)
+        random_selection.set_random_weight(1, 0)
+        plan = planner.plan(note_id_list, batch)
+        assert plan.unique_request_count == 4
+        assert plan.characters_by_service == {'ServiceA': 4, 'ServiceB': 4}
+
+    def test_plan_while_populating(self):
+        single = config_models.VoiceSelectionSingle()
+        single.set_voice(config_models.VoiceWithOptions(self.voice_a_1, {}))
+        batch = self.build_batch(single)
+
+        # the texts are planned as they get populated, the same as planning the notes
+        note_id_list = [self.config_gen.note_id_1, self.config_gen.note_id_2, self.config_gen.note_id_3,
+            self.config_gen.note_id_4, self.config_gen.note_id_2]
+        planner = batch_planner.BatchPlanner(self.hypertts_instance)
+        plan_builder = planner.get_plan_builder(single)
+        batch_status_obj = batch_status.BatchStatus(self.hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+        result = self.hypertts_instance.populate_batch_status_processed_text(note_id_list, batch.source, batch.text_processing, 
+            batch_status_obj, plan_builder)
+        assert result == None
+        plan = plan_builder.get_plan()
+        expected_plan = planner.plan(note_id_list, batch)
+        assert plan.summary() == expected_plan.summary()
+        assert plan.note_count == 5
+        assert plan.error_count == 1
+        assert plan.unique_request_count == 3
+
+    def test_format_duration(self):
+        assert batch_planner.format_duration(42) == '42s'
+        assert batch_planner.format_duration(150) == '2m 30s'
+        assert batch_planner.format_duration(3 * 3600 + 5 * 60 + 10) == '3h 05m'
@@ -0,0 +1,39 @@
+import json
+
+import benchmark
+
+
+def test_benchmark_small_deck():
+    options = benchmark.parse_options(['--sizes', '50', '--latency', '0', '--jitter', '0',
+        '--errors', 'AudioNotFoundError=0.1', '--duplicates', '0.5', '--realtime-count', '10'])
+    results = benchmark.Benchmark(options).run()
+    # results are machine readable
+    results = json.loads(json.dumps(results))
+    assert results['parameters']['errors'] == {'AudioNotFoundError': 0.1}
+    size_results = results['results'][0]
+    assert size_results['size'] == 50
+
+    assert size_results['populate']['status_counts'] == {'OK': 50}
+    assert size_results['populate']['requests'] == 0
+
+    # 25 distinct texts, duplicates share one request
+    batch_cold = size_results['batch_cold']
+    assert sum(batch_cold['status_counts'].values()) == 50
+    assert batch_cold['requests'] + sum(batch_cold['request_errors'].values()) == 25
+    assert batch_cold['request_latency']['count'] == batch_cold['requests']
+    # the second run gets the audio from the cache, only the errors get requested again
+    batch_warm = size_results['batch_warm']
+    assert batch_warm['audio_cache']['hits'] == batch_cold['requests']
+
+    realtime_cold = size_results['realtime_cold']
+    assert realtime_cold['calls'] == 10
+    assert realtime_cold['call_latency']['count'] == 10
+
+def test_parse_error_rates():
+    assert benchmark.parse_error_rates('') == []
+    assert benchmark.parse_error_rates('AudioNotFoundError=0.01,RequestError=0.5') == [('AudioNotFoundError', 0.01), ('RequestError', 0.5)]
+    try:
+        benchmark.parse_error_rates('KeyError=0.1')
+        assert False
+    except ValueError:
+        pass
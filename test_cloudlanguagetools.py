@@ -0,0 +1,133 @@
+import os
+import io
+import tempfile
+
+import testing_utils
+import config_models
+import constants
+import context
+import errors
+import batch_status
+import request_journal
+import replay_journal
+import cloudlanguagetools
+
+
+def build_client(stand_in):
+    client = cloudlanguagetools.CloudLanguageTools()
+    client.base_url = stand_in.get_base_url()
+    client.configure('test_key')
+    return client
+
+def build_audio_request(text):
+    request = {
+        'text': text,
+        'service': 'Azure',
+        'request_mode': 'batch',
+        'language_code': 'fr',
+        'voice_key': {'name': 'fr-FR-DeniseNeural'},
+        'options': {}
+    }
+    return request, (text, replay_journal.ReplayVoice(request), {}, io.BytesIO())
+
+def test_write_tts_audio_bulk():
+    error_request, error_audio_request = build_audio_request('server error')
+    stand_in = replay_journal.StandInServer([{'time': 0, 'request': error_request, 'latency_seconds': 0,
+        'size': None, 'result_hash': None, 'error': 'RequestError', 'error_message': 'voice not available'}])
+    stand_in.start()
+    try:
+        client = build_client(stand_in)
+        journal_filename = os.path.join(tempfile.mkdtemp(), constants.REQUEST_JOURNAL_FILENAME)
+        client.set_request_journal(request_journal.RequestJournal(journal_filename))
+        request_1, audio_request_1 = build_audio_request('old people')
+        request_2, audio_request_2 = build_audio_request('hello')
+        audio_requests = [audio_request_1, error_audio_request, audio_request_2]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.batch)
+        exceptions = client.write_tts_audio_bulk(audio_requests, audio_request_context)
+    finally:
+        stand_in.stop()
+
+    # one http request for all the clips
+    assert stand_in.path_request_counts == {'/audio_bulk_v2': 1}
+    assert exceptions[0] == None
+    assert isinstance(exceptions[1], errors.RequestError)
+    assert 'voice not available' in str(exceptions[1])
+    assert exceptions[2] == None
+    assert audio_request_1[3].getvalue() == replay_journal.get_stand_in_audio(request_1, replay_journal.STAND_IN_DEFAULT_SIZE)
+    assert audio_request_2[3].getvalue() == replay_journal.get_stand_in_audio(request_2, replay_journal.STAND_IN_DEFAULT_SIZE)
+    assert error_audio_request[3].getvalue() == b''
+
+    # each clip is journaled like a single request
+    entries = request_journal.load_journal(journal_filename)
+    assert [entry['request']['text'] for entry in entries] == ['old people', 'server error', 'hello']
+    assert entries[1]['error'] == 'RequestError'
+
+def test_write_tts_audio_bulk_not_supported():
+    stand_in = replay_journal.StandInServer(bulk_supported=False)
+    stand_in.start()
+    try:
+        client = build_client(stand_in)
+        request, audio_request = build_audio_request('old people')
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.batch)
+        assert client.write_tts_audio_bulk([audio_request], audio_request_context) == None
+        assert client.bulk_audio_supported == False
+        # we don't ask again
+        assert client.write_tts_audio_bulk([audio_request], audio_request_context) == None
+    finally:
+        stand_in.stop()
+    assert stand_in.path_request_counts == {'/audio_bulk_v2': 1}
+
+def run_batch_cloudlanguagetools(stand_in):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    service_manager = hypertts_instance.service_manager
+    service_manager.cloudlanguagetools = build_client(stand_in)
+    configuration = config_models.Configuration()
+    configuration.hypertts_pro_api_key = 'test_key'
+    configuration.set_service_enabled('ServiceA', True)
+    hypertts_instance.save_configuration(configuration)
+    service_manager.configure(configuration)
+
+    voice_list = service_manager.full_voice_list()
+    voice_alex = [x for x in voice_list if x.name == 'alex'][0]
+    single = config_models.VoiceSelectionSingle()
+    single.set_voice(config_models.VoiceWithOptions(voice_alex, {}))
+    batch = config_models.BatchConfig()
+    batch.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch.set_target(config_models.BatchTarget('Sound', False, True))
+    batch.set_voice_selection(single)
+    batch.set_text_processing(config_models.TextProcessing())
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+    batch_status_obj = batch_status.BatchStatus(hypertts_instance.anki_utils, note_id_list, testing_utils.MockBatchStatusListener())
+    hypertts_instance.process_batch_audio(note_id_list, batch, batch_status_obj)
+
+    for note_id in note_id_list:
+        assert batch_status_obj.get_note_status(note_id).status == constants.BatchNoteStatus.Done
+        note = hypertts_instance.anki_utils.get_note_by_id(note_id)
+        assert 'Sound' in note.set_values
+    assert hypertts_instance.audio_cache.get_stats()['entry_count'] == 3
+    return hypertts_instance
+
+def test_batch_cloudlanguagetools_bulk():
+    stand_in = replay_journal.StandInServer()
+    stand_in.start()
+    try:
+        hypertts_instance = run_batch_cloudlanguagetools(stand_in)
+    finally:
+        stand_in.stop()
+    # the 3 notes went out in a single request
+    assert stand_in.path_request_counts == {'/audio_bulk_v2': 1}
+    snapshot = hypertts_instance.service_manager.get_metrics()
+    assert snapshot['counters']['requests']['ServiceB'] == 3
+    assert snapshot['counters']['bytes']['ServiceB'] == 3 * replay_journal.STAND_IN_DEFAULT_SIZE
+
+def test_batch_cloudlanguagetools_bulk_fallback():
+    stand_in = replay_journal.StandInServer(bulk_supported=False)
+    stand_in.start()
+    try:
+        run_batch_cloudlanguagetools(stand_in)
+    finally:
+        stand_in.stop()
+    # the server doesn't know about bulk requests, the clips are requested one by one
+    assert stand_in.path_request_counts == {'/audio_bulk_v2': 1, '/audio_v2': 3}
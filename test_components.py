@@ -1,15 +1,18 @@
 import aqt.qt
 import logging
 import os
+import json
 import copy
 import pprint
 import component_batch_preview
 import component_configuration
+import startup_profiler
 import config_models
 import servicemanager
 import testing_utils
 import hypertts
 import constants
+import context
 import languages
 import component_voiceselection
 import component_source
@@ -717,6 +720,154 @@ def test_batch_preview(qtbot):
     # return 
 
 
+def test_batch_preview_plan(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    dialog = EmptyDialog()
+    dialog.setupUi()
+
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    voice_selection = config_models.VoiceSelectionSingle()
+    voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch_config = config_models.BatchConfig()
+    # all notes end up with the same text
+    batch_config.set_source(config_models.BatchSourceTemplate(constants.BatchMode.template, 'same text', constants.TemplateFormatVersion.v1))
+    batch_config.set_target(config_models.BatchTarget('Sound', False, True))
+    batch_config.set_voice_selection(voice_selection)
+    batch_config.set_text_processing(config_models.TextProcessing())
+
+    batch_preview_callback = MockBatchPreviewCallback()
+    batch_preview = component_batch_preview.BatchPreview(hypertts_instance, note_id_list, 
+        batch_preview_callback.sample_selected,
+        batch_preview_callback.batch_start,
+        batch_preview_callback.batch_end)
+    dialog.addChildLayout(batch_preview.draw())
+    batch_preview.load_model(batch_config)
+
+    assert batch_preview.batch_plan.note_count == 3
+    assert batch_preview.batch_plan.unique_request_count == 1
+    assert '1 audio requests (2 duplicates), 0 already cached, 1 to generate' in batch_preview.plan_label.text()
+    assert 'Estimated time' in batch_preview.plan_label.text()
+
+
+def test_batch_preview_incremental(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    dialog = EmptyDialog()
+    dialog.setupUi()
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    voice_a_2 = [x for x in voice_list if x.name == 'voice_a_2'][0]
+    voice_selection = config_models.VoiceSelectionSingle()
+    voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch_config = config_models.BatchConfig()
+    batch_config.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch_config.set_target(config_models.BatchTarget('Sound', False, True))
+    batch_config.set_voice_selection(voice_selection)
+    batch_config.set_text_processing(config_models.TextProcessing())
+
+    populated_note_id_lists = []
+    original_populate = hypertts_instance.populate_batch_status_processed_text
+    def populate(note_id_list, batch_source, text_processing, batch_status, plan_builder=None):
+        populated_note_id_lists.append(note_id_list)
+        return original_populate(note_id_list, batch_source, text_processing, batch_status, plan_builder)
+    hypertts_instance.populate_batch_status_processed_text = populate
+
+    batch_preview_callback = MockBatchPreviewCallback()
+    batch_preview = component_batch_preview.BatchPreview(hypertts_instance, note_id_list, 
+        batch_preview_callback.sample_selected,
+        batch_preview_callback.batch_start,
+        batch_preview_callback.batch_end)
+    dialog.addChildLayout(batch_preview.draw())
+    batch_preview.load_model(batch_config)
+    assert len(populated_note_id_lists) == 1
+    assert sorted(populated_note_id_lists[0]) == sorted(note_id_list)
+    assert batch_preview.batch_status[1].processed_text == '你好'
+
+    # changing the voice doesn't recompute the texts, only the plan
+    voice_selection = config_models.VoiceSelectionSingle()
+    voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_2, {}))
+    batch_config.set_voice_selection(voice_selection)
+    batch_preview.load_model(batch_config)
+    assert len(populated_note_id_lists) == 1
+    assert batch_preview.batch_plan.note_count == 3
+    assert batch_preview.batch_plan.unique_request_count == 3
+    # texts which the batch status dropped get recomputed for the plan
+    batch_preview.batch_status.texts.clear()
+    batch_preview.load_model(batch_config)
+    assert len(populated_note_id_lists) == 1
+    assert batch_preview.batch_plan.unique_request_count == 3
+    assert len(batch_preview.batch_status.texts) == 0
+
+    # changing the text processing does
+    text_processing = config_models.TextProcessing()
+    rule = config_models.TextReplacementRule(constants.TextReplacementRuleType.Simple)
+    rule.source = '你'
+    rule.target = '您'
+    text_processing.add_text_replacement_rule(rule)
+    batch_config.set_text_processing(text_processing)
+    batch_preview.load_model(batch_config)
+    assert len(populated_note_id_lists) == 2
+    assert batch_preview.batch_status[1].processed_text == '您好'
+    assert batch_preview.batch_status[1].status == constants.BatchNoteStatus.OK
+
+
+def test_batch_preview_resume_option(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    dialog = EmptyDialog()
+    dialog.setupUi()
+
+    note_id_list = [config_gen.note_id_1, config_gen.note_id_2, config_gen.note_id_4]
+
+    voice_list = hypertts_instance.service_manager.full_voice_list()
+    voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+    voice_selection = config_models.VoiceSelectionSingle()
+    voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+
+    batch_config = config_models.BatchConfig()
+    batch_config.set_source(config_models.BatchSourceSimple('Chinese'))
+    batch_config.set_target(config_models.BatchTarget('Sound', False, True))
+    batch_config.set_voice_selection(voice_selection)
+    batch_config.set_text_processing(config_models.TextProcessing())
+
+    batch_preview_callback = MockBatchPreviewCallback()
+    batch_preview = component_batch_preview.BatchPreview(hypertts_instance, note_id_list,
+        batch_preview_callback.sample_selected,
+        batch_preview_callback.batch_start,
+        batch_preview_callback.batch_end)
+    dialog.addChildLayout(batch_preview.draw())
+
+    # no journal for this batch, there is nothing to resume
+    batch_preview.load_model(batch_config)
+    assert hypertts_instance.get_batch_journal(note_id_list, batch_config).exists() == False
+    assert batch_preview.resume_checkbox.isEnabled() == False
+    assert batch_preview.resume_checkbox.isChecked() == False
+    assert batch_preview.resume_checkbox.text() == constants.GUI_TEXT_BATCH_RESUME
+
+    # a previous run of the same batch got one note done
+    journal = hypertts_instance.get_batch_journal(note_id_list, batch_config)
+    journal.open(False)
+    journal.record_done(config_gen.note_id_1, 'hypertts-1.mp3')
+    journal.close()
+    batch_preview.update_resume_option()
+    assert batch_preview.resume_checkbox.isEnabled() == True
+    assert batch_preview.resume_checkbox.isChecked() == True
+    assert batch_preview.resume_checkbox.text() == f'{constants.GUI_TEXT_BATCH_RESUME} (1 notes already done)'
+
+
 def test_batch_dialog(qtbot):
     config_gen = testing_utils.TestConfigGenerator()
     hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
@@ -1391,6 +1542,69 @@ def test_configuration_pro_key_exception(qtbot):
     assert configuration.service_stack_map['ServiceA'].currentIndex() == configuration.STACK_LEVEL_LITE
     assert configuration.header_logo_stack_widget.currentIndex() == configuration.STACK_LEVEL_LITE
 
+def test_configuration_metrics(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+    hypertts_instance.service_manager.get_service('ServiceA').enabled = True
+    hypertts_instance.reset_metrics()
+
+    dialog = EmptyDialog()
+    dialog.setupUi()
+
+    configuration = component_configuration.Configuration(hypertts_instance, dialog)
+    configuration.draw(dialog.getLayout())
+    assert configuration.metrics_label.text().startswith('No audio requests yet.')
+
+    # the same audio twice, the second time comes from the audio cache
+    voice_a_1 = [voice for voice in hypertts_instance.service_manager.full_voice_list() if voice.name == 'voice_a_1'][0]
+    for i in range(2):
+        hypertts_instance.generate_audio_write_file('old people', voice_a_1, {}, context.AudioRequestContext(constants.AudioRequestReason.preview))
+
+    qtbot.mouseClick(configuration.metrics_refresh_button, aqt.qt.Qt.LeftButton)
+    metrics_text = configuration.metrics_label.text()
+    assert '<td>ServiceA</td><td>1</td>' in metrics_text
+    assert '1 hits, 1 misses, hit ratio 50%' in metrics_text
+    assert hypertts_instance.get_metrics()['audio_cache']['hit_ratio'] == 0.5
+
+    qtbot.mouseClick(configuration.metrics_reset_button, aqt.qt.Qt.LeftButton)
+    assert configuration.metrics_label.text().startswith('No audio requests yet.')
+    assert hypertts_instance.get_metrics()['audio_cache']['hit_ratio'] == None
+
+def test_configuration_startup_profile(qtbot):
+    config_gen = testing_utils.TestConfigGenerator()
+    hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+    profiler = startup_profiler.StartupProfiler()
+    profiler.service_manager = hypertts_instance.service_manager
+    hypertts_instance.service_manager.service_import_seconds = {'service_a': 0.25, 'service_b': 0.5}
+    profiler.end_phase('import services')
+    profiler.end_phase('gui init')
+    profiler.finish()
+    hypertts_instance.startup_profiler = profiler
+
+    dialog = EmptyDialog()
+    dialog.setupUi()
+
+    configuration = component_configuration.Configuration(hypertts_instance, dialog)
+    configuration.draw(dialog.getLayout())
+
+    summary = configuration.startup_profile_label.text()
+    assert 'import services' in summary
+    assert 'gui init' in summary
+    # slowest module first
+    assert summary.index('service_b: 0.500s') < summary.index('service_a: 0.250s')
+
+    # dump to json
+    qtbot.mouseClick(configuration.startup_profile_save_button, aqt.qt.Qt.LeftButton)
+    filename = os.path.join(hypertts_instance.anki_utils.user_files_dir, constants.STARTUP_PROFILE_FILENAME)
+    assert configuration.startup_profile_saved_label.text() == f'saved to {filename}'
+    with open(filename, 'r') as f:
+        report = json.load(f)
+    assert [phase['name'] for phase in report['phases']] == ['import services', 'gui init']
+    assert report['service_import_seconds'] == {'service_a': 0.25, 'service_b': 0.5}
+    assert report['total_seconds'] >= 0
+    assert report['peak_memory_bytes'] > 0
+
 def test_configuration_manual(qtbot):
     # HYPERTTS_CONFIGURATION_DIALOG_DEBUG=yes pytest test_components.py -k test_configuration_manual
     config_gen = testing_utils.TestConfigGenerator()
@@ -1,10 +1,15 @@
 
 import unittest
+import os
+import tempfile
+import threading
 
 import errors
 import testing_utils
 import config_models
 import constants
+import context
+import text_utils
 
 class HyperTTSTests(unittest.TestCase):
 
@@ -44,6 +49,65 @@ yoyo
 """
         self.assertRaises(errors.TemplateExpansionError, hypertts_instance.expand_advanced_template, note, source_template)
 
+    def test_advanced_template_compiled_once(self):
+        source_template = """
+result = template_fields['French'].upper()
+"""
+        code = text_utils.compile_advanced_template(source_template)
+        self.assertIs(text_utils.compile_advanced_template(source_template), code)
+        for french in ['Bonjour', 'Salut']:
+            local_variables = text_utils.run_advanced_template(code, {'French': french})
+            self.assertEqual(local_variables['result'], french.upper())
+        # without a budget
+        local_variables = text_utils.run_advanced_template(code, {'French': 'Bonjour'}, max_steps=None)
+        self.assertEqual(local_variables['result'], 'BONJOUR')
+
+        # syntax errors get reported when compiling
+        self.assertRaises(errors.TemplateExpansionError, text_utils.compile_advanced_template, 'result = (')
+
+    def test_advanced_template_budget(self):
+        field_dict = {
+            'French': 'Bonjour',
+        }
+        note = testing_utils.MockNote(42, 43, field_dict, ['French'], None)
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        # a runaway template doesn't stall the batch
+        source_template = """
+while True:
+    pass
+"""
+        self.assertRaises(errors.TemplateExpansionError, hypertts_instance.expand_advanced_template, note, source_template)
+        code = text_utils.compile_advanced_template(source_template)
+        self.assertRaises(errors.TemplateBudgetExceeded, text_utils.run_advanced_template, code, field_dict, 1000, 5.0)
+        self.assertRaises(errors.TemplateBudgetExceeded, text_utils.run_advanced_template, code, field_dict, 10**9, 0.1)
+
+        # the template can't catch the budget exception
+        source_template = """
+try:
+    while True:
+        pass
+except Exception:
+    pass
+result = 'done'
+"""
+        self.assertRaises(errors.TemplateExpansionError, hypertts_instance.expand_advanced_template, note, source_template)
+        code = text_utils.compile_advanced_template(source_template)
+        self.assertRaises(errors.TemplateBudgetExceeded, text_utils.run_advanced_template, code, field_dict, 1000, 5.0)
+
+        # and catching everything doesn't produce a result either
+        source_template = """
+try:
+    while True:
+        pass
+except:
+    pass
+result = 'done'
+"""
+        code = text_utils.compile_advanced_template(source_template)
+        self.assertRaises(errors.TemplateBudgetExceeded, text_utils.run_advanced_template, code, field_dict, 1000, 5.0)
+
     def test_get_audio_file_errors(self):
         # error situations
 
@@ -76,3 +140,284 @@ yoyo
 
         extra_args_array = ['bla', 'yo']
         self.assertRaises(errors.TTSTagProcessingError, hypertts_instance.extract_hypertts_preset, extra_args_array)
+
+    def test_get_all_fields_from_notes(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance('default')
+
+        # notes which don't exist are skipped, the notes themselves are never loaded
+        note_id_list = [config_gen.note_id_1, config_gen.note_id_2, 42]
+        self.assertEqual(hypertts_instance.get_all_fields_from_notes(note_id_list), ['Chinese', 'English', 'Pinyin', 'Sound'])
+        self.assertEqual(hypertts_instance.anki_utils.get_notes_by_id_calls, 0)
+
+    def test_migrate_configuration(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        hypertts_instance.config[constants.CONFIG_CONFIGURATION] = {
+            'service_config': {
+                'ServiceA': {constants.SERVICE_CONFIG_THROTTLE_SECONDS: 0.5},
+                # an explicit rate limit wins over the legacy one
+                'ServiceB': {constants.SERVICE_CONFIG_THROTTLE_SECONDS: 2.0, constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: 5.0}
+            }
+        }
+        hypertts_instance.migrate_configuration()
+        self.assertEqual(hypertts_instance.anki_utils.written_config[constants.CONFIG_CONFIGURATION]['service_config'], {
+            'ServiceA': {constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: 2.0, constants.SERVICE_CONFIG_BURST: 1},
+            'ServiceB': {constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: 5.0}
+        })
+        hypertts_instance.service_manager.configure(hypertts_instance.get_configuration())
+        self.assertEqual(hypertts_instance.service_manager.service_rate_limits, {'ServiceA': (2.0, 1), 'ServiceB': (5.0, 1)})
+
+        # once migrated, the config doesn't get written again
+        hypertts_instance.anki_utils.written_config = None
+        hypertts_instance.migrate_configuration()
+        self.assertEqual(hypertts_instance.anki_utils.written_config, None)
+
+    def test_realtime_side_config_cache(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        voice_selection = config_models.VoiceSelectionSingle()
+        voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {'speed': 43}))
+        front = config_models.RealtimeConfigSide()
+        front.side_enabled = True
+        source = config_models.RealtimeSourceAnkiTTS()
+        source.field_name = 'Chinese'
+        source.field_type = constants.AnkiTTSFieldType.Regular
+        front.source = source
+        front.text_processing = config_models.TextProcessing()
+        front.voice_selection = voice_selection
+        realtime_config = config_models.RealtimeConfig()
+        realtime_config.front = front
+        realtime_config.back = config_models.RealtimeConfigSide()
+        settings_key = hypertts_instance.save_realtime_config(realtime_config, None)
+
+        # the second lookup doesn't deserialize anything
+        front_side_1 = hypertts_instance.get_realtime_side_config(f'Front_{settings_key}')
+        deserialize_voice_fn = hypertts_instance.service_manager.deserialize_voice
+        def deserialize_voice_fail(voice_data):
+            raise Exception('deserialize_voice should not be called')
+        hypertts_instance.service_manager.deserialize_voice = deserialize_voice_fail
+        front_side_2 = hypertts_instance.get_realtime_side_config(f'Front_{settings_key}')
+        assert front_side_2 == front_side_1
+        assert front_side_2.voice_selection.voice.options == {'speed': 43}
+        hypertts_instance.service_manager.deserialize_voice = deserialize_voice_fn
+
+        # saving the preset invalidates the cache
+        voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {'speed': 44}))
+        hypertts_instance.save_realtime_config(realtime_config, settings_key)
+        front_side_3 = hypertts_instance.get_realtime_side_config(f'Front_{settings_key}')
+        assert front_side_3 != front_side_1
+        assert front_side_3.voice_selection.voice.options == {'speed': 44}
+
+    def test_generate_audio_write_file_cache(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.realtime)
+
+        full_filename_1, audio_filename_1 = hypertts_instance.generate_audio_write_file('old people', voice_a_1, {}, audio_request_context)
+        # second request gets served from the cache, the service doesn't get called
+        service_a = hypertts_instance.service_manager.get_service('ServiceA')
+        del service_a.requested_audio
+        full_filename_2, audio_filename_2 = hypertts_instance.generate_audio_write_file('old people', voice_a_1, {}, audio_request_context)
+        self.assertFalse(hasattr(service_a, 'requested_audio'))
+
+        self.assertEqual(full_filename_1, full_filename_2)
+        self.assertEqual(audio_filename_1, audio_filename_2)
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['hits'], 1)
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['misses'], 1)
+
+        # different options, different audio
+        hypertts_instance.generate_audio_write_file('old people', voice_a_1, {'speaking_rate': 2.0}, audio_request_context)
+        self.assertEqual(service_a.requested_audio['options'], {'speaking_rate': 2.0})
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['misses'], 2)
+
+    def test_generate_audio_stream(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.realtime)
+
+        # short texts are downloaded completely
+        audio_stream = hypertts_instance.generate_audio_stream('old people', voice_a_1, {}, audio_request_context)
+        self.assertTrue(audio_stream.is_complete())
+        self.assertTrue(os.path.exists(audio_stream.full_filename))
+
+        # long texts are returned once the beginning of the audio is on disk
+        long_text = 'old people ' * 10
+        first_chunk = b'a' * constants.STREAMING_PLAYBACK_START_BYTES
+        second_chunk = b'b' * 1000
+        resume_event = threading.Event()
+        def write_tts_audio(source_text, voice, options, audio_request_context, output_file):
+            output_file.write(first_chunk)
+            resume_event.wait(5)
+            output_file.write(second_chunk)
+        hypertts_instance.service_manager.write_tts_audio = write_tts_audio
+        audio_stream = hypertts_instance.generate_audio_stream(long_text, voice_a_1, {}, audio_request_context)
+        self.assertFalse(audio_stream.is_complete())
+        # the player reads a temporary file while it grows, it only goes into the cache once complete
+        self.assertNotEqual(audio_stream.playback_filename, audio_stream.full_filename)
+        with open(audio_stream.playback_filename, 'rb') as f:
+            self.assertEqual(f.read(), first_chunk)
+        self.assertFalse(os.path.exists(audio_stream.full_filename))
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['entry_count'], 1)
+        resume_event.set()
+        audio_stream.wait_for_completion()
+        with open(audio_stream.full_filename, 'rb') as f:
+            self.assertEqual(f.read(), first_chunk + second_chunk)
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['entry_count'], 2)
+        # the temporary file stays until the player is done with it
+        self.assertTrue(os.path.exists(audio_stream.playback_filename))
+        audio_stream.release()
+        self.assertFalse(os.path.exists(audio_stream.playback_filename))
+        with open(audio_stream.full_filename, 'rb') as f:
+            self.assertEqual(f.read(), first_chunk + second_chunk)
+
+        # the second time, it comes from the cache
+        audio_stream = hypertts_instance.generate_audio_stream(long_text, voice_a_1, {}, audio_request_context)
+        self.assertTrue(audio_stream.is_complete())
+
+        # errors before playback can start are raised
+        def write_tts_audio_not_found(source_text, voice, options, audio_request_context, output_file):
+            raise errors.AudioNotFoundError(source_text, voice)
+        hypertts_instance.service_manager.write_tts_audio = write_tts_audio_not_found
+        self.assertRaises(errors.AudioNotFoundError, hypertts_instance.generate_audio_stream, long_text + 'yo', voice_a_1, {}, audio_request_context)
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['entry_count'], 2)
+
+    def test_generate_audio_write_files_bulk_single_flight(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.batch)
+        requested_texts = []
+        def write_tts_audio_bulk(audio_requests, audio_request_context):
+            for source_text, voice, options, output_file in audio_requests:
+                requested_texts.append(source_text)
+                output_file.write(source_text.encode('utf-8'))
+            return [None] * len(audio_requests)
+        hypertts_instance.service_manager.write_tts_audio_bulk = write_tts_audio_bulk
+
+        # another request is already fetching 'hello'
+        hash_str = hypertts_instance.get_hash_for_audio_request('hello', voice_a_1, {})
+        call, leader = hypertts_instance.audio_single_flight.acquire(hash_str)
+        self.assertTrue(leader)
+        results = {}
+        def run_bulk():
+            results.update(hypertts_instance.generate_audio_write_files_bulk(['old people', 'hello'], voice_a_1, {}, audio_request_context))
+        thread = threading.Thread(target=run_bulk)
+        thread.start()
+        # the bulk request goes out without it, then waits for the other request
+        while hypertts_instance.audio_single_flight.shared_count == 0:
+            thread.join(0.01)
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(requested_texts, ['old people'])
+        hypertts_instance.audio_single_flight.release(hash_str, call)
+        thread.join()
+        self.assertEqual(results['hello'][0], hypertts_instance.get_full_audio_file_name(hash_str))
+        self.assertEqual(hypertts_instance.audio_single_flight.calls, {})
+
+        # when the other request fails, the bulk result for that text is the exception
+        hash_str = hypertts_instance.get_hash_for_audio_request('yo', voice_a_1, {})
+        call, leader = hypertts_instance.audio_single_flight.acquire(hash_str)
+        results = {}
+        def run_bulk_failure():
+            results.update(hypertts_instance.generate_audio_write_files_bulk(['yo'], voice_a_1, {}, audio_request_context))
+        thread = threading.Thread(target=run_bulk_failure)
+        thread.start()
+        while hypertts_instance.audio_single_flight.shared_count == 1:
+            thread.join(0.01)
+        hypertts_instance.audio_single_flight.release(hash_str, call, exception=errors.RequestError('yo', voice_a_1, 'timeout'))
+        thread.join()
+        self.assertIsInstance(results['yo'], errors.RequestError)
+        self.assertEqual(requested_texts, ['old people'])
+
+    def test_generate_audio_write_files_bulk_abort(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+        user_files_dir = hypertts_instance.anki_utils.user_files_dir
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.batch)
+        def write_tts_audio_bulk(audio_requests, audio_request_context):
+            for source_text, voice, options, output_file in audio_requests:
+                output_file.write(source_text.encode('utf-8'))
+            return [None] * len(audio_requests)
+        hypertts_instance.service_manager.write_tts_audio_bulk = write_tts_audio_bulk
+
+        # the second commit fails, the writers which weren't committed leave no temporary file behind
+        open_writer = hypertts_instance.audio_cache.open_writer
+        opened_writers = []
+        def open_writer_failing_commit(hash_str, full_filename, keep_temp_file=False):
+            writer = open_writer(hash_str, full_filename, keep_temp_file=keep_temp_file)
+            opened_writers.append(writer)
+            if len(opened_writers) == 2:
+                def commit():
+                    raise OSError('disk full')
+                writer.commit = commit
+            return writer
+        hypertts_instance.audio_cache.open_writer = open_writer_failing_commit
+        self.assertRaises(OSError, hypertts_instance.generate_audio_write_files_bulk, ['old people', 'hello', 'yo'], voice_a_1, {}, audio_request_context)
+        self.assertEqual(hypertts_instance.audio_cache.get_stats()['entry_count'], 1)
+        self.assertEqual([x for x in os.listdir(user_files_dir) if x.endswith('.tmp')], [])
+        self.assertEqual(hypertts_instance.audio_single_flight.calls, {})
+
+        # same when the request gets interrupted
+        hypertts_instance.audio_cache.open_writer = open_writer
+        def write_tts_audio_bulk_interrupted(audio_requests, audio_request_context):
+            raise KeyboardInterrupt()
+        hypertts_instance.service_manager.write_tts_audio_bulk = write_tts_audio_bulk_interrupted
+        self.assertRaises(KeyboardInterrupt, hypertts_instance.generate_audio_write_files_bulk, ['bonjour', 'salut'], voice_a_1, {}, audio_request_context)
+        self.assertEqual([x for x in os.listdir(user_files_dir) if x.endswith('.tmp')], [])
+        self.assertEqual(hypertts_instance.audio_single_flight.calls, {})
+
+    def test_generate_audio_stream_linked_media_file(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        audio_request_context = context.AudioRequestContext(constants.AudioRequestReason.realtime)
+        long_text = 'old people ' * 10
+
+        # an earlier version of the file is hard linked into the media folder, but not in the cache anymore
+        hash_str = hypertts_instance.get_hash_for_audio_request(long_text, voice_a_1, {})
+        full_filename = hypertts_instance.get_full_audio_file_name(hash_str)
+        with open(full_filename, 'wb') as f:
+            f.write(b'media')
+        media_filename = os.path.join(tempfile.mkdtemp(), 'media.mp3')
+        os.link(full_filename, media_filename)
+
+        # the download fails after playback started
+        def write_tts_audio_partial(source_text, voice, options, audio_request_context, output_file):
+            output_file.write(b'a' * constants.STREAMING_PLAYBACK_START_BYTES)
+            raise errors.RequestError(source_text, voice, 'connection reset')
+        hypertts_instance.service_manager.write_tts_audio = write_tts_audio_partial
+        audio_stream = hypertts_instance.generate_audio_stream(long_text, voice_a_1, {}, audio_request_context)
+        self.assertRaises(errors.RequestError, audio_stream.wait_for_completion)
+        with open(media_filename, 'rb') as f:
+            self.assertEqual(f.read(), b'media')
+        self.assertFalse(os.path.exists(audio_stream.playback_filename))
+
+        # a successful download replaces the file without touching the media folder
+        def write_tts_audio(source_text, voice, options, audio_request_context, output_file):
+            output_file.write(b'b' * constants.STREAMING_PLAYBACK_START_BYTES)
+        hypertts_instance.service_manager.write_tts_audio = write_tts_audio
+        audio_stream = hypertts_instance.generate_audio_stream(long_text, voice_a_1, {}, audio_request_context)
+        audio_stream.wait_for_completion()
+        audio_stream.release()
+        with open(full_filename, 'rb') as f:
+            self.assertEqual(f.read(), b'b' * constants.STREAMING_PLAYBACK_START_BYTES)
+        with open(media_filename, 'rb') as f:
+            self.assertEqual(f.read(), b'media')
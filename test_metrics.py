@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+import metrics
+
+
+class HistogramTests(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = metrics.Histogram()
+        assert histogram.percentile(50) == None
+        assert histogram.mean() == None
+        # 1ms to 1000ms
+        for i in range(1, 1001):
+            histogram.observe(i / 1000.0)
+        assert histogram.count == 1000
+        assert histogram.min == 0.001
+        assert histogram.max == 1.0
+        self.assertAlmostEqual(histogram.mean(), 0.5005)
+        # within one bucket of the true value
+        self.assertAlmostEqual(histogram.percentile(50), 0.5, delta=0.5 * 0.15)
+        self.assertAlmostEqual(histogram.percentile(95), 0.95, delta=0.95 * 0.15)
+        self.assertAlmostEqual(histogram.percentile(99), 0.99, delta=0.99 * 0.15)
+        # never outside of the observed range
+        assert histogram.percentile(100) <= 1.0
+
+    def test_out_of_range_values(self):
+        histogram = metrics.Histogram()
+        histogram.observe(0.0)
+        histogram.observe(100000.0)
+        assert histogram.percentile(1) <= 0.001
+        assert histogram.percentile(100) == 100000.0
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_snapshot(self):
+        registry = metrics.MetricsRegistry()
+        registry.increment(metrics.REQUESTS, 'ServiceA')
+        registry.increment(metrics.REQUESTS, 'ServiceA')
+        registry.increment(metrics.BYTES, 'ServiceA', 2048)
+        registry.increment(metrics.ERRORS, 'ServiceA', sub_key='AudioNotFoundError')
+        registry.observe(metrics.LATENCY, 'ServiceA', 0.2)
+        registry.observe(metrics.LATENCY, 'ServiceA', 0.4)
+        with registry.get_gauge_context(metrics.IN_FLIGHT, 'ServiceA'):
+            with registry.get_gauge_context(metrics.IN_FLIGHT, 'ServiceA'):
+                assert registry.snapshot()['gauges'][metrics.IN_FLIGHT]['ServiceA'] == {'value': 2, 'max': 2}
+
+        snapshot = registry.snapshot()
+        assert snapshot['counters'][metrics.REQUESTS] == {'ServiceA': 2}
+        assert snapshot['counters'][metrics.BYTES] == {'ServiceA': 2048}
+        assert snapshot['counters'][metrics.ERRORS] == {'ServiceA': {'AudioNotFoundError': 1}}
+        assert snapshot['histograms'][metrics.LATENCY]['ServiceA']['count'] == 2
+        self.assertAlmostEqual(snapshot['histograms'][metrics.LATENCY]['ServiceA']['mean'], 0.3)
+        assert snapshot['gauges'][metrics.IN_FLIGHT]['ServiceA'] == {'value': 0, 'max': 2}
+
+        summary = metrics.format_snapshot(snapshot)
+        assert '<td>ServiceA</td><td>2</td>' in summary
+        assert 'AudioNotFoundError: 1' in summary
+
+        registry.reset()
+        snapshot = registry.snapshot()
+        assert snapshot['counters'] == {}
+        assert snapshot['histograms'] == {}
+        assert snapshot['gauges'][metrics.IN_FLIGHT]['ServiceA'] == {'value': 0, 'max': 0}
+        assert metrics.format_snapshot(snapshot) == 'No audio requests yet.<br/><b>ServiceA:</b> 0 in flight (max 0), 0 waiting (max 0)'
+
+    def test_concurrent_updates(self):
+        registry = metrics.MetricsRegistry()
+        def update():
+            for i in range(1000):
+                registry.increment(metrics.REQUESTS, 'ServiceA')
+                registry.observe(metrics.LATENCY, 'ServiceA', 0.01)
+        threads = [threading.Thread(target=update) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = registry.snapshot()
+        assert snapshot['counters'][metrics.REQUESTS]['ServiceA'] == 4000
+        assert snapshot['histograms'][metrics.LATENCY]['ServiceA']['count'] == 4000
+
+class LatencyEstimatorTests(unittest.TestCase):
+    def test_recent_latency(self):
+        estimator = metrics.LatencyEstimator(weight=0.5)
+        assert estimator.get_estimate('ServiceA') == None
+        estimator.observe('ServiceA', 1.0)
+        assert estimator.get_estimate('ServiceA') == 1.0
+        # the service got slower, the estimate follows
+        estimator.observe('ServiceA', 3.0)
+        assert estimator.get_estimate('ServiceA') == 2.0
+        for i in range(20):
+            estimator.observe('ServiceA', 3.0)
+        self.assertAlmostEqual(estimator.get_estimate('ServiceA'), 3.0, places=4)
+        # each key has its own estimate
+        assert estimator.get_estimate('cloudlanguagetools') == None
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+import testing_utils
+import config_models
+import constants
+
+
+class PrefetchTests(unittest.TestCase):
+    def setUp(self):
+        config_gen = testing_utils.TestConfigGenerator()
+        self.hypertts_instance = config_gen.build_hypertts_instance_test_servicemanager('default')
+
+        voice_list = self.hypertts_instance.service_manager.full_voice_list()
+        voice_a_1 = [x for x in voice_list if x.name == 'voice_a_1'][0]
+        voice_selection = config_models.VoiceSelectionSingle()
+        voice_selection.set_voice(config_models.VoiceWithOptions(voice_a_1, {}))
+        front = config_models.RealtimeConfigSide()
+        front.side_enabled = True
+        source = config_models.RealtimeSourceAnkiTTS()
+        source.field_name = 'Chinese'
+        source.field_type = constants.AnkiTTSFieldType.Regular
+        front.source = source
+        front.text_processing = config_models.TextProcessing()
+        front.voice_selection = voice_selection
+        realtime_config = config_models.RealtimeConfig()
+        realtime_config.front = front
+        realtime_config.back = config_models.RealtimeConfigSide()
+        settings_key = self.hypertts_instance.save_realtime_config(realtime_config, None)
+        self.other_args = [f'{constants.TTS_TAG_HYPERTTS_PRESET}=Front_{settings_key}']
+
+    def wait_for_prefetch(self, prefetcher):
+        start_time = time.time()
+        while len(prefetcher.pending) > 0 and time.time() - start_time < 5:
+            time.sleep(0.01)
+        assert len(prefetcher.pending) == 0
+
+    def test_prefetch_review_ahead(self):
+        prefetcher = self.hypertts_instance.prefetcher
+        anki_utils = self.hypertts_instance.anki_utils
+        anki_utils.review_ahead_cards = {
+            1: [testing_utils.MockTTSTag('老人家', self.other_args)],
+            2: [testing_utils.MockTTSTag('你好', self.other_args),
+                # not a HyperTTS tag
+                testing_utils.MockTTSTag('hello', ['speed=1.2'])],
+        }
+        prefetcher.prefetch_review_ahead()
+        self.wait_for_prefetch(prefetcher)
+        assert self.hypertts_instance.audio_cache.get_stats()['entry_count'] == 2
+        assert len(prefetcher.done) == 2
+        assert anki_utils.rendered_card_ids == [1, 2]
+
+        # the cards don't get rendered again while they stay in the queue
+        prefetcher.prefetch_review_ahead()
+        assert len(prefetcher.pending) == 0
+        assert anki_utils.rendered_card_ids == [1, 2]
+
+        # only the card which entered the queue gets rendered, tags which were prefetched already are not submitted again
+        del anki_utils.review_ahead_cards[1]
+        anki_utils.review_ahead_cards[3] = [testing_utils.MockTTSTag('老人家', self.other_args)]
+        prefetcher.prefetch_review_ahead()
+        assert len(prefetcher.pending) == 0
+        assert anki_utils.rendered_card_ids == [1, 2, 3]
+
+        # playing the tag is served from the cache, the service doesn't get called
+        service_a = self.hypertts_instance.service_manager.get_service('ServiceA')
+        del service_a.requested_audio
+        self.hypertts_instance.get_audio_filename_tts_tag(testing_utils.MockTTSTag('你好', self.other_args))
+        assert hasattr(service_a, 'requested_audio') == False
+        assert self.hypertts_instance.audio_cache.get_stats()['hits'] == 1
+
+    def test_prefetch_errors(self):
+        prefetcher = self.hypertts_instance.prefetcher
+        # the preset doesn't exist, errors are only logged
+        prefetcher.prefetch_tts_tags([testing_utils.MockTTSTag('老人家', [f'{constants.TTS_TAG_HYPERTTS_PRESET}=Front_notfound'])])
+        self.wait_for_prefetch(prefetcher)
+        assert self.hypertts_instance.audio_cache.get_stats()['entry_count'] == 0
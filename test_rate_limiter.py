@@ -0,0 +1,61 @@
+import time
+import threading
+import unittest
+import unittest.mock
+
+import constants
+import rate_limiter
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_no_limit(self):
+        token_bucket = rate_limiter.TokenBucket('test', 0, 1)
+        start_time = time.monotonic()
+        for i in range(100):
+            token_bucket.acquire()
+        assert time.monotonic() - start_time < 0.1
+
+    def test_pacing_concurrent_callers(self):
+        token_bucket = rate_limiter.TokenBucket('test', 20, 2)
+
+        def acquire_tokens():
+            for i in range(2):
+                token_bucket.acquire()
+
+        start_time = time.monotonic()
+        threads = [threading.Thread(target=acquire_tokens) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start_time
+
+        # 2 requests go through immediately (burst), the other 4 are spaced out at 20 requests/s
+        assert elapsed >= 0.18
+        assert elapsed < 1.0
+
+    def test_backoff(self):
+        with unittest.mock.patch.object(constants, 'RATE_LIMIT_BACKOFF_INITIAL_SECONDS', 0.05):
+            token_bucket = rate_limiter.TokenBucket('test', 10, 5)
+
+            token_bucket.penalize()
+            assert token_bucket.current_rate == 5
+            assert token_bucket.backoff_seconds == 0.05
+            assert token_bucket.acquire() >= 0.04
+
+            # consecutive 429s increase the backoff
+            token_bucket.penalize()
+            assert token_bucket.current_rate == 2.5
+            assert token_bucket.backoff_seconds == 0.1
+
+            # the service can tell us how long to wait
+            token_bucket.penalize(retry_after=0.3)
+            assert token_bucket.acquire() >= 0.25
+
+            # successful requests reset the backoff and restore the rate gradually
+            token_bucket.reward()
+            assert token_bucket.backoff_seconds == 0
+            assert token_bucket.current_rate == 1.25 + 10 * constants.RATE_LIMIT_RECOVERY_FRACTION
+            for i in range(100):
+                token_bucket.reward()
+            assert token_bucket.current_rate == 10
@@ -0,0 +1,93 @@
+import os
+import json
+import tempfile
+
+import constants
+import request_journal
+import replay_journal
+import cloudlanguagetools
+
+
+def build_request(text, request_mode='batch'):
+    return {
+        'text': text,
+        'service': 'Azure',
+        'request_mode': request_mode,
+        'language_code': 'fr',
+        'voice_key': {'name': 'fr-FR-DeniseNeural'},
+        'options': {'rate': 1.0}
+    }
+
+def record_requests(stand_in, journal_filename, requests):
+    client = cloudlanguagetools.CloudLanguageTools()
+    client.base_url = stand_in.get_base_url()
+    client.configure('test_key')
+    client.set_request_journal(request_journal.RequestJournal(journal_filename))
+    for request in requests:
+        try:
+            client.get_tts_audio(request['text'], replay_journal.ReplayVoice(request), request['options'],
+                replay_journal.ReplayRequestContext(request['request_mode']))
+        except Exception:
+            pass
+
+def test_request_journal_record_replay():
+    journal_filename = os.path.join(tempfile.mkdtemp(), constants.REQUEST_JOURNAL_FILENAME)
+    stand_in = replay_journal.StandInServer()
+    stand_in.start()
+    try:
+        record_requests(stand_in, journal_filename, [build_request('old people'), build_request('hello', 'dynamic')])
+    finally:
+        stand_in.stop()
+
+    entries = request_journal.load_journal(journal_filename)
+    assert len(entries) == 2
+    assert entries[0]['request'] == build_request('old people')
+    assert entries[1]['request']['request_mode'] == 'dynamic'
+    assert entries[0]['size'] == replay_journal.STAND_IN_DEFAULT_SIZE
+    assert entries[0]['result_hash'] != entries[1]['result_hash']
+    assert entries[0]['latency_seconds'] >= 0
+    assert 'error' not in entries[0]
+
+    # the recorded latency, size and errors are played back by the stand-in server
+    entries.append({'time': entries[1]['time'], 'request': build_request('rate limited'), 'latency_seconds': 0.01,
+        'size': None, 'result_hash': None, 'error': 'RateLimitedError'})
+    entries.append({'time': entries[1]['time'], 'request': build_request('server error'), 'latency_seconds': 0.01,
+        'size': None, 'result_hash': None, 'error': 'RequestError', 'error_message': 'Status code: 500'})
+    replay_filename = journal_filename + '.replay'
+    with open(replay_filename, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+    record_filename = journal_filename + '.recorded'
+    options = replay_journal.parse_options([replay_filename, '--speed', '0', '--record', record_filename])
+    results = json.loads(json.dumps(replay_journal.replay_journal(options)))
+
+    assert results['request_count'] == 4
+    assert results['errors'] == {'RateLimitedError': 1, 'RequestError': 1}
+    assert results['recorded_errors'] == {'RateLimitedError': 1, 'RequestError': 1}
+    assert results['status_mismatches'] == 0
+    # the stand-in server always returns the same audio for the same request
+    assert results['result_hash_mismatches'] == 0
+    assert results['latency']['count'] == 4
+    # the replay is journaled too
+    assert len(request_journal.load_journal(record_filename)) == 4
+
+def test_stand_in_server_contract():
+    stand_in = replay_journal.StandInServer()
+    headers = {'api_key': 'test_key'}
+    body = json.dumps(build_request('old people')).encode('utf-8')
+    status, response_headers, content = stand_in.handle_request('/audio_v2', headers, body)
+    assert status == 200
+    assert content == replay_journal.get_stand_in_audio(build_request('old people'), replay_journal.STAND_IN_DEFAULT_SIZE)
+    assert stand_in.handle_request('/audio_v2', {}, body)[0] == 401
+    assert stand_in.handle_request('/audio', headers, body)[0] == 404
+    assert stand_in.handle_request('/audio_v2', headers, b'{"text": "old people"}')[0] == 400
+    stand_in.httpd.server_close()
+
+def test_request_journal_rotation():
+    journal_filename = os.path.join(tempfile.mkdtemp(), constants.REQUEST_JOURNAL_FILENAME)
+    journal = request_journal.RequestJournal(journal_filename, max_size_bytes=100)
+    for i in range(3):
+        journal.record({'text': 'x' * 40, 'index': i})
+    # each line is over 50 bytes, so every record starts a new file
+    assert [entry['index'] for entry in request_journal.load_journal(journal_filename)] == [2]
+    assert [entry['index'] for entry in request_journal.load_journal(journal.get_rotated_filename())] == [1]
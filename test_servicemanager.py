@@ -1,11 +1,17 @@
 
 import os
+import sys
 import json
+import tempfile
+import subprocess
 import unittest
+import unittest.mock
 
 import config_models
 import constants
+import errors
 import languages
+import metrics
 import servicemanager
 import voice
 import testing_utils
@@ -157,6 +163,216 @@ class ServiceManagerTests(unittest.TestCase):
         assert audio_result_dict['source_text'] == 'test sentence 123'
         assert audio_result_dict['voice']['voice_key'] == {'name': 'voice_1'}
 
+    def test_get_tts_audio_rate_limited(self):
+        self.manager.init_services()
+        configuration = config_models.Configuration()
+        configuration.set_service_enabled('ServiceA', True)
+        configuration.set_service_configuration_key('ServiceA', constants.SERVICE_CONFIG_REQUESTS_PER_SECOND, 1000.0)
+        configuration.set_service_configuration_key('ServiceA', constants.SERVICE_CONFIG_BURST, 2)
+        self.manager.configure(configuration)
+
+        service_a = self.manager.get_service('ServiceA')
+        servicea_voice_1 = [voice for voice in service_a.voice_list() if voice.name == 'voice_a_1'][0]
+
+        # the first two requests get HTTP 429
+        get_tts_audio_fn = service_a.get_tts_audio
+        call_count = [0]
+        def get_tts_audio_rate_limited(source_text, voice, options):
+            call_count[0] += 1
+            if call_count[0] <= 2:
+                raise errors.RateLimitedError(source_text, voice, 'status code 429')
+            return get_tts_audio_fn(source_text, voice, options)
+        service_a.get_tts_audio = get_tts_audio_rate_limited
+
+        with unittest.mock.patch.object(constants, 'RATE_LIMIT_BACKOFF_INITIAL_SECONDS', 0.01):
+            audio_result = self.manager.get_tts_audio('test sentence 123', servicea_voice_1, {}, None)
+        assert json.loads(audio_result)['source_text'] == 'test sentence 123'
+        assert call_count[0] == 3
+
+        token_bucket = self.manager.get_rate_limiter(servicea_voice_1)
+        assert token_bucket.rate == 1000.0
+        assert token_bucket.burst == 2
+        assert token_bucket.current_rate < 1000.0
+
+        # give up after too many retries
+        call_count[0] = -10
+        with unittest.mock.patch.object(constants, 'RATE_LIMIT_BACKOFF_INITIAL_SECONDS', 0.01):
+            with unittest.mock.patch.object(constants, 'RATE_LIMIT_BACKOFF_MAX_SECONDS', 0.01):
+                self.assertRaises(errors.RateLimitedError, self.manager.get_tts_audio, 'test sentence 123', servicea_voice_1, {}, None)
+
+    def test_get_tts_audio_metrics(self):
+        self.manager.init_services()
+        self.manager.get_service('ServiceA').enabled = True
+        self.manager.get_service('ServiceB').enabled = True
+        self.manager.reset_metrics()
+        self.manager.latency_estimator = metrics.LatencyEstimator()
+        voice_list = self.manager.full_voice_list()
+        servicea_voice_1 = [voice for voice in voice_list if voice.name == 'voice_a_1'][0]
+        assert self.manager.get_latency_estimate(servicea_voice_1) == constants.BATCH_PLAN_DEFAULT_LATENCY_SECONDS
+
+        audio_result = self.manager.get_tts_audio('test sentence 123', servicea_voice_1, {}, None)
+        self.manager.get_tts_audio('test sentence 456', servicea_voice_1, {}, None)
+        notfound_voice = [voice for voice in voice_list if voice.name == 'notfound'][0]
+        self.assertRaises(errors.AudioNotFoundError, self.manager.get_tts_audio, 'test sentence 123', notfound_voice, {}, None)
+
+        snapshot = self.manager.get_metrics()
+        assert snapshot['counters'][metrics.REQUESTS] == {'ServiceA': 2}
+        assert snapshot['counters'][metrics.BYTES]['ServiceA'] == 2 * len(audio_result)
+        assert snapshot['counters'][metrics.ERRORS] == {'ServiceB': {'AudioNotFoundError': 1}}
+        assert snapshot['histograms'][metrics.LATENCY]['ServiceA']['count'] == 2
+        # all requests are done, one at a time
+        key = self.manager.get_concurrency_key(servicea_voice_1)
+        assert snapshot['gauges'][metrics.IN_FLIGHT][key] == {'value': 0, 'max': 1}
+        assert snapshot['gauges'][metrics.WAITING][key]['value'] == 0
+        # the batch planner uses the recent latency, which resetting the metrics doesn't lose
+        latency_estimate = self.manager.get_latency_estimate(servicea_voice_1)
+        latency_histogram = snapshot['histograms'][metrics.LATENCY]['ServiceA']
+        assert latency_histogram['min'] <= latency_estimate <= latency_histogram['max']
+        self.manager.reset_metrics()
+        assert self.manager.get_latency_estimate(servicea_voice_1) == latency_estimate
+
+    def test_write_tts_audio_rate_limited(self):
+        self.manager.init_services()
+        self.manager.configure(config_models.Configuration())
+        self.manager.get_service('ServiceA').enabled = True
+        service_a = self.manager.get_service('ServiceA')
+        servicea_voice_1 = [voice for voice in service_a.voice_list() if voice.name == 'voice_a_1'][0]
+
+        # the first attempt writes part of the audio before getting rate limited
+        call_count = [0]
+        def write_tts_audio(source_text, voice, options, output_file):
+            call_count[0] += 1
+            output_file.write(b'chunk 1 ')
+            if call_count[0] == 1:
+                raise errors.RateLimitedError(source_text, voice, 'status code 429')
+            output_file.write(b'chunk 2')
+        service_a.write_tts_audio = write_tts_audio
+
+        output_filename = os.path.join(tempfile.mkdtemp(), 'audio.mp3')
+        with open(output_filename, 'wb') as output_file:
+            output_file.write(b'header ')
+            with unittest.mock.patch.object(constants, 'RATE_LIMIT_BACKOFF_INITIAL_SECONDS', 0.01):
+                size = self.manager.write_tts_audio('test sentence 123', servicea_voice_1, {}, None, output_file)
+        del service_a.write_tts_audio
+
+        # the partial audio of the first attempt was dropped
+        assert size == len(b'chunk 1 chunk 2')
+        assert open(output_filename, 'rb').read() == b'header chunk 1 chunk 2'
+
+    def test_rate_limit_from_config(self):
+        assert self.manager.get_rate_limit_from_config({constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: 5.0, constants.SERVICE_CONFIG_BURST: 3}) == (5.0, 3)
+        assert self.manager.get_rate_limit_from_config({constants.SERVICE_CONFIG_REQUESTS_PER_SECOND: 2.0}) == (2.0, 1)
+        # the legacy key gets migrated on startup, see HyperTTS.migrate_configuration
+        assert self.manager.get_rate_limit_from_config({constants.SERVICE_CONFIG_THROTTLE_SECONDS: 0.5}) == None
+        assert self.manager.get_rate_limit_from_config({}) == None
+
+    def test_http_sessions(self):
+        self.manager.init_services()
+        service_a = self.manager.get_service('ServiceA')
+        service_b = self.manager.get_service('ServiceB')
+        # each service gets its own pooled session, which is kept across requests
+        assert service_a.http_session == self.manager.http_session_manager.get_session('ServiceA')
+        assert service_a.http_session != service_b.http_session
+        assert self.manager.cloudlanguagetools.http_session == self.manager.http_session_manager.get_session('cloudlanguagetools')
+        adapter = service_a.http_session.get_adapter('https://texttospeech.googleapis.com/')
+        assert adapter._pool_maxsize == constants.HTTP_POOL_MAXSIZE
+        assert adapter._pool_connections == constants.HTTP_POOL_CONNECTIONS
+
+        # the pool sizes come from the service configuration, the services keep their session
+        configuration = config_models.Configuration()
+        configuration.set_service_configuration_key('ServiceA', constants.SERVICE_CONFIG_HTTP_POOL_CONNECTIONS, 2)
+        configuration.set_service_configuration_key('ServiceA', constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE, 32)
+        configuration.set_service_configuration_key('ServiceB', constants.SERVICE_CONFIG_HTTP_POOL_MAXSIZE, 0)
+        self.manager.configure(configuration)
+        assert service_a.http_session == self.manager.http_session_manager.get_session('ServiceA')
+        adapter = service_a.http_session.get_adapter('https://texttospeech.googleapis.com/')
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_connections == 2
+        adapter = service_b.http_session.get_adapter('https://texttospeech.googleapis.com/')
+        assert adapter._pool_maxsize == constants.HTTP_POOL_MAXSIZE
+
+        # back to the defaults once the setting is removed
+        self.manager.configure(config_models.Configuration())
+        adapter = service_a.http_session.get_adapter('https://texttospeech.googleapis.com/')
+        assert adapter._pool_maxsize == constants.HTTP_POOL_MAXSIZE
+        assert adapter._pool_connections == constants.HTTP_POOL_CONNECTIONS
+
+    def test_voice_registry(self):
+        self.manager.init_services()
+        self.manager.get_service('ServiceA').enabled = True
+        self.manager.get_service('ServiceB').enabled = False
+
+        registry = self.manager.get_voice_registry()
+        assert len(registry.voice_list) == 3
+        assert registry.get_services() == set(['ServiceA'])
+        assert registry.get_voice('ServiceA', {'name': 'voice_2'}).name == 'voice_a_2'
+        assert registry.has_voice('ServiceB', {'voice_id': 'jane'}) == False
+        # the registry is reused as long as enablement doesn't change
+        assert self.manager.get_voice_registry() == registry
+
+        female_voices = registry.filter_voices(gender=constants.Gender.Female)
+        assert [voice.name for voice in female_voices] == ['voice_a_2', 'voice_a_3']
+        english_female_voices = registry.filter_voices(language=languages.Language.en, gender=constants.Gender.Female)
+        assert [voice.name for voice in english_female_voices] == ['voice_a_2']
+        assert registry.filter_voices(audio_language=languages.AudioLanguage.en_GB) == []
+
+        # enabling a service rebuilds the registry
+        self.manager.get_service('ServiceB').enabled = True
+        registry = self.manager.get_voice_registry()
+        assert registry.get_services() == set(['ServiceA', 'ServiceB'])
+        voice = self.manager.deserialize_voice({'service': 'ServiceB', 'voice_key': {'voice_id': 'jane'}})
+        assert voice.name == 'jane'
+
+    def test_service_import_lazy(self):
+        # import the real services in a separate interpreter, so that they don't get mixed with the test services
+        script = """
+import sys
+import os
+import json
+sys._pytest_mode = True
+sys._addon_import_level_base = 0
+sys._addon_import_level_services = 0
+import servicemanager
+import testing_utils
+manager = servicemanager.ServiceManager(os.path.join(os.getcwd(), 'services'), 'services', False, testing_utils.MockCloudLanguageTools())
+manager.import_services()
+manager.instantiate_services()
+# configuring doesn't create the boto3 client either
+manager.services['Amazon'].configure({'aws_access_key_id': 'key_id', 'aws_secret_access_key': 'secret'})
+print(json.dumps({
+    'services': sorted(manager.services.keys()),
+    'heavy_modules': [module for module in ['boto3', 'botocore', 'gtts'] if module in sys.modules],
+    'import_seconds': manager.service_import_seconds
+}))
+"""
+        addon_dir = os.path.dirname(os.path.realpath(__file__))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = addon_dir
+        output = subprocess.run([sys.executable, '-c', script], cwd=addon_dir, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().split('\n')[-1])
+        assert 'Amazon' in result['services']
+        assert 'GoogleTranslate' in result['services']
+        # boto3 and gtts only get imported once the services request audio
+        assert result['heavy_modules'] == []
+        assert 'service_amazon' in result['import_seconds']
+
+    def test_voicelist_data(self):
+        import services.voicelist
+        import build_voicelist
+        azure_voices = services.voicelist.get_service_voices('Azure')
+        assert len(azure_voices) == 411
+        assert azure_voices[0]['service'] == 'Azure'
+        assert set(azure_voices[0].keys()) == set(['name', 'gender', 'language', 'key', 'options', 'service'])
+        # voices with the same options share the options dict
+        option_dicts = set([id(v['options']) for v in azure_voices])
+        assert len(option_dicts) < len(azure_voices)
+        assert services.voicelist.get_service_voices('DoesNotExist') == []
+        # rebuilding the data file from the loaded voices gives back the same file
+        voice_list = services.voicelist.get_voice_list()
+        assert len(voice_list) == 1540
+        with open(services.voicelist.VOICELIST_FILENAME, 'rb') as f:
+            assert build_voicelist.build_voicelist(voice_list) == f.read()
+
     def test_services_configuration(self):
         self.manager.init_services()    
 
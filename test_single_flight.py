@@ -0,0 +1,42 @@
+import threading
+import unittest
+
+import single_flight
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_call(self):
+        flight = single_flight.SingleFlight()
+        release = threading.Event()
+        call_count = [0]
+        def fetch():
+            call_count[0] += 1
+            release.wait()
+            return 'audio'
+
+        results = []
+        def caller():
+            results.append(flight.run('hash1', fetch))
+
+        threads = [threading.Thread(target=caller) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        # wait until the other callers are waiting on the leader
+        while flight.shared_count < 4:
+            release.wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert call_count[0] == 1
+        assert results == ['audio'] * 5
+        # the key is released once the call is done
+        assert flight.calls == {}
+        assert flight.run('hash1', lambda: 'audio 2') == 'audio 2'
+
+    def test_exception(self):
+        flight = single_flight.SingleFlight()
+        def fetch():
+            raise ValueError('request failed')
+        self.assertRaises(ValueError, flight.run, 'hash1', fetch)
+        assert flight.calls == {}
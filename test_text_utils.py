@@ -86,4 +86,29 @@ def test_regex_backref(qtbot):
 
     source_text = 'word1 (word2)'
     expected_result = 'word2 word1'
-    assert text_utils.process_text(source_text, text_processing) == expected_result
\ No newline at end of file
+    assert text_utils.process_text(source_text, text_processing) == expected_result
+
+
+def test_text_processing_pipeline(qtbot):
+    text_processing = config_models.TextProcessing()
+    text_processing.ssml_convert_characters = True
+    rule = config_models.TextReplacementRule(constants.TextReplacementRuleType.Regex)
+    rule.source = '(.*)\s+\((.*)\)'
+    rule.target = '\\2 \\1'
+    text_processing.add_text_replacement_rule(rule)
+
+    # compiled once, reused as long as the settings don't change
+    pipeline = text_utils.compile_text_processing(text_processing)
+    assert text_utils.compile_text_processing(text_processing) is pipeline
+    assert pipeline.process('word1 (word2)') == 'word2 word1'
+    assert text_utils.process_texts(['word1 (word2)', 'a&b (c)', '你好，老人家'], text_processing) == ['word2 word1', 'c a&amp;b', '你好,老人家']
+
+    # the model gets edited in place
+    rule.target = '\\1'
+    assert text_utils.compile_text_processing(text_processing) is not pipeline
+    assert text_utils.process_text('word1 (word2)', text_processing) == 'word1'
+
+    # invalid rules report an error for each text
+    rule.source = 'yoyo)'
+    testcase_instance = unittest.TestCase()
+    testcase_instance.assertRaises(errors.TextReplacementError, text_utils.process_texts, ['yoyo', 'yo'], text_processing)
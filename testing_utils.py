@@ -1,6 +1,9 @@
 import logging
 import json
 import tempfile
+import shutil
+import weakref
+import hashlib
 import re
 import os
 import sys
@@ -39,6 +42,8 @@ class MockAnkiUtils():
         self.updated_note_model = None        
         self.editor_set_field_value_calls = []
         self.added_media_file = None
+        # media folder: filename -> contents
+        self.media_files = {}
         self.show_loading_indicator_called = None
         self.hide_loading_indicator_called = None
 
@@ -46,8 +51,19 @@ class MockAnkiUtils():
         self.undo_started = False
         self.undo_finished = False
 
-        # user_files dir
-        self.user_files_dir = tempfile.gettempdir()
+        # bulk note loading and saving
+        self.get_notes_by_id_calls = 0
+        self.update_notes_calls = 0
+
+        # user_files dir, each instance gets its own so that the audio cache index and batch journals
+        # don't carry over from one test to the next
+        self.user_files_dir = tempfile.mkdtemp(prefix='hypertts-test-')
+        weakref.finalize(self, shutil.rmtree, self.user_files_dir, ignore_errors=True)
+
+        # tts tags of the upcoming cards in the reviewer
+        # card_id -> tts tags of the card, in review queue order
+        self.review_ahead_cards = {}
+        self.rendered_card_ids = []
 
         # exception handling
         self.last_exception = None
@@ -83,6 +99,12 @@ class MockAnkiUtils():
     def get_note_by_id(self, note_id):
         return self.notes_by_id[note_id]
 
+    def get_notes_by_id(self, note_id_list):
+        self.get_notes_by_id_calls += 1
+        return {note_id: self.notes_by_id[note_id] for note_id in note_id_list if note_id in self.notes_by_id}
+
+    def get_note_type_ids(self, note_id_list):
+        return set([self.notes_by_id[note_id].mid for note_id in note_id_list if note_id in self.notes_by_id])
 
     def get_model(self, model_id):
         # should return a dict which has flds
@@ -99,7 +121,15 @@ class MockAnkiUtils():
 
     def media_add_file(self, filename):
         self.added_media_file = filename
-        return filename
+        media_filename = os.path.basename(filename)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        if self.media_files.get(media_filename, data) != data:
+            # like col.media.add_file, a different file with the same name gets the new file renamed
+            base, extension = os.path.splitext(media_filename)
+            media_filename = f'{base}-{hashlib.sha1(data).hexdigest()}{extension}'
+        self.media_files[media_filename] = data
+        return media_filename
 
     def undo_start(self):
         self.undo_started = True
@@ -111,12 +141,24 @@ class MockAnkiUtils():
         # even though we don't call note.flush anymore, some of the tests expect this
         note.flush()
 
+    def update_notes(self, note_list):
+        self.update_notes_calls += 1
+        for note in note_list:
+            note.flush()
+
     def create_card_from_note(self, note, card_ord, model, template):
         return MockCard(0, note, card_ord, model, template)
 
     def extract_tts_tags(self, av_tags):
         return av_tags
 
+    def get_review_ahead_card_ids(self, card_count):
+        return list(self.review_ahead_cards.keys())[:card_count]
+
+    def get_card_tts_tags(self, card_id):
+        self.rendered_card_ids.append(card_id)
+        return self.review_ahead_cards[card_id]
+
     def save_note_type_update(self, note_model):
         logging.info('save_note_type_update')
         self.updated_note_model = note_model
@@ -236,6 +278,8 @@ class MockCloudLanguageTools():
     def configure(self, api_key):
         self.api_key = api_key
 
+    def set_http_session(self, http_session):
+        self.http_session = http_session
 
     def api_key_validate_query(self, api_key):
 
@@ -288,6 +332,29 @@ class MockCloudLanguageTools():
         return encoded_dict
 
 
+class MockBatchStatusListener():
+    def __init__(self):
+        self.callbacks_received = {}
+        self.current_row = None
+        self.rows_changed_calls = []
+
+        self.batch_started = None
+        self.batch_ended = None
+
+    def batch_start(self):
+        self.batch_started = True
+
+    def batch_end(self, completed):
+        self.batch_ended = True
+
+    def batch_change(self, note_id, row):
+        self.callbacks_received[note_id] = True
+        self.current_row = row
+
+    def batch_rows_changed(self, first_row, last_row):
+        self.rows_changed_calls.append((first_row, last_row))
+
+
 class MockCard():
     def __init__(self, deck_id, note, card_ord, model, template):
         self.did = deck_id
@@ -314,8 +381,9 @@ class MockCard():
         return self.extract_tts_tags(template_format)
 
 class MockTTSTag():
-    def __init__(self, field_text):
+    def __init__(self, field_text, other_args=None):
         self.field_text = field_text
+        self.other_args = other_args if other_args != None else []
 
 class MockNote():
     def __init__(self, note_id, model_id, field_dict, field_array, model):
@@ -3,6 +3,10 @@ import logging
 import aqt
 import anki.utils
 import re
+import time
+import hashlib
+import threading
+import collections
 
 if hasattr(sys, '_pytest_mode'):
     import constants
@@ -22,6 +26,7 @@ SSML_CONVERSION_MAP ={
     '>': '&gt;',
     '，': ',', # chinese comma 
 }
+SSML_CONVERSION_TABLE = str.maketrans(SSML_CONVERSION_MAP)
 
 def extract_template_regexp(input, regexp):
     match_result = re.match(regexp, input, re.DOTALL)
@@ -39,42 +44,172 @@ def extract_simple_template(input):
 def extract_advanced_template(input):
     return extract_template_regexp(input, REGEXP_REALTIME_ADVANCED_TEMPLATE)
 
-def process_text_replacement(text, text_processing_model):
-    for text_replacement_rule in text_processing_model.text_replacement_rules:
-        text = process_text_replacement_rule(text, text_replacement_rule)    
-    return text
+# compiled text processing
+# ========================
 
-def process_text_rules(text, text_processing_model):
-    if text_processing_model.html_to_text_line:
-        text = anki.utils.htmlToTextLine(text)
-    if text_processing_model.ssml_convert_characters:
-        for pattern, replace in SSML_CONVERSION_MAP.items():
-            text = text.replace(pattern, replace)
-    return text
+class CompiledTextReplacementRule():
+    """a text replacement rule, validated and with its regex compiled"""
 
-def process_text(source_text, text_processing_model):
-    if text_processing_model.run_replace_rules_after:
-        # text replacement rules run after other text rules
-        text = process_text_rules(source_text, text_processing_model)
-        processed_text = process_text_replacement(text, text_processing_model)
-    else:
+    def __init__(self, rule):
+        self.source = rule.source
+        self.target = rule.target
+        self.rule_type = rule.rule_type
+        self.pattern = None
+        # set when the rule is invalid, every text processed with it reports the error
+        self.error_msg = None
+        try:
+            if rule.source == None:
+                raise Exception('missing pattern in text replacement rule')
+            if rule.target == None:
+                raise Exception('missing replacement in text replacement rule')
+            if rule.rule_type == constants.TextReplacementRuleType.Regex:
+                self.pattern = re.compile(rule.source)
+            elif rule.rule_type != constants.TextReplacementRuleType.Simple:
+                raise Exception(f'unsupported replacement rule type: {rule.rule_type}')
+        except Exception as e:
+            self.error_msg = str(e)
+
+    def apply(self, input_text):
+        if self.error_msg != None:
+            raise errors.TextReplacementError(input_text, self.source, self.target, self.error_msg)
+        try:
+            if self.pattern != None:
+                return self.pattern.sub(self.target, input_text)
+            return input_text.replace(self.source, self.target)
+        except Exception as e:
+            raise errors.TextReplacementError(input_text, self.source, self.target, str(e))
+
+class TextProcessingPipeline():
+    """
+    a TextProcessing model compiled once, to be applied to many texts
+    """
+
+    def __init__(self, text_processing_model):
+        self.html_to_text_line = text_processing_model.html_to_text_line
+        self.ssml_convert_characters = text_processing_model.ssml_convert_characters
+        self.run_replace_rules_after = text_processing_model.run_replace_rules_after
+        self.rules = [CompiledTextReplacementRule(rule) for rule in text_processing_model.text_replacement_rules]
+
+    def process_text_replacement(self, text):
+        for rule in self.rules:
+            text = rule.apply(text)
+        return text
+
+    def process_text_rules(self, text):
+        if self.html_to_text_line:
+            text = anki.utils.htmlToTextLine(text)
+        if self.ssml_convert_characters:
+            text = text.translate(SSML_CONVERSION_TABLE)
+        return text
+
+    def process(self, source_text):
+        if self.run_replace_rules_after:
+            # text replacement rules run after other text rules
+            text = self.process_text_rules(source_text)
+            return self.process_text_replacement(text)
         # text replacement rules run before other text rules, useful to process HTML
-        text = process_text_replacement(source_text, text_processing_model)
-        processed_text = process_text_rules(text, text_processing_model)
-    return processed_text
+        text = self.process_text_replacement(source_text)
+        return self.process_text_rules(text)
+
+    def process_texts(self, source_text_list):
+        return [self.process(source_text) for source_text in source_text_list]
+
+def get_text_processing_key(text_processing_model):
+    rules_key = tuple([(rule.rule_type, rule.source, rule.target) for rule in text_processing_model.text_replacement_rules])
+    return (text_processing_model.html_to_text_line, text_processing_model.ssml_convert_characters, 
+        text_processing_model.run_replace_rules_after, rules_key)
+
+# the models get edited in place by the GUI, so pipelines are cached by their settings rather than by model
+pipeline_cache = collections.OrderedDict()
+pipeline_cache_lock = threading.Lock()
+
+def compile_text_processing(text_processing_model):
+    key = get_text_processing_key(text_processing_model)
+    with pipeline_cache_lock:
+        if key in pipeline_cache:
+            pipeline_cache.move_to_end(key)
+            return pipeline_cache[key]
+    pipeline = TextProcessingPipeline(text_processing_model)
+    with pipeline_cache_lock:
+        pipeline_cache[key] = pipeline
+        while len(pipeline_cache) > constants.TEXT_PIPELINE_CACHE_SIZE:
+            pipeline_cache.popitem(last=False)
+    return pipeline
 
-def process_text_replacement_rule(input_text, rule):
+def process_text(source_text, text_processing_model):
+    return compile_text_processing(text_processing_model).process(source_text)
+
+def process_texts(source_text_list, text_processing_model):
+    """process many texts with the same settings, raises on the first text which can't be processed"""
+    return compile_text_processing(text_processing_model).process_texts(source_text_list)
+
+# advanced templates
+# ==================
+
+# template hash -> code object
+template_code_cache = collections.OrderedDict()
+template_code_cache_lock = threading.Lock()
+
+def compile_advanced_template(source_template):
+    """compiles the template once, raises TemplateExpansionError on syntax errors"""
+    key = hashlib.sha224(source_template.encode('utf-8')).hexdigest()
+    with template_code_cache_lock:
+        if key in template_code_cache:
+            template_code_cache.move_to_end(key)
+            return template_code_cache[key]
     try:
-        if rule.source == None:
-            raise Exception('missing pattern in text replacement rule')
-        if rule.target == None:
-            raise Exception('missing replacement in text replacement rule')
-        if rule.rule_type == constants.TextReplacementRuleType.Regex:
-            result = re.sub(rule.source, rule.target, input_text)
-        elif rule.rule_type == constants.TextReplacementRuleType.Simple:
-            result = input_text.replace(rule.source,  rule.target)
-        else:
-            raise Exception(f'unsupported replacement rule type: {rule.rule_type}')
-        return result
+        code = compile(source_template, '<hypertts advanced template>', 'exec')
     except Exception as e:
-        raise errors.TextReplacementError(input_text, rule.source, rule.target, str(e))
+        raise errors.TemplateExpansionError(e)
+    with template_code_cache_lock:
+        template_code_cache[key] = code
+        while len(template_code_cache) > constants.ADVANCED_TEMPLATE_CACHE_SIZE:
+            template_code_cache.popitem(last=False)
+    return code
+
+class TemplateBudget():
+    """trace function which stops a template once it has run too many lines or for too long"""
+
+    def __init__(self, max_steps, timeout_seconds):
+        self.max_steps = max_steps
+        self.timeout_seconds = timeout_seconds
+        self.steps = 0
+        self.deadline = time.monotonic() + timeout_seconds
+        self.exceeded = False
+
+    def trace(self, frame, event, arg):
+        if self.exceeded:
+            # once exhausted, every event raises again
+            raise errors.TemplateBudgetExceeded(self.max_steps, self.timeout_seconds)
+        if event == 'line':
+            self.steps += 1
+            if self.steps > self.max_steps or time.monotonic() > self.deadline:
+                self.exceeded = True
+                raise errors.TemplateBudgetExceeded(self.max_steps, self.timeout_seconds)
+        return self.trace
+
+    def check(self):
+        # python removes a trace function which raised, a template which catches the exception runs on untraced
+        if self.exceeded or self.steps > self.max_steps:
+            raise errors.TemplateBudgetExceeded(self.max_steps, self.timeout_seconds)
+
+def run_advanced_template(code, field_values, 
+        max_steps=constants.ADVANCED_TEMPLATE_MAX_STEPS, 
+        timeout_seconds=constants.ADVANCED_TEMPLATE_TIMEOUT_SECONDS):
+    """runs a compiled template, returns its local variables. max_steps=None runs it without a budget"""
+    local_variables = {
+        'template_fields': field_values
+    }
+    if max_steps == None:
+        exec(code, {}, local_variables)
+        return local_variables
+    # tracing only applies to the current thread, so that the budget doesn't slow down other threads
+    budget = TemplateBudget(max_steps, timeout_seconds)
+    previous_trace = sys.gettrace()
+    sys.settrace(budget.trace)
+    try:
+        exec(code, {}, local_variables)
+    finally:
+        sys.settrace(previous_trace)
+    budget.check()
+    return local_variables
@@ -13,8 +13,11 @@ import logging
 
 # import aqt
 import aqt.tts
+import aqt.sound
+import aqt.gui_hooks
 import anki
 
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
 languages = __import__('languages', globals(), locals(), [], sys._addon_import_level_base)
 
 
@@ -22,6 +25,10 @@ class AnkiHyperTTSPlayer(aqt.tts.TTSProcessPlayer):
     def __init__(self, taskman: aqt.taskman.TaskManager, hypertts) -> None:
         super(aqt.tts.TTSProcessPlayer, self).__init__(taskman)
         self.hypertts = hypertts
+        # the mpv player, while it's playing audio which is still being downloaded
+        self.streaming_player = None
+        # releases the stream mpv is playing and calls anki back, until then mpv's own done callback is put aside
+        self.on_stream_done = None
         logging.info('created AnkiHyperTTSPlayer')
 
     # this is called the first time Anki tries to play a TTS file
@@ -46,14 +53,89 @@ class AnkiHyperTTSPlayer(aqt.tts.TTSProcessPlayer):
         assert isinstance(tag, anki.sound.TTSTag)
         logging.info(f'playing TTS sound for {tag}')
 
-        audio_filename = self.hypertts.get_audio_filename_tts_tag(tag)
-        return audio_filename
+        if self.get_streaming_player() == None:
+            audio_filename = self.hypertts.get_audio_filename_tts_tag(tag)
+            return audio_filename, None
+
+        # returns as soon as the beginning of the audio is on disk
+        audio_stream = self.hypertts.get_audio_stream_tts_tag(tag)
+        return audio_stream.full_filename, audio_stream
 
     # this is called on the main thread, after _play finishes
     def _on_done(self, ret: Future, cb: aqt.sound.OnDoneCallback) -> None:
         with self.hypertts.error_manager.get_single_action_context('Playing Realtime Audio'):
-            audio_filename = ret.result()
+            audio_filename, audio_stream = ret.result()
             logging.info(f'got audio_filename: {audio_filename}')
+            if audio_stream != None and not audio_stream.is_complete():
+                # we stay the current player until mpv is done, it calls cb
+                self.play_stream(audio_stream, cb)
+                return
+            if audio_stream != None:
+                # the download is over, the complete file gets played from its final location
+                audio_stream.release()
             aqt.sound.av_player.insert_file(audio_filename)
         cb()
 
+    # streaming playback
+    # ==================
+
+    def get_streaming_player(self):
+        # only mpv can play a file which is still growing, other players would stop at the end of what was downloaded so far
+        if not constants.STREAMING_PLAYBACK_ENABLED:
+            return None
+        mpv_manager_class = getattr(aqt.sound, 'MpvManager', None)
+        if mpv_manager_class == None:
+            return None
+        for player in aqt.sound.av_player.players:
+            # MpvManager.play only takes files in the media folder, streaming needs its command and done callback
+            if isinstance(player, mpv_manager_class) and hasattr(player, 'command') and hasattr(player, '_on_done'):
+                return player
+        return None
+
+    def play_stream(self, audio_stream, cb: aqt.sound.OnDoneCallback):
+        # mpv's appending:// protocol keeps reading the file as it grows, and stops once nothing was added for about 2 seconds.
+        # this is what MpvManager.play does, it would turn the url into a path relative to the media folder
+        logging.info(f'streaming {audio_stream.playback_filename}')
+        if self.on_stream_done != None:
+            # the previous stream gets replaced before mpv told us it's done with it
+            self.on_stream_done()
+        streaming_player = self.get_streaming_player()
+        original_on_done = streaming_player._on_done
+        def on_stream_done():
+            if self.on_stream_done != on_stream_done:
+                return
+            # give mpv back its own callback, so we don't get called again if mpv goes idle or restarts later on
+            streaming_player._on_done = original_on_done
+            self.streaming_player = None
+            self.on_stream_done = None
+            try:
+                audio_stream.release()
+            finally:
+                cb()
+        self.streaming_player = streaming_player
+        self.on_stream_done = on_stream_done
+        streaming_player._on_done = on_stream_done
+        try:
+            streaming_player.command('loadfile', f'appending://{audio_stream.playback_filename}', 'replace', 'pause=no')
+        except Exception:
+            # mpv never started playing, _on_done reports the error and calls cb
+            streaming_player._on_done = original_on_done
+            self.streaming_player = None
+            self.on_stream_done = None
+            audio_stream.release()
+            raise
+        aqt.gui_hooks.av_player_did_begin_playing(streaming_player, anki.sound.SoundOrVideoTag(filename=audio_stream.playback_filename))
+
+    def stop(self) -> None:
+        super().stop()
+        if self.streaming_player != None:
+            self.streaming_player.stop()
+
+    def toggle_pause(self) -> None:
+        if self.streaming_player != None:
+            self.streaming_player.toggle_pause()
+
+    def seek_relative(self, secs: int) -> None:
+        if self.streaming_player != None:
+            self.streaming_player.seek_relative(secs)
+
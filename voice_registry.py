@@ -0,0 +1,95 @@
+import sys
+import json
+import logging
+import collections
+
+constants = __import__('constants', globals(), locals(), [], sys._addon_import_level_base)
+
+
+def get_voice_key_hash(voice_key):
+    # voice keys are dicts for most services, strings for some
+    return json.dumps(voice_key, sort_keys=True)
+
+class VoiceRegistry():
+    """
+    indexes the voices of all enabled services, so that voice lookups and voice filtering don't need to scan
+    the full voice list. the ServiceManager builds it and throws it away when service enablement changes.
+    """
+
+    def __init__(self, services):
+        self.voice_list = []
+        self.voices_by_key = {}
+        self.voices_by_service = collections.defaultdict(list)
+        self.voices_by_audio_language = collections.defaultdict(list)
+        self.voices_by_language = collections.defaultdict(list)
+        self.voices_by_gender = collections.defaultdict(list)
+        # enabled state of each service at the time the registry was built
+        self.enabled_signature = self.get_enabled_signature(services)
+        self.build(services)
+
+    @staticmethod
+    def get_enabled_signature(services):
+        return tuple((service_name, service.enabled) for service_name, service in services.items())
+
+    def build(self, services):
+        for service_name, service_instance in services.items():
+            if service_instance.enabled:
+                for voice in service_instance.voice_list():
+                    self.add_voice(voice)
+        logging.info(f'built voice registry with {len(self.voice_list)} voices')
+
+    def add_voice(self, voice):
+        key = (voice.service.name, get_voice_key_hash(voice.voice_key))
+        # keep the first one for lookups, like a linear scan would
+        self.voices_by_key.setdefault(key, voice)
+        self.voice_list.append(voice)
+        self.voices_by_service[voice.service.name].append(voice)
+        self.voices_by_audio_language[voice.language].append(voice)
+        self.voices_by_language[voice.language.lang].append(voice)
+        self.voices_by_gender[voice.gender].append(voice)
+
+    def is_current(self, services):
+        return self.enabled_signature == self.get_enabled_signature(services)
+
+    # lookups
+    # =======
+
+    def has_voice(self, service_name, voice_key):
+        return (service_name, get_voice_key_hash(voice_key)) in self.voices_by_key
+
+    def get_voice(self, service_name, voice_key):
+        return self.voices_by_key[(service_name, get_voice_key_hash(voice_key))]
+
+    def get_audio_languages(self):
+        return set(self.voices_by_audio_language.keys())
+
+    def get_languages(self):
+        return set(self.voices_by_language.keys())
+
+    def get_services(self):
+        return set(self.voices_by_service.keys())
+
+    def get_genders(self):
+        return set(self.voices_by_gender.keys())
+
+    def filter_voices(self, audio_language=None, language=None, service=None, gender=None):
+        """voices matching all the filters which are not None, in registry order"""
+        candidate_lists = []
+        filters = []
+        if audio_language != None:
+            candidate_lists.append(self.voices_by_audio_language.get(audio_language, []))
+            filters.append(lambda voice: voice.language == audio_language)
+        if language != None:
+            candidate_lists.append(self.voices_by_language.get(language, []))
+            filters.append(lambda voice: voice.language.lang == language)
+        if service != None:
+            candidate_lists.append(self.voices_by_service.get(service, []))
+            filters.append(lambda voice: voice.service.name == service)
+        if gender != None:
+            candidate_lists.append(self.voices_by_gender.get(gender, []))
+            filters.append(lambda voice: voice.gender == gender)
+        if len(candidate_lists) == 0:
+            return list(self.voice_list)
+        # start from the smallest index, check the other filters on those voices only
+        candidates = min(candidate_lists, key=len)
+        return [voice for voice in candidates if all(voice_filter(voice) for voice_filter in filters)]